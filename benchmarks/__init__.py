@@ -0,0 +1,13 @@
+"""
+Benchmarks for zipline, in the format expected by airspeed velocity (asv).
+
+Run them from the root of the repository with::
+
+    $ asv run
+
+or, against the current environment::
+
+    $ asv run --python=same
+
+See ``asv.conf.json`` for configuration.
+"""
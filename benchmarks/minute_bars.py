@@ -0,0 +1,107 @@
+"""
+Benchmarks for reading minute bars.
+
+Minute bars for a universe of 256 assets are written to an HDF5 file with the
+default chunking, and read back with spot reads of single values, like the
+reads made by ``DataPortal`` in a minute simulation.
+"""
+import os
+from shutil import rmtree
+from tempfile import mkdtemp
+
+from numpy import arange
+from numpy.random import RandomState
+import pandas as pd
+from trading_calendars import get_calendar
+
+from zipline.data.hdf5_minute_bars import (
+    DEFAULT_CHUNK_CACHE_SIZE,
+    HDF5MinuteBarReader,
+    HDF5MinuteBarWriter,
+)
+
+NUM_ASSETS = 256
+
+#: Number of sessions of minute data written, i.e. two chunks of minutes.
+NUM_SESSIONS = 42
+
+#: Number of spot reads per benchmark.
+NUM_READS = 1000
+
+SEED = 42
+START_DATE = pd.Timestamp('2014-01-02', tz='UTC')
+
+#: The default size of HDF5's chunk cache.
+HDF5_DEFAULT_CHUNK_CACHE_SIZE = 2 ** 20
+
+
+def make_minute_bars(sids, minutes):
+    rand = RandomState(SEED)
+    for sid in sids:
+        close = 10.0 + rand.random_sample(len(minutes)).cumsum() * 0.01
+        yield sid, pd.DataFrame(
+            {
+                'open': close,
+                'high': close + 0.01,
+                'low': close - 0.01,
+                'close': close,
+                'volume': rand.randint(1, 1000, len(minutes)),
+            },
+            index=minutes,
+        )
+
+
+class HDF5SpotReads(object):
+    """
+    Reads of single values at random minutes from an HDF5 minute bar file.
+    """
+    params = [HDF5_DEFAULT_CHUNK_CACHE_SIZE, DEFAULT_CHUNK_CACHE_SIZE]
+    param_names = ['chunk_cache_size']
+    timeout = 600
+
+    def setup(self, chunk_cache_size):
+        calendar = get_calendar('XNYS')
+        sessions = calendar.all_sessions
+        start = sessions.searchsorted(START_DATE)
+        sessions = sessions[start:start + NUM_SESSIONS]
+        minutes = calendar.minutes_for_sessions_in_range(
+            sessions[0],
+            sessions[-1],
+        )
+        sids = arange(1, NUM_ASSETS + 1)
+
+        self.bars_dir = mkdtemp()
+        path = os.path.join(self.bars_dir, 'minute_bars.h5')
+        HDF5MinuteBarWriter(
+            path,
+            calendar,
+            sessions[0],
+            sessions[-1],
+        ).write(make_minute_bars(sids, minutes))
+        self.reader = HDF5MinuteBarReader.from_path(
+            path,
+            chunk_cache_size=chunk_cache_size,
+        )
+
+        # Read random sids at random minutes, moving forward in time as a
+        # simulation would.
+        rand = RandomState(SEED)
+        self.sids = rand.choice(sids, NUM_READS)
+        self.minutes = minutes[
+            sorted(rand.randint(0, len(minutes), NUM_READS))
+        ]
+
+    def teardown(self, chunk_cache_size):
+        self.reader._h5_file.close()
+        rmtree(self.bars_dir, ignore_errors=True)
+
+    def time_get_value(self, chunk_cache_size):
+        get_value = self.reader.get_value
+        for sid, minute in zip(self.sids, self.minutes):
+            get_value(sid, minute, 'close')
+
+    def time_get_values(self, chunk_cache_size):
+        get_values = self.reader.get_values
+        sids = self.sids[:16]
+        for minute in self.minutes:
+            get_values(sids, minute, 'close')
@@ -0,0 +1,387 @@
+"""
+Benchmarks for the Pipeline API.
+
+Pipelines are run against synthetic universes of 500, 5000 and 50000 assets,
+over a year of sessions. Data comes from a ``SeededRandomLoader``, except for
+:class:`PricingLoader`, which reads daily bars written by ``make_bar_data``.
+"""
+from shutil import rmtree
+from tempfile import mkdtemp
+
+from numpy import arange
+import pandas as pd
+from sqlalchemy import create_engine
+from trading_calendars import get_calendar
+
+from zipline.assets import AssetDBWriter, AssetFinder
+from zipline.assets.synthetic import make_simple_equity_info
+from zipline.data.bcolz_daily_bars import (
+    BcolzDailyBarReader,
+    BcolzDailyBarWriter,
+)
+from zipline.pipeline import Pipeline
+from zipline.pipeline.data import EquityPricing
+from zipline.pipeline.data.testing import TestingDataSet
+from zipline.pipeline.domain import EquitySessionDomain
+from zipline.pipeline.engine import SimplePipelineEngine
+from zipline.pipeline.factors import (
+    AverageDollarVolume,
+    BollingerBands,
+    ExponentialWeightedMovingAverage,
+    ExponentialWeightedMovingStdDev,
+    LinearWeightedMovingAverage,
+    MaxDrawdown,
+    PercentChange,
+    RSI,
+    Returns,
+    RollingPearson,
+    SimpleMovingAverage,
+)
+from zipline.pipeline.loaders import EquityPricingLoader
+from zipline.pipeline.loaders.synthetic import (
+    NullAdjustmentReader,
+    SeededRandomLoader,
+    make_bar_data,
+)
+
+NUM_ASSETS = [500, 5000, 50000]
+
+#: Number of sessions of data available to each pipeline.
+NUM_SESSIONS = 252
+
+#: Number of sessions for which each pipeline is run. The remaining sessions
+#: are available as lookback for windowed terms.
+NUM_RUN_SESSIONS = 126
+
+SEED = 42
+START_DATE = pd.Timestamp('2014-01-02', tz='UTC')
+
+#: Columns provided by the SeededRandomLoader. ``int_col.latest`` is used as a
+#: classifier with 100 groups.
+RANDOM_COLUMNS = [
+    TestingDataSet.bool_col,
+    TestingDataSet.float_col,
+    TestingDataSet.int_col,
+]
+
+_fixtures = {}
+
+
+def make_sessions(num_sessions=NUM_SESSIONS):
+    calendar = get_calendar('XNYS')
+    sessions = calendar.all_sessions
+    start = sessions.searchsorted(START_DATE)
+    return sessions[start:start + num_sessions]
+
+
+def make_equity_info(num_assets, sessions):
+    sids = arange(1, num_assets + 1)
+    return make_simple_equity_info(
+        sids,
+        sessions[0],
+        sessions[-1],
+        symbols=['A%d' % sid for sid in sids],
+        exchange='NYSE',
+    )
+
+
+def make_asset_finder(equity_info):
+    engine = create_engine('sqlite:///:memory:')
+    AssetDBWriter(engine).write(
+        equities=equity_info,
+        exchanges=pd.DataFrame.from_records([
+            {'exchange': 'NYSE', 'country_code': 'US'},
+        ]),
+    )
+    return AssetFinder(engine)
+
+
+def seeded_random_fixture(num_assets):
+    """
+    Get an asset finder, a domain and a SeededRandomLoader for
+    ``RANDOM_COLUMNS`` for a universe of ``num_assets`` assets.
+
+    Fixtures are cached, so benchmarks run in the same process share them.
+    """
+    key = ('seeded_random', num_assets)
+    try:
+        return _fixtures[key]
+    except KeyError:
+        pass
+
+    sessions = make_sessions()
+    finder = make_asset_finder(make_equity_info(num_assets, sessions))
+    loader = SeededRandomLoader(SEED, RANDOM_COLUMNS, sessions, finder.sids)
+    domain = EquitySessionDomain(sessions, 'US')
+
+    fixture = _fixtures[key] = (finder, domain, loader)
+    return fixture
+
+
+def seeded_random_engine(num_assets, **engine_kwargs):
+    """
+    Make a SimplePipelineEngine reading from a SeededRandomLoader.
+
+    ``engine_kwargs`` are forwarded to the engine.
+    """
+    finder, domain, loader = seeded_random_fixture(num_assets)
+    return SimplePipelineEngine(
+        get_loader=lambda column: loader,
+        asset_finder=finder,
+        default_domain=domain,
+        **engine_kwargs
+    )
+
+
+def run_dates(domain):
+    """
+    Get the start and end dates on which to run pipelines over ``domain``.
+    """
+    sessions = domain.all_sessions()
+    return sessions[-NUM_RUN_SESSIONS], sessions[-1]
+
+
+class BuiltinFactors(object):
+    """
+    A pipeline of many built-in moving-window factors.
+    """
+    params = (NUM_ASSETS, [False, True])
+    param_names = ['num_assets', 'rolling_kernels']
+    timeout = 600
+
+    def setup(self, num_assets, rolling_kernels):
+        self.engine = seeded_random_engine(
+            num_assets,
+            rolling_kernels=rolling_kernels,
+        )
+        _, domain, _ = seeded_random_fixture(num_assets)
+        self.start_date, self.end_date = run_dates(domain)
+
+        close = TestingDataSet.float_col
+        self.pipeline = Pipeline({
+            'sma': SimpleMovingAverage(inputs=[close], window_length=20),
+            'lwma': LinearWeightedMovingAverage(
+                inputs=[close],
+                window_length=20,
+            ),
+            'ewma': ExponentialWeightedMovingAverage.from_span(
+                inputs=[close],
+                window_length=30,
+                span=15,
+            ),
+            'ewmstd': ExponentialWeightedMovingStdDev.from_span(
+                inputs=[close],
+                window_length=30,
+                span=15,
+            ),
+            'bollinger_upper': BollingerBands(
+                inputs=[close],
+                window_length=20,
+                k=2,
+            ).upper,
+            'returns': Returns(inputs=[close], window_length=10),
+            'pct_change': PercentChange(inputs=[close], window_length=10),
+            'rsi': RSI(inputs=[close]),
+            'max_drawdown': MaxDrawdown(inputs=[close], window_length=60),
+        })
+
+    def time_run_pipeline(self, num_assets, rolling_kernels):
+        self.engine.run_pipeline(
+            self.pipeline,
+            self.start_date,
+            self.end_date,
+        )
+
+
+class GroupedNormalizations(object):
+    """
+    Normalizations of a factor within the groups of a classifier.
+    """
+    params = NUM_ASSETS
+    param_names = ['num_assets']
+    timeout = 600
+
+    def setup(self, num_assets):
+        self.engine = seeded_random_engine(num_assets)
+        _, domain, _ = seeded_random_fixture(num_assets)
+        self.start_date, self.end_date = run_dates(domain)
+        self.factor = TestingDataSet.float_col.latest
+        self.groups = TestingDataSet.int_col.latest
+
+    def run(self, term):
+        self.engine.run_pipeline(
+            Pipeline({'term': term}),
+            self.start_date,
+            self.end_date,
+        )
+
+    def time_demean(self, num_assets):
+        self.run(self.factor.demean(groupby=self.groups))
+
+    def time_zscore(self, num_assets):
+        self.run(self.factor.zscore(groupby=self.groups))
+
+    def time_rank(self, num_assets):
+        self.run(self.factor.rank(groupby=self.groups))
+
+    def time_winsorize(self, num_assets):
+        self.run(
+            self.factor.winsorize(
+                min_percentile=0.05,
+                max_percentile=0.95,
+                groupby=self.groups,
+            )
+        )
+
+    def time_quantiles(self, num_assets):
+        self.run(self.factor.quantiles(bins=5))
+
+
+class StatisticalFactors(object):
+    """
+    Rolling correlations and regressions, against a single asset and between
+    pairs of factors.
+    """
+    params = NUM_ASSETS
+    param_names = ['num_assets']
+    timeout = 600
+
+    def setup(self, num_assets):
+        self.engine = seeded_random_engine(num_assets)
+        finder, domain, _ = seeded_random_fixture(num_assets)
+        self.start_date, self.end_date = run_dates(domain)
+
+        self.returns = Returns(
+            inputs=[TestingDataSet.float_col],
+            window_length=2,
+        )
+        self.target = self.returns[finder.retrieve_asset(finder.sids[0])]
+
+    def run(self, term):
+        self.engine.run_pipeline(
+            Pipeline({'term': term}),
+            self.start_date,
+            self.end_date,
+        )
+
+    def time_pearsonr(self, num_assets):
+        self.run(self.returns.pearsonr(self.target, correlation_length=60))
+
+    def time_spearmanr(self, num_assets):
+        self.run(self.returns.spearmanr(self.target, correlation_length=60))
+
+    def time_linear_regression(self, num_assets):
+        self.run(
+            self.returns.linear_regression(
+                self.target,
+                regression_length=60,
+            ).beta
+        )
+
+    def time_pairwise_pearsonr(self, num_assets):
+        self.run(
+            RollingPearson(
+                base_factor=self.returns,
+                target=Returns(
+                    inputs=[TestingDataSet.float_col],
+                    window_length=5,
+                ),
+                correlation_length=60,
+            )
+        )
+
+
+class ChunkedExecution(object):
+    """
+    The same pipeline run over the whole date range at once, and in chunks.
+    """
+    params = (NUM_ASSETS, [None, 21, 63])
+    param_names = ['num_assets', 'chunksize']
+    timeout = 600
+
+    def setup(self, num_assets, chunksize):
+        self.engine = seeded_random_engine(num_assets)
+        _, domain, _ = seeded_random_fixture(num_assets)
+        self.start_date, self.end_date = run_dates(domain)
+
+        close = TestingDataSet.float_col
+        sma = SimpleMovingAverage(inputs=[close], window_length=20)
+        self.pipeline = Pipeline(
+            {
+                'sma': sma,
+                'zscore': sma.zscore(),
+                'rank': Returns(inputs=[close], window_length=5).rank(),
+            },
+            screen=TestingDataSet.bool_col.latest,
+        )
+
+    def time_run_pipeline(self, num_assets, chunksize):
+        if chunksize is None:
+            self.engine.run_pipeline(
+                self.pipeline,
+                self.start_date,
+                self.end_date,
+            )
+        else:
+            self.engine.run_chunked_pipeline(
+                self.pipeline,
+                self.start_date,
+                self.end_date,
+                chunksize=chunksize,
+            )
+
+
+class PricingLoader(object):
+    """
+    Pipelines over EquityPricing, read from bcolz daily bars.
+    """
+    # make_bar_data encodes each sid into its uint32 prices, so it can't
+    # generate data for 50000 assets.
+    params = NUM_ASSETS[:2]
+    param_names = ['num_assets']
+    timeout = 600
+
+    def setup(self, num_assets):
+        sessions = make_sessions()
+        equity_info = make_equity_info(num_assets, sessions)
+
+        self.bars_path = mkdtemp()
+        calendar = get_calendar('XNYS')
+        BcolzDailyBarWriter(
+            self.bars_path,
+            calendar,
+            sessions[0],
+            sessions[-1],
+        ).write(make_bar_data(equity_info, sessions))
+
+        loader = EquityPricingLoader.without_fx(
+            BcolzDailyBarReader(self.bars_path),
+            NullAdjustmentReader(),
+        )
+        domain = EquitySessionDomain(sessions, 'US')
+        self.engine = SimplePipelineEngine(
+            get_loader=lambda column: loader,
+            asset_finder=make_asset_finder(equity_info),
+            default_domain=domain,
+        )
+        self.start_date, self.end_date = run_dates(domain)
+
+        self.pipeline = Pipeline({
+            'close': EquityPricing.close.latest,
+            'sma': SimpleMovingAverage(
+                inputs=[EquityPricing.close],
+                window_length=20,
+            ),
+            'adv': AverageDollarVolume(window_length=20),
+            'returns': Returns(window_length=20),
+        })
+
+    def teardown(self, num_assets):
+        rmtree(self.bars_path, ignore_errors=True)
+
+    def time_run_pipeline(self, num_assets):
+        self.engine.run_pipeline(
+            self.pipeline,
+            self.start_date,
+            self.end_date,
+        )
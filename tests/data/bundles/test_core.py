@@ -15,6 +15,10 @@ from zipline.data.bundles import UnknownBundle, from_bundle_ingest_dirname, \
     ingestions_for_bundle
 from zipline.data.bundles.core import _make_bundle_core, BadClean, \
     to_bundle_ingest_dirname, asset_db_path
+from zipline.data.hdf5_minute_bars import (
+    HDF5MinuteBarReader,
+    HDF5MinuteBarWriter,
+)
 from zipline.lib.adjustment import Float64Multiply
 from zipline.pipeline.loaders.synthetic import (
     make_bar_data,
@@ -265,6 +269,69 @@ class BundleCoreTestCase(WithInstanceTmpDir,
             msg='volume',
         )
 
+    def test_ingest_hdf5_minute_bars(self):
+        calendar = get_calendar('XNYS')
+        minutes = calendar.minutes_for_sessions_in_range(
+            self.START_DATE, self.END_DATE,
+        )
+
+        sids = tuple(range(3))
+        equities = make_simple_equity_info(
+            sids,
+            self.START_DATE,
+            self.END_DATE,
+        )
+        minute_bar_data = make_bar_data(equities, minutes)
+
+        @self.register(
+            'bundle',
+            calendar_name='NYSE',
+            start_session=self.START_DATE,
+            end_session=self.END_DATE,
+            minute_bar_format='hdf5',
+        )
+        def bundle_ingest(environ,
+                          asset_db_writer,
+                          minute_bar_writer,
+                          daily_bar_writer,
+                          adjustment_writer,
+                          calendar,
+                          start_session,
+                          end_session,
+                          cache,
+                          show_progress,
+                          output_dir):
+            assert_is_instance(minute_bar_writer, HDF5MinuteBarWriter)
+
+            asset_db_writer.write(equities=equities)
+            minute_bar_writer.write(minute_bar_data)
+
+        self.ingest('bundle', environ=self.environ)
+        bundle = self.load('bundle', environ=self.environ)
+
+        assert_is_instance(
+            bundle.equity_minute_bar_reader,
+            HDF5MinuteBarReader,
+        )
+
+        columns = 'open', 'high', 'low', 'close', 'volume'
+        actual = bundle.equity_minute_bar_reader.load_raw_arrays(
+            columns,
+            minutes[0],
+            minutes[-1],
+            sids,
+        )
+        for actual_column, colname in zip(actual, columns):
+            assert_equal(
+                actual_column,
+                expected_bar_values_2d(minutes, sids, equities, colname),
+                msg=colname,
+            )
+
+    def test_register_invalid_minute_bar_format(self):
+        with assert_raises(ValueError):
+            self.register('bundle', lambda *args: None, minute_bar_format='?')
+
     def test_ingest_assets_versions(self):
         versions = (1, 2)
 
@@ -51,6 +51,7 @@ from zipline.data.hdf5_daily_bars import (
     VOLUME,
     coerce_to_uint32,
 )
+from zipline.data.npy_daily_bars import NpyDailyBarReader, NpyDailyBarWriter
 from zipline.pipeline.loaders.synthetic import (
     OHLCV,
     asset_start,
@@ -483,6 +484,39 @@ class _DailyBarsTestCase(WithEquityDailyBarData,
                     ).format(asset, date.date())
                 )
 
+    @parameterized.expand([(CLOSE, nan), (VOLUME, 0)])
+    def test_get_values(self, field, missing_value):
+        reader = self.daily_bar_reader
+        unknown_sid = self.assets[-1] + 1000
+        query_assets = self.assets + [unknown_sid]
+
+        for session in self.sessions:
+            expected = []
+            for asset in self.assets:
+                try:
+                    expected.append(reader.get_value(asset, session, field))
+                except NoDataOnDate:
+                    expected.append(missing_value)
+            expected.append(missing_value)
+
+            result = reader.get_values(query_assets, session, field)
+            assert_equal(
+                result,
+                np.array(expected, dtype=result.dtype),
+                msg="Unexpected values on date={}.".format(session.date()),
+            )
+            assert_equal(
+                result.dtype,
+                np.dtype('uint32') if field == VOLUME else np.dtype(float64),
+            )
+
+        with self.assertRaises(NoDataOnDate):
+            reader.get_values(
+                self.assets,
+                Timestamp('2015-06-06', tz='UTC'),  # A Saturday.
+                CLOSE,
+            )
+
     def test_get_last_traded_dt(self):
         for sid in self.assets:
             assert_equal(
@@ -710,6 +744,65 @@ class BcolzDailyBarWriterMissingDataTestCase(WithAssetFinder,
             writer.write(bar_data)
 
 
+class NpyDailyBarTestCase(WithTmpDir, _DailyBarsTestCase):
+    EQUITY_DAILY_BAR_COUNTRY_CODES = ['US']
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(NpyDailyBarTestCase, cls).init_class_fixtures()
+
+        cls.npy_daily_bar_path = cls.tmpdir.getpath('daily_equities.npy')
+        days = cls.equity_daily_bar_days
+        NpyDailyBarWriter(
+            cls.npy_daily_bar_path,
+            cls.trading_calendar,
+            days[0],
+            days[-1],
+        ).write(
+            cls.make_equity_daily_bar_data(
+                country_code='US',
+                sids=cls.asset_finder.equities_sids_for_country_code('US'),
+            ),
+        )
+        cls.daily_bar_reader = NpyDailyBarReader(cls.npy_daily_bar_path)
+
+    def test_write_indexes(self):
+        reader = self.daily_bar_reader
+
+        assert_equal(reader.sids, np.array(self.assets))
+        assert_equal(
+            reader._first_rows,
+            {1: 0, 3: 5, 5: 12, 7: 33, 9: 44, 11: 49},
+        )
+        assert_equal(
+            reader._last_rows,
+            {1: 4, 3: 11, 5: 32, 7: 43, 9: 48, 11: 57},
+        )
+        assert_equal(
+            reader._calendar_offsets,
+            {1: 0, 3: 15, 5: 1, 7: 0, 9: 9, 11: 10},
+        )
+
+    def test_columns_are_memory_mapped(self):
+        for column in OHLCV:
+            self.assertIsInstance(
+                self.daily_bar_reader._column(column),
+                np.memmap,
+            )
+
+    def test_missing_sessions(self):
+        missing = Timestamp('2015-06-15', tz='UTC')
+        sessions = self.sessions[self.sessions != missing]
+        writer = NpyDailyBarWriter(
+            self.tmpdir.getpath('missing_sessions'),
+            self.trading_calendar,
+            self.sessions[0],
+            self.sessions[-1],
+        )
+        with self.assertRaisesRegex(ValueError, 'Missing sessions'):
+            writer.write(make_bar_data(us_info.loc[[5]], sessions))
+
+
 class _HDF5DailyBarTestCase(WithHDF5EquityMultiCountryDailyBarReader,
                             _DailyBarsTestCase):
     @classmethod
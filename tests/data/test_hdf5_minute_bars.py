@@ -0,0 +1,238 @@
+from numpy import arange, array, dtype, float64, full, nan, uint32
+from numpy.testing import assert_almost_equal, assert_array_equal
+from pandas import DataFrame, NaT, Timestamp
+
+from zipline.data.bar_reader import NoDataForSid, NoDataOnDate
+from zipline.data.hdf5_minute_bars import (
+    HDF5MinuteBarReader,
+    HDF5MinuteBarWriter,
+)
+from zipline.testing.fixtures import (
+    WithAssetFinder,
+    WithInstanceTmpDir,
+    WithTradingCalendars,
+    ZiplineTestCase,
+)
+from zipline.testing.predicates import assert_equal
+
+# Covers the half day after Thanksgiving.
+TEST_CALENDAR_START = Timestamp('2015-11-23', tz='UTC')
+TEST_CALENDAR_STOP = Timestamp('2015-12-04', tz='UTC')
+
+
+class HDF5MinuteBarTestCase(WithTradingCalendars,
+                            WithAssetFinder,
+                            WithInstanceTmpDir,
+                            ZiplineTestCase):
+
+    ASSET_FINDER_EQUITY_SIDS = 1, 2, 3
+    ASSET_FINDER_EQUITY_START_DATE = TEST_CALENDAR_START
+    ASSET_FINDER_EQUITY_END_DATE = TEST_CALENDAR_STOP
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(HDF5MinuteBarTestCase, cls).init_class_fixtures()
+
+        cls.minutes = cls.trading_calendar.minutes_for_sessions_in_range(
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+        )
+
+    def init_instance_fixtures(self):
+        super(HDF5MinuteBarTestCase, self).init_instance_fixtures()
+
+        self.path = self.instance_tmpdir.getpath('minute_bars.h5')
+        self.writer = HDF5MinuteBarWriter(
+            self.path,
+            self.trading_calendar,
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+            date_chunk_size=2,
+            sid_chunk_size=2,
+        )
+
+    def make_reader(self):
+        reader = HDF5MinuteBarReader.from_path(self.path)
+        self.add_instance_callback(reader._h5_file.close)
+        return reader
+
+    def make_frame(self, minutes, base):
+        values = arange(len(minutes), dtype=float) + base
+        return DataFrame(
+            data={
+                'open': values,
+                'high': values + 1,
+                'low': values - 1,
+                'close': values + 0.5,
+                'volume': values * 100,
+            },
+            index=minutes,
+        )
+
+    def test_chunk_cache(self):
+        reader = HDF5MinuteBarReader.from_path(
+            self.path,
+            chunk_cache_size=2 ** 20,
+            chunk_cache_slots=101,
+        )
+        self.add_instance_callback(reader._h5_file.close)
+
+        access_plist = reader._h5_file.id.get_access_plist()
+        _, nslots, nbytes, _ = access_plist.get_cache()
+        assert_equal((nslots, nbytes), (101, 2 ** 20))
+
+    def test_empty(self):
+        reader = self.make_reader()
+
+        assert_equal(reader.sids, array([], dtype='int64'))
+        assert_equal(reader.first_trading_day, TEST_CALENDAR_START)
+        assert_equal(reader.last_available_dt, self.minutes[-1])
+
+        close, volume = reader.load_raw_arrays(
+            ['close', 'volume'],
+            self.minutes[0],
+            self.minutes[9],
+            [1, 2],
+        )
+        assert_array_equal(close, full((10, 2), nan))
+        assert_array_equal(volume, full((10, 2), 0, dtype=uint32))
+
+    def test_get_value(self):
+        minute = self.minutes[5]
+        self.writer.write([
+            (1, DataFrame(
+                data={
+                    'open': [10.0],
+                    'high': [20.0],
+                    'low': [30.0],
+                    'close': [130.23],
+                    'volume': [50.0],
+                },
+                index=[minute],
+            )),
+        ])
+        reader = self.make_reader()
+
+        assert_equal(reader.get_value(1, minute, 'open'), 10.0)
+        assert_equal(reader.get_value(1, minute, 'high'), 20.0)
+        assert_equal(reader.get_value(1, minute, 'low'), 30.0)
+        assert_equal(reader.get_value(1, minute, 'close'), 130.23)
+        assert_equal(reader.get_value(1, minute, 'volume'), 50)
+
+        # No trade in this minute.
+        assert_equal(reader.get_value(1, self.minutes[0], 'close'), nan)
+        assert_equal(reader.get_value(1, self.minutes[0], 'volume'), 0)
+
+        with self.assertRaises(NoDataForSid):
+            reader.get_value(1337, minute, 'close')
+
+        # Not a market minute.
+        with self.assertRaises(NoDataOnDate):
+            reader.get_value(1, minute.normalize(), 'close')
+
+    def test_load_raw_arrays(self):
+        # Write sids out of order, and in more than one batch, with gaps in
+        # the data for sid 2.
+        frames = {
+            3: self.make_frame(self.minutes, 1),
+            1: self.make_frame(self.minutes[100:], 1000),
+            2: self.make_frame(self.minutes[::2], 2000),
+        }
+        self.writer.write([(3, frames[3]), (1, frames[1])])
+        self.writer.write([(2, frames[2])])
+        reader = self.make_reader()
+
+        assert_equal(reader.sids, array([3, 1, 2]))
+
+        # Includes the early close on 2015-11-27.
+        start, end = self.minutes[50], self.minutes[2000]
+        window = self.minutes[50:2001]
+        sids = [2, 1337, 1, 3]
+
+        fields = ['open', 'high', 'low', 'close', 'volume']
+        results = reader.load_raw_arrays(fields, start, end, sids)
+
+        for field, result in zip(fields, results):
+            if field == 'volume':
+                expected = full((len(window), len(sids)), 0, dtype=uint32)
+            else:
+                expected = full((len(window), len(sids)), nan)
+
+            for i, sid in enumerate(sids):
+                if sid not in frames:
+                    continue
+                values = frames[sid][field].reindex(window).fillna(0).values
+                if field != 'volume':
+                    values[values == 0] = nan
+                expected[:, i] = values
+
+            assert_almost_equal(result, expected, err_msg=field)
+            assert_equal(result.dtype, expected.dtype)
+
+    def test_get_values(self):
+        frames = {
+            3: self.make_frame(self.minutes, 1),
+            1: self.make_frame(self.minutes[::2], 1000),
+        }
+        self.writer.write([(3, frames[3]), (1, frames[1])])
+        reader = self.make_reader()
+
+        sids = [1, 1337, 3]
+        for minute in self.minutes[:4]:
+            for field in 'open', 'high', 'low', 'close', 'volume':
+                missing = 0 if field == 'volume' else nan
+                expected = [
+                    frames[sid][field].get(minute, missing)
+                    if sid in frames else missing
+                    for sid in sids
+                ]
+                result = reader.get_values(sids, minute, field)
+                assert_almost_equal(result, expected, err_msg=field)
+                assert_equal(
+                    result.dtype,
+                    dtype(uint32 if field == 'volume' else float64),
+                )
+
+        # Only unknown sids.
+        assert_array_equal(
+            reader.get_values([1337], self.minutes[0], 'close'),
+            array([nan]),
+        )
+
+        # Not a market minute.
+        with self.assertRaises(NoDataOnDate):
+            reader.get_values(sids, self.minutes[0].normalize(), 'close')
+
+    def test_get_last_traded_dt(self):
+        frame = self.make_frame(self.minutes[10:20], 1)
+        self.writer.write([(1, frame)])
+        reader = self.make_reader()
+        asset = self.asset_finder.retrieve_asset(1)
+
+        assert_equal(reader.get_last_traded_dt(asset, self.minutes[5]), NaT)
+        assert_equal(
+            reader.get_last_traded_dt(asset, self.minutes[15]),
+            self.minutes[15],
+        )
+        assert_equal(
+            reader.get_last_traded_dt(asset, self.minutes[-1]),
+            self.minutes[19],
+        )
+
+    def test_duplicate_sids(self):
+        frame = self.make_frame(self.minutes[:10], 1)
+        self.writer.write([(1, frame)])
+
+        with self.assertRaises(ValueError):
+            self.writer.write([(1, frame)])
+
+        with self.assertRaises(ValueError):
+            self.writer.write([(2, frame), (2, frame)])
+
+    def test_non_market_minutes(self):
+        frame = self.make_frame(
+            [self.minutes[0], self.minutes[0].normalize()],
+            1,
+        )
+        with self.assertRaises(ValueError):
+            self.writer.write([(1, frame)])
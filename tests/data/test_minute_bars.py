@@ -601,6 +601,74 @@ class BcolzMinuteBarTestCase(WithTradingCalendars,
 
         self.assertEquals(200.0, volume_price)
 
+    def test_get_values(self):
+        minute = self.market_opens[self.test_calendar_start]
+        next_minute = minute + timedelta(minutes=1)
+
+        writer = BcolzMinuteBarWriter(
+            self.dest,
+            self.trading_calendar,
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+            US_EQUITIES_MINUTES_PER_DAY,
+            ohlc_ratios_per_sid={2: 25},
+        )
+        writer.write_sid(1, DataFrame(
+            data={
+                'open': [10.0, 11.0],
+                'high': [20.0, 21.0],
+                'low': [30.0, 31.0],
+                'close': [40.0, 41.0],
+                'volume': [50.0, 51.0],
+            },
+            index=[minute, next_minute],
+        ))
+        writer.write_sid(2, DataFrame(
+            data={
+                'open': [15.0],
+                'high': [25.0],
+                'low': [35.0],
+                'close': [45.0],
+                'volume': [55.0],
+            },
+            index=[minute],
+        ))
+        reader = BcolzMinuteBarReader(self.dest)
+
+        assert_array_equal(
+            reader.get_values([2, 1], minute, 'close'),
+            array([45.0, 40.0]),
+        )
+        assert_array_equal(
+            reader.get_values([2, 1], minute, 'volume'),
+            array([55, 50]),
+        )
+
+        # Sid 2's table ends before next_minute.
+        assert_array_equal(
+            reader.get_values([2, 1], next_minute, 'open'),
+            array([nan, 11.0]),
+        )
+        assert_array_equal(
+            reader.get_values([2, 1], next_minute, 'volume'),
+            array([0, 51]),
+        )
+
+        for field in 'open', 'high', 'low', 'close', 'volume':
+            assert_array_equal(
+                reader.get_values([1, 2], minute, field),
+                array([
+                    reader.get_value(1, minute, field),
+                    reader.get_value(2, minute, field),
+                ]),
+            )
+
+        with self.assertRaises(NoDataForSid):
+            reader.get_values([1, 1337], minute, 'close')
+
+        with self.assertRaises(NoDataOnDate):
+            reader.get_values([1, 2], minute.normalize(), 'close')
+
     def test_pad_data(self):
         """
         Test writing empty data.
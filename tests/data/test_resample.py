@@ -523,6 +523,26 @@ class MinuteToDailyAggregationTestCase(WithBcolzEquityMinuteBarReader,
                     err_msg='sid={0} field={1} dt={2}'.format(
                         asset, field, minute))
 
+    @parameterized.expand(OHLCV)
+    def test_staggered_minutes_multiple(self, field):
+        # Aggregate one asset ahead of the other, so that a single request
+        # has to backfill different numbers of minutes for each asset.
+        method_name = field + 's'
+        assets = self.asset_finder.retrieve_all([1, 2])
+        minutes = EQUITY_CASES[1].index
+
+        getattr(self.equity_daily_aggregator, method_name)(
+            assets[:1], minutes[2])
+        for i in [3, 5]:
+            values = getattr(self.equity_daily_aggregator, method_name)(
+                assets, minutes[i])
+            for j, asset in enumerate(assets):
+                assert_almost_equal(
+                    values[j],
+                    EXPECTED_AGGREGATION[asset][field][i],
+                    err_msg='sid={0} field={1} dt={2}'.format(
+                        asset, field, minutes[i]))
+
 
 class TestMinuteToSession(WithEquityMinuteBarData,
                           ZiplineTestCase):
@@ -14,6 +14,7 @@ from numpy import (
     asarray,
     dtype,
     full,
+    shares_memory,
 )
 from six.moves import zip_longest
 from toolz import curry
@@ -41,6 +42,7 @@ from zipline.utils.numpy_utils import (
     datetime64ns_dtype,
     default_missing_value_for_dtype,
     bool_dtype,
+    float32_dtype,
     float64_dtype,
     int64_dtype,
     object_dtype,
@@ -518,6 +520,49 @@ class AdjustedArrayTestCase(TestCase):
             'cannot traverse invalidated AdjustedArray',
         )
 
+    def test_traverse_labels_without_adjustments_is_zero_copy(self):
+        data = LabelArray(
+            array([['a', 'b'], ['c', 'a'], ['b', 'c']], dtype=object),
+            missing_value=None,
+        )
+        adjusted_array = AdjustedArray(data, {}, None)
+
+        for copy in (True, False):
+            for window in adjusted_array.traverse(2, copy=copy):
+                self.assertIs(window.categories, data.categories)
+                self.assertTrue(
+                    shares_memory(window.as_int_array(), data.as_int_array()),
+                )
+
+        # Nothing was written, so the array is still valid.
+        check_arrays(adjusted_array.data, data)
+        self.assertEqual(len(list(adjusted_array.traverse(1))), 3)
+
+    def test_traverse_copies_on_adjust(self):
+        data = arange(6 * 3, dtype='f8').reshape(6, 3)
+        data.setflags(write=False)
+        adjustments = {4: [Float64Multiply(0, 3, 0, 2, 2.0)]}
+        adjusted_array = AdjustedArray(data, adjustments, float('nan'))
+
+        for copy in (True, False):
+            windows = adjusted_array.traverse(2, copy=copy)
+
+            # Windows before the adjustment are views of the data.
+            for expected_anchor in (2, 3, 4):
+                window = next(windows)
+                self.assertTrue(shares_memory(window, data))
+                check_arrays(window, data[expected_anchor - 2:expected_anchor])
+
+            window = next(windows)
+            self.assertFalse(shares_memory(window, data))
+            check_arrays(window[0], data[3] * 2.0)
+            check_arrays(window[1], data[4])
+            check_arrays(next(windows), data[4:])
+            self.assertEqual(list(windows), [])
+
+        # The data is never adjusted in place.
+        check_arrays(adjusted_array.data, data)
+
     def test_copy(self):
         data = arange(5 * 3, dtype='f8').reshape(5, 3)
         original_data = data.copy()
@@ -636,6 +681,100 @@ class AdjustedArrayTestCase(TestCase):
             for yielded, expected_yield in zip_longest(window_iter, expected):
                 check_arrays(yielded, expected_yield)
 
+    @parameterized.expand(
+        case for case in chain(
+            _gen_multiplicative_adjustment_cases(float64_dtype),
+            _gen_overwrite_adjustment_cases(float64_dtype),
+            _gen_overwrite_adjustment_cases(datetime64ns_dtype),
+        )
+        # traverse_blocks doesn't support perspective offsets.
+        if case[5] == 0
+    )
+    def test_traverse_blocks_matches_traverse(self,
+                                              name,
+                                              data,
+                                              lookback,
+                                              adjustments,
+                                              missing_value,
+                                              perspective_offset,
+                                              expected):
+        array = AdjustedArray(data, adjustments, missing_value)
+        for offset in range(len(data) - lookback + 1):
+            windows = [
+                block[i:i + lookback].copy()
+                for block in array.traverse_blocks(lookback, offset=offset)
+                for i in range(len(block) - lookback + 1)
+            ]
+            expected_windows = list(array.traverse(lookback, offset=offset))
+            self.assertEqual(len(windows), len(expected_windows))
+            for window, expected_window in zip(windows, expected_windows):
+                check_arrays(window, expected_window)
+
+    def test_select_columns(self):
+        data = arange(5 * 4, dtype='f8').reshape(5, 4)
+        adjustments = {
+            1: [Float64Multiply(0, 1, 0, 2, 2.0)],
+            3: [
+                Float64Overwrite(0, 3, 1, 1, -1.0),
+                Float64Multiply(0, 3, 2, 3, 3.0),
+            ],
+        }
+        adjusted = AdjustedArray(data, adjustments, float('nan'))
+        columns = array([0, 3])
+
+        selected = adjusted.select_columns(columns)
+        assert_equal(
+            selected.adjustments,
+            {
+                1: [Float64Multiply(0, 1, 0, 0, 2.0)],
+                3: [Float64Multiply(0, 3, 1, 1, 3.0)],
+            },
+        )
+
+        expected = [window[:, columns] for window in adjusted.traverse(2)]
+        for window, expected_window in zip_longest(selected.traverse(2),
+                                                   expected):
+            check_arrays(window, expected_window)
+
+        # The original array is untouched.
+        check_arrays(adjusted.data, data)
+
+    @parameterized.expand(_gen_multiplicative_adjustment_cases(float64_dtype))
+    def test_float32_storage(self,
+                             name,
+                             data,
+                             lookback,
+                             adjustments,
+                             missing_value,
+                             perspective_offset,
+                             expected):
+        array = AdjustedArray(
+            data.astype(float32_dtype),
+            adjustments,
+            missing_value,
+        )
+        self.assertEqual(array.dtype, float32_dtype)
+        self.assertEqual(array.data.dtype, float32_dtype)
+
+        for block in array.traverse_blocks(lookback):
+            self.assertEqual(block.dtype, float64_dtype)
+
+        # Windows are always float64, and traversing without copying
+        # invalidates the array but leaves the float32 data alone.
+        for copy in (True, False):
+            window_iter = array.traverse(
+                lookback,
+                perspective_offset=perspective_offset,
+                copy=copy,
+            )
+            for yielded, expected_yield in zip_longest(window_iter, expected):
+                self.assertEqual(yielded.dtype, float64_dtype)
+                check_arrays(yielded, expected_yield)
+
+        with self.assertRaises(ValueError):
+            array.traverse(lookback)
+        check_arrays(array.data, data.astype(float32_dtype))
+
     @parameterized.expand(
         chain(
             _gen_overwrite_adjustment_cases(bool_dtype),
@@ -0,0 +1,318 @@
+"""
+Tests for zipline.pipeline.cache.
+"""
+import types
+
+import numpy as np
+from pandas import Timestamp
+
+from zipline.pipeline import CustomFactor, Pipeline
+from zipline.pipeline.cache import TermResultCache, term_signature
+from zipline.pipeline.data.testing import TestingDataSet
+from zipline.pipeline.domain import US_EQUITIES
+from zipline.pipeline.engine import SimplePipelineEngine
+from zipline.pipeline.factors import Returns, SimpleMovingAverage
+from zipline.pipeline.hooks.testing import TestingHooks
+import zipline.testing.fixtures as zf
+from zipline.testing.predicates import assert_equal
+
+
+def _window_mean(data):
+    return np.nanmean(data, axis=0)
+
+
+def _window_median(data):
+    return np.nanmedian(data, axis=0)
+
+
+def _compute_with_helper(self, today, assets, out, data):
+    out[:] = _aggregate(data)  # noqa: F821 (bound by make_factor)
+
+
+class TermSignatureTestCase(zf.ZiplineTestCase):
+
+    def test_signature_identifies_term(self):
+        sma_10 = SimpleMovingAverage(
+            inputs=[TestingDataSet.float_col],
+            window_length=10,
+        )
+        sma_20 = SimpleMovingAverage(
+            inputs=[TestingDataSet.float_col],
+            window_length=20,
+        )
+        self.assertEqual(term_signature(sma_10), term_signature(sma_10))
+        self.assertNotEqual(term_signature(sma_10), term_signature(sma_20))
+
+        # Expressions and masks participate in the signature.
+        self.assertNotEqual(
+            term_signature(sma_10 + 1),
+            term_signature(sma_10 + 2),
+        )
+        self.assertNotEqual(
+            term_signature(sma_10),
+            term_signature(SimpleMovingAverage(
+                inputs=[TestingDataSet.float_col],
+                window_length=10,
+                mask=TestingDataSet.bool_col.latest,
+            )),
+        )
+
+        # Specialized columns have different signatures than generic ones.
+        self.assertNotEqual(
+            term_signature(TestingDataSet.float_col),
+            term_signature(
+                TestingDataSet.float_col.specialize(US_EQUITIES),
+            ),
+        )
+
+    def test_signature_identifies_implementation(self):
+
+        def make_factor(func, closure):
+            class Aggregate(CustomFactor):
+                inputs = [TestingDataSet.float_col]
+                window_length = 10
+
+                if closure:
+                    def compute(self, today, assets, out, data):
+                        out[:] = func(data, axis=0)
+                elif func is np.nanmean:
+                    def compute(self, today, assets, out, data):
+                        out[:] = np.nanmean(data, axis=0)
+                else:
+                    def compute(self, today, assets, out, data):
+                        out[:] = np.nanmedian(data, axis=0)
+
+            return Aggregate()
+
+        for closure in (False, True):
+            mean = make_factor(np.nanmean, closure)
+            self.assertEqual(
+                term_signature(mean),
+                term_signature(make_factor(np.nanmean, closure)),
+            )
+            self.assertNotEqual(
+                term_signature(mean),
+                term_signature(make_factor(np.nanmedian, closure)),
+            )
+
+    def test_signature_identifies_called_globals(self):
+
+        def make_factor(helper):
+            # The same compute function, bound to globals in which _aggregate
+            # is a different helper.
+            compute = types.FunctionType(
+                _compute_with_helper.__code__,
+                {'_aggregate': helper},
+            )
+            return type(
+                'Aggregate',
+                (CustomFactor,),
+                {
+                    'inputs': [TestingDataSet.float_col],
+                    'window_length': 10,
+                    'compute': compute,
+                },
+            )()
+
+        self.assertEqual(
+            term_signature(make_factor(_window_mean)),
+            term_signature(make_factor(_window_mean)),
+        )
+        self.assertNotEqual(
+            term_signature(make_factor(_window_mean)),
+            term_signature(make_factor(_window_median)),
+        )
+
+
+class TermResultCacheTestCase(zf.WithSeededRandomPipelineEngine,
+                              zf.WithInstanceTmpDir,
+                              zf.ZiplineTestCase):
+
+    START_DATE = Timestamp('2014-01-02', tz='UTC')
+    END_DATE = Timestamp('2014-03-31', tz='UTC')
+    PIPELINE_START_DATE = Timestamp('2014-02-03', tz='UTC')
+    ASSET_FINDER_COUNTRY_CODE = 'US'
+
+    def make_engine(self, term_cache, **kwargs):
+        loader = self.seeded_random_loader
+        return SimplePipelineEngine(
+            get_loader=lambda column: loader,
+            asset_finder=self.asset_finder,
+            default_domain=US_EQUITIES,
+            term_cache=term_cache,
+            **kwargs
+        )
+
+    def make_cache(self, max_size=2 ** 30):
+        return TermResultCache(
+            self.instance_tmpdir.path,
+            max_size=max_size,
+            data_version=1,
+        )
+
+    def make_pipeline(self):
+        sma = SimpleMovingAverage(
+            inputs=[TestingDataSet.float_col],
+            window_length=10,
+        )
+        returns = Returns(inputs=[TestingDataSet.float_col], window_length=5)
+        return Pipeline(
+            columns={
+                'sma': sma,
+                'returns_rank': returns.rank(),
+            },
+            screen=TestingDataSet.bool_col.latest,
+            domain=US_EQUITIES,
+        )
+
+    def computed_terms(self, hooks):
+        return [
+            call.args[0] for call in hooks.trace
+            if call.method_name == 'computing_term' and call.state == 'enter'
+        ]
+
+    def test_cached_results_are_reused(self):
+        cache = self.make_cache()
+        engine = self.make_engine(cache)
+        pipe = self.make_pipeline()
+        end_date = self.trading_days[-1]
+
+        expected = self.run_pipeline(pipe, self.PIPELINE_START_DATE, end_date)
+
+        hooks = TestingHooks()
+        first = engine.run_pipeline(
+            pipe, self.PIPELINE_START_DATE, end_date, hooks=[hooks],
+        )
+        assert_equal(first, expected)
+        self.assertTrue(self.computed_terms(hooks))
+        self.assertGreater(cache.size(), 0)
+
+        hooks.clear()
+        second = engine.run_pipeline(
+            pipe, self.PIPELINE_START_DATE, end_date, hooks=[hooks],
+        )
+        assert_equal(second, expected)
+
+        # The outputs and the screen were all cached, so nothing should have
+        # been recomputed or loaded.
+        self.assertEqual(self.computed_terms(hooks), [])
+        self.assertFalse([
+            call for call in hooks.trace
+            if call.method_name == 'loading_terms'
+        ])
+
+    def test_overlapping_range_is_sliced(self):
+        cache = self.make_cache()
+        engine = self.make_engine(cache)
+        pipe = self.make_pipeline()
+
+        engine.run_pipeline(
+            pipe, self.PIPELINE_START_DATE, self.trading_days[-1],
+        )
+
+        start_date = self.trading_days[-20]
+        end_date = self.trading_days[-5]
+        hooks = TestingHooks()
+        result = engine.run_pipeline(
+            pipe, start_date, end_date, hooks=[hooks],
+        )
+        assert_equal(result, self.run_pipeline(pipe, start_date, end_date))
+        self.assertEqual(self.computed_terms(hooks), [])
+
+    def test_data_version_invalidates(self):
+        path = self.instance_tmpdir.path
+        pipe = self.make_pipeline()
+        end_date = self.trading_days[-1]
+
+        self.make_engine(
+            TermResultCache(path, max_size=2 ** 30, data_version=1),
+        ).run_pipeline(pipe, self.PIPELINE_START_DATE, end_date)
+
+        hooks = TestingHooks()
+        self.make_engine(
+            TermResultCache(path, max_size=2 ** 30, data_version=2),
+        ).run_pipeline(
+            pipe, self.PIPELINE_START_DATE, end_date, hooks=[hooks],
+        )
+        self.assertTrue(self.computed_terms(hooks))
+
+    def test_float32_results_are_separate(self):
+        cache = self.make_cache()
+        pipe = self.make_pipeline()
+        end_date = self.trading_days[-1]
+
+        self.make_engine(cache, float32_storage=True).run_pipeline(
+            pipe, self.PIPELINE_START_DATE, end_date,
+        )
+
+        # An engine without float32 storage doesn't read the less precise
+        # results of the float32 engine.
+        hooks = TestingHooks()
+        result = self.make_engine(cache).run_pipeline(
+            pipe, self.PIPELINE_START_DATE, end_date, hooks=[hooks],
+        )
+        self.assertTrue(self.computed_terms(hooks))
+        assert_equal(
+            result,
+            self.run_pipeline(pipe, self.PIPELINE_START_DATE, end_date),
+        )
+
+    def test_pruned_results_are_separate(self):
+        cache = self.make_cache()
+        ranked = Returns(
+            inputs=[TestingDataSet.float_col],
+            window_length=5,
+        ).rank()
+        # Compute a single day, so that the screens prune assets.
+        date = self.PIPELINE_START_DATE
+
+        def make_pipeline(threshold):
+            return Pipeline(
+                columns={'ranked': ranked},
+                screen=TestingDataSet.int_col.latest < threshold,
+                domain=US_EQUITIES,
+            )
+
+        engine = self.make_engine(cache, prune_assets=True)
+        engine.run_pipeline(make_pipeline(30), date, date)
+
+        # The ranks computed among the assets retained by the first screen
+        # aren't reused for the assets retained by the second one.
+        pipe = make_pipeline(60)
+        assert_equal(
+            engine.run_pipeline(pipe, date, date),
+            self.make_engine(None, prune_assets=True).run_pipeline(
+                pipe, date, date,
+            ),
+        )
+
+    def test_eviction(self):
+        cache = self.make_cache(max_size=0)
+        self.make_engine(cache).run_pipeline(
+            self.make_pipeline(),
+            self.PIPELINE_START_DATE,
+            self.trading_days[-1],
+        )
+        self.assertEqual(cache.size(), 0)
+
+    def test_only_outputs_and_windowed_terms_are_stored(self):
+        sma = SimpleMovingAverage(
+            inputs=[TestingDataSet.float_col],
+            window_length=10,
+        )
+        doubled = sma * 2
+        ranked = doubled.rank()
+        outputs = frozenset([ranked])
+
+        self.assertTrue(TermResultCache.is_worth_storing(sma, outputs))
+        self.assertTrue(TermResultCache.is_worth_storing(ranked, outputs))
+        self.assertFalse(TermResultCache.is_worth_storing(doubled, outputs))
+
+        cache = self.make_cache()
+        self.make_engine(cache).run_pipeline(
+            Pipeline({'ranked': ranked}, domain=US_EQUITIES),
+            self.PIPELINE_START_DATE,
+            self.trading_days[-1],
+        )
+        # Only sma and the ranked output are stored.
+        self.assertEqual(len(cache._entries()), 2)
@@ -2,9 +2,11 @@
 Tests for SimplePipelineEngine
 """
 from __future__ import division
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
+from functools import partial
 from itertools import product
 from operator import add, sub
+import os
 from unittest import skipIf
 
 from nose_parameterized import parameterized
@@ -31,6 +33,7 @@ from pandas import (
     Int64Index,
     MultiIndex,
     Series,
+    Timedelta,
     Timestamp,
 )
 from pandas.compat.chainmap import ChainMap
@@ -55,15 +58,19 @@ from zipline.pipeline.domain import (
 )
 from zipline.pipeline.engine import SimplePipelineEngine
 from zipline.pipeline.factors import (
+    AnnualizedVolatility,
     AverageDollarVolume,
+    BollingerBands,
     EWMA,
     EWMSTD,
     ExponentialWeightedMovingAverage,
     ExponentialWeightedMovingStdDev,
     MaxDrawdown,
+    Returns,
     SimpleMovingAverage,
 )
-from zipline.pipeline.filters import CustomFilter
+from zipline.pipeline.filters import CustomFilter, StaticSids
+from zipline.pipeline.hooks.testing import TestingHooks
 from zipline.pipeline.loaders.equity_pricing_loader import (
     EquityPricingLoader,
 )
@@ -74,7 +81,7 @@ from zipline.pipeline.loaders.synthetic import (
     expected_bar_values_2d,
 )
 from zipline.pipeline.sentinels import NotSpecified
-from zipline.pipeline.term import InputDates
+from zipline.pipeline.term import AssetExists, InputDates
 from zipline.testing import (
     AssetID,
     AssetIDPlusDay,
@@ -91,7 +98,12 @@ from zipline.testing.core import create_simple_domain
 from zipline.testing.predicates import assert_equal
 from zipline.utils.memoize import lazyval
 from zipline.utils.numpy_utils import bool_dtype, datetime64ns_dtype
-from zipline.utils.pandas_utils import new_pandas, skip_pipeline_new_pandas
+from zipline.utils.pool import SequentialPool
+from zipline.utils.pandas_utils import (
+    categorical_df_concat,
+    new_pandas,
+    skip_pipeline_new_pandas,
+)
 
 
 class RollingSumDifference(CustomFactor):
@@ -124,6 +136,18 @@ class OpenCloseSumAndDiff(CustomFactor):
         out.diff[:] = open.sum(axis=0) - close.sum(axis=0)
 
 
+def make_single_loader_engine(loader, asset_finder):
+    """Build an engine which loads every column with ``loader``.
+
+    This is defined at module scope so that it can be used as the
+    ``engine_factory`` of pipelines run in a process pool.
+    """
+    return SimplePipelineEngine(
+        get_loader=lambda column: loader,
+        asset_finder=asset_finder,
+    )
+
+
 def assert_multi_index_is_product(testcase, index, *levels):
     """Assert that a MultiIndex contains the product of `*levels`."""
     testcase.assertIsInstance(
@@ -909,6 +933,328 @@ class FrameInputTestCase(zf.WithAssetFinder,
                 high_results = results.unstack()['high']
                 assert_frame_equal(high_results, high_base.iloc[iloc_bounds])
 
+    def make_adjusted_loader(self, column, adjustment_idxs=(3, 10, 16)):
+        dates, asset_ids = self.dates, self.asset_ids
+        adjustments = DataFrame.from_records(
+            [
+                dict(
+                    kind=MULTIPLY,
+                    sid=asset_ids[1],
+                    value=value,
+                    start_date=None,
+                    end_date=dates[idx - 1],
+                    apply_date=dates[idx],
+                )
+                for idx, value in zip(adjustment_idxs, [2.0, 3.0, 5.0])
+            ]
+        )
+        baseline = DataFrame(
+            np.arange(len(dates) * len(asset_ids), dtype=float).reshape(
+                len(dates), len(asset_ids),
+            ),
+            columns=self.assets,
+            index=dates,
+        )
+        return DataFrameLoader(column, baseline, adjustments)
+
+    def check_engine_option_with_adjustments(self, columns, **engine_kwargs):
+        dates = self.dates
+        loader = self.make_adjusted_loader(EquityPricing.high)
+
+        def make_engine(**kwargs):
+            return SimplePipelineEngine(
+                lambda column: loader,
+                self.asset_finder,
+                **kwargs
+            )
+
+        pipe = Pipeline(columns=columns, domain=self.domain)
+        for start in (5, 12):
+            expected = make_engine().run_pipeline(
+                pipe, dates[start], dates[-1],
+            )
+            result = make_engine(**engine_kwargs).run_pipeline(
+                pipe, dates[start], dates[-1],
+            )
+            assert_equal(result, expected)
+
+    def test_shared_windows_with_adjustments(self):
+        high = EquityPricing.high
+        columns = {
+            'sma_%d' % window_length: SimpleMovingAverage(
+                inputs=[high],
+                window_length=window_length,
+            )
+            for window_length in (2, 3, 5)
+        }
+        columns['latest'] = high.latest
+        self.check_engine_option_with_adjustments(columns, share_windows=True)
+
+    def test_rolling_kernels_with_adjustments(self):
+        high = EquityPricing.high
+        columns = {
+            'sma_%d' % window_length: SimpleMovingAverage(
+                inputs=[high],
+                window_length=window_length,
+            )
+            for window_length in (1, 3, 5)
+        }
+        columns['ewma'] = EWMA(inputs=[high], window_length=4, decay_rate=0.5)
+        columns['ewmstd'] = EWMSTD(
+            inputs=[high],
+            window_length=4,
+            decay_rate=0.5,
+        )
+        columns['bollinger_upper'] = BollingerBands(
+            inputs=[high],
+            window_length=5,
+            k=2.0,
+        ).upper
+        self.check_engine_option_with_adjustments(
+            columns,
+            rolling_kernels=True,
+        )
+
+    def test_compute_block_with_adjustments(self):
+        dates = self.dates
+        high, low = EquityPricing.high, EquityPricing.low
+        loaders = {
+            high: self.make_adjusted_loader(high),
+            low: self.make_adjusted_loader(low, adjustment_idxs=(5, 10, 14)),
+        }
+        block_calls = []
+
+        class Range(CustomFactor):
+            inputs = [high, low]
+            window_length = 3
+
+            def compute(self, today, assets, out, highs, lows):
+                out[:] = highs.max(axis=0) - lows.min(axis=0) + lows[0]
+
+        class BlockRange(Range):
+            def compute_block(self, today_index, assets, out, highs, lows):
+                block_calls.append((today_index, assets, highs))
+                out[:] = highs.max(axis=1) - lows.min(axis=1) + lows[:, 0]
+
+        engine = SimplePipelineEngine(
+            lambda column: loaders[column],
+            self.asset_finder,
+        )
+        pipe = Pipeline(
+            columns={'compute': Range(), 'compute_block': BlockRange()},
+            domain=self.domain,
+        )
+        result = engine.run_pipeline(pipe, dates[4], dates[-1])
+        assert_equal(
+            result['compute_block'],
+            result['compute'],
+            check_names=False,
+        )
+
+        # compute_block should be called once for each run of dates between
+        # adjustments to either input.
+        for today_index, assets, highs in block_calls:
+            self.assertEqual(
+                highs.shape,
+                (len(today_index), BlockRange.window_length, len(assets)),
+            )
+            self.assertFalse(highs.flags.writeable)
+
+        self.assertEqual(
+            [(index[0], index[-1]) for index, _, _ in block_calls],
+            [
+                (dates[4], dates[4]),
+                (dates[5], dates[9]),
+                (dates[10], dates[13]),
+                (dates[14], dates[15]),
+                (dates[16], dates[-1]),
+            ],
+        )
+
+
+class IncrementalPipelineTestCase(zf.WithAssetFinder,
+                                  zf.WithTradingCalendars,
+                                  zf.ZiplineTestCase):
+    asset_ids = ASSET_FINDER_EQUITY_SIDS = 1, 2, 3
+    START_DATE = Timestamp('2015-01-01', tz='utc')
+    END_DATE = Timestamp('2015-03-31', tz='utc')
+    ASSET_FINDER_COUNTRY_CODE = 'US'
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(IncrementalPipelineTestCase, cls).init_class_fixtures()
+        cls.dates = date_range(
+            cls.START_DATE,
+            cls.END_DATE,
+            freq=cls.trading_calendar.day,
+            tz='UTC',
+        )
+        cls.baseline = DataFrame(
+            arange(len(cls.dates) * 3, dtype=float).reshape(-1, 3) + 1.0,
+            index=cls.dates,
+            columns=cls.asset_finder.retrieve_all(cls.asset_ids),
+        )
+        cls.pipe = Pipeline(
+            columns={
+                'close': EquityPricing.close.latest,
+                'sma': SimpleMovingAverage(
+                    inputs=[EquityPricing.close],
+                    window_length=5,
+                ),
+            },
+            domain=US_EQUITIES,
+        )
+
+    def make_loader(self, adjustments=None):
+        return DataFrameLoader(
+            USEquityPricing.close,
+            self.baseline.copy(),
+            adjustments,
+        )
+
+    def computed_chunks(self, hooks):
+        return [
+            (call.args[1], call.args[2]) for call in hooks.trace
+            if call.method_name == 'computing_chunk' and call.state == 'enter'
+        ]
+
+    def test_incremental_matches_run_pipeline(self):
+        loader = self.make_loader()
+        engine = SimplePipelineEngine(lambda column: loader, self.asset_finder)
+        hooks = TestingHooks()
+        runner = engine.incremental(self.pipe, hooks=[hooks])
+        dates = self.dates
+
+        for offset in range(10, 20):
+            start, end = dates[offset], dates[offset + 10]
+            hooks.clear()
+            result = runner.run(start, end, data_version=1)
+            assert_equal(result, engine.run_pipeline(self.pipe, start, end))
+
+            if offset == 10:
+                expected_chunks = [(start, end)]
+            else:
+                # Only the new session should have been computed.
+                expected_chunks = [(end, end)]
+            self.assertEqual(self.computed_chunks(hooks), expected_chunks)
+            self.assertEqual(runner.retained_dates, (start, end))
+
+        # Requesting a range that starts before the retained results forces a
+        # full recompute.
+        start, end = dates[5], dates[25]
+        hooks.clear()
+        assert_equal(
+            runner.run(start, end, data_version=1),
+            engine.run_pipeline(self.pipe, start, end),
+        )
+        self.assertEqual(self.computed_chunks(hooks), [(start, end)])
+
+    def test_non_session_dates(self):
+        loader = self.make_loader()
+        engine = SimplePipelineEngine(
+            lambda column: loader,
+            self.asset_finder,
+            share_windows=True,
+            rolling_kernels=True,
+        )
+        hooks = TestingHooks()
+        runner = engine.incremental(self.pipe, hooks=[hooks])
+
+        start = self.dates[5]
+        friday = next(d for d in self.dates[10:] if d.dayofweek == 4)
+        saturday = friday + Timedelta(days=1)
+        monday = self.dates[self.dates.get_loc(friday) + 1]
+        tuesday = self.dates[self.dates.get_loc(friday) + 2]
+        runner.run(start, tuesday, data_version=1)
+
+        # Like run_pipeline, the runner only accepts sessions.
+        with self.assertRaises(ValueError):
+            runner.run(start, saturday, data_version=1)
+        self.assertEqual(runner.retained_dates, (start, tuesday))
+
+        # Invalidating from a non-session keeps the sessions before it.
+        runner.invalidate(since=saturday)
+        self.assertEqual(runner.retained_dates, (start, friday))
+
+        hooks.clear()
+        assert_equal(
+            runner.run(start, tuesday, data_version=1),
+            engine.run_pipeline(self.pipe, start, tuesday),
+        )
+        self.assertEqual(self.computed_chunks(hooks), [(monday, tuesday)])
+
+    @parameterized.expand([
+        # Inside the lookback of the new session.
+        ('near_new_sessions', 28),
+        # Before the lookback of the new session, but inside the retained
+        # range.
+        ('inside_retained_range', 15),
+    ])
+    def test_revised_adjustment_invalidates(self, name, apply_loc):
+        dates = self.dates
+        asset_id = self.asset_ids[1]
+        revised_adjustments = DataFrame.from_records([
+            dict(
+                kind=MULTIPLY,
+                sid=asset_id,
+                value=0.5,
+                start_date=None,
+                end_date=dates[apply_loc - 1],
+                apply_date=dates[apply_loc],
+            ),
+        ])
+        loaders = {'current': self.make_loader()}
+        engine = SimplePipelineEngine(
+            lambda column: loaders['current'],
+            self.asset_finder,
+        )
+        hooks = TestingHooks()
+        runner = engine.incremental(self.pipe, hooks=[hooks])
+        runner.run(dates[10], dates[30], data_version=1)
+
+        # Simulate a re-ingestion that adds a split inside the retained
+        # window.
+        loaders['current'] = self.make_loader(revised_adjustments)
+
+        hooks.clear()
+        result = runner.run(dates[11], dates[31], data_version=2)
+        expected = engine.run_pipeline(self.pipe, dates[11], dates[31])
+        assert_equal(result, expected)
+
+        # Every retained result was dropped and recomputed.
+        self.assertEqual(
+            self.computed_chunks(hooks),
+            [(dates[11], dates[31])],
+        )
+
+        # Results are retained again for the new data version.
+        hooks.clear()
+        assert_equal(
+            runner.run(dates[11], dates[31], data_version=2),
+            expected,
+        )
+        self.assertEqual(self.computed_chunks(hooks), [])
+
+    def test_revised_baseline_invalidates(self):
+        dates = self.dates
+        loaders = {'current': self.make_loader()}
+        engine = SimplePipelineEngine(
+            lambda column: loaders['current'],
+            self.asset_finder,
+        )
+        runner = engine.incremental(self.pipe)
+        runner.run(dates[10], dates[30], data_version=1)
+
+        # Revise a value well before the lookback of the new session.
+        revised = self.make_loader()
+        revised.baseline[15, 0] *= 2
+        loaders['current'] = revised
+
+        assert_equal(
+            runner.run(dates[11], dates[31], data_version=2),
+            engine.run_pipeline(self.pipe, dates[11], dates[31]),
+        )
+
 
 class SyntheticBcolzTestCase(zf.WithAdjustmentReader,
                              zf.WithAssetFinder,
@@ -1543,6 +1889,97 @@ class ChunkedPipelineTestCase(zf.WithSeededRandomPipelineEngine,
         )
         self.assertTrue(chunked_result.equals(pipeline_result))
 
+    def test_run_chunked_pipeline_in_process_pool(self):
+        """
+        Test that running chunks in a process pool produces the same result as
+        running them serially.
+        """
+        pipe = Pipeline(
+            columns={
+                'float': TestingDataSet.float_col.latest,
+                'custom_factor': SimpleMovingAverage(
+                    inputs=[TestingDataSet.float_col],
+                    window_length=10,
+                ),
+            },
+            screen=TestingDataSet.bool_col.latest,
+            domain=US_EQUITIES,
+        )
+
+        engine_factory = partial(
+            make_single_loader_engine,
+            self.seeded_random_loader,
+            self.asset_finder,
+        )
+
+        serial_result = self.run_chunked_pipeline(
+            pipeline=pipe,
+            start_date=self.PIPELINE_START_DATE,
+            end_date=self.END_DATE,
+            chunksize=22,
+        )
+        parallel_result = self.seeded_random_engine.run_chunked_pipeline(
+            pipe,
+            self.PIPELINE_START_DATE,
+            self.END_DATE,
+            chunksize=22,
+            max_workers=3,
+            engine_factory=engine_factory,
+        )
+        assert_equal(parallel_result, serial_result)
+
+    def test_process_pool_requires_engine_factory(self):
+        pipe = Pipeline(
+            {'float': TestingDataSet.float_col.latest},
+            domain=US_EQUITIES,
+        )
+        with self.assertRaises(ValueError):
+            self.seeded_random_engine.run_chunked_pipeline(
+                pipe,
+                self.PIPELINE_START_DATE,
+                self.END_DATE,
+                chunksize=22,
+                max_workers=2,
+            )
+
+    def test_run_pipeline_iter(self):
+        pipe = Pipeline(
+            columns={
+                'float': TestingDataSet.float_col.latest,
+                'custom_factor': SimpleMovingAverage(
+                    inputs=[TestingDataSet.float_col],
+                    window_length=10,
+                ),
+            },
+            domain=US_EQUITIES,
+        )
+        expected = self.run_pipeline(
+            pipe, self.PIPELINE_START_DATE, self.END_DATE,
+        )
+
+        for chunksize in (1, 22, None):
+            kwargs = {} if chunksize is None else {'chunksize': chunksize}
+            chunks = list(self.seeded_random_engine.run_pipeline_iter(
+                pipe,
+                self.PIPELINE_START_DATE,
+                self.END_DATE,
+                **kwargs
+            ))
+            if chunksize is None:
+                # The default is a month of sessions.
+                chunksize = 21
+            sessions = self.trading_days[self.trading_days.slice_indexer(
+                self.PIPELINE_START_DATE, self.END_DATE,
+            )]
+            self.assertEqual(
+                len(chunks),
+                -(-len(sessions) // chunksize),
+            )
+            for chunk in chunks:
+                chunk_dates = chunk.index.get_level_values(0).unique()
+                self.assertLessEqual(len(chunk_dates), chunksize)
+            assert_equal(categorical_df_concat(chunks), expected)
+
     def test_concatenate_empty_chunks(self):
         # Test that we correctly handle concatenating chunked pipelines when
         # some of the chunks are empty. This is slightly tricky b/c pandas
@@ -1616,6 +2053,638 @@ class MaximumRegressionTest(zf.WithSeededRandomPipelineEngine,
         assert_equal(groupby_max, pipeline_max)
 
 
+class ComputePoolTestCase(zf.WithSeededRandomPipelineEngine,
+                          zf.ZiplineTestCase):
+
+    PIPELINE_START_DATE = Timestamp('2006-01-05', tz='UTC')
+    END_DATE = Timestamp('2006-03-31', tz='UTC')
+    ASSET_FINDER_COUNTRY_CODE = 'US'
+
+    def make_engine(self, compute_pool):
+        loader = self.seeded_random_loader
+        return SimplePipelineEngine(
+            get_loader=lambda column: loader,
+            asset_finder=self.asset_finder,
+            default_domain=US_EQUITIES,
+            compute_pool=compute_pool,
+        )
+
+    def make_pipeline(self):
+        columns = {
+            'sma_%d' % window_length: SimpleMovingAverage(
+                inputs=[TestingDataSet.float_col],
+                window_length=window_length,
+            )
+            for window_length in (2, 5, 10, 20)
+        }
+        columns['rolling_sum_sum'] = RollingSumSum(
+            inputs=[TestingDataSet.float_col, TestingDataSet.int_col],
+            window_length=3,
+        )
+        columns['drawdown'] = MaxDrawdown(
+            inputs=[TestingDataSet.float_col],
+            window_length=5,
+            mask=TestingDataSet.bool_col.latest,
+        )
+        columns['float'] = TestingDataSet.float_col.latest
+        columns['ranked'] = columns['sma_5'].rank()
+        return Pipeline(
+            columns=columns,
+            screen=TestingDataSet.bool_col.latest,
+            domain=US_EQUITIES,
+        )
+
+    @parameter_space(compute_pool=[SequentialPool(), 4])
+    def test_compute_pool_matches_serial(self, compute_pool):
+        pipe = self.make_pipeline()
+        expected = self.run_pipeline(
+            pipe, self.PIPELINE_START_DATE, self.END_DATE,
+        )
+        result = self.make_engine(compute_pool).run_pipeline(
+            pipe, self.PIPELINE_START_DATE, self.END_DATE,
+        )
+        assert_equal(result, expected)
+
+    def test_compute_pool_propagates_errors(self):
+
+        class Explodes(CustomFactor):
+            inputs = [TestingDataSet.float_col]
+            window_length = 2
+
+            def compute(self, today, assets, out, data):
+                raise ZeroDivisionError('boom')
+
+        pipe = Pipeline(
+            {'explodes': Explodes(), 'float': TestingDataSet.float_col.latest},
+            domain=US_EQUITIES,
+        )
+        engine = self.make_engine(2)
+        with self.assertRaises(ZeroDivisionError):
+            engine.run_pipeline(pipe, self.PIPELINE_START_DATE, self.END_DATE)
+
+
+class SharedWindowsTestCase(ComputePoolTestCase):
+
+    def make_engine(self, compute_pool):
+        loader = self.seeded_random_loader
+        return SimplePipelineEngine(
+            get_loader=lambda column: loader,
+            asset_finder=self.asset_finder,
+            default_domain=US_EQUITIES,
+            compute_pool=compute_pool,
+            share_windows=True,
+        )
+
+    @parameter_space(compute_pool=[None, SequentialPool(), 4])
+    def test_compute_pool_matches_serial(self, compute_pool):
+        super(SharedWindowsTestCase, self).test_compute_pool_matches_serial(
+            compute_pool,
+        )
+
+    def test_shared_window_groups(self):
+        pipe = self.make_pipeline()
+        plan = pipe.to_execution_plan(
+            US_EQUITIES,
+            AssetExists(),
+            self.PIPELINE_START_DATE,
+            self.END_DATE,
+        )
+        columns = pipe.columns
+        groups = plan.shared_window_groups
+
+        # Every windowed CustomFactor over float_col is in the same group,
+        # including the masked drawdown.
+        float_terms = {
+            columns[name]
+            for name in ('sma_2', 'sma_5', 'sma_10', 'sma_20', 'drawdown')
+        }
+        float_terms.add(columns['float'])
+        self.assertEqual(set(groups[columns['sma_2']]), float_terms)
+
+        # Terms that don't share their inputs with anything aren't grouped.
+        self.assertNotIn(columns['rolling_sum_sum'], groups)
+        self.assertNotIn(columns['ranked'], groups)
+
+    def test_hooks_see_every_term(self):
+        pipe = self.make_pipeline()
+        hooks = TestingHooks()
+        self.make_engine(None).run_pipeline(
+            pipe, self.PIPELINE_START_DATE, self.END_DATE, hooks=[hooks],
+        )
+        computed = {
+            call.args[0] for call in hooks.trace
+            if call.method_name == 'computing_term' and call.state == 'enter'
+        }
+        self.assertTrue(set(pipe.columns.values()) <= computed)
+
+
+class MemoryBudgetTestCase(zf.WithInstanceTmpDir, ComputePoolTestCase):
+
+    def make_engine(self, compute_pool, memory_budget=1):
+        loader = self.seeded_random_loader
+        return SimplePipelineEngine(
+            get_loader=lambda column: loader,
+            asset_finder=self.asset_finder,
+            default_domain=US_EQUITIES,
+            compute_pool=compute_pool,
+            memory_budget=memory_budget,
+            spill_directory=self.instance_tmpdir.path,
+        )
+
+    @parameter_space(compute_pool=[None, SequentialPool(), 4])
+    def test_compute_pool_matches_serial(self, compute_pool):
+        super(MemoryBudgetTestCase, self).test_compute_pool_matches_serial(
+            compute_pool,
+        )
+
+    def test_reports_workspace_memory(self):
+        pipe = self.make_pipeline()
+        hooks = TestingHooks()
+        self.make_engine(None).run_chunked_pipeline(
+            pipe,
+            self.PIPELINE_START_DATE,
+            self.END_DATE,
+            chunksize=30,
+            hooks=[hooks],
+        )
+        reports = [
+            call.args for call in hooks.trace
+            if call.method_name == 'on_workspace_memory'
+        ]
+        # One report per chunk.
+        self.assertEqual(len(reports), 2)
+        for peak_resident_bytes, spilled_bytes in reports:
+            self.assertGreater(peak_resident_bytes, 0)
+            self.assertGreater(spilled_bytes, 0)
+
+        # Spilled results are cleaned up after each chunk.
+        self.assertEqual(os.listdir(self.instance_tmpdir.path), [])
+
+    def test_large_budget_doesnt_spill(self):
+        pipe = self.make_pipeline()
+        hooks = TestingHooks()
+        self.make_engine(None, memory_budget=2 ** 40).run_pipeline(
+            pipe, self.PIPELINE_START_DATE, self.END_DATE, hooks=[hooks],
+        )
+        reports = [
+            call.args for call in hooks.trace
+            if call.method_name == 'on_workspace_memory'
+        ]
+        self.assertEqual(len(reports), 1)
+        peak_resident_bytes, spilled_bytes = reports[0]
+        self.assertGreater(peak_resident_bytes, 0)
+        self.assertEqual(spilled_bytes, 0)
+
+
+class Float32StorageTestCase(ComputePoolTestCase):
+
+    def make_engine(self, compute_pool):
+        loader = self.seeded_random_loader
+        return SimplePipelineEngine(
+            get_loader=lambda column: loader,
+            asset_finder=self.asset_finder,
+            default_domain=US_EQUITIES,
+            compute_pool=compute_pool,
+            float32_storage=True,
+        )
+
+    @parameter_space(compute_pool=[None, SequentialPool(), 4])
+    def test_compute_pool_matches_serial(self, compute_pool):
+        pipe = self.make_pipeline()
+        expected = self.run_pipeline(
+            pipe, self.PIPELINE_START_DATE, self.END_DATE,
+        )
+        result = self.make_engine(compute_pool).run_pipeline(
+            pipe, self.PIPELINE_START_DATE, self.END_DATE,
+        )
+
+        # Results are stored as float32, but are computed from float64 inputs
+        # and returned with the dtypes of their terms.
+        assert_equal(result.dtypes, expected.dtypes)
+        assert_equal(result.index, expected.index)
+        columns = sorted(expected.columns)
+        np.testing.assert_allclose(
+            result[columns].values,
+            expected[columns].values,
+            rtol=1e-6,
+        )
+
+
+class PruneAssetsTestCase(zf.WithSeededRandomPipelineEngine,
+                          zf.ZiplineTestCase):
+
+    PIPELINE_START_DATE = Timestamp('2006-01-05', tz='UTC')
+    END_DATE = Timestamp('2006-03-31', tz='UTC')
+    ASSET_FINDER_COUNTRY_CODE = 'US'
+    ASSET_FINDER_EQUITY_SIDS = list(range(1, 11))
+
+    def make_engine(self):
+        loader = self.seeded_random_loader
+        return SimplePipelineEngine(
+            get_loader=lambda column: loader,
+            asset_finder=self.asset_finder,
+            default_domain=US_EQUITIES,
+            prune_assets=True,
+        )
+
+    def make_factor(self, computed_widths):
+        returns = Returns(inputs=[TestingDataSet.float_col], window_length=2)
+        target = self.asset_finder.retrieve_asset(10)
+
+        class SpreadToTarget(CustomFactor):
+            inputs = [returns, returns[target]]
+            window_length = 3
+
+            def compute(self, today, assets, out, returns, target_returns):
+                computed_widths.append(len(assets))
+                out[:] = (returns - target_returns).sum(axis=0)
+
+        return returns, SpreadToTarget()
+
+    def test_static_screen(self):
+        computed_widths = []
+        returns, spread = self.make_factor(computed_widths)
+        pipe = Pipeline(
+            columns={
+                'returns': returns,
+                'spread': spread,
+                'float': TestingDataSet.float_col.latest,
+            },
+            screen=StaticSids([1, 2, 3]) & (returns > 0),
+            domain=US_EQUITIES,
+        )
+
+        expected = self.run_pipeline(
+            pipe, self.PIPELINE_START_DATE, self.END_DATE,
+        )
+        self.assertEqual(set(computed_widths), {10})
+
+        del computed_widths[:]
+        result = self.make_engine().run_pipeline(
+            pipe, self.PIPELINE_START_DATE, self.END_DATE,
+        )
+        assert_equal(result, expected)
+
+        # Only the screened assets and the sliced asset are computed.
+        self.assertEqual(set(computed_widths), {4})
+
+    def test_latest_value_screen(self):
+        computed_widths = []
+        _, spread = self.make_factor(computed_widths)
+        screen = TestingDataSet.int_col.latest < 30
+        pipe = Pipeline(
+            columns={'spread': spread},
+            screen=screen,
+            domain=US_EQUITIES,
+        )
+
+        # Compute a single day, so that the screen prunes assets.
+        date = self.PIPELINE_START_DATE
+        expected = self.run_pipeline(pipe, date, date)
+
+        del computed_widths[:]
+        hooks = TestingHooks()
+        result = self.make_engine().run_pipeline(
+            pipe, date, date, hooks=[hooks],
+        )
+        assert_equal(result, expected)
+
+        passed = {asset.sid for asset in result.index.get_level_values(1)}
+        self.assertEqual(computed_widths, [len(passed | {10})])
+
+        # The screen was computed to prune assets, so it isn't recomputed.
+        computed = [
+            call.args[0] for call in hooks.trace
+            if call.method_name == 'computing_term' and call.state == 'enter'
+        ]
+        self.assertNotIn(screen, computed)
+
+    def test_screen_without_asset_local_conjuncts(self):
+        pipe = Pipeline(
+            columns={'float': TestingDataSet.float_col.latest},
+            screen=TestingDataSet.float_col.latest.rank() < 5,
+            domain=US_EQUITIES,
+        )
+        expected = self.run_pipeline(
+            pipe, self.PIPELINE_START_DATE, self.END_DATE,
+        )
+        result = self.make_engine().run_pipeline(
+            pipe, self.PIPELINE_START_DATE, self.END_DATE,
+        )
+        assert_equal(result, expected)
+
+
+class ScreenFirstTestCase(zf.WithSeededRandomPipelineEngine,
+                          zf.ZiplineTestCase):
+
+    PIPELINE_START_DATE = Timestamp('2006-01-05', tz='UTC')
+    END_DATE = Timestamp('2006-03-31', tz='UTC')
+    ASSET_FINDER_COUNTRY_CODE = 'US'
+    ASSET_FINDER_EQUITY_SIDS = list(range(1, 11))
+
+    def make_engine(self, compute_pool=None):
+        loader = self.seeded_random_loader
+        return SimplePipelineEngine(
+            get_loader=lambda column: loader,
+            asset_finder=self.asset_finder,
+            default_domain=US_EQUITIES,
+            compute_pool=compute_pool,
+            screen_first_cost=100,
+        )
+
+    def make_pipeline(self, computed_assets):
+
+        class Expensive(CustomFactor):
+            inputs = [TestingDataSet.float_col]
+            window_length = 5
+            cost = 1000
+
+            def compute(self, today, assets, out, data):
+                computed_assets[type(self).__name__].append(
+                    {int(asset) for asset in assets},
+                )
+                out[:] = data.mean(axis=0)
+
+        class Cheap(Expensive):
+            cost = 1
+
+        expensive = Expensive()
+        return Pipeline(
+            columns={
+                'expensive': expensive,
+                'cheap': Cheap(),
+                'demeaned': expensive.demean(),
+                'float': TestingDataSet.float_col.latest,
+            },
+            screen=TestingDataSet.int_col.latest < 30,
+            domain=US_EQUITIES,
+        )
+
+    @parameterized.expand([
+        ('serial', None),
+        ('sequential_pool', SequentialPool()),
+        ('threads', 4),
+    ])
+    def test_matches_default_engine(self, name, compute_pool):
+        pipe = self.make_pipeline(defaultdict(list))
+        expected = self.run_pipeline(
+            pipe, self.PIPELINE_START_DATE, self.END_DATE,
+        )
+        result = self.make_engine(compute_pool).run_pipeline(
+            pipe, self.PIPELINE_START_DATE, self.END_DATE,
+        )
+        assert_equal(result, expected)
+
+    def make_plan(self, pipe):
+        return pipe.to_execution_plan(
+            US_EQUITIES,
+            AssetExists(),
+            self.PIPELINE_START_DATE,
+            self.END_DATE,
+        )
+
+    def test_screen_first_terms(self):
+        pipe = self.make_pipeline(defaultdict(list))
+        expensive = pipe.columns['expensive']
+
+        # Expensive has a dependent (the demeaned column), so it has to be
+        # computed for every asset in its mask.
+        self.assertEqual(self.make_plan(pipe).screen_first(100), frozenset())
+
+        pipe.remove('demeaned')
+        self.assertEqual(
+            self.make_plan(pipe).screen_first(100),
+            frozenset([expensive]),
+        )
+        self.assertEqual(self.make_plan(pipe).screen_first(10000), frozenset())
+
+    def test_only_terms_with_a_cost_are_screened_first(self):
+
+        class CrossSectional(CustomFactor):
+            inputs = [TestingDataSet.float_col, TestingDataSet.int_col]
+            window_length = 100
+
+            def compute(self, today, assets, out, floats, ints):
+                out[:] = floats.mean(axis=0) - ints.mean()
+
+        sma = SimpleMovingAverage(
+            inputs=[TestingDataSet.float_col],
+            window_length=100,
+        )
+        pipe = Pipeline(
+            columns={'cross_sectional': CrossSectional(), 'sma': sma},
+            screen=TestingDataSet.int_col.latest < 30,
+            domain=US_EQUITIES,
+        )
+
+        # Custom factors can't be computed for just the screened assets
+        # unless they set a cost, but asset-local built-ins estimate one.
+        self.assertIsNone(CrossSectional().cost)
+        self.assertEqual(
+            self.make_plan(pipe).screen_first(100),
+            frozenset([sma]),
+        )
+
+    def test_expensive_terms_skip_screened_assets(self):
+        computed_assets = defaultdict(list)
+        pipe = self.make_pipeline(computed_assets)
+        pipe.remove('demeaned')
+        result = self.make_engine().run_pipeline(
+            pipe, self.PIPELINE_START_DATE, self.END_DATE,
+        )
+
+        sessions = US_EQUITIES.all_sessions()
+        dates = sessions[
+            sessions.slice_indexer(self.PIPELINE_START_DATE, self.END_DATE)
+        ]
+        passed = {date: set() for date in dates}
+        for date, asset in result.index:
+            passed[date].add(asset.sid)
+
+        # Expensive is only computed for the assets that passed the screen
+        # on each day, while Cheap is computed for every asset.
+        self.assertEqual(
+            computed_assets['Expensive'],
+            [passed[date] for date in dates],
+        )
+        self.assertEqual(len(computed_assets['Cheap']), len(dates))
+        for cheap, expensive in zip(computed_assets['Cheap'],
+                                    computed_assets['Expensive']):
+            self.assertLessEqual(expensive, cheap)
+        self.assertGreater(
+            sum(map(len, computed_assets['Cheap'])),
+            sum(map(len, computed_assets['Expensive'])),
+        )
+
+
+class RunPipelinesTestCase(zf.WithSeededRandomPipelineEngine,
+                           zf.ZiplineTestCase):
+
+    PIPELINE_START_DATE = Timestamp('2006-01-05', tz='UTC')
+    END_DATE = Timestamp('2006-03-31', tz='UTC')
+    ASSET_FINDER_COUNTRY_CODE = 'US'
+
+    def make_pipelines(self, screens):
+        float_col = TestingDataSet.float_col
+        return [
+            Pipeline(
+                columns={
+                    'sma': SimpleMovingAverage(
+                        inputs=[float_col],
+                        window_length=window_length,
+                    ),
+                    'ranked': SimpleMovingAverage(
+                        inputs=[float_col],
+                        window_length=window_length,
+                    ).rank(),
+                    'float': float_col.latest,
+                },
+                screen=screen,
+                domain=US_EQUITIES,
+            )
+            for window_length, screen in zip((2, 5, 10), screens)
+        ]
+
+    @parameterized.expand([
+        ('mixed_screens', [
+            None,
+            TestingDataSet.bool_col.latest,
+            TestingDataSet.int_col.latest < 30,
+        ]),
+        ('no_screens', [None, None, None]),
+        ('all_screens', [
+            TestingDataSet.bool_col.latest,
+            TestingDataSet.bool_col.latest,
+            TestingDataSet.int_col.latest < 30,
+        ]),
+    ])
+    def test_matches_run_pipeline(self, name, screens):
+        pipes = self.make_pipelines(screens)
+        hooks = TestingHooks()
+        results = self.run_pipelines(
+            pipes, self.PIPELINE_START_DATE, self.END_DATE, hooks=[hooks],
+        )
+        self.assertEqual(len(results), len(pipes))
+        for pipe, result in zip(pipes, results):
+            assert_equal(
+                result,
+                self.run_pipeline(
+                    pipe, self.PIPELINE_START_DATE, self.END_DATE,
+                ),
+            )
+
+        # Every column is loaded once, no matter how many pipelines use it.
+        loaded = [
+            term
+            for call in hooks.trace
+            if call.method_name == 'loading_terms' and call.state == 'enter'
+            for term in call.args[0]
+        ]
+        self.assertEqual(len(loaded), len(set(loaded)))
+        self.assertEqual(
+            len([t for t in loaded if t.name == 'float_col']),
+            1,
+        )
+
+    def test_no_pipelines(self):
+        self.assertEqual(
+            self.run_pipelines([], self.PIPELINE_START_DATE, self.END_DATE),
+            [],
+        )
+
+    def test_different_domains(self):
+        pipes = [
+            Pipeline({'float': TestingDataSet.float_col.latest},
+                     domain=US_EQUITIES),
+            Pipeline({'float': TestingDataSet.float_col.latest},
+                     domain=JP_EQUITIES),
+        ]
+        with self.assertRaises(ValueError):
+            self.run_pipelines(
+                pipes, self.PIPELINE_START_DATE, self.END_DATE,
+            )
+
+
+class RollingKernelsTestCase(zf.WithSeededRandomPipelineEngine,
+                             zf.ZiplineTestCase):
+
+    PIPELINE_START_DATE = Timestamp('2006-01-05', tz='UTC')
+    END_DATE = Timestamp('2006-03-31', tz='UTC')
+    ASSET_FINDER_COUNTRY_CODE = 'US'
+
+    def make_engine(self, compute_pool):
+        loader = self.seeded_random_loader
+        return SimplePipelineEngine(
+            get_loader=lambda column: loader,
+            asset_finder=self.asset_finder,
+            default_domain=US_EQUITIES,
+            compute_pool=compute_pool,
+            rolling_kernels=True,
+        )
+
+    def make_pipeline(self):
+        float_col = TestingDataSet.float_col
+        mask = TestingDataSet.bool_col.latest
+        bollinger = BollingerBands(inputs=[float_col], window_length=10, k=2)
+        return Pipeline(
+            columns={
+                'sma': SimpleMovingAverage(
+                    inputs=[float_col],
+                    window_length=20,
+                ),
+                'masked_sma': SimpleMovingAverage(
+                    inputs=[float_col],
+                    window_length=20,
+                    mask=mask,
+                ),
+                'ewma': EWMA.from_span(
+                    inputs=[float_col],
+                    window_length=30,
+                    span=15,
+                ),
+                'ewmstd': EWMSTD.from_span(
+                    inputs=[float_col],
+                    window_length=30,
+                    span=15,
+                ),
+                'volatility': AnnualizedVolatility(
+                    inputs=[Returns(inputs=[float_col], window_length=2)],
+                    window_length=20,
+                    mask=mask,
+                ),
+                'lower': bollinger.lower,
+                'middle': bollinger.middle,
+                'upper': bollinger.upper,
+            },
+            domain=US_EQUITIES,
+        )
+
+    @parameter_space(compute_pool=[None, SequentialPool()])
+    def test_rolling_kernels_match_compute(self, compute_pool):
+        pipe = self.make_pipeline()
+        expected = self.run_pipeline(
+            pipe, self.PIPELINE_START_DATE, self.END_DATE,
+        )
+        result = self.make_engine(compute_pool).run_pipeline(
+            pipe, self.PIPELINE_START_DATE, self.END_DATE,
+        )
+        assert_equal(result, expected)
+
+    def test_subclass_overriding_compute_is_not_rolling(self):
+
+        class Doubled(SimpleMovingAverage):
+            def compute(self, today, assets, out, data):
+                out[:] = 2 * data.mean(axis=0)
+
+        sma = SimpleMovingAverage(
+            inputs=[TestingDataSet.float_col],
+            window_length=5,
+        )
+        doubled = Doubled(inputs=[TestingDataSet.float_col], window_length=5)
+        self.assertTrue(sma.can_compute_rolling)
+        self.assertFalse(doubled.can_compute_rolling)
+
+
 class ResolveDomainTestCase(zf.ZiplineTestCase):
 
     def test_resolve_domain(self):
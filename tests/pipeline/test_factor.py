@@ -25,12 +25,20 @@ from numpy import (
 )
 from numpy.random import randn, seed
 import pandas as pd
+from scipy.stats import rankdata
 from scipy.stats.mstats import winsorize as scipy_winsorize
 
 from zipline.errors import BadPercentileBounds, UnknownRankMethod
 from zipline.lib.labelarray import LabelArray
 from zipline.lib.rank import masked_rankdata_2d
-from zipline.lib.normalize import naive_grouped_rowwise_apply as grouped_apply
+from zipline.lib.normalize import (
+    grouped_rowwise_demean,
+    grouped_rowwise_rankdata,
+    grouped_rowwise_zscore,
+    naive_grouped_rowwise_apply as grouped_apply,
+)
+from zipline.lib.quantiles import quantiles
+from zipline.lib.rank import rankdata_1d_descending
 from zipline.pipeline import Classifier, Factor, Filter, Pipeline
 from zipline.pipeline.data import DataSet, Column, EquityPricing
 from zipline.pipeline.factors import (
@@ -1443,6 +1451,70 @@ class ReprTestCase(TestCase):
         self.assertEqual(recursive_repr, "Rank(...)")
 
 
+class GroupedKernelsTestCase(ZiplineTestCase):
+    """Tests for the vectorized kernels in zipline.lib.normalize.
+    """
+
+    def make_data(self, nans):
+        rand = np.random.RandomState(42)
+        # Round so that there are ties for rank to break.
+        data = rand.randn(20, 30).round(1)
+        labels = rand.randint(0, 4, size=data.shape).astype(int64_dtype)
+        if nans:
+            data[rand.uniform(size=data.shape) < 0.2] = nan
+            # Make a whole group NaN.
+            data[0][labels[0] == labels[0, 0]] = nan
+        return data, labels
+
+    @parameter_space(nans=[True, False])
+    def test_demean(self, nans):
+        data, labels = self.make_data(nans)
+        with ignore_nanwarnings():
+            expected = grouped_apply(
+                data,
+                labels,
+                lambda row: row - np.nanmean(row),
+            )
+        check_allclose(grouped_rowwise_demean(data, labels), expected)
+
+    @parameter_space(nans=[True, False])
+    def test_zscore(self, nans):
+        data, labels = self.make_data(nans)
+        with ignore_nanwarnings():
+            expected = grouped_apply(
+                data,
+                labels,
+                lambda row: (row - np.nanmean(row)) / np.nanstd(row),
+            )
+        check_allclose(grouped_rowwise_zscore(data, labels), expected)
+
+    @parameter_space(
+        nans=[True, False],
+        method=['ordinal', 'min', 'max', 'dense', 'average'],
+        ascending=[True, False],
+    )
+    def test_rankdata(self, nans, method, ascending):
+        data, labels = self.make_data(nans)
+        func = rankdata if ascending else rankdata_1d_descending
+        check_arrays(
+            grouped_rowwise_rankdata(data, labels, method, ascending),
+            grouped_apply(data, labels, func, (method,)),
+        )
+
+    def test_rankdata_unknown_method(self):
+        data, labels = self.make_data(nans=False)
+        with self.assertRaises(ValueError):
+            grouped_rowwise_rankdata(data, labels, 'fake')
+
+    @parameter_space(nans=[True, False], bins=[2, 3, 5])
+    def test_quantiles(self, nans, bins):
+        data, _ = self.make_data(nans)
+        # Break ties so that bin edges are unique.
+        data += np.arange(data.shape[1]) * 1e-6
+        expected = apply_along_axis(pd.qcut, 1, data, q=bins, labels=False)
+        check_arrays(quantiles(data, bins), expected.astype(float))
+
+
 class TestWindowSafety(TestCase):
 
     def test_zscore_is_window_safe(self):
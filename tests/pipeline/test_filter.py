@@ -773,6 +773,23 @@ class FilterTestCase(BaseUSEquityPipelineTestCase):
         filter_ = TestFactor() > 3
         self.assertTrue(filter_.window_safe)
 
+    def test_conjuncts(self):
+        f, g = SomeFilter(), Mask()
+        factor, classifier = SomeFactor(), SomeClassifier()
+
+        self.assertEqual(f._conjuncts(), [f])
+        self.assertEqual((f & g)._conjuncts(), [f, g])
+
+        # Only top-level intersections are split.
+        for filter_ in (f | g, ~(f & g), (f & g) | factor.isnan()):
+            self.assertEqual(filter_._conjuncts(), [filter_])
+
+        combined = (factor > 3) & classifier.eq(2) & (f | g)
+        self.assertEqual(
+            combined._conjuncts(),
+            [factor > 3, classifier.eq(2), f | g],
+        )
+
     @parameter_space(
         dtype=('float64', 'datetime64[ns]'),
         seed=(1, 2, 3),
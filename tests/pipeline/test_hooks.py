@@ -1,9 +1,11 @@
+from contextlib import contextmanager
 import itertools
 from operator import attrgetter
 
 import numpy as np
 import pandas as pd
 import toolz
+from interface import implements
 
 from zipline.pipeline import Pipeline
 from zipline.pipeline.classifiers import Everything
@@ -11,6 +13,8 @@ from zipline.pipeline.domain import US_EQUITIES
 from zipline.pipeline.factors import CustomFactor
 from zipline.pipeline.data import Column, DataSet
 from zipline.pipeline.data.testing import TestingDataSet
+from zipline.pipeline.hooks import PipelineHooks
+from zipline.pipeline.hooks.profiling import ProfilingHooks
 from zipline.pipeline.hooks.testing import TestingHooks
 from zipline.pipeline.hooks.progress import (
     ProgressHooks,
@@ -146,8 +150,16 @@ class HooksTestCase(WithSeededRandomPipelineEngine, ZiplineTestCase):
             # happen in dependency order, but we don't bother to assert that
             # here. We just make sure that we see each expected load/compute
             # exactly once.
-            loads_and_computes = ctrace[1:-1]
+            loads_and_computes = [
+                call for call in ctrace[1:-1]
+                if call.method_name != 'on_term_result'
+            ]
+            results = [
+                call for call in ctrace[1:-1]
+                if call.method_name == 'on_term_result'
+            ]
             loads = set()
+            loaded_terms = set()
             computes = set()
             for enter, exit_ in two_at_a_time(loads_and_computes):
                 self.expect_context_pair(enter, exit_, method=None)
@@ -158,6 +170,7 @@ class HooksTestCase(WithSeededRandomPipelineEngine, ZiplineTestCase):
                         self.assertNotIn(loaded_term, loads)
                         # Don't worry about domains here.
                         loads.add(loaded_term.unspecialize())
+                        loaded_terms.add(loaded_term)
                 elif enter.method_name == 'computing_term':
                     computed_term = enter.args[0]
                     self.assertNotIn(computed_term, computes)
@@ -170,6 +183,18 @@ class HooksTestCase(WithSeededRandomPipelineEngine, ZiplineTestCase):
             self.assertEqual(loads, expected_loads)
             self.assertEqual(computes, expected_computes)
 
+            # The result of each loaded or computed term is reported once.
+            self.assertEqual(
+                len(results),
+                len(loaded_terms) + len(computes),
+            )
+            self.assertEqual(
+                {call.args[0] for call in results},
+                loaded_terms | computes,
+            )
+            for call in results:
+                self.assertGreater(call.args[1], 0)
+
     def split_by_chunk(self, trace):
         """
         Split a trace of a chunked pipeline execution into a list of traces for
@@ -201,6 +226,39 @@ class HooksTestCase(WithSeededRandomPipelineEngine, ZiplineTestCase):
             self.assertEqual(enter.call.method_name, method)
 
 
+class MinimalHooks(implements(PipelineHooks)):
+    """Hooks implementing only the context manager methods of PipelineHooks.
+    """
+    @contextmanager
+    def running_pipeline(self, pipeline, start_date, end_date):
+        yield
+
+    @contextmanager
+    def computing_chunk(self, terms, start_date, end_date):
+        yield
+
+    @contextmanager
+    def loading_terms(self, terms):
+        yield
+
+    @contextmanager
+    def computing_term(self, term):
+        yield
+
+
+class DefaultHooksMethodsTestCase(ZiplineTestCase):
+
+    def test_on_workspace_memory_is_optional(self):
+        # Hooks written before on_workspace_memory existed still implement
+        # PipelineHooks.
+        hooks = MinimalHooks()
+        self.assertIsNone(hooks.on_workspace_memory(100, 0))
+
+    def test_on_term_result_is_optional(self):
+        hooks = MinimalHooks()
+        self.assertIsNone(hooks.on_term_result(TrivialFactor(), 100))
+
+
 class ShouldGetSkipped(DataSet):
     """
     Dataset that's only used by PrepopulatedFactor. It should get pruned from
@@ -464,6 +522,185 @@ class ProgressHooksTestCase(WithSeededRandomPipelineEngine, ZiplineTestCase):
         return round((100.0 * days_complete) / total_days, 3)
 
 
+class ProfilingHooksTestCase(WithSeededRandomPipelineEngine, ZiplineTestCase):
+    """Tests for verifying ProfilingHooks.
+    """
+    ASSET_FINDER_COUNTRY_CODE = 'US'
+
+    def run_profiled_pipeline(self, hooks):
+        pipeline = Pipeline(
+            {
+                'bool_': TestingDataSet.bool_col.latest,
+                'factor_rank': TrivialFactor().rank().zscore(),
+            },
+            domain=US_EQUITIES,
+        )
+        start_date, end_date = self.trading_days[[-10, -1]]
+        self.run_chunked_pipeline(
+            pipeline=pipeline,
+            start_date=start_date,
+            end_date=end_date,
+            chunksize=5,
+            hooks=[hooks],
+        )
+        return pipeline, start_date, end_date
+
+    @parameter_space(trace_memory=[True, False])
+    def test_profiling_hooks(self, trace_memory):
+        hooks = ProfilingHooks(trace_memory=trace_memory)
+        pipeline, start_date, end_date = self.run_profiled_pipeline(hooks)
+
+        frame = hooks.to_frame()
+        self.assertEqual(len(frame), len(hooks.records))
+
+        pipeline_rows = frame[frame.event == 'pipeline']
+        self.assertEqual(len(pipeline_rows), 1)
+        self.assertEqual(
+            tuple(pipeline_rows[['start_date', 'end_date']].iloc[0]),
+            (start_date, end_date),
+        )
+
+        chunk_rows = frame[frame.event == 'chunk']
+        self.assertEqual(
+            list(zip(chunk_rows.start_date, chunk_rows.end_date)),
+            [
+                tuple(self.trading_days[[-10, -6]]),
+                tuple(self.trading_days[[-5, -1]]),
+            ],
+        )
+        self.assertLessEqual(
+            chunk_rows.wall_time.sum(),
+            pipeline_rows.wall_time.iloc[0],
+        )
+
+        # Every term is loaded or computed once per chunk.
+        loaded = frame[frame.event == 'load']
+        computed = frame[frame.event == 'compute']
+        expected_loads = set(TrivialFactor.inputs) | {
+            TestingDataSet.bool_col,
+        }
+        expected_computes = {
+            TestingDataSet.bool_col.latest,
+            TrivialFactor(),
+            TrivialFactor().rank(),
+            TrivialFactor().rank().zscore(),
+            Everything(),
+        }
+        self.assertEqual(
+            {t.unspecialize() for t in toolz.concat(loaded.terms)},
+            expected_loads,
+        )
+        self.assertEqual(
+            sorted(computed.terms.map(len).tolist()),
+            [1] * 2 * len(expected_computes),
+        )
+        self.assertEqual(
+            set(toolz.concat(computed.terms)),
+            expected_computes,
+        )
+
+        if trace_memory:
+            self.assertTrue(
+                (computed.peak_bytes >= computed.net_bytes).all()
+            )
+            zscore = TrivialFactor().rank().zscore()
+            zscore_rows = computed[computed.terms.map((zscore,).__eq__)]
+            # zscore allocates at least its float64 output.
+            for bytes_ in zscore_rows.net_bytes:
+                self.assertGreaterEqual(bytes_, 5 * 8)
+        else:
+            self.assertTrue(frame.peak_bytes.isnull().all())
+            self.assertTrue(frame.net_bytes.isnull().all())
+
+        # Loads and computes record the size of their results.
+        outer = frame[frame.event.isin(['pipeline', 'chunk'])]
+        self.assertTrue(outer.result_bytes.isnull().all())
+        for row in loaded.itertuples():
+            # At least a byte per term for each of the chunk's 5 days.
+            self.assertGreaterEqual(row.result_bytes, len(row.terms) * 5)
+        zscore = TrivialFactor().rank().zscore()
+        zscore_rows = computed[computed.terms.map((zscore,).__eq__)]
+        for bytes_ in zscore_rows.result_bytes:
+            # zscore's output is float64, with a row for each of 5 days.
+            self.assertGreater(bytes_, 0)
+            self.assertEqual(bytes_ % (5 * 8), 0)
+
+        # Records accumulate until cleared.
+        self.run_profiled_pipeline(hooks)
+        self.assertEqual(len(hooks.to_frame()), 2 * len(frame))
+        hooks.clear()
+        self.assertEqual(hooks.records, [])
+
+    def test_events_outside_chunk(self):
+        hooks = ProfilingHooks()
+        term = TrivialFactor()
+        with hooks.loading_terms([TestingDataSet.float_col]):
+            pass
+        with hooks.computing_term(term):
+            pass
+        hooks.on_workspace_memory(10, 0)
+
+        hooks.on_term_result(TestingDataSet.float_col, 16)
+        hooks.on_term_result(term, 8)
+
+        frame = hooks.to_frame()
+        self.assertEqual(list(frame.event), ['load', 'compute'])
+        self.assertTrue(frame.start_date.isnull().all())
+        self.assertTrue(frame.end_date.isnull().all())
+        self.assertEqual(list(frame.result_bytes), [16, 8])
+        self.assertEqual(hooks.workspace_memory, [(None, None, 10, 0)])
+
+    def test_folded_stacks(self):
+        hooks = ProfilingHooks(trace_memory=False)
+        self.run_profiled_pipeline(hooks)
+
+        lines = hooks.to_folded().splitlines()
+        stacks = {line.rsplit(' ', 1)[0] for line in lines}
+        self.assertEqual(len(stacks), len(lines))
+        self.assertIn('pipeline', stacks)
+
+        for line in lines:
+            stack, microseconds = line.rsplit(' ', 1)
+            self.assertGreaterEqual(int(microseconds), 0)
+            self.assertEqual(stack.split(';')[0], 'pipeline')
+
+        # Loads and computations are nested directly under their chunk.
+        term_stacks = [
+            s.split(';') for s in stacks
+            if s.split(';')[-1].startswith(('load ', 'compute '))
+        ]
+        self.assertTrue(term_stacks)
+        for stack in term_stacks:
+            self.assertEqual(len(stack), 3)
+            self.assertTrue(stack[1].startswith('chunk '))
+
+    def test_to_dot(self):
+        hooks = ProfilingHooks(trace_memory=False)
+        pipeline, start_date, end_date = self.run_profiled_pipeline(hooks)
+        plan = pipeline.to_execution_plan(
+            US_EQUITIES,
+            AssetExists(),
+            start_date,
+            end_date,
+        )
+
+        times = hooks.term_times()
+        self.assertIn(TrivialFactor(), times)
+        bool_col = TestingDataSet.bool_col.specialize(US_EQUITIES)
+        self.assertIn(bool_col, times)
+
+        source = hooks.to_dot(plan)
+        self.assertTrue(source.startswith('strict digraph G {'))
+        timed_nodes = [
+            line for line in source.splitlines()
+            if 'colorscheme=reds9' in line
+        ]
+        self.assertEqual(
+            len(timed_nodes),
+            len([t for t in plan.graph if t in times]),
+        )
+
+
 class TermReprTestCase(ZiplineTestCase):
 
     def test_htmlsafe_repr(self):
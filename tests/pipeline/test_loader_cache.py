@@ -0,0 +1,47 @@
+"""
+Tests for zipline.pipeline.loaders.cache.
+"""
+from unittest import TestCase
+
+import pandas as pd
+
+from zipline.pipeline.loaders import LoaderCache
+
+
+class LoaderCacheTestCase(TestCase):
+
+    def test_get_contained_dates(self):
+        dates = pd.date_range('2014-01-02', periods=10, tz='UTC')
+        cache = LoaderCache(max_size=100)
+        cache.put('a', dates, 'value', 10)
+
+        self.assertEqual(cache.get('a', dates), ('value', 0))
+        self.assertEqual(cache.get('a', dates[3:7]), ('value', 3))
+        self.assertIsNone(cache.get('b', dates))
+        self.assertIsNone(cache.get('a', dates[::2]))
+        self.assertIsNone(
+            cache.get('a', pd.date_range(dates[5], periods=10, tz='UTC')),
+        )
+
+    def test_evicts_least_recently_used(self):
+        dates = pd.date_range('2014-01-02', periods=10, tz='UTC')
+        cache = LoaderCache(max_size=25)
+        cache.put('a', dates, 'a', 10)
+        cache.put('b', dates, 'b', 10)
+
+        # Touch 'a' so that 'b' is the least recently used.
+        cache.get('a', dates)
+        cache.put('c', dates, 'c', 10)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.size(), 20)
+        self.assertIsNone(cache.get('b', dates))
+        self.assertEqual(cache.get('a', dates), ('a', 0))
+        self.assertEqual(cache.get('c', dates), ('c', 0))
+
+        # Values larger than the cache are never stored.
+        cache.put('d', dates, 'd', 30)
+        self.assertIsNone(cache.get('d', dates))
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.size(), 0)
@@ -0,0 +1,160 @@
+"""
+Tests for zipline.lib.shared_adjusted_array.
+"""
+import pickle
+from unittest import TestCase, skipIf
+
+from numpy import arange, array, datetime64, shares_memory
+
+from zipline.lib.adjusted_array import AdjustedArray
+from zipline.lib.adjustment import Float64Multiply, Float64Overwrite
+from zipline.lib.shared_adjusted_array import (
+    SharedAdjustedArray,
+    shared_memory,
+)
+from zipline.testing import check_arrays
+from zipline.testing.predicates import assert_equal
+
+
+@skipIf(shared_memory is None, 'multiprocessing.shared_memory unavailable')
+class SharedAdjustedArrayTestCase(TestCase):
+
+    def publish(self, adjusted):
+        shared = SharedAdjustedArray.publish(adjusted)
+        self.addCleanup(shared.unlink)
+        return shared
+
+    def test_attach(self):
+        data = arange(30.0).reshape(6, 5)
+        adjustments = {
+            2: [Float64Multiply(0, 2, 0, 1, 2.0)],
+            4: [Float64Overwrite(0, 4, 3, 4, -1.0)],
+        }
+        adjusted = AdjustedArray(data.copy(), adjustments, float('nan'))
+        shared = self.publish(adjusted)
+
+        # Handles pickle without their data.
+        unpickled = pickle.loads(pickle.dumps(shared))
+        self.addCleanup(unpickled.close)
+        self.assertLess(len(pickle.dumps(shared)), data.nbytes)
+
+        attached = unpickled.attach()
+        self.assertFalse(attached.data.flags.writeable)
+        assert_equal(attached.adjustments, adjustments)
+        check_arrays(attached.data, data)
+
+        expected = [window.copy() for window in adjusted.traverse(3)]
+        for copy in (True, False):
+            assert_equal(
+                [window.copy() for window in attached.traverse(3, copy=copy)],
+                expected,
+            )
+
+        # Traversals never adjust the shared data.
+        check_arrays(unpickled.attach().data, data)
+        del attached
+
+    def test_attach_columns(self):
+        data = arange(30.0).reshape(6, 5)
+        adjustments = {4: [Float64Multiply(0, 3, 1, 3, 2.0)]}
+        adjusted = AdjustedArray(data.copy(), adjustments, float('nan'))
+        shared = self.publish(adjusted)
+
+        columns = array([1, 4])
+        attached = shared.attach(columns)
+        self.assertTrue(attached.data.flags.writeable)
+        check_arrays(attached.data, data[:, columns])
+
+        expected = [
+            window[:, columns].copy() for window in adjusted.traverse(3)
+        ]
+        assert_equal(
+            [window.copy() for window in attached.traverse(3, copy=False)],
+            expected,
+        )
+        check_arrays(shared.attach().data, data)
+
+    def test_traverse_copies_on_adjust(self):
+        data = arange(30.0).reshape(6, 5)
+        adjustments = {4: [Float64Multiply(0, 3, 0, 4, 2.0)]}
+        shared = self.publish(AdjustedArray(data, adjustments, float('nan')))
+        attached = shared.attach()
+
+        windows = attached.traverse(2)
+
+        # Windows before the adjustment are views of the shared data.
+        before = [next(windows) for _ in range(3)]
+        for i, window in enumerate(before):
+            self.assertTrue(shares_memory(window, attached.data))
+            check_arrays(window, data[i:i + 2])
+
+        after = list(windows)
+        self.assertFalse(shares_memory(after[0], attached.data))
+        check_arrays(after[0][0], data[3] * 2.0)
+        check_arrays(after[0][1], data[4])
+        check_arrays(after[1], data[4:])
+        check_arrays(attached.data, data)
+        del before, after, window, windows, attached
+
+    def test_traverse_blocks_copies_on_adjust(self):
+        data = arange(30.0).reshape(6, 5)
+        adjustments = {4: [Float64Multiply(0, 3, 0, 4, 2.0)]}
+        shared = self.publish(AdjustedArray(data, adjustments, float('nan')))
+        attached = shared.attach()
+
+        blocks = attached.traverse_blocks(2)
+
+        # Blocks before the adjustment are views of the shared data.
+        first = next(blocks)
+        self.assertTrue(shares_memory(first, attached.data))
+        check_arrays(first, data[:4])
+
+        second = next(blocks)
+        self.assertFalse(shares_memory(second, attached.data))
+        check_arrays(second[0], data[3] * 2.0)
+        check_arrays(second[1:], data[4:])
+        check_arrays(attached.data, data)
+        del first, second, blocks, attached
+
+    def test_dtypes(self):
+        bools = array([[True, False], [False, True]])
+        dates = array(
+            [['2014-01-02', '2014-01-03'], ['2014-01-06', '2014-01-07']],
+            dtype='datetime64[ns]',
+        )
+        for data, missing_value in ((bools, False),
+                                    (dates, datetime64('NaT', 'ns'))):
+            shared = self.publish(AdjustedArray(data, {}, missing_value))
+            attached = shared.attach()
+            self.assertEqual(attached.dtype, data.dtype)
+            check_arrays(attached.data, data)
+            del attached
+
+    def test_categorical(self):
+        adjusted = AdjustedArray(
+            array([['a', 'b'], ['c', 'd']], dtype=object),
+            {},
+            None,
+        )
+        with self.assertRaises(TypeError):
+            SharedAdjustedArray.publish(adjusted)
+
+
+@skipIf(shared_memory is not None, 'multiprocessing.shared_memory available')
+class SharedAdjustedArrayUnavailableTestCase(TestCase):
+
+    def test_requires_shared_memory(self):
+        adjusted = AdjustedArray(arange(4.0).reshape(2, 2), {}, float('nan'))
+
+        with self.assertRaises(NotImplementedError):
+            SharedAdjustedArray.publish(adjusted)
+
+        with self.assertRaises(NotImplementedError):
+            SharedAdjustedArray(
+                'name',
+                (2, 2),
+                adjusted.dtype,
+                {},
+                float('nan'),
+            )
+
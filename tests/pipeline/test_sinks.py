@@ -0,0 +1,117 @@
+"""
+Tests for zipline.pipeline.sinks.
+"""
+from importlib import import_module
+import os
+from unittest import skipIf
+
+from pandas import Timestamp
+
+from zipline.pipeline import Pipeline
+from zipline.pipeline.data.testing import TestingDataSet
+from zipline.pipeline.domain import US_EQUITIES
+from zipline.pipeline.factors import SimpleMovingAverage
+from zipline.pipeline.sinks import (
+    HDF5PipelineSink,
+    ParquetPipelineSink,
+    partition_name,
+    to_storable_frame,
+)
+import zipline.testing.fixtures as zf
+from zipline.testing.predicates import assert_equal
+
+
+def have_parquet_engine():
+    """Whether pandas can write Parquet files.
+    """
+    for name in ('pyarrow', 'fastparquet'):
+        try:
+            import_module(name)
+        except ImportError:
+            continue
+        return True
+    return False
+
+
+def make_pipeline():
+    return Pipeline(
+        columns={
+            'float': TestingDataSet.float_col.latest,
+            'sma': SimpleMovingAverage(
+                inputs=[TestingDataSet.float_col],
+                window_length=10,
+            ),
+            'bool': TestingDataSet.bool_col.latest,
+        },
+        domain=US_EQUITIES,
+    )
+
+
+class HDF5PipelineSinkTestCase(zf.WithSeededRandomPipelineEngine,
+                               zf.WithInstanceTmpDir,
+                               zf.ZiplineTestCase):
+
+    PIPELINE_START_DATE = Timestamp('2006-01-05', tz='UTC')
+    END_DATE = Timestamp('2006-03-31', tz='UTC')
+    ASSET_FINDER_COUNTRY_CODE = 'US'
+
+    def test_write_chunks(self):
+        pipe = make_pipeline()
+        path = os.path.join(self.instance_tmpdir.path, 'results.h5')
+        sink = HDF5PipelineSink(path)
+
+        chunks = list(self.seeded_random_engine.run_pipeline_iter(
+            pipe,
+            self.PIPELINE_START_DATE,
+            self.END_DATE,
+            chunksize=10,
+            sink=sink,
+        ))
+
+        expected = to_storable_frame(self.run_pipeline(
+            pipe, self.PIPELINE_START_DATE, self.END_DATE,
+        ))
+        assert_equal(sink.read().sort_index(), expected.sort_index())
+
+        first = chunks[0].index.get_level_values(0)
+        self.assertEqual(
+            partition_name(first[0], first[-1]),
+            'd20060105_20060119',
+        )
+
+
+@skipIf(not have_parquet_engine(), 'pyarrow or fastparquet is required')
+class ParquetPipelineSinkTestCase(zf.WithSeededRandomPipelineEngine,
+                                  zf.WithInstanceTmpDir,
+                                  zf.ZiplineTestCase):
+
+    PIPELINE_START_DATE = Timestamp('2006-01-05', tz='UTC')
+    END_DATE = Timestamp('2006-03-31', tz='UTC')
+    ASSET_FINDER_COUNTRY_CODE = 'US'
+
+    def test_write_chunks(self):
+        pipe = make_pipeline()
+        path = os.path.join(self.instance_tmpdir.path, 'results')
+        sink = ParquetPipelineSink(path)
+
+        chunks = list(self.seeded_random_engine.run_pipeline_iter(
+            pipe,
+            self.PIPELINE_START_DATE,
+            self.END_DATE,
+            chunksize=10,
+            sink=sink,
+        ))
+
+        # Each chunk is written to its own file.
+        expected_names = []
+        for chunk in chunks:
+            dates = chunk.index.get_level_values(0)
+            expected_names.append(
+                partition_name(dates[0], dates[-1]) + '.parquet',
+            )
+        self.assertEqual(sorted(os.listdir(path)), expected_names)
+
+        expected = to_storable_frame(self.run_pipeline(
+            pipe, self.PIPELINE_START_DATE, self.END_DATE,
+        ))
+        assert_equal(sink.read().sort_index(), expected.sort_index())
@@ -36,13 +36,16 @@ from zipline.pipeline.factors import (
 )
 from zipline.pipeline.factors.statistical import (
     vectorized_beta,
+    vectorized_linear_regression,
     vectorized_pearson_r,
+    vectorized_spearman_r,
 )
 from zipline.pipeline.loaders.frame import DataFrameLoader
 from zipline.pipeline.sentinels import NotSpecified
 from zipline.testing import (
     AssetID,
     AssetIDPlusDay,
+    check_allclose,
     check_arrays,
     make_alternating_boolean_array,
     make_cascading_boolean_array,
@@ -1091,12 +1094,14 @@ class VectorizedCorrelationTestCase(zf.ZiplineTestCase):
         seed=[1, 2, 42],
         nan_offset=[-1, 0, 1],
         nans=['dependent', 'independent', 'both'],
+        method=['pearson', 'spearman'],
         __fail_fast=True,
     )
     def test_produce_nans_when_too_much_missing_data(self,
                                                      seed,
                                                      nans,
-                                                     nan_offset):
+                                                     nan_offset,
+                                                     method):
         rand = np.random.RandomState(seed)
 
         betas = np.array([-0.5, 0.0, 0.5, 1.0, 1.5])
@@ -1117,9 +1122,16 @@ class VectorizedCorrelationTestCase(zf.ZiplineTestCase):
         if nans == 'independent' or nans == 'both':
             independents[10 + nan_offset:15 + nan_offset][nan_grid] = np.nan
 
-        expected = self.naive_columnwise_pearson(dependents, independents)
+        if method == 'pearson':
+            naive_func = self.naive_columnwise_pearson
+            vectorized_func = vectorized_pearson_r
+        else:
+            naive_func = self.naive_columnwise_spearman
+            vectorized_func = vectorized_spearman_r
+
+        expected = naive_func(dependents, independents)
         for allowed_missing in list(range(7)) + [10000]:
-            results = vectorized_pearson_r(
+            results = vectorized_func(
                 dependents, independents, allowed_missing
             )
             for i, result in enumerate(results):
@@ -1143,3 +1155,105 @@ class VectorizedCorrelationTestCase(zf.ZiplineTestCase):
         # array with the column tiled 3 times.
         do_check(_independent)
         do_check(np.tile(_independent, 3))
+
+    @parameter_space(seed=[1, 2, 42])
+    def test_spearman_matches_scipy_with_ties(self, seed):
+        rand = np.random.RandomState(seed)
+
+        # Round to a small number of distinct values so that every column has
+        # ties in both inputs.
+        dependents = rand.randint(0, 5, (30, 5)).astype(float64_dtype)
+        independents = rand.randint(0, 5, (30, 5)).astype(float64_dtype)
+
+        result = vectorized_spearman_r(
+            dependents, independents, allowed_missing=0,
+        )
+        expected = self.naive_columnwise_spearman(dependents, independents)
+        check_allclose(result, expected)
+
+
+class VectorizedRegressionTestCase(zf.ZiplineTestCase):
+
+    def naive_columnwise_regression(self, dependents, independents):
+        out = np.recarray(
+            dependents.shape[1],
+            formats=[float64_dtype.str] * 5,
+            names=['alpha', 'beta', 'r_value', 'p_value', 'stderr'],
+        )
+        independents = np.broadcast_arrays(independents, dependents)[0]
+        for col in range(dependents.shape[1]):
+            y = dependents[:, col]
+            x = independents[:, col]
+            missing = np.isnan(y) | np.isnan(x)
+            slope, intercept, r, p, stderr = linregress(
+                x=x[~missing], y=y[~missing],
+            )[:5]
+            out[col] = (intercept, slope, r, p, stderr)
+        return out
+
+    @parameter_space(seed=[1, 2, 42], broadcast=[True, False])
+    def test_matches_linregress(self, seed, broadcast):
+        rand = np.random.RandomState(seed)
+
+        betas = np.array([-0.5, 0.0, 0.5, 1.0, 1.5])
+        independents = as_column(rand.uniform(-5, 5, 30))
+        if not broadcast:
+            independents = independents + rand.uniform(-1, 1, (30, 5))
+        noise = rand.uniform(-2, 2, (30, 5))
+        dependents = 1.0 + betas * independents + noise
+
+        result = vectorized_linear_regression(
+            dependents, independents, allowed_missing=0,
+        )
+        expected = self.naive_columnwise_regression(dependents, independents)
+        for field in expected.dtype.names:
+            check_allclose(result[field], expected[field], err_msg=field)
+
+    def test_produce_nans_when_too_much_missing_data(self):
+        rand = np.random.RandomState(42)
+
+        independents = rand.uniform(-5, 5, (30, 5))
+        dependents = 2.0 * independents + rand.uniform(-2, 2, (30, 5))
+
+        # Column i has i + 1 missing values, split between the two inputs.
+        nan_grid = np.array([[1, 1, 1, 1, 1],
+                             [0, 1, 1, 1, 1],
+                             [0, 0, 1, 1, 1],
+                             [0, 0, 0, 1, 1],
+                             [0, 0, 0, 0, 1]], dtype=bool)
+        dependents[10:15][nan_grid & (arange(5) % 2 == 0)] = nan
+        independents[10:15][nan_grid & (arange(5) % 2 == 1)] = nan
+
+        expected = self.naive_columnwise_regression(dependents, independents)
+        for allowed_missing in list(range(7)) + [10000]:
+            result = vectorized_linear_regression(
+                dependents, independents, allowed_missing,
+            )
+            for i in range(5):
+                for field in expected.dtype.names:
+                    if i + 1 > allowed_missing:
+                        self.assertTrue(np.isnan(result[field][i]))
+                    else:
+                        np.testing.assert_allclose(
+                            result[field][i],
+                            expected[field][i],
+                            err_msg=field,
+                        )
+
+    def test_out(self):
+        independents = as_column(np.array([1.0, 2.0, 3.0, 4.0, 5.0]))
+        dependents = 1.0 + independents * [2.5, 1.0, -3.5]
+
+        out = np.recarray(
+            3,
+            formats=[float64_dtype.str] * 5,
+            names=['alpha', 'beta', 'r_value', 'p_value', 'stderr'],
+        )
+        result = vectorized_linear_regression(
+            dependents, independents, allowed_missing=0, out=out,
+        )
+        self.assertIs(result, out)
+        assert_equal(out.alpha, np.array([1.0, 1.0, 1.0]))
+        assert_equal(out.beta, np.array([2.5, 1.0, -3.5]))
+        assert_equal(out.r_value, np.array([1.0, 1.0, -1.0]))
+        assert_equal(out.stderr, np.array([0.0, 0.0, 0.0]))
@@ -19,8 +19,10 @@ from nose_parameterized import parameterized
 from numpy import (
     arange,
     datetime64,
+    float32,
     float64,
     ones,
+    shares_memory,
     uint32,
 )
 from numpy.testing import (
@@ -43,6 +45,7 @@ from zipline.pipeline.loaders.synthetic import (
     make_bar_data,
     expected_bar_values_2d,
 )
+from zipline.pipeline.loaders import LoaderCache
 from zipline.pipeline.loaders.equity_pricing_loader import (
     USEquityPricingLoader,
 )
@@ -58,6 +61,7 @@ from zipline.testing.fixtures import (
     WithAdjustmentReader,
     ZiplineTestCase,
 )
+from zipline.testing.predicates import assert_equal
 
 # Test calendar ranges over the month of June 2015
 #      June 2015
@@ -656,3 +660,104 @@ class USEquityPricingLoaderTestCase(WithAdjustmentReader,
             highs.traverse(windowlen + 1)
         with self.assertRaises(WindowLengthTooLong):
             volumes.traverse(windowlen + 1)
+
+    def test_float32_storage(self):
+        columns = [USEquityPricing.high, USEquityPricing.volume]
+        query_days = self.calendar_days_between(
+            TEST_QUERY_START,
+            TEST_QUERY_STOP
+        )
+        sids = Int64Index(arange(1, 7))
+        mask = ones((len(query_days), 6), dtype=bool)
+
+        def load(float32_storage):
+            loader = USEquityPricingLoader.without_fx(
+                self.bcolz_equity_daily_bar_reader,
+                self.adjustment_reader,
+                float32_storage=float32_storage,
+            )
+            results = loader.load_adjusted_array(
+                domain=US_EQUITIES,
+                columns=columns,
+                dates=query_days,
+                sids=sids,
+                mask=mask,
+            )
+            return map(getitem(results), columns)
+
+        highs, volumes = load(float32_storage=False)
+        highs32, volumes32 = load(float32_storage=True)
+
+        # Only float64 columns are stored as float32.
+        self.assertEqual(highs32.data.dtype, float32)
+        self.assertEqual(volumes32.data.dtype, volumes.data.dtype)
+
+        windowlen = len(query_days) // 2
+        for window, window32 in zip(highs.traverse(windowlen),
+                                    highs32.traverse(windowlen)):
+            self.assertEqual(window32.dtype, float64)
+            assert_allclose(window32, window, rtol=1e-6)
+
+    def test_cache(self):
+        columns = [USEquityPricing.high, USEquityPricing.volume]
+        query_days = self.calendar_days_between(
+            TEST_QUERY_START,
+            TEST_QUERY_STOP
+        )
+        sids = Int64Index(arange(1, 7))
+        cache = LoaderCache(max_size=1 << 20)
+
+        def load(dates, cache=None, data_version=None):
+            loader = USEquityPricingLoader.without_fx(
+                self.bcolz_equity_daily_bar_reader,
+                self.adjustment_reader,
+                cache=cache,
+                data_version=data_version,
+            )
+            return loader.load_adjusted_array(
+                domain=US_EQUITIES,
+                columns=columns,
+                dates=dates,
+                sids=sids,
+                mask=ones((len(dates), len(sids)), dtype=bool),
+            )
+
+        first = load(query_days, cache)
+        self.assertEqual(len(cache), len(columns))
+
+        # Loading the same data again reuses the cached baselines.
+        second = load(query_days, cache)
+        self.assertEqual(len(cache), len(columns))
+        for c in columns:
+            self.assertTrue(shares_memory(first[c].data, second[c].data))
+            assert_equal(second[c].adjustments, first[c].adjustments)
+
+        # Every subrange of the cached dates is served from the cache, with
+        # the same values and adjustments as an uncached load.
+        for start in range(len(query_days)):
+            for stop in range(start + 1, len(query_days) + 1):
+                dates = query_days[start:stop]
+                cached = load(dates, cache)
+                expected = load(dates)
+                for c in columns:
+                    self.assertTrue(
+                        shares_memory(cached[c].data, first[c].data),
+                    )
+                    assert_array_equal(cached[c].data, expected[c].data)
+                    assert_equal(
+                        cached[c].adjustments,
+                        expected[c].adjustments,
+                    )
+                    assert_equal(
+                        [w.copy() for w in cached[c].traverse(1, copy=False)],
+                        [w.copy() for w in expected[c].traverse(1)],
+                    )
+        self.assertEqual(len(cache), len(columns))
+
+        # Traversals never mutate cached baselines.
+        assert_array_equal(load(query_days, cache)[columns[0]].data,
+                           load(query_days)[columns[0]].data)
+
+        # Data loaded for another data version isn't reused.
+        load(query_days, cache, data_version='other')
+        self.assertEqual(len(cache), 2 * len(columns))
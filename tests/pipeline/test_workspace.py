@@ -0,0 +1,87 @@
+"""
+Tests for zipline.pipeline.workspace.
+"""
+import os
+
+import numpy as np
+
+from zipline.lib.adjusted_array import AdjustedArray
+from zipline.lib.adjustment import Float64Multiply
+from zipline.lib.labelarray import LabelArray
+from zipline.pipeline.workspace import SpillingWorkspace
+import zipline.testing.fixtures as zf
+from zipline.testing.predicates import assert_equal
+
+
+class SpillingWorkspaceTestCase(zf.WithInstanceTmpDir, zf.ZiplineTestCase):
+
+    def make_workspace(self, memory_budget, initial=()):
+        return SpillingWorkspace(
+            memory_budget,
+            initial,
+            directory=self.instance_tmpdir.path,
+        )
+
+    def test_spills_least_recently_used(self):
+        a = np.arange(10.0)
+        b = np.arange(10.0, 20.0)
+        c = np.arange(20.0, 30.0)
+
+        # Room for two of the three arrays.
+        with self.make_workspace(2 * a.nbytes) as workspace:
+            workspace['a'] = a
+            workspace['b'] = b
+            self.assertEqual(workspace.spilled_bytes, 0)
+
+            # Touch 'a' so that 'b' is the least recently used.
+            workspace['a']
+            workspace['c'] = c
+            self.assertEqual(workspace.spilled_bytes, b.nbytes)
+            self.assertEqual(workspace.resident_bytes, 2 * a.nbytes)
+            self.assertEqual(workspace.peak_resident_bytes, 3 * a.nbytes)
+
+            self.assertEqual(sorted(workspace), ['a', 'b', 'c'])
+            self.assertEqual(len(workspace), 3)
+
+            # Reading 'b' brings it back into memory and spills 'a'.
+            assert_equal(workspace['b'], b)
+            assert_equal(workspace['a'], a)
+            assert_equal(workspace['c'], c)
+
+            del workspace['a']
+            self.assertNotIn('a', workspace)
+
+        # Closing the workspace deletes any spilled arrays.
+        self.assertEqual(os.listdir(self.instance_tmpdir.path), [])
+
+    def test_adjusted_arrays(self):
+        data = np.arange(20.0).reshape(10, 2)
+        adjustments = {3: [Float64Multiply(0, 3, 0, 1, 2.0)]}
+        adjusted = AdjustedArray(data.copy(), adjustments, np.nan)
+
+        with self.make_workspace(1) as workspace:
+            workspace['adjusted'] = adjusted
+            workspace['other'] = np.zeros(5)
+            self.assertEqual(workspace.spilled_bytes, data.nbytes)
+
+            reloaded = workspace['adjusted']
+            self.assertIsNot(reloaded, adjusted)
+            self.assertIs(reloaded.adjustments, adjustments)
+            assert_equal(
+                [window.copy() for window in reloaded.traverse(3)],
+                [window.copy() for window in adjusted.traverse(3)],
+            )
+
+    def test_unspillable_values(self):
+        labels = LabelArray(['a', 'b', 'c'], missing_value=None)
+        objects = np.array(['a', 'b', 'c'], dtype=object)
+
+        with self.make_workspace(1) as workspace:
+            workspace['labels'] = labels
+            workspace['objects'] = objects
+            workspace['floats'] = np.zeros(5)
+
+            # Values that can't be written to disk stay in memory.
+            self.assertEqual(workspace.spilled_bytes, 0)
+            self.assertIs(workspace['labels'], labels)
+            self.assertIs(workspace['objects'], objects)
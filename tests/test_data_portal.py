@@ -398,6 +398,31 @@ class DataPortalTestBase(WithDataPortal,
         ]
         assert_almost_equal(expected.values.tolist(), result)
 
+    @parameter_space(data_frequency=['daily', 'minute'])
+    def test_get_spot_value_multiple_assets_matches_single(self,
+                                                           data_frequency):
+        trading_calendar = self.trading_calendars[Equity]
+        assets = self.asset_finder.retrieve_all(self.ASSET_FINDER_EQUITY_SIDS)
+
+        for session in self.trading_days[:4]:
+            dts = trading_calendar.minutes_for_session(session)
+            for dt in dts[[0, 1, 100, -1]]:
+                for field in sorted(OHLCV_FIELDS) + ['price']:
+                    expected = [
+                        self.data_portal.get_spot_value(
+                            asset, field, dt, data_frequency,
+                        )
+                        for asset in assets
+                    ]
+                    result = self.data_portal.get_spot_value(
+                        assets, field, dt, data_frequency,
+                    )
+                    assert_almost_equal(
+                        result,
+                        expected,
+                        err_msg='field=%s, dt=%s' % (field, dt),
+                    )
+
     @parameter_space(data_frequency=['daily', 'minute'],
                      field=['close', 'price'])
     def test_get_adjustments(self, data_frequency, field):
@@ -1672,6 +1672,49 @@ class NoPrefetchMinuteEquityHistoryTestCase(MinuteEquityHistoryTestCase):
     DATA_PORTAL_DAILY_HISTORY_PREFETCH = 0
 
 
+class PreloadedMinuteEquityHistoryTestCase(MinuteEquityHistoryTestCase):
+    """Run the minute history tests against preloaded history buffers.
+    """
+    def make_data_portal(self):
+        data_portal = super(
+            PreloadedMinuteEquityHistoryTestCase,
+            self,
+        ).make_data_portal()
+        assets = self.asset_finder.retrieve_all(range(1, 9))
+        data_portal.preload_history(assets, 1000, '1m')
+        data_portal.preload_history(assets, 100, '1d')
+        return data_portal
+
+    def test_preloaded_minute_window_is_view(self):
+        assets = self.asset_finder.retrieve_all(range(1, 9))
+        minutes = self.trading_calendar.minutes_for_session(
+            pd.Timestamp('2015-01-06', tz='UTC'),
+        )
+        loader = self.data_portal._minute_history_loader
+        unbuffered_portal = super(
+            PreloadedMinuteEquityHistoryTestCase,
+            self,
+        ).make_data_portal()
+
+        for minute in minutes[30:33]:
+            window_minutes = self.trading_calendar.minutes_window(minute, -30)
+            window = loader.history(assets, window_minutes, 'close', False)
+            self.assertFalse(window.flags.writeable)
+
+            expected = unbuffered_portal.get_history_window(
+                assets,
+                minute,
+                30,
+                '1m',
+                'close',
+                'minute',
+            )
+            np.testing.assert_array_equal(window, expected.values)
+
+        with self.assertRaises(ValueError):
+            self.data_portal.preload_history(assets, 10, '5m')
+
+
 class DailyEquityHistoryTestCase(WithHistory, zf.ZiplineTestCase):
     CREATE_BARDATA_DATA_FREQUENCY = 'daily'
 
@@ -2170,6 +2213,22 @@ class NoPrefetchDailyEquityHistoryTestCase(DailyEquityHistoryTestCase):
     DATA_PORTAL_DAILY_HISTORY_PREFETCH = 0
 
 
+class PreloadedDailyEquityHistoryTestCase(DailyEquityHistoryTestCase):
+    """Run the daily history tests against preloaded history buffers.
+    """
+    def make_data_portal(self):
+        data_portal = super(
+            PreloadedDailyEquityHistoryTestCase,
+            self,
+        ).make_data_portal()
+        data_portal.preload_history(
+            self.asset_finder.retrieve_all([1, 2, 3, 4, 5, 6, 8]),
+            100,
+            '1d',
+        )
+        return data_portal
+
+
 class MinuteEquityHistoryFuturesCalendarTestCase(MinuteEquityHistoryTestCase):
     TRADING_CALENDAR_STRS = ('NYSE', 'us_futures')
     TRADING_CALENDAR_PRIMARY_CAL = 'us_futures'
@@ -1,3 +1,4 @@
+import gc
 from itertools import product
 from operator import eq, ne
 import warnings
@@ -5,7 +6,7 @@ import warnings
 import numpy as np
 from toolz import take
 
-from zipline.lib.labelarray import LabelArray
+from zipline.lib.labelarray import LabelArray, _category_results
 from zipline.testing import check_arrays, parameter_space, ZiplineTestCase
 from zipline.testing.predicates import assert_equal
 from zipline.utils.compat import unicode
@@ -145,6 +146,61 @@ class LabelArrayTestCase(ZiplineTestCase):
         expected = LabelArray([missing, 'C', 'D'], missing_value=missing)
         assert_equal(result.as_string_array(), expected.as_string_array())
 
+    def test_predicate_results_cached_per_categories(self):
+        la = LabelArray(self.strs, missing_value='')
+        calls = []
+
+        def startswith_a(s):
+            calls.append(s)
+            return s.startswith('a')
+
+        expected = la.startswith('a')
+        for arr in la, la[1:], la[:, ::2], la.empty_like((2, 2)):
+            check_arrays(
+                arr.map_predicate(startswith_a, cache_key='a'),
+                arr.startswith('a'),
+            )
+        # startswith_a was only called once per non-missing category.
+        self.assertEqual(sorted(calls), ['a', 'ab', 'b', 'z'])
+        check_arrays(la.startswith('a'), expected)
+
+        # Arrays with different categories don't share results.
+        other = LabelArray(self.strs[:, :2], missing_value='')
+        check_arrays(
+            other.map_predicate(startswith_a, cache_key='a'),
+            other.startswith('a'),
+        )
+        self.assertEqual(len(calls), 4 + len(other.categories) - 1)
+
+    def test_category_results_dropped_with_categories(self):
+        _category_results.clear()
+        la = LabelArray(self.strs, missing_value='')
+        la.has_substring('b')
+        self.assertEqual(len(_category_results), 1)
+
+        del la
+        gc.collect()
+        self.assertEqual(len(_category_results), 0)
+
+    def test_map_cached_per_categories(self):
+        la = LabelArray(self.strs, missing_value=None)
+        calls = []
+
+        def f(s):
+            calls.append(s)
+            return s.upper()
+
+        first = la.map(f, cache_key=f)
+        second = la[1:].map(f, cache_key=f)
+        self.assertEqual(len(calls), len(la.categories) - 1)
+
+        # Results of a cached map share their categories.
+        self.assertIs(first.categories, second.categories)
+        assert_equal(
+            second.as_string_array(),
+            np.vectorize(f)(self.strs[1:]),
+        )
+
     @parameter_space(
         __fail_fast=True,
         f=[
@@ -382,15 +382,16 @@ cdef class BarData:
                 # assume assets is iterable
                 # return a Series indexed by asset
                 if not self._adjust_minutes:
-                    return pd.Series(data={
-                        asset: self.data_portal.get_spot_value(
-                                    asset,
-                                    field,
-                                    self._get_current_minute(),
-                                    self.data_frequency
-                               )
-                        for asset in assets
-                        }, index=assets, name=fields)
+                    return pd.Series(
+                        self.data_portal.get_spot_value(
+                            assets,
+                            field,
+                            self._get_current_minute(),
+                            self.data_frequency
+                        ),
+                        index=assets,
+                        name=fields,
+                    )
                 else:
                     return pd.Series(data={
                         asset: self.data_portal.get_adjusted_value(
@@ -409,15 +410,16 @@ cdef class BarData:
 
                 if not self._adjust_minutes:
                     for field in fields:
-                        series = pd.Series(data={
-                            asset: self.data_portal.get_spot_value(
-                                        asset,
-                                        field,
-                                        self._get_current_minute(),
-                                        self.data_frequency
-                                   )
-                            for asset in assets
-                            }, index=assets, name=field)
+                        series = pd.Series(
+                            self.data_portal.get_spot_value(
+                                assets,
+                                field,
+                                self._get_current_minute(),
+                                self.data_frequency
+                            ),
+                            index=assets,
+                            name=field,
+                        )
                         data[field] = series
                 else:
                     for field in fields:
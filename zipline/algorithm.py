@@ -2036,6 +2036,35 @@ class TradingAlgorithm(object):
 
             return window
 
+    @api_method
+    def preload_history(self, assets, bar_count, frequency='1m'):
+        """Keep rolling history buffers for a fixed set of assets.
+
+        Calls to ``data.history`` for these assets, with at most
+        ``bar_count`` bars of the given frequency, are served from buffers
+        which move forward with the simulation instead of being reloaded for
+        every call.
+
+        Parameters
+        ----------
+        assets : iterable[zipline.assets.Asset]
+            The assets whose history will be requested.
+        bar_count : int
+            The maximum number of bars which will be requested.
+        frequency : {'1m', '1d'}, optional
+            The frequency of the history which will be requested.
+
+        Notes
+        -----
+        Windows of ``frequency='1m'`` for all of the preloaded assets, in the
+        order they were preloaded, are read-only views of the buffers, which
+        change as the simulation moves forward. Copy them to keep them across
+        bars.
+
+        Continuous futures can't be preloaded.
+        """
+        self.data_portal.preload_history(assets, bar_count, frequency)
+
     ####################
     # Account Controls #
     ####################
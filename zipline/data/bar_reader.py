@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from abc import ABCMeta, abstractmethod, abstractproperty
+
+import numpy as np
 from six import with_metaclass
 
 
@@ -125,6 +127,51 @@ class BarReader(with_metaclass(ABCMeta, object)):
         """
         pass
 
+    def get_values(self, sids, dt, field):
+        """
+        Retrieve the values of a field for many sids at the same dt.
+
+        The default implementation calls ``get_value`` for each sid.
+        Readers which can look up all of the sids at once should override
+        it.
+
+        Parameters
+        ----------
+        sids : iterable[int]
+            The asset identifiers.
+        dt : pd.Timestamp
+            The timestamp for the desired data points.
+        field : string
+            The OHLVC name for the desired data points.
+
+        Returns
+        -------
+        values : np.array[float64|uint32]
+            The value for each sid at ``dt``. OHLC values are float64 and
+            volumes are uint32. Sids with no data at ``dt``, e.g. because
+            ``dt`` is outside of their lifetime, have a value of nan for
+            OHLC, and 0 for volume.
+
+        Raises
+        ------
+        NoDataOnDate
+            If the given dt is not a valid market minute (in minute mode) or
+            session (in daily mode) according to this reader's tradingcalendar.
+        """
+        if field == 'volume':
+            missing, dtype = 0, np.uint32
+        else:
+            missing, dtype = np.nan, np.float64
+
+        values = []
+        for sid in sids:
+            try:
+                values.append(self.get_value(sid, dt, field))
+            except (NoDataBeforeDate, NoDataAfterDate):
+                values.append(missing)
+
+        return np.array(values, dtype=dtype)
+
     @abstractmethod
     def get_last_traded_dt(self, asset, dt):
         """
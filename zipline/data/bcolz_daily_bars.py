@@ -705,6 +705,54 @@ class BcolzDailyBarReader(CurrencyAwareSessionBarReader):
         else:
             return price
 
+    def get_values(self, sids, dt, field):
+        """
+        Parameters
+        ----------
+        sids : iterable[int]
+            The asset identifiers.
+        dt : datetime64-like
+            Midnight of the day for which data is requested.
+        field : string
+            The price field. e.g. ('open', 'high', 'low', 'close', 'volume')
+
+        Returns
+        -------
+        np.array[float64|uint32]
+            The spot value of ``field`` for each sid on the given day. Sids
+            which did not exist on ``dt``, or which are not in the table, get
+            nan for prices and 0 for volume.
+            Raises a NoDataOnDate exception if the given day is not in the
+            table's calendar.
+        """
+        day_loc = self._load_raw_arrays_date_to_index(dt)
+        sids = np.asarray(sids, dtype='int64')
+
+        try:
+            first_rows, last_rows, _ = self._compute_slices(
+                day_loc,
+                day_loc,
+                sids,
+            )
+        except ValueError:
+            # None of the sids are in the table.
+            first_rows = last_rows = full(len(sids), -1, dtype=np.intp)
+
+        # For a single day query, a sid has a row iff the day is within its
+        # lifetime, in which case first_rows == last_rows.
+        has_row = (first_rows != -1) & (first_rows <= last_rows)
+
+        out = np.zeros(len(sids), dtype=uint32_dtype)
+        if has_row.any():
+            out[has_row] = self._spot_col(field)[first_rows[has_row]]
+
+        if field == 'volume':
+            return out
+
+        prices = out.astype(float64_dtype)
+        prices[out == 0] = nan
+        return prices * self.PRICE_ADJUSTMENT_FACTOR
+
     def currency_codes(self, sids):
         # XXX: This is pretty inefficient. This reader doesn't really support
         # country codes, so we always either return USD or None if we don't
@@ -12,6 +12,7 @@ from toolz import curry, complement, take
 
 from ..adjustments import SQLiteAdjustmentReader, SQLiteAdjustmentWriter
 from ..bcolz_daily_bars import BcolzDailyBarReader, BcolzDailyBarWriter
+from ..hdf5_minute_bars import HDF5MinuteBarReader, HDF5MinuteBarWriter
 from ..minute_bars import (
     BcolzMinuteBarReader,
     BcolzMinuteBarWriter,
@@ -45,6 +46,13 @@ def minute_equity_path(bundle_name, timestr, environ=None):
     )
 
 
+def minute_equity_hdf5_path(bundle_name, timestr, environ=None):
+    return pth.data_path(
+        minute_equity_hdf5_relative(bundle_name, timestr),
+        environ=environ,
+    )
+
+
 def daily_equity_path(bundle_name, timestr, environ=None):
     return pth.data_path(
         daily_equity_relative(bundle_name, timestr),
@@ -82,6 +90,10 @@ def minute_equity_relative(bundle_name, timestr):
     return bundle_name, timestr, 'minute_equities.bcolz'
 
 
+def minute_equity_hdf5_relative(bundle_name, timestr):
+    return bundle_name, timestr, 'minute_equities.h5'
+
+
 def asset_db_relative(bundle_name, timestr, db_version=None):
     db_version = ASSET_DB_VERSION if db_version is None else db_version
 
@@ -137,7 +149,8 @@ RegisteredBundle = namedtuple(
      'end_session',
      'minutes_per_day',
      'ingest',
-     'create_writers']
+     'create_writers',
+     'minute_bar_format']
 )
 
 BundleData = namedtuple(
@@ -227,7 +240,8 @@ def _make_bundle_core():
                  start_session=None,
                  end_session=None,
                  minutes_per_day=390,
-                 create_writers=True):
+                 create_writers=True,
+                 minute_bar_format='bcolz'):
         """Register a data bundle ingest function.
 
         Parameters
@@ -241,7 +255,7 @@ def _make_bundle_core():
                   The environment this is being run with.
               asset_db_writer : AssetDBWriter
                   The asset db writer to write into.
-              minute_bar_writer : BcolzMinuteBarWriter
+              minute_bar_writer : BcolzMinuteBarWriter or HDF5MinuteBarWriter
                   The minute bar writer to write into.
               daily_bar_writer : BcolzDailyBarWriter
                   The daily bar writer to write into.
@@ -277,6 +291,12 @@ def _make_bundle_core():
             Should the ingest machinery create the writers for the ingest
             function. This can be disabled as an optimization for cases where
             they are not needed, like the ``quantopian-quandl`` bundle.
+        minute_bar_format : {'bcolz', 'hdf5'}, optional
+            The format in which to store minute bars. 'bcolz' writes a
+            directory per sid with a BcolzMinuteBarWriter. 'hdf5' writes a
+            single file with an array per field across all sids with an
+            HDF5MinuteBarWriter, which is faster to read for many sids at
+            once. Default is 'bcolz'.
 
         Notes
         -----
@@ -292,6 +312,13 @@ def _make_bundle_core():
         --------
         zipline.data.bundles.bundles
         """
+        if minute_bar_format not in ('bcolz', 'hdf5'):
+            raise ValueError(
+                'minute_bar_format must be one of {%r, %r}, got %r' % (
+                    'bcolz', 'hdf5', minute_bar_format,
+                )
+            )
+
         if name in bundles:
             warnings.warn(
                 'Overwriting bundle with name %r' % name,
@@ -309,6 +336,7 @@ def _make_bundle_core():
             minutes_per_day=minutes_per_day,
             ingest=f,
             create_writers=create_writers,
+            minute_bar_format=minute_bar_format,
         )
         return f
 
@@ -402,13 +430,23 @@ def _make_bundle_core():
                 # that it can compute the adjustment ratios for the dividends.
 
                 daily_bar_writer.write(())
-                minute_bar_writer = BcolzMinuteBarWriter(
-                    wd.ensure_dir(*minute_equity_relative(name, timestr)),
-                    calendar,
-                    start_session,
-                    end_session,
-                    minutes_per_day=bundle.minutes_per_day,
-                )
+                if bundle.minute_bar_format == 'hdf5':
+                    minute_bar_writer = HDF5MinuteBarWriter(
+                        wd.getpath(
+                            *minute_equity_hdf5_relative(name, timestr)
+                        ),
+                        calendar,
+                        start_session,
+                        end_session,
+                    )
+                else:
+                    minute_bar_writer = BcolzMinuteBarWriter(
+                        wd.ensure_dir(*minute_equity_relative(name, timestr)),
+                        calendar,
+                        start_session,
+                        end_session,
+                        minutes_per_day=bundle.minutes_per_day,
+                    )
                 assets_db_path = wd.getpath(*asset_db_relative(name, timestr))
                 asset_db_writer = AssetDBWriter(assets_db_path)
 
@@ -511,13 +549,24 @@ def _make_bundle_core():
         if timestamp is None:
             timestamp = pd.Timestamp.utcnow()
         timestr = most_recent_data(name, timestamp, environ=environ)
+
+        hdf5_minute_path = minute_equity_hdf5_path(
+            name,
+            timestr,
+            environ=environ,
+        )
+        if os.path.exists(hdf5_minute_path):
+            minute_bar_reader = HDF5MinuteBarReader.from_path(hdf5_minute_path)
+        else:
+            minute_bar_reader = BcolzMinuteBarReader(
+                minute_equity_path(name, timestr, environ=environ),
+            )
+
         return BundleData(
             asset_finder=AssetFinder(
                 asset_db_path(name, timestr, environ=environ),
             ),
-            equity_minute_bar_reader=BcolzMinuteBarReader(
-                minute_equity_path(name, timestr, environ=environ),
-            ),
+            equity_minute_bar_reader=minute_bar_reader,
             equity_daily_bar_reader=BcolzDailyBarReader(
                 daily_equity_path(name, timestr, environ=environ),
             ),
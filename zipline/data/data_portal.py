@@ -524,17 +524,81 @@ class DataPortal(object):
                 data_frequency,
             )
         else:
-            get_single_asset_value = self._get_single_asset_value
-            return [
-                get_single_asset_value(
+            return self._get_multi_asset_values(
+                session_label,
+                assets,
+                field,
+                dt,
+                data_frequency,
+            )
+
+    def _get_multi_asset_values(self,
+                                session_label,
+                                assets,
+                                field,
+                                dt,
+                                data_frequency):
+        """
+        Get the spot values of ``field`` for many assets.
+
+        OHLCV values for live assets are read from the pricing reader with a
+        single ``get_values`` call. Everything else, including prices which
+        need to be forward filled, goes through ``_get_single_asset_value``.
+        """
+        assets = list(assets)
+        values = [None] * len(assets)
+
+        if field in OHLCV_FIELDS or field == 'price':
+            augmented_sources_map = self._augmented_sources_map
+            batch_ixs = [
+                i for i, asset in enumerate(assets)
+                if isinstance(asset, Asset) and
+                not self._is_extra_source(
+                    asset, field, augmented_sources_map) and
+                asset.start_date <= dt and
+                session_label <= asset.end_date
+            ]
+        else:
+            batch_ixs = []
+
+        if batch_ixs:
+            column = 'close' if field == 'price' else field
+            query_dt = session_label if data_frequency == 'daily' else dt
+            reader = self._get_pricing_reader(data_frequency)
+            try:
+                batch_values = reader.get_values(
+                    [assets[i].sid for i in batch_ixs],
+                    query_dt,
+                    column,
+                ).tolist()
+            except NoDataOnDate:
+                # Leave every asset to the single asset path, which decides
+                # what a missing value is.
+                batch_values = []
+
+            for i, value in zip(batch_ixs, batch_values):
+                # Missing prices need to be forward filled, and daily readers
+                # report a missing bar as a volume of 0 where the single asset
+                # path reports nan. Both are done one asset at a time.
+                if field == 'price' and isnull(value):
+                    continue
+                if data_frequency == 'daily' and column == 'volume' and \
+                        value == 0:
+                    continue
+                values[i] = value
+
+        get_single_asset_value = self._get_single_asset_value
+        for i, value in enumerate(values):
+            if value is None:
+                values[i] = get_single_asset_value(
                     session_label,
-                    asset,
+                    assets[i],
                     field,
                     dt,
                     data_frequency,
                 )
-                for asset in assets
-            ]
+
+        return values
 
     def get_scalar_asset_spot_value(self, asset, field, dt, data_frequency):
         """
@@ -912,6 +976,33 @@ class DataPortal(object):
             columns=assets
         )
 
+    def preload_history(self, assets, bar_count, frequency):
+        """
+        Keep rolling buffers of history for a fixed set of assets.
+
+        History windows of up to ``bar_count`` bars for these assets, at the
+        given frequency, are then read from buffers which move forward by the
+        bars since the last window, rather than from per-asset sliding
+        windows which are rebuilt for every window length.
+
+        Parameters
+        ----------
+        assets : list of zipline.data.Asset objects
+            The assets whose history will be requested.
+
+        bar_count: int
+            The maximum number of bars which will be requested.
+
+        frequency: string
+            "1d" or "1m"
+        """
+        if frequency == "1m":
+            self._minute_history_loader.preload(assets, bar_count)
+        elif frequency == "1d":
+            self._history_loader.preload(assets, bar_count)
+        else:
+            raise ValueError("Invalid frequency: {0}".format(frequency))
+
     def get_history_window(self,
                            assets,
                            end_dt,
@@ -979,6 +1070,9 @@ class DataPortal(object):
         if field == "price":
             if frequency == "1m":
                 ffill_data_frequency = 'minute'
+                # Preloaded minute windows are read-only views of the
+                # history buffers.
+                df = df.copy()
             elif frequency == "1d":
                 ffill_data_frequency = 'daily'
             else:
@@ -96,11 +96,21 @@ class AssetDispatchBarReader(with_metaclass(ABCMeta)):
         r = self._readers[type(asset)]
         return r.get_value(asset, dt, field)
 
+    def get_values(self, sids, dt, field):
+        sid_groups, out_pos = self._group_by_asset_type(sids)
+
+        out = self._make_raw_array_out(field, len(sids))
+        for t, group in iteritems(sid_groups):
+            if group:
+                out[out_pos[t]] = self._readers[t].get_values(group, dt, field)
+
+        return out
+
     def get_last_traded_dt(self, asset, dt):
         r = self._readers[type(asset)]
         return r.get_last_traded_dt(asset, dt)
 
-    def load_raw_arrays(self, fields, start_dt, end_dt, sids):
+    def _group_by_asset_type(self, sids):
         asset_types = self._asset_types
         sid_groups = {t: [] for t in asset_types}
         out_pos = {t: [] for t in asset_types}
@@ -112,6 +122,12 @@ class AssetDispatchBarReader(with_metaclass(ABCMeta)):
             sid_groups[t].append(asset)
             out_pos[t].append(i)
 
+        return sid_groups, out_pos
+
+    def load_raw_arrays(self, fields, start_dt, end_dt, sids):
+        asset_types = self._asset_types
+        sid_groups, out_pos = self._group_by_asset_type(sids)
+
         batched_arrays = {
             t: self._readers[t].load_raw_arrays(fields,
                                                 start_dt,
@@ -815,6 +815,50 @@ class HDF5DailyBarReader(CurrencyAwareSessionBarReader):
 
         return value
 
+    def get_values(self, sids, dt, field):
+        """
+        Retrieve the values of a field for many sids on the same day.
+
+        Parameters
+        ----------
+        sids : iterable[int]
+            The asset identifiers.
+        dt : pd.Timestamp
+            The timestamp for the desired data points.
+        field : string
+            The OHLVC name for the desired data points.
+
+        Returns
+        -------
+        values : np.array[float64|uint32]
+            The value for each sid on ``dt``. Sids which are unknown, or
+            which have no data on ``dt``, get nan for OHLC and 0 for volume.
+
+        Raises
+        ------
+        NoDataOnDate
+            If the given dt is not a valid session according to this reader's
+            trading calendar.
+        """
+        self._validate_timestamp(dt)
+        dt_ix = self.dates.searchsorted(dt.asm8)
+
+        sid_selector = self._make_sid_selector(np.asarray(sids, dtype='int64'))
+        known = sid_selector[sid_selector != -1]
+
+        # Read the smallest span of sids which covers all the requested sids,
+        # with an extra empty entry at the end for the unknown sids to select.
+        if len(known):
+            start, stop = known.min(), known.max() + 1
+        else:
+            start = stop = 0
+        buf = np.zeros(stop - start + 1, dtype=np.uint32)
+        if stop > start:
+            buf[:-1] = self._country_group[DATA][field][start:stop, dt_ix]
+
+        selector = np.where(sid_selector == -1, -1, sid_selector - start)
+        return self._postprocessors[field](buf[selector])
+
     def get_last_traded_dt(self, asset, dt):
         """
         Get the latest day on or before ``dt`` in which ``asset`` traded.
@@ -1043,6 +1087,33 @@ class MultiCountryDailyBarReader(CurrencyAwareSessionBarReader):
             )
         return self._readers[country_code].get_value(sid, dt, field)
 
+    def get_values(self, sids, dt, field):
+        """
+        Retrieve the values of a field for many sids on the same day.
+
+        Parameters
+        ----------
+        sids : iterable[int]
+            The asset identifiers.
+        dt : pd.Timestamp
+            The timestamp for the desired data points.
+        field : string
+            The OHLVC name for the desired data points.
+
+        Returns
+        -------
+        values : np.array[float64|uint32]
+            The value for each sid on ``dt``.
+
+        Raises
+        ------
+        NoDataOnDate
+            If the given dt is not a valid session according to this reader's
+            trading calendar.
+        """
+        country_code = self._country_code_for_assets(sids)
+        return self._readers[country_code].get_values(sids, dt, field)
+
     def get_last_traded_dt(self, asset, dt):
         """
         Get the latest day on or before ``dt`` in which ``asset`` traded.
@@ -0,0 +1,675 @@
+"""
+HDF5 Minute Pricing File Format
+-------------------------------
+Minute bars for every sid in a dataset are stored in a single HDF5 file, with
+one 2D dataset per field. Unlike the bcolz minute format, which writes a
+directory of carrays per sid, a cross-sectional read of many sids is a single
+slice of each field's dataset.
+
+``/data``
+^^^^^^^^^
+Each field (OHLCV) is stored in a dataset as a 2D array, with a row per
+trading minute and a column per sid. The datasets are chunked in blocks of
+``date_chunk_size`` sessions by ``sid_chunk_size`` sids, so reading a window of
+minutes for many adjacent sids decompresses a small number of large chunks.
+
+Values are stored as uint32, scaled by the ``scaling_factor`` attribute of
+each dataset. A value of 0 means that no trade happened in that minute.
+
+.. code-block:: none
+
+   /data
+     /open
+     /high
+     /low
+     /close
+     /volume
+
+``/index``
+^^^^^^^^^^
+Contains two datasets, the index of trading minutes (aligned to the rows of
+the OHLCV 2D arrays) and the index of sids (aligned to the columns of the
+OHLCV 2D arrays) to use for lookups.
+
+Sids are stored in the order in which they were written, which need not be
+sorted.
+
+.. code-block:: none
+
+   /index
+     /minute
+     /sid
+
+The file's attributes hold the format version, the name of the trading
+calendar, and the first and last sessions of the dataset.
+"""
+import h5py
+import logbook
+import numpy as np
+import pandas as pd
+from trading_calendars import get_calendar
+
+from zipline.data.bar_reader import NoDataForSid, NoDataOnDate
+from zipline.data.hdf5_daily_bars import (
+    CLOSE,
+    DATA,
+    FIELDS,
+    HIGH,
+    INDEX,
+    LOW,
+    OPEN,
+    SCALING_FACTOR,
+    SID,
+    VOLUME,
+    convert_price_with_scaling_factor,
+)
+from zipline.data.minute_bars import MinuteBarReader, OHLC_RATIO, convert_cols
+from zipline.utils.cli import maybe_show_progress
+from zipline.utils.memoize import lazyval
+
+
+log = logbook.Logger('HDF5MinuteBars')
+
+VERSION = 0
+
+MINUTE = 'minute'
+
+CALENDAR_NAME = 'calendar_name'
+START_SESSION = 'start_session'
+END_SESSION = 'end_session'
+
+DEFAULT_DATE_CHUNK_SIZE = 21
+DEFAULT_SID_CHUNK_SIZE = 64
+
+#: Size in bytes of the chunk cache of each field's dataset, when opening a
+#: file with ``HDF5MinuteBarReader.from_path``. This holds 8 chunks of the
+#: default size (21 sessions of 390 minutes by 64 sids of uint32 values, about
+#: 2MB), where the HDF5 default of 1MB can't cache any.
+DEFAULT_CHUNK_CACHE_SIZE = 16 * 2 ** 20
+
+#: Number of slots in the hash table of each chunk cache. HDF5 recommends a
+#: prime about 100 times the number of chunks that fit in the cache.
+DEFAULT_CHUNK_CACHE_SLOTS = 1009
+
+
+class HDF5MinuteBarWriter(object):
+    """
+    Class capable of writing minute OHLCV data to disk in a format that
+    can be read efficiently by HDF5MinuteBarReader.
+
+    The layout of the file is created when the writer is constructed, so a
+    reader can be opened on the file even if no data is written.
+
+    Parameters
+    ----------
+    filename : str
+        The location at which we should write our output.
+    calendar : trading_calendars.TradingCalendar
+        The trading calendar on which to base the minute bars.
+    start_session : pd.Timestamp
+        The first trading session in the data set.
+    end_session : pd.Timestamp
+        The last trading session in the data set.
+    date_chunk_size : int, optional
+        The number of sessions per chunk in the HDF5 file.
+    sid_chunk_size : int, optional
+        The number of sids per chunk in the HDF5 file. This is also the
+        number of sids which are buffered in memory before being written.
+    ohlc_ratio : int, optional
+        The ratio by which to multiply the pricing data to convert from
+        floats to integers that fit within np.uint32. Default is
+        OHLC_RATIO (1000).
+
+    See Also
+    --------
+    zipline.data.hdf5_minute_bars.HDF5MinuteBarReader
+    """
+    def __init__(self,
+                 filename,
+                 calendar,
+                 start_session,
+                 end_session,
+                 date_chunk_size=DEFAULT_DATE_CHUNK_SIZE,
+                 sid_chunk_size=DEFAULT_SID_CHUNK_SIZE,
+                 ohlc_ratio=OHLC_RATIO):
+        self._filename = filename
+        self._calendar = calendar
+        self._start_session = start_session
+        self._end_session = end_session
+        self._date_chunk_size = date_chunk_size
+        self._sid_chunk_size = sid_chunk_size
+        self._ohlc_ratio = ohlc_ratio
+
+        self._minutes = calendar.minutes_for_sessions_in_range(
+            start_session,
+            end_session,
+        ).asi8
+
+        with self.h5_file(mode='a') as h5_file:
+            if DATA not in h5_file:
+                self._write_layout(h5_file)
+
+    def h5_file(self, mode):
+        return h5py.File(self._filename, mode)
+
+    def write(self, data, show_progress=False, invalid_data_behavior='warn'):
+        """Write a stream of minute data.
+
+        Parameters
+        ----------
+        data : iterable[(int, pd.DataFrame)]
+            The data to write. Each element should be a tuple of sid, data
+            where data has the following format:
+              columns : ('open', 'high', 'low', 'close', 'volume')
+                  open : float64
+                  high : float64
+                  low  : float64
+                  close : float64
+                  volume : float64|int64
+              index : DatetimeIndex of market minutes.
+            Unlike BcolzMinuteBarWriter, a sid may only appear once in
+            ``data``, and may not already be in the file.
+        show_progress : bool, optional
+            Whether or not to show a progress bar while writing.
+        invalid_data_behavior : {'warn', 'raise', 'ignore'}, optional
+            What to do when data cannot be converted to uint32.
+
+        Raises
+        ------
+        ValueError
+            If a sid is written more than once, or if the index of a frame
+            contains minutes which are not trading minutes of the calendar.
+        """
+        ctx = maybe_show_progress(
+            data,
+            show_progress=show_progress,
+            item_show_func=lambda e: e if e is None else str(e[0]),
+            label="Merging minute equity files:",
+        )
+        with self.h5_file(mode='a') as h5_file, ctx as it:
+            batch = []
+            for sid, df in it:
+                batch.append((sid, df))
+                if len(batch) == self._sid_chunk_size:
+                    self._write_batch(h5_file, batch, invalid_data_behavior)
+                    batch = []
+
+            if batch:
+                self._write_batch(h5_file, batch, invalid_data_behavior)
+
+    def _write_layout(self, h5_file):
+        """Write the file attributes and the empty /index and /data groups.
+        """
+        h5_file.attrs['version'] = VERSION
+        h5_file.attrs[CALENDAR_NAME] = self._calendar.name
+        h5_file.attrs[START_SESSION] = self._start_session.value
+        h5_file.attrs[END_SESSION] = self._end_session.value
+
+        index_group = h5_file.create_group(INDEX)
+        self._log_writing_dataset(index_group)
+
+        # h5py does not support datetimes, so they need to be stored
+        # as integers.
+        index_group.create_dataset(MINUTE, data=self._minutes)
+        index_group.create_dataset(
+            SID,
+            shape=(0,),
+            maxshape=(None,),
+            dtype='int64',
+            chunks=(self._sid_chunk_size,),
+        )
+
+        n_minutes = len(self._minutes)
+        n_sessions = len(self._calendar.sessions_in_range(
+            self._start_session,
+            self._end_session,
+        ))
+        minutes_per_session = -(-n_minutes // max(n_sessions, 1))
+        minutes_per_chunk = self._date_chunk_size * minutes_per_session
+        chunks = (
+            max(min(minutes_per_chunk, n_minutes), 1),
+            self._sid_chunk_size,
+        )
+
+        data_group = h5_file.create_group(DATA)
+        self._log_writing_dataset(data_group)
+
+        for field in FIELDS:
+            dataset = data_group.create_dataset(
+                field,
+                shape=(n_minutes, 0),
+                maxshape=(n_minutes, None),
+                dtype='uint32',
+                chunks=chunks,
+                compression='lzf',
+                shuffle=True,
+                fillvalue=0,
+            )
+            self._log_writing_dataset(dataset)
+
+            dataset.attrs[SCALING_FACTOR] = (
+                1 if field == VOLUME else self._ohlc_ratio
+            )
+
+    def _minute_positions(self, sid, dts):
+        """
+        Get the rows of /data at which to write the minutes ``dts`` for
+        ``sid``.
+        """
+        positions = self._minutes.searchsorted(dts)
+        in_range = positions < len(self._minutes)
+        if not in_range.all() or (self._minutes[positions] != dts).any():
+            raise ValueError(
+                'Data for sid {} contains minutes which are not trading '
+                'minutes of {} between {} and {}.'.format(
+                    sid,
+                    self._calendar.name,
+                    self._start_session.date(),
+                    self._end_session.date(),
+                )
+            )
+        if (np.diff(positions) <= 0).any():
+            raise ValueError(
+                'Minutes for sid {} are not strictly increasing.'.format(sid)
+            )
+        return positions
+
+    def _write_batch(self, h5_file, batch, invalid_data_behavior):
+        """
+        Append a block of columns to each field's dataset, one for each
+        (sid, df) pair in ``batch``.
+        """
+        sids = np.array([sid for sid, _ in batch], dtype='int64')
+        sid_dataset = h5_file[INDEX][SID]
+        all_sids, counts = np.unique(
+            np.concatenate([sid_dataset[:], sids]),
+            return_counts=True,
+        )
+        duplicated = all_sids[counts > 1]
+        if len(duplicated):
+            raise ValueError(
+                'Sids may only be written once, got duplicates: {}'.format(
+                    duplicated,
+                )
+            )
+
+        positions = []
+        values = []
+        for sid, df in batch:
+            positions.append(
+                self._minute_positions(sid, df.index.values.view('int64')),
+            )
+            values.append(
+                convert_cols(
+                    {field: df[field].values for field in FIELDS},
+                    self._ohlc_ratio,
+                    sid,
+                    invalid_data_behavior,
+                )
+            )
+
+        start = len(sid_dataset)
+        stop = start + len(sids)
+        sid_dataset.resize((stop,))
+        sid_dataset[start:stop] = sids
+
+        # Only write the block of rows containing data. Everything else is
+        # left at the fill value of 0.
+        nonempty = [p for p in positions if len(p)]
+        if nonempty:
+            first_row = min(p[0] for p in nonempty)
+            last_row = max(p[-1] for p in nonempty) + 1
+        else:
+            first_row = last_row = 0
+        buf = np.zeros((last_row - first_row, len(sids)), dtype=np.uint32)
+
+        for field_ix, field in enumerate(FIELDS):
+            dataset = h5_file[DATA][field]
+            dataset.resize(stop, axis=1)
+            if not len(buf):
+                continue
+
+            buf.fill(0)
+            for col, (rows, cols) in enumerate(zip(positions, values)):
+                buf[rows - first_row, col] = cols[field_ix]
+
+            dataset[first_row:last_row, start:stop] = buf
+
+        log.debug(
+            'Wrote minute bars for {} sids to file {}',
+            len(sids), self._filename,
+        )
+
+    def _log_writing_dataset(self, dataset):
+        log.debug("Writing {} to file {}", dataset.name, self._filename)
+
+
+class HDF5MinuteBarReader(MinuteBarReader):
+    """
+    Reader for data written by HDF5MinuteBarWriter.
+
+    Parameters
+    ----------
+    h5_file : h5py.File
+        An HDF5 minute pricing file.
+
+    Notes
+    -----
+    ``load_raw_arrays`` reads a single block of columns spanning all of the
+    requested sids for each field, so it is fastest when the requested sids
+    were written near each other, e.g. when data is written in sid order.
+
+    See Also
+    --------
+    zipline.data.hdf5_minute_bars.HDF5MinuteBarWriter
+    """
+    def __init__(self, h5_file):
+        self._h5_file = h5_file
+
+        attrs = h5_file.attrs
+        self.calendar = get_calendar(attrs[CALENDAR_NAME])
+        self._start_session = pd.Timestamp(attrs[START_SESSION], tz='UTC')
+        self._end_session = pd.Timestamp(attrs[END_SESSION], tz='UTC')
+
+        self._scaling_factors = {
+            field: h5_file[DATA][field].attrs[SCALING_FACTOR]
+            for field in FIELDS
+        }
+        self._ohlc_inverses = {
+            field: 1.0 / self._scaling_factors[field]
+            for field in (OPEN, HIGH, LOW, CLOSE)
+        }
+
+    @classmethod
+    def from_file(cls, h5_file):
+        """
+        Construct from an h5py.File.
+
+        Parameters
+        ----------
+        h5_file : h5py.File
+            An HDF5 minute pricing file.
+        """
+        if h5_file.attrs['version'] != VERSION:
+            raise ValueError(
+                'mismatched version: file is of version %s, expected %s' % (
+                    h5_file.attrs['version'],
+                    VERSION,
+                ),
+            )
+
+        return cls(h5_file)
+
+    @classmethod
+    def from_path(cls,
+                  path,
+                  chunk_cache_size=DEFAULT_CHUNK_CACHE_SIZE,
+                  chunk_cache_slots=DEFAULT_CHUNK_CACHE_SLOTS):
+        """
+        Construct from a file path.
+
+        Parameters
+        ----------
+        path : str
+            The path to an HDF5 minute pricing file.
+        chunk_cache_size : int, optional
+            Size in bytes of the chunk cache of each field. Chunks larger than
+            the cache are decompressed again on every read, so this should
+            hold at least a few chunks of the file.
+        chunk_cache_slots : int, optional
+            Number of slots in the hash table of each chunk cache.
+        """
+        return cls.from_file(
+            h5py.File(
+                path,
+                'r',
+                rdcc_nbytes=chunk_cache_size,
+                rdcc_nslots=chunk_cache_slots,
+            ),
+        )
+
+    @property
+    def trading_calendar(self):
+        return self.calendar
+
+    @lazyval
+    def last_available_dt(self):
+        _, close = self.calendar.open_and_close_for_session(self._end_session)
+        return close
+
+    @property
+    def first_trading_day(self):
+        return self._start_session
+
+    @lazyval
+    def minutes(self):
+        return self._h5_file[INDEX][MINUTE][:].astype('datetime64[ns]')
+
+    @lazyval
+    def sids(self):
+        return self._h5_file[INDEX][SID][:].astype('int64', copy=False)
+
+    @lazyval
+    def _sid_sorter(self):
+        return self.sids.argsort(kind='mergesort')
+
+    def _column_indices(self, sids):
+        """
+        Get the column of /data holding each sid in ``sids``.
+
+        Parameters
+        ----------
+        sids : list[int]
+            The sids to look up.
+
+        Returns
+        -------
+        columns : np.array[int64]
+            The column for each sid. Sids which are not in the file have a
+            column of -1.
+        """
+        sids = np.asarray(sids, dtype='int64')
+        if not len(self.sids):
+            return np.full(len(sids), -1, dtype='int64')
+
+        sorted_sids = self.sids[self._sid_sorter]
+        ixs = sorted_sids.searchsorted(sids).clip(max=len(sorted_sids) - 1)
+        found = sorted_sids[ixs] == sids
+        return np.where(found, self._sid_sorter[ixs], -1)
+
+    def _minute_position(self, dt):
+        """
+        Get the row of /data for the minute ``dt``.
+
+        Raises
+        ------
+        NoDataOnDate
+            If ``dt`` is not a trading minute in the file.
+        """
+        pos = self.minutes.searchsorted(dt.asm8)
+        if pos == len(self.minutes) or self.minutes[pos] != dt.asm8:
+            raise NoDataOnDate(dt)
+        return pos
+
+    def _postprocess(self, field, values):
+        if field == VOLUME:
+            return values
+
+        return convert_price_with_scaling_factor(
+            values,
+            self._scaling_factors[field],
+        )
+
+    def load_raw_arrays(self, fields, start_dt, end_dt, sids):
+        """
+        Parameters
+        ----------
+        fields : list of str
+           'open', 'high', 'low', 'close', or 'volume'
+        start_dt: Timestamp
+           Beginning of the window range.
+        end_dt: Timestamp
+           End of the window range.
+        sids : list of int
+           The asset identifiers in the window.
+
+        Returns
+        -------
+        list of np.ndarray
+            A list with an entry per field of ndarrays with shape
+            (minutes in range, sids) with a dtype of float64, containing the
+            values for the respective field over start and end dt range.
+        """
+        start_ix = self.minutes.searchsorted(start_dt.asm8)
+        end_ix = self.minutes.searchsorted(end_dt.asm8, side='right')
+        n_minutes = max(end_ix - start_ix, 0)
+
+        columns = self._column_indices(sids)
+        known = columns[columns != -1]
+        if len(known):
+            first_col, last_col = known.min(), known.max() + 1
+        else:
+            first_col = last_col = 0
+
+        # Read the block of columns spanning all of the requested sids into
+        # a buffer with an extra column, which is always empty. Unknown sids
+        # select that column, which fills them with "null" values.
+        buf = np.zeros(
+            (n_minutes, last_col - first_col + 1),
+            dtype=np.uint32,
+        )
+        selector = np.where(columns == -1, -1, columns - first_col)
+
+        out = []
+        for field in fields:
+            if n_minutes and len(known):
+                self._h5_file[DATA][field].read_direct(
+                    buf,
+                    np.s_[start_ix:end_ix, first_col:last_col],
+                    np.s_[:, :-1],
+                )
+            out.append(self._postprocess(field, buf[:, selector]))
+
+        return out
+
+    def get_value(self, sid, dt, field):
+        """
+        Retrieve the pricing info for the given sid, dt, and field.
+
+        Parameters
+        ----------
+        sid : int
+            Asset identifier.
+        dt : datetime-like
+            The datetime at which the trade occurred.
+        field : string
+            The type of pricing data to retrieve.
+            ('open', 'high', 'low', 'close', 'volume')
+
+        Returns
+        -------
+        out : float|int
+
+        The market data for the given sid, dt, and field coordinates.
+
+        For OHLC:
+            Returns a float if a trade occurred at the given dt.
+            If no trade occurred, a np.nan is returned.
+
+        For volume:
+            Returns the integer value of the volume.
+            (A volume of 0 signifies no trades for the given dt.)
+        """
+        pos = self._minute_position(dt)
+
+        col = self._column_indices([sid])[0]
+        if col == -1:
+            raise NoDataForSid('No minute data for sid {}.'.format(sid))
+
+        value = self._h5_file[DATA][field][pos, col]
+        if value == 0:
+            if field == VOLUME:
+                return 0
+            else:
+                return np.nan
+
+        if field != VOLUME:
+            value *= self._ohlc_inverses[field]
+        return value
+
+    def get_values(self, sids, dt, field):
+        """
+        Retrieve the pricing info for many sids at the given dt.
+
+        Parameters
+        ----------
+        sids : iterable[int]
+            Asset identifiers.
+        dt : datetime-like
+            The datetime at which the trades occurred.
+        field : string
+            The type of pricing data to retrieve.
+            ('open', 'high', 'low', 'close', 'volume')
+
+        Returns
+        -------
+        out : np.array[float64|uint32]
+            The market data for each sid at the given dt. Sids which are not
+            in the file, or which did not trade at ``dt``, get nan for OHLC
+            and 0 for volume.
+        """
+        pos = self._minute_position(dt)
+
+        columns = self._column_indices(sids)
+        known = columns[columns != -1]
+        if len(known):
+            first_col, last_col = known.min(), known.max() + 1
+        else:
+            first_col = last_col = 0
+
+        # Read the span of the row covering all of the requested sids, with
+        # an extra empty entry for unknown sids to select.
+        buf = np.zeros(last_col - first_col + 1, dtype=np.uint32)
+        if len(known):
+            buf[:-1] = self._h5_file[DATA][field][pos, first_col:last_col]
+        selector = np.where(columns == -1, -1, columns - first_col)
+
+        return self._postprocess(field, buf[selector])
+
+    def get_last_traded_dt(self, asset, dt):
+        """
+        Get the latest minute on or before ``dt`` in which ``asset`` traded.
+
+        If there are no trades on or before ``dt``, returns ``pd.NaT``.
+
+        Parameters
+        ----------
+        asset : zipline.asset.Asset
+            The asset for which to get the last traded minute.
+        dt : pd.Timestamp
+            The minute at which to start searching for the last traded minute.
+
+        Returns
+        -------
+        last_traded : pd.Timestamp
+            The minute of the last trade for the given asset, using the input
+            dt as a vantage point.
+        """
+        col = self._column_indices([asset.sid])[0]
+        if col == -1:
+            raise NoDataForSid('No minute data for sid {}.'.format(asset.sid))
+
+        volumes = self._h5_file[DATA][VOLUME]
+        start = self.minutes.searchsorted(asset.start_date.asm8)
+        stop = self.minutes.searchsorted(dt.asm8, side='right')
+
+        # Search backwards one chunk of minutes at a time.
+        step = volumes.chunks[0]
+        while stop > start:
+            lo = max(start, stop - step)
+            traded = np.flatnonzero(volumes[lo:stop, col])
+            if len(traded):
+                return pd.Timestamp(self.minutes[lo + traded[-1]], tz='UTC')
+            stop = lo
+
+        return pd.NaT
@@ -18,12 +18,13 @@ from abc import (
     abstractproperty,
 )
 
+import numpy as np
 from numpy import concatenate
 from lru import LRU
 from pandas import isnull
 from toolz import sliding_window
 
-from six import with_metaclass
+from six import iteritems, with_metaclass
 
 from zipline.assets import Equity, Future
 from zipline.assets.continuous_futures import ContinuousFuture
@@ -293,6 +294,199 @@ class SlidingWindow(object):
         return self.current
 
 
+class HistoryRingBuffer(object):
+    """
+    Rolling window of the most recent bars of one field for a fixed set of
+    assets.
+
+    The last ``max_lookback`` bars are kept in a ring, which is stored twice
+    back to back so that every window of up to ``max_lookback`` bars ending
+    at the latest bar is a contiguous slice. The buffer moves forward by
+    writing the new bars over the oldest ones, and adjustments are applied
+    in place when the buffer reaches their effective dates, so windows are
+    views of the buffer and never need to be reloaded.
+
+    Parameters
+    ----------
+    calendar : pd.DatetimeIndex
+        The dts of the bars which can be loaded.
+    load : callable
+        Function of a slice of ``calendar`` returning an array of raw data
+        with a row per dt and a column per asset.
+    num_assets : int
+        The number of assets in the buffer.
+    max_lookback : int
+        The longest window which can be read from the buffer.
+    adjustments : list[tuple[int, int, float]]
+        Tuples of ``(loc, column, ratio)``, sorted by ``loc``. Each one
+        multiplies the bars before ``calendar[loc]`` in ``column`` by
+        ``ratio``.
+    decimals : list[int]
+        The number of decimal places to which to round the values of each
+        asset.
+    perspective_offset : int
+        1 if windows are viewed after their last bar, so adjustments dated
+        on the bar after the window are also applied, otherwise 0. See
+        ``HistoryLoader.history``.
+    prefetch_length : int
+        The number of bars to load ahead of the latest bar requested.
+    """
+    def __init__(self,
+                 calendar,
+                 load,
+                 num_assets,
+                 max_lookback,
+                 adjustments,
+                 decimals,
+                 perspective_offset,
+                 prefetch_length):
+        self._calendar = calendar
+        self._load = load
+        self._max_lookback = max_lookback
+        self._perspective_offset = perspective_offset
+        self._prefetch_length = prefetch_length
+
+        # Adjusted values, and the same values rounded for the output.
+        shape = (2 * max_lookback, num_assets)
+        self._values = np.full(shape, np.nan)
+        self._rounded = np.full(shape, np.nan)
+
+        self._adjustment_locs = np.array(
+            [loc for loc, _, _ in adjustments],
+            dtype=np.int64,
+        )
+        self._adjustment_columns = [column for _, column, _ in adjustments]
+        self._adjustment_ratios = [ratio for _, _, ratio in adjustments]
+        self._next_adjustment = 0
+
+        decimal_columns = {}
+        for column, places in enumerate(decimals):
+            decimal_columns.setdefault(places, []).append(column)
+        self._decimals = np.array(decimals, dtype=np.int64)
+        self._decimal_groups = list(iteritems(decimal_columns))
+
+        # Raw bars loaded ahead of the latest bar in the buffer.
+        self._prefetched = None
+        self._prefetched_start_ix = None
+
+        self.latest_ix = None
+
+    def _round(self, values):
+        if len(self._decimal_groups) == 1:
+            return values.round(self._decimal_groups[0][0])
+
+        out = np.empty_like(values)
+        for places, columns in self._decimal_groups:
+            out[:, columns] = values[:, columns].round(places)
+        return out
+
+    def _raw_bars(self, start_ix, end_ix):
+        prefetched = self._prefetched
+        if (prefetched is None or
+                start_ix < self._prefetched_start_ix or
+                end_ix >= self._prefetched_start_ix + len(prefetched)):
+            load_end_ix = min(
+                max(end_ix, start_ix + self._prefetch_length),
+                len(self._calendar) - 1,
+            )
+            prefetched = self._prefetched = self._load(
+                self._calendar[start_ix:load_end_ix + 1],
+            ).astype(np.float64)
+            self._prefetched_start_ix = start_ix
+
+        offset = start_ix - self._prefetched_start_ix
+        return prefetched[offset:offset + end_ix - start_ix + 1]
+
+    def _write(self, start_ix, end_ix):
+        bars = self._raw_bars(start_ix, end_ix)
+        rows = np.arange(start_ix, end_ix + 1) % self._max_lookback
+        mirror_rows = rows + self._max_lookback
+
+        self._values[rows] = self._values[mirror_rows] = bars
+        self._rounded[rows] = self._rounded[mirror_rows] = self._round(bars)
+
+    def _apply_adjustments(self, through_ix):
+        """
+        Apply the adjustments dated on or before ``calendar[through_ix]``
+        which have not been applied yet. Every bar in the buffer is before
+        the adjustments' dates, so they apply to whole columns.
+        """
+        locs = self._adjustment_locs
+        i = self._next_adjustment
+        adjusted = set()
+        while i < len(locs) and locs[i] <= through_ix:
+            column = self._adjustment_columns[i]
+            self._values[:, column] *= self._adjustment_ratios[i]
+            adjusted.add(column)
+            i += 1
+        self._next_adjustment = i
+
+        for column in adjusted:
+            self._rounded[:, column] = self._values[:, column].round(
+                self._decimals[column],
+            )
+
+    def advance(self, end_ix):
+        """
+        Move the buffer forward so that its latest bar is
+        ``calendar[end_ix]``.
+        """
+        latest_ix = self.latest_ix
+        if latest_ix is None or end_ix - latest_ix >= self._max_lookback:
+            # None of the bars in the buffer are in the new window.
+            self._values[:] = np.nan
+            self._rounded[:] = np.nan
+            latest_ix = end_ix - self._max_lookback
+            self._next_adjustment = self._adjustment_locs.searchsorted(
+                latest_ix + 1,
+                side='right',
+            )
+
+        locs = self._adjustment_locs
+        start_ix = max(latest_ix + 1, 0)
+        while start_ix <= end_ix:
+            self._apply_adjustments(start_ix)
+
+            # Write the bars up to the next adjustment at once.
+            stop_ix = end_ix
+            if self._next_adjustment < len(locs):
+                stop_ix = min(stop_ix, locs[self._next_adjustment] - 1)
+            self._write(start_ix, stop_ix)
+            start_ix = stop_ix + 1
+
+        self._apply_adjustments(end_ix + self._perspective_offset)
+        self.latest_ix = end_ix
+
+    def window(self, size, columns=None):
+        """
+        Get the latest ``size`` bars.
+
+        Parameters
+        ----------
+        size : int
+            The number of bars in the window. Must not be greater than the
+            buffer's ``max_lookback``.
+        columns : np.array[intp], optional
+            The columns of the assets to include in the window. If not
+            given, all of the assets are included.
+
+        Returns
+        -------
+        out : np.ndarray
+            A read-only array of the window. If ``columns`` is not given,
+            this is a view of the buffer, which changes as the buffer
+            advances.
+        """
+        end = self.latest_ix % self._max_lookback + self._max_lookback + 1
+        out = self._rounded[end - size:end]
+        if columns is not None:
+            out = out[:, columns]
+        else:
+            out = out.view()
+        out.setflags(write=False)
+        return out
+
+
 class HistoryLoader(with_metaclass(ABCMeta)):
     """
     Loader for sliding history windows, with support for adjustments.
@@ -334,6 +528,12 @@ class HistoryLoader(with_metaclass(ABCMeta)):
         }
         self._prefetch_length = prefetch_length
 
+        self._preloaded_assets = None
+        self._preloaded_columns = None
+        self._preloaded_max_lookback = None
+        self._ring_buffers = {}
+        self._preloaded_adjustments = {}
+
     @abstractproperty
     def _frequency(self):
         pass
@@ -468,6 +668,121 @@ class HistoryLoader(with_metaclass(ABCMeta)):
 
         return [asset_windows[asset] for asset in assets]
 
+    def preload(self, assets, max_lookback):
+        """
+        Declare the assets for which history windows will be requested.
+
+        History windows of up to ``max_lookback`` bars for these assets are
+        read from ring buffers which move forward with the simulation,
+        instead of from per-asset sliding windows. A buffer is created for
+        each field the first time a window of it is requested.
+
+        Parameters
+        ----------
+        assets : iterable of Asset or int
+            The assets to preload.
+        max_lookback : int
+            The longest window which will be read from the buffers.
+        """
+        assets = self._asset_finder.retrieve_all(assets)
+        if any(isinstance(asset, ContinuousFuture) for asset in assets):
+            raise ValueError(
+                'Cannot preload history for continuous futures.'
+            )
+        if max_lookback < 1:
+            raise ValueError(
+                'max_lookback must be positive, got {}.'.format(max_lookback)
+            )
+
+        self._preloaded_assets = assets
+        self._preloaded_columns = {
+            asset: column for column, asset in enumerate(assets)
+        }
+        self._preloaded_max_lookback = max_lookback
+        self._ring_buffers = {}
+        self._preloaded_adjustments = {}
+
+    def _adjustments_for_preloaded(self, field):
+        """
+        Get the adjustments to apply to a ring buffer of ``field`` as a list
+        of ``(loc, column, ratio)`` tuples sorted by ``loc``.
+        """
+        # Prices all share the same adjustments.
+        kind = 'volume' if field == 'volume' else 'price'
+        try:
+            return self._preloaded_adjustments[kind]
+        except KeyError:
+            pass
+
+        cal = self._calendar
+        out = []
+        for column, asset in enumerate(self._preloaded_assets):
+            adj_reader = self._adjustment_readers.get(type(asset))
+            if adj_reader is None:
+                continue
+            adjs = adj_reader.load_pricing_adjustments([field], cal, [asset])
+            for loc, mults in iteritems(adjs[0]):
+                out.extend((loc, column, mult.value) for mult in mults)
+
+        out.sort(key=lambda adj: adj[0])
+        self._preloaded_adjustments[kind] = out
+        return out
+
+    def _ring_buffer(self, field, is_perspective_after):
+        key = (field, is_perspective_after)
+        try:
+            return self._ring_buffers[key]
+        except KeyError:
+            pass
+
+        assets = self._preloaded_assets
+        cal = self._calendar
+        reference_date = cal[-1]
+        buf = self._ring_buffers[key] = HistoryRingBuffer(
+            cal,
+            lambda dts: self._array(dts, assets, field),
+            len(assets),
+            self._preloaded_max_lookback,
+            self._adjustments_for_preloaded(field),
+            [self._decimal_places_for_asset(asset, reference_date)
+             for asset in assets],
+            int(is_perspective_after),
+            self._prefetch_length,
+        )
+        return buf
+
+    def _preloaded_history(self, assets, dts, field, is_perspective_after):
+        """
+        Read a history window from the ring buffers, if it can be served by
+        them.
+
+        Returns
+        -------
+        out : np.ndarray or None
+            The window, or None if it can't be read from the ring buffers.
+        """
+        if (self._preloaded_assets is None or
+                field == 'sid' or
+                len(dts) > self._preloaded_max_lookback):
+            return None
+
+        preloaded = self._preloaded_columns
+        try:
+            columns = [preloaded[asset] for asset in assets]
+        except (KeyError, TypeError):
+            return None
+
+        end_ix = find_in_sorted_index(self._calendar, dts[-1])
+        buf = self._ring_buffer(field, is_perspective_after)
+        if buf.latest_ix is not None and end_ix < buf.latest_ix:
+            # Don't rewind adjustments for windows in the past.
+            return None
+        buf.advance(end_ix)
+
+        if columns == list(range(len(preloaded))):
+            return buf.window(len(dts))
+        return buf.window(len(dts), np.array(columns, dtype=np.intp))
+
     def history(self, assets, dts, field, is_perspective_after):
         """
         A window of pricing data with adjustments applied assuming that the
@@ -542,7 +857,13 @@ class HistoryLoader(with_metaclass(ABCMeta)):
         Returns
         -------
         out : np.ndarray with shape(len(days between start, end), len(assets))
+            If the assets were preloaded, this may be a read-only view which
+            changes when later windows are requested.
         """
+        out = self._preloaded_history(assets, dts, field, is_perspective_after)
+        if out is not None:
+            return out
+
         block = self._ensure_sliding_windows(assets,
                                              dts,
                                              field,
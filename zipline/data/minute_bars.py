@@ -1096,6 +1096,24 @@ class BcolzMinuteBarReader(MinuteBarReader):
         except KeyError:
             return None
 
+    def _get_value_position(self, dt):
+        """
+        Get the position of ``dt`` in the minute tapes, caching the position
+        of the last dt looked up, since spot reads tend to come in runs on the
+        same minute.
+        """
+        if self._last_get_value_dt_value == dt.value:
+            return self._last_get_value_dt_position
+
+        try:
+            minute_pos = self._find_position_of_minute(dt)
+        except ValueError:
+            raise NoDataOnDate()
+
+        self._last_get_value_dt_value = dt.value
+        self._last_get_value_dt_position = minute_pos
+        return minute_pos
+
     def get_value(self, sid, dt, field):
         """
         Retrieve the pricing info for the given sid, dt, and field.
@@ -1124,16 +1142,7 @@ class BcolzMinuteBarReader(MinuteBarReader):
             Returns the integer value of the volume.
             (A volume of 0 signifies no trades for the given dt.)
         """
-        if self._last_get_value_dt_value == dt.value:
-            minute_pos = self._last_get_value_dt_position
-        else:
-            try:
-                minute_pos = self._find_position_of_minute(dt)
-            except ValueError:
-                raise NoDataOnDate()
-
-            self._last_get_value_dt_value = dt.value
-            self._last_get_value_dt_position = minute_pos
+        minute_pos = self._get_value_position(dt)
 
         try:
             value = self._open_minute_file(field, sid)[minute_pos]
@@ -1149,6 +1158,56 @@ class BcolzMinuteBarReader(MinuteBarReader):
             value *= self._ohlc_ratio_inverse_for_sid(sid)
         return value
 
+    def get_values(self, sids, dt, field):
+        """
+        Retrieve the pricing info for many sids at the given dt.
+
+        Parameters
+        ----------
+        sids : iterable[int]
+            Asset identifiers.
+        dt : datetime-like
+            The datetime at which the trades occurred.
+        field : string
+            The type of pricing data to retrieve.
+            ('open', 'high', 'low', 'close', 'volume')
+
+        Returns
+        -------
+        out : np.array[float64|uint32]
+            The market data for each sid at the given dt, as returned by
+            ``get_value``: nan for OHLC if no trade occurred, and 0 volume.
+
+        Notes
+        -----
+        Each sid's minutes are stored in their own carray, so this still
+        reads one value from each sid's carray. Only the minute lookup and the
+        price scaling are shared between sids.
+        """
+        minute_pos = self._get_value_position(dt)
+        sids = np.asarray(sids, dtype='int64')
+
+        raw = np.zeros(len(sids), dtype=np.uint32)
+        for i, sid in enumerate(sids):
+            try:
+                raw[i] = self._open_minute_file(field, sid)[minute_pos]
+            except IndexError:
+                pass
+
+        if field == 'volume':
+            return raw
+
+        if self._ohlc_inverses_per_sid is None:
+            ratio_inverses = self._default_ohlc_inverse
+        else:
+            ratio_inverses = np.array(
+                [self._ohlc_ratio_inverse_for_sid(sid) for sid in sids],
+                dtype=np.float64,
+            )
+        out = raw * ratio_inverses
+        out[raw == 0] = np.nan
+        return out
+
     def get_last_traded_dt(self, asset, dt):
         minute_pos = self._find_last_traded_position(asset, dt)
         if minute_pos == -1:
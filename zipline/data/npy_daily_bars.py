@@ -0,0 +1,540 @@
+"""
+Memory-Mapped Daily Pricing Format
+----------------------------------
+Daily bars are stored in a directory of uncompressed ``.npy`` files, which
+readers open with ``np.memmap``. Opening a reader doesn't read any pricing
+data, and pages of the files are shared between all of the processes on a
+host which read the same directory.
+
+The layout of the pricing data matches the bcolz daily format. Each field is
+stored as a 1D uint32 column, grouped by sid and sorted by session within each
+sid's block of rows.
+
+.. code-block:: none
+
+   /open.npy
+   /high.npy
+   /low.npy
+   /close.npy
+   /volume.npy
+
+Prices are stored as 1000 * the as-traded price, and a value of 0 means there
+was no trade in that session.
+
+Four int64 arrays, aligned with each other, index into the columns:
+
+.. code-block:: none
+
+   /sid.npy
+   /first_row.npy
+   /last_row.npy
+   /calendar_offset.npy
+
+``first_row`` and ``last_row`` are the rows of the first and last session of
+each sid, and ``calendar_offset`` is the index of the sid's first session in
+the sessions of the calendar.
+
+``metadata.json`` holds the format version, the name of the trading calendar,
+the first and last sessions of the dataset and the first trading day.
+"""
+import json
+import os
+import shutil
+
+import logbook
+import numpy as np
+import pandas as pd
+from trading_calendars import get_calendar
+
+from zipline.data.bar_reader import (
+    NoDataAfterDate,
+    NoDataBeforeDate,
+    NoDataOnDate,
+)
+from zipline.data.bcolz_daily_bars import (
+    OHLC,
+    winsorise_uint32,
+)
+from zipline.data.session_bars import CurrencyAwareSessionBarReader
+from zipline.utils.cli import maybe_show_progress
+from zipline.utils.input_validation import expect_element
+from zipline.utils.memoize import lazyval
+from ._equities import _compute_row_slices, _read_bcolz_data
+
+
+log = logbook.Logger('NpyDailyBars')
+
+VERSION = 0
+
+METADATA_FILENAME = 'metadata.json'
+
+FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+SID = 'sid'
+FIRST_ROW = 'first_row'
+LAST_ROW = 'last_row'
+CALENDAR_OFFSET = 'calendar_offset'
+
+INDEXES = (SID, FIRST_ROW, LAST_ROW, CALENDAR_OFFSET)
+
+# Columns are written little-endian, regardless of the host.
+UINT32_LE = np.dtype('<u4')
+
+
+def _npy_path(rootdir, name):
+    return os.path.join(rootdir, name + '.npy')
+
+
+class NpyDailyBarWriter(object):
+    """
+    Class capable of writing daily OHLCV data to disk in a format that can
+    be read by NpyDailyBarReader.
+
+    Parameters
+    ----------
+    rootdir : str
+        The directory into which to write the ``.npy`` files. It is created
+        if it doesn't exist.
+    calendar : trading_calendars.TradingCalendar
+        Calendar to use to compute asset calendar offsets.
+    start_session: pd.Timestamp
+        Midnight UTC session label.
+    end_session: pd.Timestamp
+        Midnight UTC session label.
+
+    See Also
+    --------
+    zipline.data.npy_daily_bars.NpyDailyBarReader
+    """
+    def __init__(self, rootdir, calendar, start_session, end_session):
+        self._rootdir = rootdir
+        self._calendar = calendar
+        self._start_session = start_session
+        self._end_session = end_session
+
+    @expect_element(invalid_data_behavior={'warn', 'raise', 'ignore'})
+    def write(self,
+              data,
+              assets=None,
+              show_progress=False,
+              invalid_data_behavior='warn'):
+        """
+        Parameters
+        ----------
+        data : iterable[tuple[int, pandas.DataFrame]]
+            The data chunks to write. Each chunk should be a tuple of sid
+            and the data for that asset, indexed by session.
+        assets : set[int], optional
+            The assets that should be in ``data``. If this is provided
+            we will check ``data`` against the assets and provide better
+            progress information.
+        show_progress : bool, optional
+            Whether or not to show a progress bar while writing.
+        invalid_data_behavior : {'warn', 'raise', 'ignore'}, optional
+            What to do when data is encountered that is outside the range of
+            a uint32.
+        """
+        if not os.path.isdir(self._rootdir):
+            os.makedirs(self._rootdir)
+
+        sessions = self._calendar.sessions_in_range(
+            self._start_session,
+            self._end_session,
+        )
+
+        ctx = maybe_show_progress(
+            data,
+            show_progress=show_progress,
+            item_show_func=lambda e: e if e is None else str(e[0]),
+            label="Merging daily equity files:",
+            length=len(assets) if assets is not None else None,
+        )
+
+        indexes = {name: [] for name in INDEXES}
+        total_rows = 0
+        first_trading_day = None
+
+        # Columns are streamed into raw files, which are copied into .npy
+        # files once the number of rows is known.
+        raw_paths = {
+            field: _npy_path(self._rootdir, field) + '.raw'
+            for field in FIELDS
+        }
+        raw_files = {field: open(raw_paths[field], 'wb') for field in FIELDS}
+        try:
+            with ctx as it:
+                for sid, df in it:
+                    if assets is not None and sid not in assets:
+                        raise ValueError('unknown asset id %r' % sid)
+
+                    asset_sessions = self._asset_sessions(sid, df, sessions)
+                    columns = self._to_uint32_columns(
+                        df,
+                        invalid_data_behavior,
+                    )
+                    for field in FIELDS:
+                        columns[field].astype(UINT32_LE).tofile(
+                            raw_files[field],
+                        )
+
+                    nrows = len(df)
+                    indexes[SID].append(sid)
+                    indexes[FIRST_ROW].append(total_rows)
+                    indexes[LAST_ROW].append(total_rows + nrows - 1)
+                    indexes[CALENDAR_OFFSET].append(
+                        sessions.get_loc(asset_sessions[0]),
+                    )
+                    total_rows += nrows
+
+                    if first_trading_day is None:
+                        first_trading_day = asset_sessions[0]
+                    else:
+                        first_trading_day = min(
+                            first_trading_day,
+                            asset_sessions[0],
+                        )
+        finally:
+            for f in raw_files.values():
+                f.close()
+
+        for field in FIELDS:
+            self._write_column(raw_paths[field], field, total_rows)
+            os.remove(raw_paths[field])
+
+        for name in INDEXES:
+            np.save(
+                _npy_path(self._rootdir, name),
+                np.array(indexes[name], dtype='int64'),
+            )
+
+        self._write_metadata(first_trading_day)
+
+    def _asset_sessions(self, sid, df, sessions):
+        """
+        Get the sessions of ``df``, checking that they are all of the
+        sessions of the calendar between its first and last session.
+        """
+        days = pd.DatetimeIndex(df.index)
+        if days.tz is None:
+            days = days.tz_localize('UTC')
+
+        expected = sessions[sessions.slice_indexer(days[0], days[-1])]
+        if not days.equals(expected):
+            raise ValueError(
+                'Got {} rows for daily bars of sid {} with first day={}, last '
+                'day={}, expected {} rows.\n'
+                'Missing sessions: {}\n'
+                'Extra sessions: {}'.format(
+                    len(days),
+                    sid,
+                    days[0].date(),
+                    days[-1].date(),
+                    len(expected),
+                    expected.difference(days).tolist(),
+                    days.difference(expected).tolist(),
+                )
+            )
+        return days
+
+    def _to_uint32_columns(self, df, invalid_data_behavior):
+        winsorise_uint32(df, invalid_data_behavior, 'volume', *OHLC)
+        columns = {
+            field: (df[field].values * 1000).round().astype('uint32')
+            for field in OHLC
+        }
+        columns['volume'] = df.volume.values.astype('uint32')
+        return columns
+
+    def _write_column(self, raw_path, field, nrows):
+        """Write a .npy file for ``field`` from the raw column at ``raw_path``.
+        """
+        path = _npy_path(self._rootdir, field)
+        log.debug("Writing {} to {}", field, path)
+
+        with open(path, 'wb') as out, open(raw_path, 'rb') as raw:
+            np.lib.format.write_array_header_1_0(out, {
+                'descr': np.lib.format.dtype_to_descr(UINT32_LE),
+                'fortran_order': False,
+                'shape': (nrows,),
+            })
+            shutil.copyfileobj(raw, out)
+
+    def _write_metadata(self, first_trading_day):
+        metadata = {
+            'version': VERSION,
+            'calendar_name': self._calendar.name,
+            'start_session_ns': self._start_session.value,
+            'end_session_ns': self._end_session.value,
+            'first_trading_day_ns': (
+                first_trading_day.value
+                if first_trading_day is not None
+                else None
+            ),
+        }
+        with open(os.path.join(self._rootdir, METADATA_FILENAME), 'w') as fp:
+            json.dump(metadata, fp)
+
+
+class NpyDailyBarReader(CurrencyAwareSessionBarReader):
+    """
+    Reader for daily pricing data written by NpyDailyBarWriter.
+
+    Columns are memory-mapped on first use, so constructing a reader is
+    cheap, and reads only touch the pages holding the requested rows.
+
+    Parameters
+    ----------
+    rootdir : str
+        The directory containing the ``.npy`` files.
+
+    See Also
+    --------
+    zipline.data.npy_daily_bars.NpyDailyBarWriter
+    """
+    def __init__(self, rootdir):
+        self._rootdir = rootdir
+
+        with open(os.path.join(rootdir, METADATA_FILENAME)) as fp:
+            metadata = json.load(fp)
+
+        if metadata['version'] != VERSION:
+            raise ValueError(
+                'mismatched version: file is of version %s, expected %s' % (
+                    metadata['version'],
+                    VERSION,
+                ),
+            )
+
+        self._metadata = metadata
+        self._columns = {}
+
+    def _load(self, name):
+        return np.load(_npy_path(self._rootdir, name), mmap_mode='r')
+
+    def _column(self, field):
+        try:
+            return self._columns[field]
+        except KeyError:
+            col = self._columns[field] = self._load(field)
+            return col
+
+    @lazyval
+    def trading_calendar(self):
+        return get_calendar(self._metadata['calendar_name'])
+
+    @lazyval
+    def sessions(self):
+        return self.trading_calendar.sessions_in_range(
+            pd.Timestamp(self._metadata['start_session_ns'], tz='UTC'),
+            pd.Timestamp(self._metadata['end_session_ns'], tz='UTC'),
+        )
+
+    @lazyval
+    def first_trading_day(self):
+        first_trading_day_ns = self._metadata['first_trading_day_ns']
+        if first_trading_day_ns is None:
+            return None
+        return pd.Timestamp(first_trading_day_ns, tz='UTC')
+
+    @property
+    def last_available_dt(self):
+        return self.sessions[-1]
+
+    @lazyval
+    def sids(self):
+        return np.asarray(self._load(SID))
+
+    @lazyval
+    def _first_rows(self):
+        return dict(zip(self.sids.tolist(), self._load(FIRST_ROW).tolist()))
+
+    @lazyval
+    def _last_rows(self):
+        return dict(zip(self.sids.tolist(), self._load(LAST_ROW).tolist()))
+
+    @lazyval
+    def _calendar_offsets(self):
+        return dict(
+            zip(self.sids.tolist(), self._load(CALENDAR_OFFSET).tolist()),
+        )
+
+    def _session_index(self, day):
+        try:
+            return self.sessions.get_loc(day)
+        except KeyError:
+            raise NoDataOnDate(day)
+
+    def load_raw_arrays(self, columns, start_date, end_date, assets):
+        start_idx = self._session_index(start_date)
+        end_idx = self._session_index(end_date)
+
+        first_rows, last_rows, offsets = _compute_row_slices(
+            self._first_rows,
+            self._last_rows,
+            self._calendar_offsets,
+            start_idx,
+            end_idx,
+            assets,
+        )
+        # Slicing a memory-mapped column doesn't copy it, so there's no reason
+        # to read whole columns at once.
+        return _read_bcolz_data(
+            {column: self._column(column) for column in columns},
+            (end_idx - start_idx + 1, len(assets)),
+            list(columns),
+            first_rows,
+            last_rows,
+            offsets,
+            False,
+        )
+
+    def sid_day_index(self, sid, day):
+        """
+        Parameters
+        ----------
+        sid : int
+            The asset identifier.
+        day : datetime64-like
+            Midnight of the day for which data is requested.
+
+        Returns
+        -------
+        int
+            Index into the columns for the given sid and day.
+            Raises a NoDataOnDate exception if the given day and sid is before
+            or after the date range of the equity.
+        """
+        try:
+            day_loc = self.sessions.get_loc(day)
+        except Exception:
+            raise NoDataOnDate("day={0} is outside of calendar={1}".format(
+                day, self.sessions))
+        offset = day_loc - self._calendar_offsets[sid]
+        if offset < 0:
+            raise NoDataBeforeDate(
+                "No data on or before day={0} for sid={1}".format(
+                    day, sid))
+        ix = self._first_rows[sid] + offset
+        if ix > self._last_rows[sid]:
+            raise NoDataAfterDate(
+                "No data on or after day={0} for sid={1}".format(
+                    day, sid))
+        return ix
+
+    def get_value(self, sid, dt, field):
+        """
+        Parameters
+        ----------
+        sid : int
+            The asset identifier.
+        dt : datetime64-like
+            Midnight of the day for which data is requested.
+        field : string
+            The price field. e.g. ('open', 'high', 'low', 'close', 'volume')
+
+        Returns
+        -------
+        float
+            The spot price for colname of the given sid on the given day.
+            Raises a NoDataOnDate exception if the given day and sid is before
+            or after the date range of the equity.
+            Returns nan if the day is within the date range, but the price is
+            0.
+        """
+        ix = self.sid_day_index(sid, dt)
+        price = self._column(field)[ix]
+        if field != 'volume':
+            if price == 0:
+                return np.nan
+            else:
+                return price * 0.001
+        else:
+            return price
+
+    def get_values(self, sids, dt, field):
+        """
+        Parameters
+        ----------
+        sids : iterable[int]
+            The asset identifiers.
+        dt : datetime64-like
+            Midnight of the day for which data is requested.
+        field : string
+            The price field. e.g. ('open', 'high', 'low', 'close', 'volume')
+
+        Returns
+        -------
+        np.array[float64|uint32]
+            The spot value of ``field`` for each sid on the given day. Sids
+            which did not exist on ``dt``, or which are not in the columns,
+            get nan for prices and 0 for volume.
+            Raises a NoDataOnDate exception if the given day is not in the
+            calendar.
+        """
+        day_loc = self._session_index(dt)
+        sids = np.asarray(sids, dtype='int64')
+
+        try:
+            first_rows, last_rows, _ = _compute_row_slices(
+                self._first_rows,
+                self._last_rows,
+                self._calendar_offsets,
+                day_loc,
+                day_loc,
+                sids,
+            )
+        except ValueError:
+            # None of the sids are in the columns.
+            first_rows = last_rows = np.full(len(sids), -1, dtype=np.intp)
+
+        # For a single day query, a sid has a row iff the day is within its
+        # lifetime, in which case first_rows == last_rows.
+        has_row = (first_rows != -1) & (first_rows <= last_rows)
+
+        out = np.zeros(len(sids), dtype=np.uint32)
+        out[has_row] = self._column(field)[first_rows[has_row]]
+
+        if field == 'volume':
+            return out
+
+        prices = out.astype(np.float64)
+        prices[out == 0] = np.nan
+        return prices * 0.001
+
+    def get_last_traded_dt(self, asset, day):
+        try:
+            first_row = self._first_rows[asset]
+        except KeyError:
+            return pd.NaT
+
+        try:
+            day_loc = self.sessions.get_loc(day)
+        except KeyError:
+            return pd.NaT
+
+        calendar_offset = self._calendar_offsets[asset]
+        stop = min(
+            first_row + day_loc - calendar_offset,
+            self._last_rows[asset],
+        ) + 1
+        if stop <= first_row:
+            return pd.NaT
+
+        traded = np.flatnonzero(self._column('volume')[first_row:stop])
+        if not len(traded):
+            return pd.NaT
+
+        return self.sessions[calendar_offset + traded[-1]]
+
+    def currency_codes(self, sids):
+        # Like BcolzDailyBarReader, this format doesn't store listing
+        # currencies, so we always either return USD or None if we don't know
+        # about the sid at all.
+        first_rows = self._first_rows
+        out = []
+        for sid in sids:
+            if sid in first_rows:
+                out.append('USD')
+            else:
+                out.append(None)
+        return np.array(out, dtype=object)
@@ -100,6 +100,87 @@ def minute_to_session(column, close_locs, data, out):
     return out
 
 
+def _first_non_nan(window):
+    """
+    Get the first non-nan value in each column of ``window``, or nan for
+    columns which are all nan.
+    """
+    has_value = ~np.isnan(window)
+    rows = has_value.argmax(axis=0)
+    first = window[rows, np.arange(window.shape[1])]
+    first[~has_value.any(axis=0)] = np.nan
+    return first
+
+
+def _last_non_nan(window):
+    """
+    Get the last non-nan value in each column of ``window``, or nan for
+    columns which are all nan.
+    """
+    return _first_non_nan(window[::-1])
+
+
+class _SessionAggregate(object):
+    """
+    The running aggregation of a single field over a single session.
+
+    Parameters
+    ----------
+    session : pd.Timestamp
+        The session being aggregated.
+    market_open : pd.Timestamp
+        The first minute of ``session``.
+    dtype : np.dtype
+        The dtype of the aggregated values.
+    missing_value : float or int
+        The aggregated value for an asset with no data.
+    """
+    def __init__(self, session, market_open, dtype, missing_value):
+        self.session = session
+        self.market_open = market_open
+        self.missing_value = missing_value
+
+        # The latest dt which has been aggregated for any asset.
+        self.latest_dt_value = market_open.value
+
+        # The asset in each column of ``last_visited`` and ``values``.
+        self.assets = []
+        self.columns = {}
+
+        # The last minute aggregated into ``values`` for each asset.
+        self.last_visited = np.empty(0, dtype=np.int64)
+        self.values = np.empty(0, dtype=dtype)
+
+    def columns_for(self, assets, before_open_value):
+        """
+        Get the column of each asset in ``assets``, adding columns for
+        assets which have not been seen this session.
+        """
+        columns = self.columns
+        new_assets = []
+        for asset in assets:
+            if asset not in columns:
+                columns[asset] = len(self.assets) + len(new_assets)
+                new_assets.append(asset)
+
+        if new_assets:
+            self.assets.extend(new_assets)
+            self.last_visited = np.append(
+                self.last_visited,
+                np.full(len(new_assets), before_open_value, dtype=np.int64),
+            )
+            self.values = np.append(
+                self.values,
+                np.full(
+                    len(new_assets),
+                    self.missing_value,
+                    dtype=self.values.dtype,
+                ),
+            )
+
+        return np.array([columns[asset] for asset in assets], dtype=np.intp)
+
+
 class DailyHistoryAggregator(object):
     """
     Converts minute pricing data into a daily summary, to be used for the
@@ -119,23 +200,17 @@ class DailyHistoryAggregator(object):
         self._minute_reader = minute_reader
         self._trading_calendar = trading_calendar
 
-        # The caches are structured as (date, market_open, entries), where
-        # entries is a dict of asset -> (last_visited_dt, value)
-        #
-        # Whenever an aggregation method determines the current value,
-        # the entry for the respective asset should be overwritten with a new
-        # entry for the current dt.value (int) and aggregation value.
+        # The caches map each field to a _SessionAggregate holding the
+        # aggregated value of that field for every asset requested so far in
+        # the current session, along with the last minute aggregated for
+        # each asset.
         #
-        # When the requested dt's date is different from date the cache is
-        # flushed, so that the cache entries do not grow unbounded.
+        # Each request only reads the minutes which have not been aggregated
+        # yet, for all of the requested assets at once.
         #
-        # Example cache:
-        # cache = (date(2016, 3, 17),
-        #          pd.Timestamp('2016-03-17 13:31', tz='UTC'),
-        #          {
-        #              1: (1458221460000000000, np.nan),
-        #              2: (1458221460000000000, 42.0),
-        #         })
+        # When the requested dt's session is different from the cached
+        # session the cache is flushed, so that the cache entries do not grow
+        # unbounded.
         self._caches = {
             'open': None,
             'high': None,
@@ -150,19 +225,110 @@ class DailyHistoryAggregator(object):
 
     def _prelude(self, dt, field):
         session = self._trading_calendar.minute_to_session_label(dt)
-        dt_value = dt.value
         cache = self._caches[field]
-        if cache is None or cache[0] != session:
-            market_open = self._market_opens.loc[session]
-            cache = self._caches[field] = (session, market_open, {})
-
-        _, market_open, entries = cache
-        market_open = market_open.tz_localize('UTC')
-        if dt != market_open:
-            prev_dt = dt_value - self._one_min
-        else:
-            prev_dt = None
-        return market_open, prev_dt, dt_value, entries
+        # Requests normally move forward through the session. If they go
+        # back, start the session's aggregation again.
+        if (cache is None or
+                cache.session != session or
+                dt.value < cache.latest_dt_value):
+            market_open = self._market_opens.loc[session].tz_localize('UTC')
+            if field == 'volume':
+                dtype, missing_value = np.int64, 0
+            else:
+                dtype, missing_value = np.float64, np.nan
+            cache = self._caches[field] = _SessionAggregate(
+                session,
+                market_open,
+                dtype,
+                missing_value,
+            )
+        return cache
+
+    def _aggregate(self, field, assets, dt, combine):
+        """
+        Update the aggregation of ``field`` for ``assets`` through ``dt``.
+
+        Parameters
+        ----------
+        field : str
+            The field to aggregate.
+        assets : list[Asset]
+            The assets whose aggregated values are requested.
+        dt : pd.Timestamp
+            The minute through which to aggregate.
+        combine : callable
+            A function of ``(window, previous)``, where ``window`` is an
+            array of shape (minutes, assets) holding the minutes which have
+            not been aggregated yet, and ``previous`` is the aggregation up to
+            the first of those minutes, which returns the new aggregation.
+            Entries of ``window`` which have already been aggregated hold the
+            missing value for ``field``.
+
+        Returns
+        -------
+        np.array with dtype=float64, or int64 for volume, in order of assets
+        parameter.
+        """
+        cache = self._prelude(dt, field)
+        dt_value = dt.value
+        one_min = self._one_min
+
+        out = np.full(
+            len(assets),
+            cache.missing_value,
+            dtype=cache.values.dtype,
+        )
+
+        session = cache.session
+        alive = np.array(
+            [asset.is_alive_for_session(session) for asset in assets],
+            dtype=bool,
+        )
+        if not alive.any():
+            return out
+
+        columns = cache.columns_for(
+            [asset for asset, is_alive in zip(assets, alive) if is_alive],
+            cache.market_open.value - one_min,
+        )
+
+        stale = np.unique(columns[cache.last_visited[columns] != dt_value])
+        if len(stale):
+            stale_assets = [cache.assets[column] for column in stale]
+            last_visited = cache.last_visited[stale]
+            start_value = last_visited.min() + one_min
+
+            # Load the minutes which have not been aggregated for any of the
+            # stale assets with one read.
+            if start_value == dt_value:
+                window = self._minute_reader.get_values(
+                    stale_assets,
+                    dt,
+                    field,
+                )[np.newaxis]
+            else:
+                window = self._minute_reader.load_raw_arrays(
+                    [field],
+                    pd.Timestamp(start_value, tz='UTC'),
+                    dt,
+                    stale_assets,
+                )[0]
+            window = window.astype(cache.values.dtype)
+
+            # Blank out the minutes which were already aggregated for assets
+            # which are further along than the earliest stale asset.
+            first_rows = (last_visited + one_min - start_value) // one_min
+            aggregated = (
+                np.arange(len(window))[:, np.newaxis] < first_rows
+            )
+            window[aggregated] = cache.missing_value
+
+            cache.values[stale] = combine(window, cache.values[stale])
+            cache.last_visited[stale] = dt_value
+
+        cache.latest_dt_value = max(cache.latest_dt_value, dt_value)
+        out[alive] = cache.values[columns]
+        return out
 
     def opens(self, assets, dt):
         """
@@ -177,64 +343,14 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=float64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'open')
-
-        opens = []
-        session_label = self._trading_calendar.minute_to_session_label(dt)
+        def combine(window, previous):
+            return np.where(
+                np.isnan(previous),
+                _first_non_nan(window),
+                previous,
+            )
 
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                opens.append(np.NaN)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'open')
-                entries[asset] = (dt_value, val)
-                opens.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, first_open = entries[asset]
-                    if last_visited_dt == dt_value:
-                        opens.append(first_open)
-                        continue
-                    elif not pd.isnull(first_open):
-                        opens.append(first_open)
-                        entries[asset] = (dt_value, first_open)
-                        continue
-                    else:
-                        after_last = pd.Timestamp(
-                            last_visited_dt + self._one_min, tz='UTC')
-                        window = self._minute_reader.load_raw_arrays(
-                            ['open'],
-                            after_last,
-                            dt,
-                            [asset],
-                        )[0]
-                        nonnan = window[~pd.isnull(window)]
-                        if len(nonnan):
-                            val = nonnan[0]
-                        else:
-                            val = np.nan
-                        entries[asset] = (dt_value, val)
-                        opens.append(val)
-                        continue
-                except KeyError:
-                    window = self._minute_reader.load_raw_arrays(
-                        ['open'],
-                        market_open,
-                        dt,
-                        [asset],
-                    )[0]
-                    nonnan = window[~pd.isnull(window)]
-                    if len(nonnan):
-                        val = nonnan[0]
-                    else:
-                        val = np.nan
-                    entries[asset] = (dt_value, val)
-                    opens.append(val)
-                    continue
-        return np.array(opens)
+        return self._aggregate('open', assets, dt, combine)
 
     def highs(self, assets, dt):
         """
@@ -246,64 +362,11 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=float64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'high')
-
-        highs = []
-        session_label = self._trading_calendar.minute_to_session_label(dt)
+        def combine(window, previous):
+            # fmax ignores nans, unless both sides are nan.
+            return np.fmax(previous, np.fmax.reduce(window, axis=0))
 
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                highs.append(np.NaN)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'high')
-                entries[asset] = (dt_value, val)
-                highs.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, last_max = entries[asset]
-                    if last_visited_dt == dt_value:
-                        highs.append(last_max)
-                        continue
-                    elif last_visited_dt == prev_dt:
-                        curr_val = self._minute_reader.get_value(
-                            asset, dt, 'high')
-                        if pd.isnull(curr_val):
-                            val = last_max
-                        elif pd.isnull(last_max):
-                            val = curr_val
-                        else:
-                            val = max(last_max, curr_val)
-                        entries[asset] = (dt_value, val)
-                        highs.append(val)
-                        continue
-                    else:
-                        after_last = pd.Timestamp(
-                            last_visited_dt + self._one_min, tz='UTC')
-                        window = self._minute_reader.load_raw_arrays(
-                            ['high'],
-                            after_last,
-                            dt,
-                            [asset],
-                        )[0].T
-                        val = np.nanmax(np.append(window, last_max))
-                        entries[asset] = (dt_value, val)
-                        highs.append(val)
-                        continue
-                except KeyError:
-                    window = self._minute_reader.load_raw_arrays(
-                        ['high'],
-                        market_open,
-                        dt,
-                        [asset],
-                    )[0].T
-                    val = np.nanmax(window)
-                    entries[asset] = (dt_value, val)
-                    highs.append(val)
-                    continue
-        return np.array(highs)
+        return self._aggregate('high', assets, dt, combine)
 
     def lows(self, assets, dt):
         """
@@ -315,59 +378,11 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=float64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'low')
-
-        lows = []
-        session_label = self._trading_calendar.minute_to_session_label(dt)
+        def combine(window, previous):
+            # fmin ignores nans, unless both sides are nan.
+            return np.fmin(previous, np.fmin.reduce(window, axis=0))
 
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                lows.append(np.NaN)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'low')
-                entries[asset] = (dt_value, val)
-                lows.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, last_min = entries[asset]
-                    if last_visited_dt == dt_value:
-                        lows.append(last_min)
-                        continue
-                    elif last_visited_dt == prev_dt:
-                        curr_val = self._minute_reader.get_value(
-                            asset, dt, 'low')
-                        val = np.nanmin([last_min, curr_val])
-                        entries[asset] = (dt_value, val)
-                        lows.append(val)
-                        continue
-                    else:
-                        after_last = pd.Timestamp(
-                            last_visited_dt + self._one_min, tz='UTC')
-                        window = self._minute_reader.load_raw_arrays(
-                            ['low'],
-                            after_last,
-                            dt,
-                            [asset],
-                        )[0].T
-                        val = np.nanmin(np.append(window, last_min))
-                        entries[asset] = (dt_value, val)
-                        lows.append(val)
-                        continue
-                except KeyError:
-                    window = self._minute_reader.load_raw_arrays(
-                        ['low'],
-                        market_open,
-                        dt,
-                        [asset],
-                    )[0].T
-                    val = np.nanmin(window)
-                    entries[asset] = (dt_value, val)
-                    lows.append(val)
-                    continue
-        return np.array(lows)
+        return self._aggregate('low', assets, dt, combine)
 
     def closes(self, assets, dt):
         """
@@ -381,69 +396,11 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=float64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'close')
-
-        closes = []
-        session_label = self._trading_calendar.minute_to_session_label(dt)
-
-        def _get_filled_close(asset):
-            """
-            Returns the most recent non-nan close for the asset in this
-            session. If there has been no data in this session on or before the
-            `dt`, returns `nan`
-            """
-            window = self._minute_reader.load_raw_arrays(
-                ['close'],
-                market_open,
-                dt,
-                [asset],
-            )[0]
-            try:
-                return window[~np.isnan(window)][-1]
-            except IndexError:
-                return np.NaN
+        def combine(window, previous):
+            last = _last_non_nan(window)
+            return np.where(np.isnan(last), previous, last)
 
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                closes.append(np.NaN)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'close')
-                entries[asset] = (dt_value, val)
-                closes.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, last_close = entries[asset]
-                    if last_visited_dt == dt_value:
-                        closes.append(last_close)
-                        continue
-                    elif last_visited_dt == prev_dt:
-                        val = self._minute_reader.get_value(
-                            asset, dt, 'close')
-                        if pd.isnull(val):
-                            val = last_close
-                        entries[asset] = (dt_value, val)
-                        closes.append(val)
-                        continue
-                    else:
-                        val = self._minute_reader.get_value(
-                            asset, dt, 'close')
-                        if pd.isnull(val):
-                            val = _get_filled_close(asset)
-                        entries[asset] = (dt_value, val)
-                        closes.append(val)
-                        continue
-                except KeyError:
-                    val = self._minute_reader.get_value(
-                        asset, dt, 'close')
-                    if pd.isnull(val):
-                        val = _get_filled_close(asset)
-                    entries[asset] = (dt_value, val)
-                    closes.append(val)
-                    continue
-        return np.array(closes)
+        return self._aggregate('close', assets, dt, combine)
 
     def volumes(self, assets, dt):
         """
@@ -455,59 +412,10 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=int64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'volume')
-
-        volumes = []
-        session_label = self._trading_calendar.minute_to_session_label(dt)
+        def combine(window, previous):
+            return previous + window.sum(axis=0)
 
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                volumes.append(0)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'volume')
-                entries[asset] = (dt_value, val)
-                volumes.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, last_total = entries[asset]
-                    if last_visited_dt == dt_value:
-                        volumes.append(last_total)
-                        continue
-                    elif last_visited_dt == prev_dt:
-                        val = self._minute_reader.get_value(
-                            asset, dt, 'volume')
-                        val += last_total
-                        entries[asset] = (dt_value, val)
-                        volumes.append(val)
-                        continue
-                    else:
-                        after_last = pd.Timestamp(
-                            last_visited_dt + self._one_min, tz='UTC')
-                        window = self._minute_reader.load_raw_arrays(
-                            ['volume'],
-                            after_last,
-                            dt,
-                            [asset],
-                        )[0]
-                        val = np.nansum(window) + last_total
-                        entries[asset] = (dt_value, val)
-                        volumes.append(val)
-                        continue
-                except KeyError:
-                    window = self._minute_reader.load_raw_arrays(
-                        ['volume'],
-                        market_open,
-                        dt,
-                        [asset],
-                    )[0]
-                    val = np.nansum(window)
-                    entries[asset] = (dt_value, val)
-                    volumes.append(val)
-                    continue
-        return np.array(volumes)
+        return self._aggregate('volume', assets, dt, combine)
 
 
 class MinuteResampleSessionBarReader(SessionBarReader):
@@ -575,6 +483,9 @@ class MinuteResampleSessionBarReader(SessionBarReader):
         # for real world use.
         return self._get_resampled([colname], session, session, [sid])[0][0][0]
 
+    def get_values(self, sids, session, colname):
+        return self._get_resampled([colname], session, session, sids)[0][0]
+
     @lazyval
     def sessions(self):
         cal = self._calendar
@@ -659,6 +570,16 @@ class ReindexBarReader(with_metaclass(ABCMeta)):
             else:
                 return np.nan
 
+    def get_values(self, sids, dt, field):
+        # Give an empty result if no data is present.
+        try:
+            return self._reader.get_values(sids, dt, field)
+        except NoDataOnDate:
+            if field == 'volume':
+                return np.zeros(len(sids), dtype=np.uint32)
+            else:
+                return np.full(len(sids), np.nan)
+
     @abstractmethod
     def _outer_dts(self, start_dt, end_dt):
         raise NotImplementedError
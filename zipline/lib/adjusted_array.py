@@ -10,6 +10,7 @@ from numpy import (
     int16,
     uint16,
     ndarray,
+    searchsorted,
     uint32,
     uint8,
 )
@@ -22,6 +23,7 @@ from zipline.errors import (
 from zipline.lib.labelarray import LabelArray
 from zipline.utils.numpy_utils import (
     datetime64ns_dtype,
+    float32_dtype,
     float64_dtype,
     int64_dtype,
     uint8_dtype,
@@ -75,6 +77,8 @@ def is_categorical(dtype):
 
 
 CONCRETE_WINDOW_TYPES = {
+    # float32 data is upcast to float64 before it's traversed.
+    float32_dtype: Float64Window,
     float64_dtype: Float64Window,
     int64_dtype: Int64Window,
     uint8_dtype: UInt8Window,
@@ -87,10 +91,11 @@ def _normalize_array(data, missing_value):
     representation, returning the coerced array and a dict of argument to pass
     to np.view to use when providing a user-facing view of the underlying data.
 
-    - float* data is coerced to float64 with viewtype float64.
+    - float32 data is stored as-is, and upcast to float64 when traversed.
+    - other float* data is coerced to float64 with viewtype float64.
     - int32, int64, and uint32 are converted to int64 with viewtype int64.
     - datetime[*] data is coerced to int64 with a viewtype of datetime64[ns].
-    - bool_ data is coerced to uint8 with a viewtype of bool_.
+    - bool_ data is viewed as uint8 with a viewtype of bool_.
 
     Parameters
     ----------
@@ -100,14 +105,18 @@ def _normalize_array(data, missing_value):
     -------
     coerced, view_kwargs : (np.ndarray, np.dtype)
         The input ``data`` array coerced to the appropriate pipeline type.
-        This may return the original array or a view over the same data.
+        This may return the original array or a view over the same data, in
+        which case traversing the AdjustedArray with ``copy=False`` adjusts
+        the caller's array in place.
     """
     if isinstance(data, LabelArray):
         return data, {}
 
     data_dtype = data.dtype
     if data_dtype in BOOL_DTYPES:
-        return data.astype(uint8, copy=False), {'dtype': dtype(bool_)}
+        return data.view(uint8), {'dtype': dtype(bool_)}
+    elif data_dtype == float32_dtype:
+        return data, {}
     elif data_dtype in FLOAT_DTYPES:
         return data.astype(float64, copy=False), {'dtype': dtype(float64)}
     elif data_dtype in INT_DTYPES:
@@ -187,7 +196,9 @@ class AdjustedArray(object):
     ----------
     data : np.ndarray
         The baseline data values. This array may be mutated by
-        ``traverse(..., copy=False)`` calls.
+        ``traverse(..., copy=False)`` calls, unless it's read-only. float32
+        data is stored in float32 to save memory, but windows over it are
+        always float64.
     adjustments : dict[int -> list[Adjustment]]
         A dict mapping row indices to lists of adjustments to apply when we
         reach that row.
@@ -223,6 +234,51 @@ class AdjustedArray(object):
             self.missing_value,
         )
 
+    def select_columns(self, columns):
+        """
+        Get an AdjustedArray holding only some of the columns of this array.
+
+        Parameters
+        ----------
+        columns : np.ndarray[int]
+            Sorted indices of the columns to select.
+
+        Returns
+        -------
+        selected : AdjustedArray
+            An array holding a copy of the data of ``columns``, along with the
+            adjustments to those columns.
+        """
+        if self._invalidated:
+            raise ValueError(
+                'cannot select columns of invalidated AdjustedArray',
+            )
+
+        adjustments = {}
+        for row, row_adjustments in iteritems(self.adjustments):
+            selected = []
+            for adjustment in row_adjustments:
+                # Selected columns within an adjustment's range of columns
+                # are contiguous in the result.
+                first_col = int(searchsorted(columns, adjustment.first_col))
+                last_col = int(searchsorted(
+                    columns, adjustment.last_col, side='right',
+                )) - 1
+                if first_col > last_col:
+                    continue
+                type_, args = adjustment.__reduce__()
+                selected.append(
+                    type_(args[0], args[1], first_col, last_col, *args[4:]),
+                )
+            if selected:
+                adjustments[row] = selected
+
+        return type(self)(
+            self.data[:, columns],
+            adjustments,
+            self.missing_value,
+        )
+
     def update_adjustments(self, adjustments, method):
         """
         Merge ``adjustments`` with existing adjustments, handling index
@@ -275,6 +331,40 @@ class AdjustedArray(object):
             return LabelWindow
         return CONCRETE_WINDOW_TYPES[self._data.dtype]
 
+    def _traversal_buffer(self, copy):
+        """
+        Get the buffer that a traversal of this array should read.
+
+        Returns
+        -------
+        data : np.ndarray
+            The buffer to traverse.
+        needs_copy : bool
+            Whether ``data`` has to be copied before any adjustment is applied
+            to it.
+        """
+        if self._invalidated:
+            raise ValueError('cannot traverse invalidated AdjustedArray')
+
+        data = self._data
+        if data.dtype == float32_dtype:
+            # Adjustments and windows work in float64, so compute in float64
+            # even if we store float32. This always produces a new buffer.
+            data = data.astype(float64_dtype, order='F')
+            if not copy:
+                self._invalidated = True
+            return data, False
+        elif isinstance(data, LabelArray) and not self.adjustments:
+            # Nothing will be written into the buffer, so windows can be
+            # views of the baseline codes.
+            return data, False
+        elif copy or not data.flags.writeable:
+            # Read-only data, e.g. data in shared memory, can't be adjusted
+            # in place.
+            return data, True
+        self._invalidated = True
+        return data, False
+
     def traverse(self,
                  window_length,
                  offset=0,
@@ -294,19 +384,29 @@ class AdjustedArray(object):
             Number of rows past the end of the current window from which to
             "view" the underlying data.
         copy : bool, optional
-            Copy the underlying data. If ``copy=False``, the adjusted array
-            will be invalidated and cannot be traversed again.
+            Copy the underlying data. If ``copy=False``, adjustments are
+            applied in place to the data this array was constructed with, and
+            the adjusted array will be invalidated and cannot be traversed
+            again.
+
+        Notes
+        -----
+        If ``copy=True``, or if the data is read-only (e.g. data in shared
+        memory), windows are read-only views of the data until the first
+        adjustment is applied, and the data is only copied then.
         """
-        if self._invalidated:
-            raise ValueError('cannot traverse invalidated AdjustedArray')
-
-        data = self._data
-        if copy:
-            data = data.copy(order='F')
-        else:
-            self._invalidated = True
-
+        data, needs_copy = self._traversal_buffer(copy)
         _check_window_params(data, window_length)
+        if needs_copy:
+            return _CopyOnAdjustWindow(
+                self._iterator_type,
+                data,
+                self._view_kwargs,
+                self.adjustments,
+                offset,
+                window_length,
+                perspective_offset,
+            )
         return self._iterator_type(
             data,
             self._view_kwargs,
@@ -317,6 +417,47 @@ class AdjustedArray(object):
             rounding_places=None,
         )
 
+    def traverse_blocks(self, window_length, offset=0, copy=True):
+        """
+        Produce an iterator over blocks of rows of our data, each of which
+        covers a run of consecutive windows that no adjustment falls between.
+
+        Between adjustments, consecutive windows are overlapping slices of the
+        same data, so rolling computations can process a whole block at once
+        instead of one window at a time. A block covering ``N`` windows has
+        ``N + window_length - 1`` rows, and its ``i``th window is
+        ``block[i:i + window_length]``. Concatenating the windows of each
+        block in order produces the same windows as :meth:`traverse`.
+
+        Each block is a read-only view that is only valid until the next block
+        is requested, since adjustments are applied to the underlying data in
+        place. Data is only copied once the first adjustment is applied, so
+        traversing an array without adjustments in the traversed rows (e.g.
+        read-only data in shared memory) doesn't copy it.
+
+        Parameters
+        ----------
+        window_length : int
+            The number of rows in each window.
+        offset : int, optional
+            Number of rows to skip before the first window.  Default is 0.
+        copy : bool, optional
+            Copy the underlying data. If ``copy=False``, adjustments are
+            applied in place to the data this array was constructed with, and
+            the adjusted array will be invalidated and cannot be traversed
+            again.
+        """
+        data, needs_copy = self._traversal_buffer(copy)
+        _check_window_params(data, window_length)
+        return _iter_blocks(
+            data,
+            self._view_kwargs,
+            self.adjustments,
+            offset,
+            window_length,
+            needs_copy,
+        )
+
     def inspect(self):
         """
         Return a string representation of the data stored in this array.
@@ -357,6 +498,148 @@ class AdjustedArray(object):
                 adjustment.value = func(adjustment.value)
 
 
+class _CopyOnAdjustWindow(object):
+    """
+    Iterator backing :meth:`AdjustedArray.traverse` over data that mustn't be
+    adjusted in place.
+
+    Windows are read-only views of ``data`` until the first adjustment has to
+    be applied. ``data`` is then copied, and the rest of the traversal is
+    delegated to an ``iterator_type`` window over the copy.
+
+    This mirrors the anchor bookkeeping of ``AdjustedArrayWindow``: the window
+    ending at row ``anchor`` (exclusive) sees every adjustment whose index is
+    less than ``anchor + perspective_offset``.
+    """
+    def __init__(self,
+                 iterator_type,
+                 data,
+                 view_kwargs,
+                 adjustments,
+                 offset,
+                 window_length,
+                 perspective_offset):
+        if perspective_offset > 1:
+            raise Exception(
+                "perspective_offset should not exceed 1, value "
+                "is perspective_offset={0}".format(perspective_offset)
+            )
+        self._iterator_type = iterator_type
+        self._data = data
+        self._view_kwargs = view_kwargs
+        self._adjustments = adjustments
+        self._window_length = window_length
+        self._perspective_offset = perspective_offset
+        self._anchor = window_length + offset - 1
+        self._max_anchor = data.shape[0]
+        if adjustments:
+            self._first_adjustment = min(adjustments)
+        else:
+            self._first_adjustment = self._max_anchor + perspective_offset
+        self._output = None
+
+        # Window over a copy of the data, created on the first adjustment.
+        self._window = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._window is not None:
+            return next(self._window)
+        if self._anchor >= self._max_anchor:
+            raise StopIteration()
+        return self._tick_forward(self._anchor + 1)
+
+    next = __next__
+
+    def seek(self, target_anchor):
+        if self._window is not None:
+            return self._window.seek(target_anchor)
+        if target_anchor < self._anchor:
+            raise Exception('Can not access data after window has passed.')
+        if target_anchor == self._anchor:
+            return self._output
+        if target_anchor > self._max_anchor:
+            raise ValueError(
+                'Can not seek past the end of the data, target_anchor=%d, '
+                'max_anchor=%d.' % (target_anchor, self._max_anchor)
+            )
+        return self._tick_forward(target_anchor)
+
+    def _tick_forward(self, target):
+        if target + self._perspective_offset > self._first_adjustment:
+            self._window = self._iterator_type(
+                self._data.copy(order='F'),
+                self._view_kwargs,
+                self._adjustments,
+                # Start the new window at our current anchor, so that it
+                # applies every adjustment on its way to ``target``.
+                self._anchor - self._window_length + 1,
+                self._window_length,
+                self._perspective_offset,
+                rounding_places=None,
+            )
+            self._data = self._output = None
+            return self._window.seek(target)
+
+        window = self._data[target - self._window_length:target]
+        if self._view_kwargs:
+            window = window.view(**self._view_kwargs)
+        window.setflags(write=False)
+        self._anchor = target
+        self._output = window
+        return window
+
+
+def _iter_blocks(data,
+                 view_kwargs,
+                 adjustments,
+                 offset,
+                 window_length,
+                 copy_on_adjust):
+    """
+    Generator backing :meth:`AdjustedArray.traverse_blocks`.
+
+    This mirrors the anchor bookkeeping of ``AdjustedArrayWindow``: the window
+    ending at row ``anchor`` (exclusive) sees every adjustment whose index is
+    less than ``anchor``. If ``copy_on_adjust`` is True, ``data`` is copied
+    before the first adjustment is applied to it.
+    """
+    adjustment_indices = sorted(adjustments)
+    num_adjustments = len(adjustment_indices)
+    max_anchor = data.shape[0]
+
+    anchor = window_length + offset
+    next_adj = 0
+    while anchor <= max_anchor:
+        while (next_adj < num_adjustments
+               and adjustment_indices[next_adj] < anchor):
+            if copy_on_adjust:
+                # Blocks already yielded are views of the original data, which
+                # is left untouched.
+                data = data.copy(order='F')
+                copy_on_adjust = False
+            for adjustment in adjustments[adjustment_indices[next_adj]]:
+                adjustment.mutate(data)
+            next_adj += 1
+
+        # Every window up to and including the one ending at the next
+        # adjustment's index sees the same data.
+        if next_adj < num_adjustments:
+            last_anchor = min(adjustment_indices[next_adj], max_anchor)
+        else:
+            last_anchor = max_anchor
+
+        block = data[anchor - window_length:last_anchor]
+        if view_kwargs:
+            block = block.view(**view_kwargs)
+        block.setflags(write=False)
+        yield block
+
+        anchor = last_anchor + 1
+
+
 def ensure_adjusted_array(ndarray_or_adjusted_array, missing_value):
     if isinstance(ndarray_or_adjusted_array, AdjustedArray):
         return ndarray_or_adjusted_array
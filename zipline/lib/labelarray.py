@@ -4,6 +4,7 @@ An ndarray subclass for working with arrays of strings.
 from functools import partial, total_ordering
 from operator import eq, ne
 import re
+from weakref import ref
 
 import numpy as np
 from numpy import ndarray
@@ -88,6 +89,57 @@ class CategoryMismatch(ValueError):
 _NotPassed = sentinel('_NotPassed')
 
 
+class _CategoryResultCache(object):
+    """
+    Cache of values computed from the categories of LabelArrays.
+
+    LabelArrays produced by slicing, windowing or ``empty_like`` share their
+    parent's categories array, so results computed once per category (e.g.
+    the result of ``startswith`` for each category) can be reused by every
+    array sharing the same categories.
+
+    Entries are keyed on the identity of the categories array, and are
+    dropped when that array is garbage collected.
+    """
+    def __init__(self):
+        # id(categories) -> (weakref to categories, {key -> value})
+        self._entries = {}
+
+    def get(self, categories, key, compute):
+        """
+        Get the value cached for ``key`` on ``categories``, calling
+        ``compute()`` to produce it if it's not yet cached.
+        """
+        entries = self._entries
+        categories_id = id(categories)
+        try:
+            _, values = entries[categories_id]
+        except KeyError:
+            values = {}
+            entries[categories_id] = (
+                ref(categories, lambda _: entries.pop(categories_id, None)),
+                values,
+            )
+
+        try:
+            return values[key]
+        except KeyError:
+            value = values[key] = compute()
+            return value
+        except TypeError:
+            # Unhashable key, e.g. a container of unhashable choices.
+            return compute()
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_category_results = _CategoryResultCache()
+
+
 class LabelArray(ndarray):
     """
     An ndarray subclass for working with arrays of strings.
@@ -623,38 +675,99 @@ class LabelArray(ndarray):
             missing_value=self.missing_value,
         )
 
-    def map_predicate(self, f):
+    def map_predicate(self, f, cache_key=None):
         """
         Map a function from str -> bool element-wise over ``self``.
 
         ``f`` will be applied exactly once to each non-missing unique value in
         ``self``. Missing values will always return False.
+
+        If ``cache_key`` is supplied, the result of ``f`` for each category is
+        cached under that key, and reused by any LabelArray sharing the same
+        categories. ``cache_key`` must identify the predicate computed by
+        ``f``.
         """
-        # Functions passed to this are of type str -> bool.  Don't ever call
-        # them on None, which is the only non-str value we ever store in
-        # categories.
-        if self.missing_value is None:
-            def f_to_use(x):
-                return False if x is None else f(x)
+        if cache_key is None:
+            results = self._category_predicate(f)
         else:
-            f_to_use = f
-
-        # Call f on each unique value in our categories.
-        results = np.vectorize(f_to_use, otypes=[bool_dtype])(self.categories)
-
-        # missing_value should produce False no matter what
-        results[self.reverse_categories[self.missing_value]] = False
+            results = _category_results.get(
+                self.categories,
+                ('predicate', self.missing_value, cache_key),
+                partial(self._category_predicate, f),
+            )
 
         # unpack the results form each unique value into their corresponding
         # locations in our indices.
-        return results[self.as_int_array()]
+        return results.take(self.as_int_array())
+
+    def _category_predicate(self, f):
+        """
+        Compute ``f`` for each entry in ``self.categories``, returning False
+        for ``self.missing_value``.
+        """
+        categories = self.categories
+        missing_value = self.missing_value
+
+        # Functions passed to this are of type str -> bool.  Don't ever call
+        # them on the missing value, which is the only non-str value we ever
+        # store in categories.
+        results = np.fromiter(
+            (x != missing_value and f(x) for x in categories),
+            dtype=bool_dtype,
+            count=len(categories),
+        )
+        # Never write into the cached array.
+        results.setflags(write=False)
+        return results
 
-    def map(self, f):
+    def map(self, f, cache_key=None):
         """
         Map a function from str -> str element-wise over ``self``.
 
         ``f`` will be applied exactly once to each non-missing unique value in
         ``self``. Missing values will always map to ``self.missing_value``.
+
+        If ``cache_key`` is supplied, the mapping from old to new categories
+        is cached under that key, and reused by any LabelArray sharing the
+        same categories. ``cache_key`` must identify the mapping computed by
+        ``f``.
+        """
+        if cache_key is None:
+            new_categories, reverse_index, reverse_categories = (
+                self._map_categories(f)
+            )
+        else:
+            new_categories, reverse_index, reverse_categories = (
+                _category_results.get(
+                    self.categories,
+                    ('map', self.missing_value, cache_key),
+                    partial(self._map_categories, f),
+                )
+            )
+
+        new_codes = np.take(reverse_index, self.as_int_array())
+
+        return self.from_codes_and_metadata(
+            new_codes,
+            new_categories,
+            reverse_categories,
+            missing_value=self.missing_value,
+        )
+
+    def _map_categories(self, f):
+        """
+        Compute the categories produced by mapping ``f`` over
+        ``self.categories``.
+
+        Returns
+        -------
+        new_categories : np.ndarray[object]
+            The unique outputs of ``f``.
+        reverse_index : np.ndarray[uint]
+            The index in ``new_categories`` of the output for each entry in
+            ``self.categories``.
+        reverse_categories : dict[str, int]
+            The mapping from each new category to its index.
         """
         # f() should only return None if None is our missing value.
         if self.missing_value is None:
@@ -717,13 +830,13 @@ class LabelArray(ndarray):
         reverse_index = bloated_inverse_index.astype(
             smallest_uint_that_can_hold(len(new_categories))
         )
-        new_codes = np.take(reverse_index, self.as_int_array())
+        new_categories.setflags(write=False)
+        reverse_index.setflags(write=False)
 
-        return self.from_codes_and_metadata(
-            new_codes,
+        return (
             new_categories,
+            reverse_index,
             dict(zip(new_categories, range(len(new_categories)))),
-            missing_value=self.missing_value,
         )
 
     def startswith(self, prefix):
@@ -740,7 +853,10 @@ class LabelArray(ndarray):
             An array with the same shape as self indicating whether each
             element of self started with ``prefix``.
         """
-        return self.map_predicate(lambda elem: elem.startswith(prefix))
+        return self.map_predicate(
+            lambda elem: elem.startswith(prefix),
+            cache_key=('startswith', prefix),
+        )
 
     def endswith(self, suffix):
         """
@@ -756,7 +872,10 @@ class LabelArray(ndarray):
             An array with the same shape as self indicating whether each
             element of self ended with ``suffix``
         """
-        return self.map_predicate(lambda elem: elem.endswith(suffix))
+        return self.map_predicate(
+            lambda elem: elem.endswith(suffix),
+            cache_key=('endswith', suffix),
+        )
 
     def has_substring(self, substring):
         """
@@ -772,7 +891,10 @@ class LabelArray(ndarray):
             An array with the same shape as self indicating whether each
             element of self ended with ``suffix``.
         """
-        return self.map_predicate(lambda elem: substring in elem)
+        return self.map_predicate(
+            lambda elem: substring in elem,
+            cache_key=('has_substring', substring),
+        )
 
     @preprocess(pattern=coerce(from_=(bytes, unicode), to=re.compile))
     def matches(self, pattern):
@@ -789,7 +911,10 @@ class LabelArray(ndarray):
             An array with the same shape as self indicating whether each
             element of self was matched by ``pattern``.
         """
-        return self.map_predicate(compose(bool, pattern.match))
+        return self.map_predicate(
+            compose(bool, pattern.match),
+            cache_key=('matches', pattern.pattern, pattern.flags),
+        )
 
     # These types all implement an O(N) __contains__, so pre-emptively
     # coerce to `set`.
@@ -810,7 +935,11 @@ class LabelArray(ndarray):
             An array with the same shape as self indicating whether each
             element of self was an element of ``container``.
         """
-        return self.map_predicate(container.__contains__)
+        if isinstance(container, (set, frozenset)):
+            cache_key = ('element_of', frozenset(container))
+        else:
+            cache_key = None
+        return self.map_predicate(container.__contains__, cache_key=cache_key)
 
 
 @instance  # This makes _sortable_sentinel a singleton instance.
@@ -49,3 +49,227 @@ def naive_grouped_rowwise_apply(data,
             locs = (label_row == label)
             out_row[locs] = func(row[locs], *func_args)
     return out
+
+
+def _row_segments(keys):
+    """
+    Partition the sorted entries of each row of ``keys`` into segments of
+    equal keys.
+
+    Parameters
+    ----------
+    keys : ndarray[ndim=2]
+        Keys to sort and segment. Each row is sorted independently.
+
+    Returns
+    -------
+    order : ndarray[intp]
+        Indices into ``keys.ravel()`` that sort each row of ``keys``, row by
+        row. Equal keys keep their order within a row.
+    starts : ndarray[intp]
+        Position in ``order`` of the start of each segment.
+    segment_ids : ndarray[intp]
+        Segment containing each entry of ``order``.
+    """
+    nrows, ncols = keys.shape
+    order = np.argsort(keys, axis=1, kind='mergesort')
+    order += (np.arange(nrows) * ncols)[:, np.newaxis]
+    order = order.ravel()
+
+    sorted_keys = keys.ravel()[order]
+    is_start = np.empty(len(order), dtype=bool)
+    is_start[1:] = sorted_keys[1:] != sorted_keys[:-1]
+    # Every row starts a new segment.
+    is_start[::max(ncols, 1)] = True
+
+    return order, np.flatnonzero(is_start), np.cumsum(is_start) - 1
+
+
+def _segment_sums(values, starts):
+    """
+    Sum each segment of ``values``.
+
+    Segments of equal length are summed together as the rows of a 2D array,
+    so that each sum is computed exactly as ``np.sum`` would compute it on
+    the segment alone.
+    """
+    lengths = np.diff(np.append(starts, len(values)))
+    sums = np.empty(len(starts), dtype=values.dtype)
+    for length in np.unique(lengths):
+        which = np.flatnonzero(lengths == length)
+        indices = starts[which, np.newaxis] + np.arange(length)
+        sums[which] = values[indices].sum(axis=1)
+    return sums
+
+
+def _segment_nanmeans(values, starts):
+    """
+    Compute the nanmean of each segment of ``values``, matching
+    ``np.nanmean`` on each segment.
+    """
+    isnan = np.isnan(values)
+    counts = np.add.reduceat(~isnan, starts)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = _segment_sums(np.where(isnan, 0.0, values), starts) / counts
+    return means, counts, isnan
+
+
+def grouped_rowwise_demean(data, group_labels, out=None):
+    """
+    Vectorized equivalent of::
+
+        naive_grouped_rowwise_apply(data, group_labels,
+                                    lambda row: row - np.nanmean(row))
+
+    Entries of each row are sorted by label, and each group is reduced with
+    a single segmented reduction over the whole array.
+
+    Parameters
+    ----------
+    data : ndarray[float64, ndim=2]
+        Input array to demean.
+    group_labels : ndarray[int64, ndim=2]
+        Labels to use to bucket inputs from ``data``.
+    out : ndarray, optional
+        Array into which to write output.
+
+    Returns
+    -------
+    demeaned : ndarray[float64, ndim=2]
+    """
+    if not data.size:
+        return _unsort(data.ravel(), np.arange(0), data.shape, out)
+    order, starts, segment_ids = _row_segments(group_labels)
+    values = data.ravel()[order]
+    means, _, _ = _segment_nanmeans(values, starts)
+    return _unsort(values - means[segment_ids], order, data.shape, out)
+
+
+def grouped_rowwise_zscore(data, group_labels, out=None):
+    """
+    Vectorized equivalent of::
+
+        naive_grouped_rowwise_apply(
+            data,
+            group_labels,
+            lambda row: (row - np.nanmean(row)) / np.nanstd(row),
+        )
+
+    Parameters
+    ----------
+    data : ndarray[float64, ndim=2]
+        Input array to z-score.
+    group_labels : ndarray[int64, ndim=2]
+        Labels to use to bucket inputs from ``data``.
+    out : ndarray, optional
+        Array into which to write output.
+
+    Returns
+    -------
+    zscored : ndarray[float64, ndim=2]
+    """
+    if not data.size:
+        return _unsort(data.ravel(), np.arange(0), data.shape, out)
+    order, starts, segment_ids = _row_segments(group_labels)
+    values = data.ravel()[order]
+    means, counts, isnan = _segment_nanmeans(values, starts)
+
+    deviations = values - means[segment_ids]
+    squares = np.where(isnan, 0.0, deviations)
+    squares *= squares
+    with np.errstate(invalid='ignore', divide='ignore'):
+        stds = np.sqrt(_segment_sums(squares, starts) / counts)
+        zscores = deviations / stds[segment_ids]
+    return _unsort(zscores, order, data.shape, out)
+
+
+def grouped_rowwise_rankdata(data, group_labels, method, ascending=True,
+                             out=None):
+    """
+    Vectorized equivalent of::
+
+        naive_grouped_rowwise_apply(data, group_labels,
+                                    scipy.stats.rankdata, (method,))
+
+    Entries of each row are sorted by label and value, and ranks are assigned
+    from each entry's position within its group. NaNs are ranked after every
+    other value, and each NaN is ranked as distinct from every other NaN.
+
+    Parameters
+    ----------
+    data : ndarray[float64, ndim=2]
+        Input array to rank.
+    group_labels : ndarray[int64, ndim=2]
+        Labels to use to bucket inputs from ``data``.
+    method : {'ordinal', 'min', 'max', 'dense', 'average'}
+        The method used to assign ranks to tied elements. See
+        ``scipy.stats.rankdata``.
+    ascending : bool, optional
+        Whether to rank in ascending or descending order.
+    out : ndarray, optional
+        Array into which to write output.
+
+    Returns
+    -------
+    ranks : ndarray[float64, ndim=2]
+    """
+    if method not in ('ordinal', 'min', 'max', 'dense', 'average'):
+        raise ValueError('Unknown rank method %r.' % method)
+    if not data.size:
+        return _unsort(data.ravel(), np.arange(0), data.shape, out)
+
+    values = data if ascending else -data
+    nrows, ncols = data.shape
+    rows = np.repeat(np.arange(nrows), ncols)
+    # lexsort is stable, so ties keep their order, as for 'ordinal' ranks in
+    # scipy.
+    order = np.lexsort((values.ravel(), group_labels.ravel(), rows))
+
+    sorted_labels = group_labels.ravel()[order]
+    is_start = np.empty(len(order), dtype=bool)
+    is_start[0] = True
+    is_start[1:] = (
+        (sorted_labels[1:] != sorted_labels[:-1])
+        | (rows[1:] != rows[:-1])
+    )
+    starts = np.flatnonzero(is_start)
+    segment_ids = np.cumsum(is_start) - 1
+    # One-based position of each entry within its group.
+    positions = np.arange(1, len(order) + 1) - starts[segment_ids]
+
+    if method == 'ordinal':
+        ranks = positions
+    else:
+        sorted_values = values.ravel()[order]
+        is_new_value = is_start.copy()
+        is_new_value[1:] |= sorted_values[1:] != sorted_values[:-1]
+        tie_starts = np.flatnonzero(is_new_value)
+        tie_ids = np.cumsum(is_new_value) - 1
+
+        if method == 'dense':
+            ranks = tie_ids - tie_ids[starts][segment_ids] + 1
+        else:
+            tie_ends = np.append(tie_starts[1:], len(order)) - 1
+            lowest = positions[tie_starts][tie_ids]
+            highest = positions[tie_ends][tie_ids]
+            if method == 'min':
+                ranks = lowest
+            elif method == 'max':
+                ranks = highest
+            else:
+                ranks = 0.5 * (lowest + highest)
+
+    return _unsort(ranks, order, data.shape, out)
+
+
+def _unsort(sorted_values, order, shape, out):
+    """
+    Write ``sorted_values``, sorted by ``order``, back into an array of
+    ``shape`` in their original positions.
+    """
+    if out is None:
+        out = np.empty(shape, dtype=np.float64)
+    flat = np.empty(out.size, dtype=out.dtype)
+    flat[order] = sorted_values
+    out[...] = flat.reshape(shape)
+    return out
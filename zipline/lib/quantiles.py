@@ -1,17 +1,82 @@
 """
 Algorithms for computing quantiles on numpy arrays.
 """
-from numpy.lib import apply_along_axis
-from pandas import qcut
+from numbers import Integral
+
+import numpy as np
 
 
 def quantiles(data, nbins_or_partition_bounds):
     """
     Compute rowwise array quantiles on an input.
+
+    This is equivalent to applying::
+
+        pandas.qcut(row, q=nbins_or_partition_bounds, labels=False)
+
+    to each row of ``data``, but bin edges and labels are computed for every
+    row at once. Rows containing only NaNs are labelled with NaN.
+
+    Parameters
+    ----------
+    data : ndarray[float64, ndim=2]
+        The data to bin.
+    nbins_or_partition_bounds : int or array-like[float]
+        Either the number of equal-sized bins into which to divide each row,
+        or the quantiles at which to place the bin edges.
+
+    Returns
+    -------
+    labels : ndarray[float64, ndim=2]
+        The bin into which each entry of ``data`` falls, or NaN for NaN
+        entries.
     """
-    return apply_along_axis(
-        qcut,
-        1,
-        data,
-        q=nbins_or_partition_bounds, labels=False,
+    if isinstance(nbins_or_partition_bounds, Integral):
+        q = np.linspace(0, 1, nbins_or_partition_bounds + 1)
+    else:
+        q = np.asarray(nbins_or_partition_bounds, dtype=np.float64)
+
+    data = np.asarray(data, dtype=np.float64)
+    out = np.full(data.shape, np.nan)
+    if not data.size:
+        return out
+
+    nrows, ncols = data.shape
+    # NaNs are sorted to the end of each row.
+    values = np.sort(data, axis=1)
+    counts = ncols - np.isnan(data).sum(axis=1)
+
+    # Compute bin edges by linear interpolation between the sorted values of
+    # each row, in the same way as pandas.qcut.
+    at = q * (counts[:, np.newaxis] - 1)
+    lower = np.floor(at)
+    fraction = at - lower
+    lower = lower.clip(0, ncols - 1).astype(np.intp)
+    upper = (lower + 1).clip(0, ncols - 1)
+    rows = np.arange(nrows)[:, np.newaxis]
+    below = values[rows, lower]
+    above = values[rows, upper]
+    edges = np.where(
+        fraction == 0,
+        below,
+        below + (above - below) * fraction,
     )
+
+    if len(q) > 2:
+        duplicated = (edges[:, 1:] == edges[:, :-1]).any(axis=1)
+        duplicated &= counts > 0
+        if duplicated.any():
+            raise ValueError(
+                'Bin edges must be unique: %r.'
+                % edges[np.flatnonzero(duplicated)[0]]
+            )
+
+    # Label each entry with the number of edges strictly below it, minus
+    # one. Entries equal to the lowest edge go in the first bin.
+    ids = (data == edges[:, :1]).astype(np.int64)
+    for i in range(len(q)):
+        ids += data > edges[:, i:i + 1]
+
+    valid = (ids > 0) & (ids < len(q))
+    out[valid] = ids[valid] - 1
+    return out
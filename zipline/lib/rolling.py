@@ -0,0 +1,160 @@
+"""
+Rolling-window kernels over 2D blocks of data.
+
+Each kernel takes a ``data`` block of shape ``(N + window_length - 1, M)``
+and computes a statistic over each of the ``N`` trailing windows
+``data[i:i + window_length]``, producing an array of shape ``(N, M)``. This
+is the same result as applying the equivalent reduction to each window in
+turn, but it's computed in a constant number of passes over ``data`` rather
+than one pass per window.
+
+Kernels are computed with cumulative sums of the data after subtracting each
+column's mean over the block, which keeps the accumulated values small and
+so keeps the loss of precision from differencing them negligible. Kernels
+assume that ``data`` contains no infinities.
+
+See Also
+--------
+:meth:`zipline.lib.adjusted_array.AdjustedArray.traverse_blocks`
+"""
+from numpy import (
+    arange,
+    cumsum,
+    errstate,
+    float64,
+    isnan,
+    maximum,
+    nan,
+    sqrt,
+    where,
+    zeros,
+)
+from scipy.signal import lfilter
+
+from zipline.utils.math_utils import nanmean
+
+
+def _centered(data):
+    """
+    Subtract the mean of each column of ``data``, ignoring NaNs.
+
+    Returns
+    -------
+    centered : np.ndarray[float64]
+        ``data`` minus ``center``, with NaNs replaced by 0.
+    is_nan : np.ndarray[bool]
+        Mask of NaNs in ``data``.
+    center : np.ndarray[float64]
+        The value subtracted from each column.
+    """
+    is_nan = isnan(data)
+    with errstate(invalid='ignore'):
+        center = nanmean(data, axis=0)
+    center = where(isnan(center), 0.0, center)
+    centered = where(is_nan, 0.0, data - center)
+    return centered, is_nan, center
+
+
+def rolling_sum(data, window_length):
+    """
+    Sum each trailing window of ``window_length`` rows of ``data``.
+    """
+    out = zeros((data.shape[0] + 1,) + data.shape[1:], dtype=float64)
+    cumsum(data, axis=0, out=out[1:])
+    return out[window_length:] - out[:-window_length]
+
+
+def rolling_nanmean(data, window_length):
+    """
+    Rolling equivalent of ``nanmean(window, axis=0)``.
+    """
+    centered, is_nan, center = _centered(data)
+    counts = rolling_sum(~is_nan, window_length)
+    with errstate(invalid='ignore', divide='ignore'):
+        return rolling_sum(centered, window_length) / counts + center
+
+
+def rolling_nanstd(data, window_length):
+    """
+    Rolling equivalent of ``nanstd(window, axis=0)``.
+    """
+    return rolling_nanmean_and_nanstd(data, window_length)[1]
+
+
+def rolling_nanmean_and_nanstd(data, window_length):
+    """
+    Compute :func:`rolling_nanmean` and :func:`rolling_nanstd` together,
+    sharing the cumulative sums they have in common.
+    """
+    centered, is_nan, center = _centered(data)
+    counts = rolling_sum(~is_nan, window_length)
+    with errstate(invalid='ignore', divide='ignore'):
+        mean = rolling_sum(centered, window_length) / counts
+        variance = rolling_sum(centered ** 2, window_length) / counts
+        return mean + center, sqrt(maximum(variance - mean ** 2, 0.0))
+
+
+def _rolling_decayed_sum(data, window_length, decay_rate):
+    """
+    Compute ``sum(decay_rate ** k * window[-1 - k] for k in range(N))`` for
+    each trailing window of ``data``.
+    """
+    # ``lfilter`` computes the untruncated recurrence
+    #     y[t] = data[t] + decay_rate * y[t - 1]
+    # from which we drop the contribution of rows that have left the window.
+    decayed = lfilter([1.0], [1.0, -decay_rate], data, axis=0)
+    out = decayed[window_length - 1:].copy()
+    out[1:] -= (decay_rate ** window_length) * decayed[:-window_length]
+    return out
+
+
+def _decay_weights(window_length, decay_rate):
+    """
+    Weights applied by :func:`_rolling_decayed_sum` to each row of a window,
+    from oldest to newest.
+    """
+    return decay_rate ** arange(window_length - 1, -1, -1, dtype=float64)
+
+
+def rolling_exponential_weighted_mean(data, window_length, decay_rate):
+    """
+    Rolling equivalent of
+    ``average(window, axis=0, weights=exponential_weights(N, decay_rate))``.
+
+    As with ``average``, the result is NaN for any window containing a NaN.
+    """
+    centered, is_nan, center = _centered(data)
+    has_nan = rolling_sum(is_nan, window_length) > 0
+    weight_sum = _decay_weights(window_length, decay_rate).sum()
+    mean = _rolling_decayed_sum(centered, window_length, decay_rate)
+    mean /= weight_sum
+    mean += center
+    mean[has_nan] = nan
+    return mean
+
+
+def rolling_exponential_weighted_std(data, window_length, decay_rate):
+    """
+    Rolling equivalent of the bias-corrected exponentially-weighted standard
+    deviation computed by
+    :class:`~zipline.pipeline.factors.ExponentialWeightedMovingStdDev`.
+
+    As with ``average``, the result is NaN for any window containing a NaN.
+    """
+    centered, is_nan, _ = _centered(data)
+    has_nan = rolling_sum(is_nan, window_length) > 0
+    weights = _decay_weights(window_length, decay_rate)
+    weight_sum = weights.sum()
+    squared_weight_sum = weight_sum ** 2
+    bias_correction = (
+        squared_weight_sum / (squared_weight_sum - (weights ** 2).sum())
+    )
+
+    mean = _rolling_decayed_sum(centered, window_length, decay_rate)
+    mean /= weight_sum
+    variance = _rolling_decayed_sum(centered ** 2, window_length, decay_rate)
+    variance /= weight_sum
+    variance -= mean ** 2
+    out = sqrt(maximum(variance, 0.0) * bias_correction)
+    out[has_nan] = nan
+    return out
@@ -0,0 +1,223 @@
+"""
+Sharing AdjustedArrays between processes with shared memory.
+"""
+import numpy as np
+
+from zipline.lib.adjusted_array import AdjustedArray, is_categorical
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Before Python 3.8
+    shared_memory = None
+
+
+def _require_shared_memory():
+    if shared_memory is None:
+        raise NotImplementedError(
+            'Sharing AdjustedArrays requires multiprocessing.shared_memory, '
+            'which is only available on Python 3.8 or later.'
+        )
+
+
+def _attach_shared_memory(name):
+    try:
+        # Don't let this process's resource tracker unlink the block when
+        # the process exits: it belongs to the process that published it.
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Before Python 3.13
+        return shared_memory.SharedMemory(name=name)
+
+
+class SharedAdjustedArray(object):
+    """
+    Handle to the data and adjustments of an AdjustedArray that have been
+    published to shared memory.
+
+    Use :meth:`publish` to copy an AdjustedArray's data into a new block of
+    shared memory. Handles pickle to just the name of the block and the
+    adjustments, so they can be sent cheaply to other processes, where
+    :meth:`attach` builds read-only AdjustedArrays over the shared data
+    without copying it.
+
+    Parameters
+    ----------
+    name : str
+        Name of the shared memory block holding the data.
+    shape : tuple[int, int]
+        Shape of the data.
+    dtype : np.dtype
+        Dtype of the data.
+    adjustments : dict[int -> list[Adjustment]]
+        The adjustments of the array.
+    missing_value : object
+        The missing value of the array.
+
+    Notes
+    -----
+    Adjustments are applied to a traversal's data in place, so
+    :meth:`AdjustedArray.traverse` and :meth:`AdjustedArray.traverse_blocks`
+    read the shared data until the first adjustment in the traversed rows,
+    and copy it into the traversing process then. Pass ``columns`` to
+    :meth:`attach` to copy only the columns being computed.
+
+    The process that published an array owns its block, and must call
+    :meth:`unlink` once every process is done with it. Every process must
+    keep the handle alive while it uses arrays attached from it, and should
+    call :meth:`close` when it's done.
+
+    Categorical data isn't supported.
+
+    This requires :mod:`multiprocessing.shared_memory`, which is new in
+    Python 3.8. On earlier versions, creating a handle raises
+    ``NotImplementedError``.
+
+    Examples
+    --------
+    ::
+
+        shared = SharedAdjustedArray.publish(adjusted_array)
+        try:
+            pool.map(compute, [(shared, asset_slice) for ...])
+        finally:
+            shared.unlink()
+
+        # In each worker:
+        array = shared.attach()
+    """
+    __slots__ = (
+        'name',
+        'shape',
+        'dtype',
+        'adjustments',
+        'missing_value',
+        '_shm',
+    )
+
+    def __init__(self, name, shape, dtype, adjustments, missing_value):
+        _require_shared_memory()
+        self.name = name
+        self.shape = shape
+        self.dtype = np.dtype(dtype)
+        self.adjustments = adjustments
+        self.missing_value = missing_value
+        self._shm = None
+
+    @classmethod
+    def publish(cls, array, name=None):
+        """
+        Copy the data of an AdjustedArray into a new block of shared memory.
+
+        Parameters
+        ----------
+        array : AdjustedArray
+            The array to publish.
+        name : str, optional
+            Name of the shared memory block to create. By default, a unique
+            name is generated.
+
+        Returns
+        -------
+        shared : SharedAdjustedArray
+            Handle to the published array, which owns the new block.
+        """
+        _require_shared_memory()
+        if is_categorical(array.dtype):
+            raise TypeError(
+                "Can't publish AdjustedArray with categorical dtype %s to "
+                "shared memory." % array.dtype
+            )
+
+        data = array.data
+        shm = shared_memory.SharedMemory(
+            name=name,
+            create=True,
+            # Shared memory blocks can't be empty.
+            size=max(data.nbytes, 1),
+        )
+        out = np.ndarray(data.shape, data.dtype, buffer=shm.buf, order='F')
+        out[...] = data
+        del out
+
+        shared = cls(
+            shm.name,
+            data.shape,
+            data.dtype,
+            array.adjustments,
+            array.missing_value,
+        )
+        shared._shm = shm
+        return shared
+
+    def attach(self, columns=None):
+        """
+        Build a read-only AdjustedArray over the shared data.
+
+        Parameters
+        ----------
+        columns : np.ndarray[int], optional
+            Sorted indices of the columns to attach. If passed, the data of
+            just these columns is copied out of the shared memory block into
+            an array that can be traversed with ``copy=False``.
+
+        Returns
+        -------
+        array : AdjustedArray
+            An array whose data is a read-only view of the shared memory
+            block, which is only valid until :meth:`close` is called, or a
+            copy of ``columns`` of it.
+        """
+        if self._shm is None:
+            self._shm = _attach_shared_memory(self.name)
+
+        data = np.ndarray(
+            self.shape,
+            self.dtype,
+            buffer=self._shm.buf,
+            order='F',
+        )
+        data.setflags(write=False)
+        array = AdjustedArray(data, self.adjustments, self.missing_value)
+        if columns is not None:
+            return array.select_columns(columns)
+        return array
+
+    def close(self):
+        """
+        Close this process's view of the shared memory block.
+
+        Every array attached from this handle must be deleted first.
+        """
+        shm, self._shm = self._shm, None
+        if shm is not None:
+            shm.close()
+
+    def unlink(self):
+        """
+        Close and free the shared memory block.
+
+        This should be called once, by the process that published the array,
+        after every other process is done with it.
+        """
+        shm = self._shm
+        if shm is None:
+            shm = _attach_shared_memory(self.name)
+        self._shm = None
+        shm.close()
+        shm.unlink()
+
+    def __reduce__(self):
+        return type(self), (
+            self.name,
+            self.shape,
+            self.dtype,
+            self.adjustments,
+            self.missing_value,
+        )
+
+    def __repr__(self):
+        return '{}(name={!r}, shape={}, dtype={})'.format(
+            type(self).__name__,
+            self.name,
+            self.shape,
+            self.dtype,
+        )
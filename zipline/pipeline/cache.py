@@ -0,0 +1,532 @@
+"""
+Persistent, content-addressed caching of computed Pipeline terms.
+"""
+from hashlib import sha256
+import errno
+import os
+from shutil import rmtree
+from tempfile import mkdtemp
+import types
+
+import numpy as np
+from six import iteritems, string_types
+
+from zipline.assets import Asset
+from zipline.utils.numpy_utils import int64_dtype
+from zipline.utils.paths import ensure_directory
+
+from .domain import Domain
+from .sentinels import NotSpecified
+from .term import LoadableTerm, Term
+
+_VALUES = 'values.npy'
+_DATES = 'dates.npy'
+_SIDS = 'sids.npy'
+
+
+def term_signature(term):
+    """
+    Compute a stable, content-addressed signature for ``term``.
+
+    Unlike ``hash(term)``, the signature is stable across processes, so it can
+    be used to identify a term's results on disk. Two terms have the same
+    signature if they were constructed from the same type, params, inputs,
+    window length, mask, dtype, and domain. The signature of a type also
+    includes the implementation of its ``compute`` method, including the
+    names, closure values, and global helper functions it uses, so editing a
+    CustomFactor's implementation produces a new signature. Changes to code
+    outside of the functions ``compute`` references directly (e.g. the body
+    of a library function it calls through a module attribute) aren't
+    detected.
+
+    Parameters
+    ----------
+    term : zipline.pipeline.Term
+        The term to sign.
+
+    Returns
+    -------
+    signature : str
+        Hex digest identifying ``term``.
+    """
+    return sha256(repr(_canonicalize(term, {})).encode('utf-8')).hexdigest()
+
+
+def _canonicalize_code(func, seen=None):
+    """
+    Hash the implementation of ``func``.
+
+    The hash covers ``func``'s bytecode, the names and constants it uses
+    (including nested functions), the values of its closure cells, and the
+    implementations of the global functions it references, so changing which
+    helper a function calls changes its hash.
+    """
+    code = getattr(func, '__code__', None)
+    if code is None:
+        return None
+
+    if seen is None:
+        seen = set()
+    if code in seen:
+        # Recursive reference; the code is already part of the hash.
+        return 'recursive'
+    seen.add(code)
+
+    closure = []
+    for cell in getattr(func, '__closure__', None) or ():
+        try:
+            contents = cell.cell_contents
+        except ValueError:  # Empty cell.
+            contents = NotSpecified
+        closure.append(_canonicalize_reference(contents, seen))
+
+    func_globals = getattr(func, '__globals__', {})
+    referenced = tuple(
+        (name, _canonicalize_reference(func_globals[name], seen))
+        for name in sorted(_code_names(code))
+        if name in func_globals
+    )
+    return sha256(
+        repr((
+            _canonicalize_code_object(code),
+            tuple(closure),
+            referenced,
+        )).encode('utf-8'),
+    ).hexdigest()
+
+
+def _canonicalize_code_object(code):
+    return (
+        code.co_code,
+        code.co_names,
+        tuple(
+            _canonicalize_code_object(const)
+            if isinstance(const, types.CodeType) else repr(const)
+            for const in code.co_consts
+        ),
+    )
+
+
+def _code_names(code):
+    """Get the global and attribute names used by ``code`` and nested code.
+    """
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _code_names(const)
+    return names
+
+
+def _canonicalize_reference(ob, seen):
+    """
+    Canonicalize an object referenced by a function's globals or closure.
+    """
+    if isinstance(ob, types.ModuleType):
+        return ('module', ob.__name__)
+    elif isinstance(ob, (types.FunctionType, types.MethodType)):
+        return (
+            'function',
+            ob.__module__,
+            ob.__name__,
+            _canonicalize_code(ob, seen),
+        )
+    elif isinstance(ob, type):
+        return ('type', ob.__module__, ob.__name__)
+    elif callable(ob) and hasattr(ob, '__name__'):
+        # Builtins and other callables without bytecode, e.g. numpy ufuncs.
+        return ('callable', getattr(ob, '__module__', None), ob.__name__)
+    return _canonicalize(ob, {})
+
+
+def _canonicalize(ob, memo):
+    """
+    Convert ``ob`` into a nested structure of builtin values whose ``repr`` is
+    stable across processes.
+    """
+    if isinstance(ob, Term):
+        try:
+            return memo[ob]
+        except KeyError:
+            out = memo[ob] = ('term', _canonicalize(ob._identity, memo))
+            return out
+    elif isinstance(ob, type):
+        return (
+            'type',
+            ob.__module__,
+            ob.__name__,
+            _canonicalize_code(getattr(ob, 'compute', None)),
+        )
+    elif isinstance(ob, (types.FunctionType, types.BuiltinFunctionType)):
+        return (
+            'function',
+            ob.__module__,
+            ob.__name__,
+            _canonicalize_code(ob),
+        )
+    elif isinstance(ob, (Domain, np.dtype)):
+        return repr(ob)
+    elif isinstance(ob, Asset):
+        return ('asset', ob.sid)
+    elif isinstance(ob, (tuple, list)):
+        return tuple(_canonicalize(x, memo) for x in ob)
+    elif isinstance(ob, (set, frozenset)):
+        return ('set',) + tuple(sorted(repr(_canonicalize(x, memo))
+                                       for x in ob))
+    elif isinstance(ob, dict):
+        return ('dict',) + tuple(sorted(
+            (repr(_canonicalize(k, memo)), _canonicalize(v, memo))
+            for k, v in iteritems(ob)
+        ))
+    elif ob is NotSpecified or ob is None or isinstance(
+            ob, string_types + (bytes, bool, int, float, np.generic)):
+        return repr(ob)
+    # Objects without a stable repr (e.g. default ``object.__repr__``) will
+    # just produce signatures that never match across processes, which costs
+    # us cache misses but never incorrect results.
+    return repr(ob)
+
+
+class TermResultCache(object):
+    """
+    Size-bounded on-disk cache of computed Pipeline term results.
+
+    Results are keyed on the signature of the term (see
+    :func:`~zipline.pipeline.cache.term_signature`), the domain of execution,
+    ``data_version``, and a ``variant`` identifying how the engine computed
+    the result, e.g. whether it stored intermediate results as float32. Each
+    entry stores the 2D result array for a range of dates and assets, and is
+    memory-mapped when read back, so a hit costs only the pages that are
+    actually touched. A request for a date range and set of assets contained
+    within a cached entry is served as a slice of that entry.
+
+    Pass an instance to :class:`~zipline.pipeline.engine.SimplePipelineEngine`
+    as ``term_cache`` to seed each pipeline's initial workspace from the cache
+    and to store newly-computed results.
+
+    Parameters
+    ----------
+    path : str
+        Directory in which to store cached results.
+    max_size : int
+        Maximum number of bytes to store. When the cache grows beyond this
+        size, the least-recently-used entries are evicted.
+    data_version : object
+        Value identifying the version of the underlying data, for example the
+        ingestion timestamp of the bundle being used. Results computed against
+        different data versions never match each other, so this must change
+        whenever the data is re-ingested.
+    """
+    def __init__(self, path, max_size, data_version):
+        ensure_directory(path)
+        self._path = path
+        self._max_size = max_size
+        self._data_version = str(data_version)
+
+        # Running count of the bytes stored in the cache. This is computed
+        # from the directory on the first ``put`` and recomputed whenever we
+        # evict, which also picks up entries written by other processes.
+        self._size = None
+
+    @property
+    def path(self):
+        return self._path
+
+    @staticmethod
+    def is_cacheable(term):
+        """Can we store results for ``term``?
+        """
+        return (
+            not isinstance(term, LoadableTerm)
+            and term.outputs is NotSpecified
+            and term.dtype != object
+        )
+
+    @classmethod
+    def is_worth_storing(cls, term, outputs):
+        """
+        Should the results of ``term`` be stored when it's computed for an
+        execution plan with ``outputs``?
+
+        Only pipeline outputs and windowed terms are stored. Other
+        intermediate results are cheap to recompute from their inputs, and
+        writing every one of them would make each run pay for a write per
+        term.
+        """
+        return cls.is_cacheable(term) and (term.windowed or term in outputs)
+
+    def _term_dir(self, term, domain, variant):
+        key = sha256(
+            '\0'.join([
+                term_signature(term),
+                repr(domain),
+                self._data_version,
+                repr(variant),
+            ]).encode('utf-8'),
+        ).hexdigest()
+        return os.path.join(self._path, key)
+
+    def get(self, term, domain, dates, assets, variant=None):
+        """
+        Look up the values of ``term`` for ``dates`` and ``assets``.
+
+        Parameters
+        ----------
+        term : zipline.pipeline.Term
+            The term to look up.
+        domain : zipline.pipeline.domain.Domain
+            The domain on which ``term`` is being computed.
+        dates : pd.DatetimeIndex
+            Row labels of the requested values.
+        assets : pd.Int64Index
+            Column labels of the requested values.
+        variant : object, optional
+            Value identifying how the engine computes results. Only results
+            stored with an equal ``variant`` are returned.
+
+        Returns
+        -------
+        values : np.ndarray or None
+            The cached values, or None if no entry covers the request.
+        """
+        if not self.is_cacheable(term) or not len(dates):
+            return None
+
+        term_dir = self._term_dir(term, domain, variant)
+        try:
+            entries = os.listdir(term_dir)
+        except OSError as e:
+            if e.errno != errno.ENOENT:
+                raise
+            return None
+
+        requested_dates = dates.asi8
+        requested_sids = np.asarray(assets, dtype=int64_dtype)
+        first, last = requested_dates[0], requested_dates[-1]
+        for entry in entries:
+            try:
+                entry_first, entry_last = map(int, entry.split('_')[:2])
+            except ValueError:
+                # Not an entry, e.g. a partially-written temporary directory.
+                continue
+            if entry_first > first or entry_last < last:
+                continue
+
+            entry_dir = os.path.join(term_dir, entry)
+            try:
+                values = self._read_entry(
+                    entry_dir,
+                    term,
+                    requested_dates,
+                    requested_sids,
+                )
+            except (IOError, OSError):
+                # The entry was evicted out from under us.
+                continue
+            if values is not None:
+                self._touch(entry_dir)
+                return values
+        return None
+
+    def _read_entry(self, entry_dir, term, requested_dates, requested_sids):
+        cached_dates = np.load(os.path.join(entry_dir, _DATES))
+        start = cached_dates.searchsorted(requested_dates[0])
+        stop = start + len(requested_dates)
+        if not np.array_equal(cached_dates[start:stop], requested_dates):
+            return None
+
+        # Map copy-on-write so that consumers which mutate their inputs in
+        # place (e.g. ``AdjustedArray.traverse(copy=False)``) never write back
+        # to the cache.
+        values = np.load(os.path.join(entry_dir, _VALUES), mmap_mode='c')
+        values = values[start:stop]
+        if term.ndim == 1:
+            return values
+
+        cached_sids = np.load(os.path.join(entry_dir, _SIDS))
+        if np.array_equal(cached_sids, requested_sids):
+            return values
+
+        columns = cached_sids.searchsorted(requested_sids)
+        if (columns >= len(cached_sids)).any() or \
+                not np.array_equal(cached_sids[columns], requested_sids):
+            return None
+        return values[:, columns]
+
+    def put(self, term, domain, dates, assets, values, variant=None):
+        """
+        Store the values of ``term`` for ``dates`` and ``assets``.
+
+        Parameters
+        ----------
+        term : zipline.pipeline.Term
+            The term whose values are being stored.
+        domain : zipline.pipeline.domain.Domain
+            The domain on which ``term`` was computed.
+        dates : pd.DatetimeIndex
+            Row labels of ``values``.
+        assets : pd.Int64Index
+            Column labels of ``values``.
+        values : np.ndarray
+            The computed values of ``term``.
+        variant : object, optional
+            Value identifying how the engine computed ``values``. See
+            :meth:`get`.
+        """
+        if not (self.is_cacheable(term)
+                and isinstance(values, np.ndarray)
+                and values.size):
+            return
+
+        term_dir = self._term_dir(term, domain, variant)
+        ensure_directory(term_dir)
+
+        raw_dates = dates.asi8
+        sids = np.asarray(assets, dtype=int64_dtype)
+        entry_dir = os.path.join(
+            term_dir,
+            '%d_%d_%s' % (
+                raw_dates[0],
+                raw_dates[-1],
+                sha256(sids.tobytes()).hexdigest()[:16],
+            ),
+        )
+        if os.path.exists(entry_dir):
+            self._touch(entry_dir)
+            return
+
+        # Write into a temporary directory and rename it into place so that
+        # concurrent readers never observe a partially-written entry.
+        tmp_dir = mkdtemp(prefix='.tmp', dir=term_dir)
+        try:
+            np.save(os.path.join(tmp_dir, _VALUES), np.asarray(values))
+            np.save(os.path.join(tmp_dir, _DATES), raw_dates)
+            np.save(os.path.join(tmp_dir, _SIDS), sids)
+            entry_size = self._entry_size(tmp_dir)
+            os.rename(tmp_dir, entry_dir)
+        except OSError:
+            # Another process stored the same entry first.
+            rmtree(tmp_dir, ignore_errors=True)
+            if not os.path.exists(entry_dir):
+                raise
+            return
+
+        if self._size is None:
+            self._size = self.size()
+        else:
+            self._size += entry_size
+
+        if self._size > self._max_size:
+            self.evict()
+
+    @staticmethod
+    def _touch(entry_dir):
+        try:
+            os.utime(entry_dir, None)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _entry_size(entry_dir):
+        return sum(
+            os.path.getsize(os.path.join(entry_dir, f))
+            for f in os.listdir(entry_dir)
+        )
+
+    def _entries(self):
+        """
+        Get a list of (last_used, size, path) triples for each cache entry.
+        """
+        out = []
+        for term_dir in os.listdir(self._path):
+            term_dir = os.path.join(self._path, term_dir)
+            if not os.path.isdir(term_dir):
+                continue
+            for entry in os.listdir(term_dir):
+                if entry.startswith('.'):
+                    # Skip entries that are still being written.
+                    continue
+                entry_dir = os.path.join(term_dir, entry)
+                try:
+                    size = self._entry_size(entry_dir)
+                    out.append((os.path.getmtime(entry_dir), size, entry_dir))
+                except OSError:
+                    # Evicted by another process.
+                    continue
+        return out
+
+    def size(self):
+        """The number of bytes currently stored in the cache.
+        """
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """
+        Remove least-recently-used entries until the cache fits in
+        ``max_size`` bytes.
+
+        This walks the whole cache directory, so ``put`` only calls it once
+        the running count of stored bytes passes ``max_size``.
+        """
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry_dir in entries:
+            if total <= self._max_size:
+                break
+            rmtree(entry_dir, ignore_errors=True)
+            total -= size
+        self._size = total
+
+    def clear(self):
+        """Remove all entries from the cache.
+        """
+        for term_dir in os.listdir(self._path):
+            rmtree(os.path.join(self._path, term_dir), ignore_errors=True)
+        self._size = 0
+
+    def populate_initial_workspace(self,
+                                   initial_workspace,
+                                   root_mask_term,
+                                   execution_plan,
+                                   dates,
+                                   assets,
+                                   variant=None):
+        """
+        Seed ``initial_workspace`` with cached results for terms in
+        ``execution_plan``.
+
+        This has the same signature as
+        :func:`zipline.pipeline.engine.default_populate_initial_workspace`,
+        plus the ``variant`` of the results to look up (see :meth:`get`).
+        Terms are visited from the outputs of the plan back toward its
+        inputs, and a term is only looked up if some term that depends on it
+        still needs to be computed, so a fully-cached pipeline loads nothing
+        but its outputs.
+        """
+        workspace = initial_workspace.copy()
+        graph = execution_plan.graph
+        extra_rows = execution_plan.extra_rows
+        root_extra_rows = extra_rows[root_mask_term]
+        outputs = set(execution_plan.outputs.values())
+
+        needed = set()
+        for term in reversed(list(execution_plan.ordered())):
+            if not (term in outputs or any(
+                    dependent in needed and dependent not in workspace
+                    for dependent in graph.successors(term))):
+                continue
+            needed.add(term)
+            if term in workspace:
+                continue
+
+            term_dates = dates[root_extra_rows - extra_rows[term]:]
+            values = self.get(
+                term,
+                execution_plan.domain,
+                term_dates,
+                assets,
+                variant,
+            )
+            if values is not None:
+                workspace[term] = values
+
+        return workspace
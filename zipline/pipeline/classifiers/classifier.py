@@ -496,7 +496,7 @@ class Relabel(SingleInputMixin, Classifier):
         data = arrays[0]
 
         if isinstance(data, LabelArray):
-            result = data.map(relabeler)
+            result = data.map(relabeler, cache_key=relabeler)
             result[~mask] = data.missing_value
         else:
             raise NotImplementedError(
@@ -51,23 +51,40 @@ implements the following algorithm for executing pipelines:
 
    This logic lives in SimplePipelineEngine.compute_chunk.
 
+   If the engine was constructed with a ``compute_pool``, terms whose
+   inputs are all present in the workspace are instead submitted to the
+   pool as soon as they become ready, so independent terms run
+   concurrently. Loads, refcounting, and workspace bookkeeping still
+   happen on the calling thread.
+
 7. Extract the pipeline's outputs from the workspace and convert them
    into "narrow" format, with output labels dictated by the Pipeline's
    screen. This logic lives in SimplePipelineEngine._to_narrow.
 """
 from abc import ABCMeta, abstractmethod
-from functools import partial
-
-from six import iteritems, with_metaclass, viewkeys
+from collections import deque
+from functools import partial, reduce
+from hashlib import sha256
+from operator import and_, attrgetter, or_
+from multiprocessing.pool import Pool, ThreadPool
+import sys
+
+from six import iteritems, reraise, with_metaclass, viewkeys
+from six.moves.queue import Queue
 from numpy import array, arange
 from pandas import DataFrame, MultiIndex
 from toolz import groupby
 
 from zipline.lib.adjusted_array import ensure_adjusted_array, ensure_ndarray
 from zipline.errors import NoFurtherDataError
+from zipline.utils.compat import ExitStack
 from zipline.utils.input_validation import expect_types
 from zipline.utils.numpy_utils import (
     as_column,
+    float32_dtype,
+    float64_dtype,
+    int64_dtype,
+    object_dtype,
     repeat_first_axis,
     repeat_last_axis,
 )
@@ -75,9 +92,20 @@ from zipline.utils.pandas_utils import explode
 from zipline.utils.string_formatting import bulleted_list
 
 from .domain import Domain, GENERIC
-from .graph import maybe_specialize
-from .hooks import DelegatingHooks
+from .expression import NumericalExpression
+from .filters import (
+    ArrayPredicate,
+    NotNullFilter,
+    NullFilter,
+    SingleAsset,
+    StaticSids,
+)
+from .graph import SCREEN_NAME, maybe_specialize
+from .hooks import DelegatingHooks, NoHooks
+from .mixins import LatestMixin, SliceMixin, compute_with_shared_windows
+from .pipeline import Pipeline
 from .term import AssetExists, InputDates, LoadableTerm
+from .workspace import SpillingWorkspace
 
 from zipline.utils.date_utils import compute_date_range_chunks
 from zipline.utils.pandas_utils import categorical_df_concat
@@ -247,6 +275,79 @@ class SimplePipelineEngine(PipelineEngine):
     default_hooks : list, optional
         List of hooks that should be used to instrument all pipelines executed
         by this engine.
+    compute_pool : int or Pool, optional
+        Pool used to compute independent terms concurrently. This may be any
+        object implementing ``apply_async`` (for example,
+        :class:`multiprocessing.pool.ThreadPool` or
+        :class:`zipline.utils.pool.SequentialPool`). If an integer is passed,
+        a ``ThreadPool`` with that many workers is created on first use. Most
+        built-in and custom factor computations spend their time in numpy,
+        which releases the GIL, so a thread pool is usually the right choice.
+        By default, terms are computed serially in execution order.
+    term_cache : zipline.pipeline.cache.TermResultCache, optional
+        Persistent cache of computed term results. If supplied, the initial
+        workspace of each pipeline execution is seeded with any cached results
+        (after ``populate_initial_workspace`` has run), and newly-computed
+        results are written back to the cache.
+    share_windows : bool, optional
+        Compute windowed custom terms that share the same inputs from a single
+        traversal of those inputs, instead of traversing (and copying) each
+        input once per term. Results are identical either way; this trades a
+        little generality in hook tracing (the ``computing_term`` contexts of
+        grouped terms are nested) for less time spent applying adjustments
+        and copying inputs. Only the input windows are shared: each term
+        still does its own arithmetic over them. See
+        :attr:`zipline.pipeline.graph.ExecutionPlan.shared_window_groups`.
+    rolling_kernels : bool, optional
+        Compute built-in moving-window factors that provide a
+        ``compute_rolling`` method (e.g. ``SimpleMovingAverage``) with a
+        single vectorized pass over each run of rows between adjustments,
+        rather than with one ``compute`` call per output row. Results agree
+        with the default implementations up to floating point error.
+    memory_budget : int, optional
+        Number of bytes of intermediate results to hold in memory while
+        computing a chunk. When the workspace grows past this size, the least
+        recently used results are spilled to memory-mapped temporary files
+        and read back when they're next needed. The peak in-memory size of
+        each chunk's workspace is reported to the ``on_workspace_memory``
+        method of the execution's hooks. By default, all intermediate results
+        are held in memory. See
+        :class:`zipline.pipeline.workspace.SpillingWorkspace`.
+    spill_directory : str, optional
+        Directory in which to write spilled results when ``memory_budget`` is
+        set. Defaults to the system temporary directory.
+    float32_storage : bool, optional
+        Store the results of float64 terms as float32, halving the memory
+        they occupy between computations. Computations still happen in
+        float64: float32 inputs are upcast before they're passed to
+        ``compute``, and pipeline outputs of float64 terms are upcast back
+        to float64, though they only have float32 precision. Results stored
+        in ``term_cache`` by engines with and without float32 storage are
+        kept separate.
+        Pair this with ``EquityPricingLoader(..., float32_storage=True)`` to
+        also store loaded prices as float32.
+    prune_assets : bool, optional
+        Compute each pipeline only for the assets that can pass its screen.
+        The parts of the screen that depend only on each asset's own current
+        data (e.g. ``StaticAssets``, or comparisons of ``.latest`` values like
+        ``Sector().eq(...)``) are evaluated first, and the rest of the
+        pipeline is computed only for assets that pass them on at least one
+        date. This can make pipelines with small screens over large domains
+        much faster, but cross-sectional computations (e.g. ``rank()``,
+        ``zscore()``, or a custom factor comparing assets) then only see the
+        retained assets, as if they were masked by those parts of the screen.
+        Assets selected by slices are always retained.
+    screen_first_cost : float, optional
+        Minimum ``cost`` of custom terms that should only be computed where
+        they can affect the pipeline's output. Pipeline outputs at least this
+        expensive that no other term depends on are computed after the
+        screen, and only where it passes. All terms at least this expensive
+        skip the assets that their mask excludes on every date, without
+        traversing those assets' inputs. As with ``prune_assets``, this
+        assumes that the value computed for each asset doesn't depend on the
+        other assets computed alongside it. See
+        :attr:`zipline.pipeline.mixins.CustomTermMixin.cost` and
+        :meth:`zipline.pipeline.graph.ExecutionPlan.screen_first`.
 
     See Also
     --------
@@ -258,6 +359,17 @@ class SimplePipelineEngine(PipelineEngine):
         '_root_mask_term',
         '_root_mask_dates_term',
         '_populate_initial_workspace',
+        '_default_domain',
+        '_default_hooks',
+        '_compute_pool',
+        '_term_cache',
+        '_share_windows',
+        '_rolling_kernels',
+        '_memory_budget',
+        '_spill_directory',
+        '_float32_storage',
+        '_prune_assets',
+        '_screen_first_cost',
     )
 
     @expect_types(
@@ -269,7 +381,16 @@ class SimplePipelineEngine(PipelineEngine):
                  asset_finder,
                  default_domain=GENERIC,
                  populate_initial_workspace=None,
-                 default_hooks=None):
+                 default_hooks=None,
+                 compute_pool=None,
+                 term_cache=None,
+                 share_windows=False,
+                 rolling_kernels=False,
+                 memory_budget=None,
+                 spill_directory=None,
+                 float32_storage=False,
+                 prune_assets=False,
+                 screen_first_cost=None):
 
         self._get_loader = get_loader
         self._finder = asset_finder
@@ -287,12 +408,32 @@ class SimplePipelineEngine(PipelineEngine):
         else:
             self._default_hooks = list(default_hooks)
 
+        self._compute_pool = compute_pool
+        self._term_cache = term_cache
+        self._share_windows = share_windows
+        self._rolling_kernels = rolling_kernels
+        self._memory_budget = memory_budget
+        self._spill_directory = spill_directory
+        self._float32_storage = float32_storage
+        self._prune_assets = prune_assets
+        self._screen_first_cost = screen_first_cost
+
+    def _get_compute_pool(self):
+        """Get the pool used to compute independent terms, if any.
+        """
+        pool = self._compute_pool
+        if isinstance(pool, int):
+            pool = self._compute_pool = ThreadPool(pool)
+        return pool
+
     def run_chunked_pipeline(self,
                              pipeline,
                              start_date,
                              end_date,
                              chunksize,
-                             hooks=None):
+                             hooks=None,
+                             max_workers=None,
+                             engine_factory=None):
         """
         Compute values for ``pipeline`` from ``start_date`` to ``end_date``, in
         date chunks of size ``chunksize``.
@@ -312,6 +453,18 @@ class SimplePipelineEngine(PipelineEngine):
             The number of days to execute at a time.
         hooks : list[implements(PipelineHooks)], optional
             Hooks for instrumenting Pipeline execution.
+        max_workers : int, optional
+            If supplied and greater than 1, compute chunks concurrently in a
+            process pool with this many workers. ``engine_factory`` must also
+            be supplied.
+        engine_factory : callable, optional
+            Zero-argument function returning the ``PipelineEngine`` that each
+            worker process should use to compute its chunks. Workers build
+            their own engines so that loaders don't share file handles or
+            database connections with the parent process. ``engine_factory``
+            and ``pipeline`` are sent to the workers when the pool starts, so
+            they must be picklable unless processes are started with
+            ``fork``.
 
         Returns
         -------
@@ -340,9 +493,31 @@ class SimplePipelineEngine(PipelineEngine):
         )
         hooks = self._resolve_hooks(hooks)
 
-        run_pipeline = partial(self._run_pipeline_impl, pipeline, hooks=hooks)
-        with hooks.running_pipeline(pipeline, start_date, end_date):
-            chunks = [run_pipeline(s, e) for s, e in ranges]
+        if max_workers is not None and max_workers > 1:
+            ranges = list(ranges)
+
+        if max_workers is not None and max_workers > 1 and len(ranges) > 1:
+            if engine_factory is None:
+                raise ValueError(
+                    "engine_factory must be supplied to run a chunked "
+                    "pipeline with max_workers={}.".format(max_workers)
+                )
+            # Hooks can't be shared across processes, so only
+            # ``running_pipeline`` is reported to ``hooks``. Per-chunk events
+            # are reported to the default hooks of the workers' engines.
+            with hooks.running_pipeline(pipeline, start_date, end_date):
+                chunks = _run_chunks_in_process_pool(
+                    engine_factory,
+                    pipeline,
+                    ranges,
+                    max_workers,
+                )
+        else:
+            run_pipeline = partial(
+                self._run_pipeline_impl, pipeline, hooks=hooks,
+            )
+            with hooks.running_pipeline(pipeline, start_date, end_date):
+                chunks = [run_pipeline(s, e) for s, e in ranges]
 
         if len(chunks) == 1:
             # OPTIMIZATION: Don't make an extra copy in `categorical_df_concat`
@@ -392,6 +567,157 @@ class SimplePipelineEngine(PipelineEngine):
                 hooks,
             )
 
+    def run_pipeline_iter(self,
+                          pipeline,
+                          start_date,
+                          end_date,
+                          chunksize=21,
+                          hooks=None,
+                          sink=None):
+        """
+        Lazily compute values for ``pipeline`` from ``start_date`` to
+        ``end_date``, yielding results in date chunks of size ``chunksize``.
+
+        Unlike :meth:`run_chunked_pipeline`, results are never concatenated, so
+        peak memory is bounded by the size of a single chunk rather than by
+        the size of the full date range, as long as the caller doesn't retain
+        the yielded frames.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline to run.
+        start_date : pd.Timestamp
+            The start date to run the pipeline for.
+        end_date : pd.Timestamp
+            The end date to run the pipeline for.
+        chunksize : int, optional
+            The number of days to compute at a time. Default is 21, about a
+            month of sessions. Every chunk loads its own lookback window, so
+            smaller chunks use less memory at the cost of reloading the
+            lookback window more often.
+        hooks : list[implements(PipelineHooks)], optional
+            Hooks for instrumenting Pipeline execution.
+        sink : implements(PipelineSink), optional
+            If supplied, each chunk is written to ``sink`` before it's
+            yielded. See :mod:`zipline.pipeline.sinks`.
+
+        Yields
+        ------
+        result : pd.DataFrame
+            The results for each chunk, in date order, in the same format as
+            the result of :meth:`run_pipeline`.
+
+        Notes
+        -----
+        Categorical columns of different chunks may have different categories.
+        Use :func:`zipline.utils.pandas_utils.categorical_df_concat` to combine
+        chunks.
+        """
+        domain = self.resolve_domain(pipeline)
+        ranges = compute_date_range_chunks(
+            domain.all_sessions(),
+            start_date,
+            end_date,
+            chunksize,
+        )
+        hooks = self._resolve_hooks(hooks)
+
+        with hooks.running_pipeline(pipeline, start_date, end_date):
+            for chunk_start, chunk_end in ranges:
+                result = self._run_pipeline_impl(
+                    pipeline, chunk_start, chunk_end, hooks,
+                )
+                if sink is not None:
+                    sink.write(result, chunk_start, chunk_end)
+                yield result
+
+    def run_pipelines(self, pipelines, start_date, end_date, hooks=None):
+        """
+        Compute values for several pipelines from ``start_date`` to
+        ``end_date`` in a single execution.
+
+        The terms of every pipeline are merged into one execution plan, so
+        columns and terms shared by several pipelines are loaded and computed
+        only once. This is much faster than running each pipeline separately
+        when the pipelines overlap, e.g. in a sweep over factor parameters.
+
+        Terms are computed for every asset that passes any pipeline's screen,
+        or for every asset if any pipeline has no screen.
+
+        Parameters
+        ----------
+        pipelines : iterable[zipline.pipeline.Pipeline]
+            The pipelines to run. They must all have the same domain.
+        start_date : pd.Timestamp
+            Start date of the computed matrices.
+        end_date : pd.Timestamp
+            End date of the computed matrices.
+        hooks : list[implements(PipelineHooks)], optional
+            Hooks for instrumenting Pipeline execution. The hooks see a single
+            pipeline holding the columns and screens of every pipeline in
+            ``pipelines``.
+
+        Returns
+        -------
+        results : list[pd.DataFrame]
+            The results of each pipeline, in the same order as ``pipelines``
+            and in the same format as the result of :meth:`run_pipeline`.
+        """
+        pipelines = list(pipelines)
+        if not pipelines:
+            return []
+
+        domains = [self.resolve_domain(p) for p in pipelines]
+        domain = domains[0]
+        if any(d is not domain for d in domains):
+            raise ValueError(
+                "Can't run pipelines with different domains together.\n"
+                "Domains were:\n%s" % bulleted_list(map(repr, domains))
+            )
+
+        columns = {}
+        screens = []
+        for i, pipeline in enumerate(pipelines):
+            for name, term in iteritems(pipeline.columns):
+                columns[_batched_column_name(i, name)] = term
+            screen = pipeline.screen
+            if screen is None:
+                continue
+            columns[_batched_column_name(i, SCREEN_NAME)] = screen
+            # Terms overload ==, so compare screens by identity.
+            if not any(screen is s for s in screens):
+                screens.append(screen)
+
+        # Compute every asset that passes any of the screens, then select
+        # the rows of each pipeline by its own screen. If any pipeline is
+        # unscreened, every asset is computed.
+        if any(p.screen is None for p in pipelines):
+            batched_screen = None
+        else:
+            batched_screen = reduce(or_, screens)
+        batched = Pipeline(
+            columns=columns,
+            screen=batched_screen,
+            domain=domain,
+        )
+        result = self.run_pipeline(batched, start_date, end_date, hooks)
+
+        out = []
+        for i, pipeline in enumerate(pipelines):
+            names = sorted(pipeline.columns)
+            if pipeline.screen is None:
+                passed = slice(None)
+            else:
+                passed = result[_batched_column_name(i, SCREEN_NAME)].values
+            frame = result.loc[
+                passed,
+                [_batched_column_name(i, name) for name in names],
+            ]
+            frame.columns = names
+            out.append(frame)
+        return out
+
     def _run_pipeline_impl(self, pipeline, start_date, end_date, hooks):
         """Shared core for ``run_pipeline`` and ``run_chunked_pipeline``.
         """
@@ -408,22 +734,37 @@ class SimplePipelineEngine(PipelineEngine):
         plan = pipeline.to_execution_plan(
             domain, self._root_mask_term, start_date, end_date,
         )
+        if self._screen_first_cost is not None:
+            plan.screen_first(self._screen_first_cost)
         extra_rows = plan.extra_rows[self._root_mask_term]
         root_mask = self._compute_root_mask(
             domain, start_date, end_date, extra_rows,
         )
+        initial_workspace = {}
+        if self._prune_assets:
+            root_mask, initial_workspace = self._prune_root_mask(
+                plan, domain, root_mask, start_date, end_date, extra_rows,
+            )
         dates, sids, root_mask_values = explode(root_mask)
 
+        initial_workspace[self._root_mask_term] = root_mask_values
+        initial_workspace[self._root_mask_dates_term] = as_column(dates.values)
         workspace = self._populate_initial_workspace(
-            {
-                self._root_mask_term: root_mask_values,
-                self._root_mask_dates_term: as_column(dates.values)
-            },
+            initial_workspace,
             self._root_mask_term,
             plan,
             dates,
             sids,
         )
+        if self._term_cache is not None:
+            workspace = self._term_cache.populate_initial_workspace(
+                workspace,
+                self._root_mask_term,
+                plan,
+                dates,
+                sids,
+                self._term_cache_variant(sids),
+            )
 
         refcounts = plan.initial_refcounts(workspace)
         execution_order = plan.execution_order(workspace, refcounts)
@@ -535,14 +876,119 @@ class SimplePipelineEngine(PipelineEngine):
 
         return ret
 
+    def _prune_root_mask(self,
+                         plan,
+                         domain,
+                         root_mask,
+                         start_date,
+                         end_date,
+                         extra_rows):
+        """
+        Drop the columns of ``root_mask`` for assets that can't pass the screen
+        of ``plan``.
+
+        Parameters
+        ----------
+        plan : zipline.pipeline.graph.ExecutionPlan
+            The plan being executed.
+        domain : zipline.pipeline.domain.Domain
+            Domain for which we're computing a pipeline.
+        root_mask : pd.DataFrame
+            Root mask for ``plan``, from ``_compute_root_mask``.
+        start_date : pd.Timestamp
+            Start date of the requested output.
+        end_date : pd.Timestamp
+            End date of the requested output.
+        extra_rows : int
+            Number of rows of ``root_mask`` before ``start_date``.
+
+        Returns
+        -------
+        pruned : pd.DataFrame
+            ``root_mask``, without the columns of assets that fail the
+            asset-local conjuncts of the screen on every requested date.
+        computed : dict[Term, np.ndarray]
+            The values of the conjuncts of the screen that were computed to
+            prune ``root_mask``, for the columns of ``pruned``, to seed the
+            workspace of ``plan``. This only includes conjuncts that ``plan``
+            doesn't need extra rows of.
+        """
+        screen = plan.outputs[plan.screen_name]
+        prefilters = [f for f in screen._conjuncts() if _is_asset_local(f)]
+        if not prefilters:
+            return root_mask, {}
+
+        prefilter_plan = Pipeline(
+            columns={str(i): f for i, f in enumerate(prefilters)},
+            screen=reduce(and_, prefilters),
+            domain=domain,
+        ).to_execution_plan(domain, self._root_mask_term, start_date, end_date)
+        prefilter_rows = prefilter_plan.extra_rows[self._root_mask_term]
+
+        dates, sids, mask_values = explode(
+            root_mask.iloc[extra_rows - prefilter_rows:],
+        )
+        workspace = self._populate_initial_workspace(
+            {
+                self._root_mask_term: mask_values,
+                self._root_mask_dates_term: as_column(dates.values)
+            },
+            self._root_mask_term,
+            prefilter_plan,
+            dates,
+            sids,
+        )
+        refcounts = prefilter_plan.initial_refcounts(workspace)
+        results = self.compute_chunk(
+            graph=prefilter_plan,
+            dates=dates,
+            sids=sids,
+            workspace=workspace,
+            refcounts=refcounts,
+            execution_order=prefilter_plan.execution_order(
+                workspace, refcounts,
+            ),
+            hooks=NoHooks(),
+        )
+
+        passed = results[prefilter_plan.screen_name].any(axis=0)
+        if not passed.any():
+            # Nothing will pass the screen, so there's no need to compute on
+            # fewer assets.
+            keep = slice(None)
+        else:
+            # Slices and single-asset filters fail if their asset is missing.
+            required = {
+                term._asset.sid for term in plan.graph
+                if isinstance(term, (SliceMixin, SingleAsset))
+            }
+            keep = passed | sids.isin(required)
+            root_mask = root_mask.loc[:, keep]
+
+        # The outputs of the prefilter plan only cover the requested dates.
+        computed = {
+            f: results[str(i)][:, keep]
+            for i, f in enumerate(prefilters)
+            if plan.extra_rows[f] == 0
+        }
+        return root_mask, computed
+
     @staticmethod
-    def _inputs_for_term(term, workspace, graph, domain, refcounts):
+    def _inputs_for_term(term,
+                         workspace,
+                         graph,
+                         domain,
+                         refcounts,
+                         columns=None):
         """
         Compute inputs for the given term.
 
         This is mostly complicated by the fact that for each input we store as
         many rows as will be necessary to serve **any** computation requiring
         that input.
+
+        If ``columns`` is supplied, only those columns of each input are
+        returned. Single-column inputs are returned as-is.
         """
         offsets = graph.offset
         out = []
@@ -556,19 +1002,23 @@ class SimplePipelineEngine(PipelineEngine):
             # If term is windowed, then all input data should be instances of
             # AdjustedArray.
             for input_ in specialized:
-                adjusted_array = ensure_adjusted_array(
-                    workspace[input_], input_.missing_value,
+                adjusted_array, copy = _select_columns(
+                    ensure_adjusted_array(
+                        workspace[input_], input_.missing_value,
+                    ),
+                    columns,
+                    # If the refcount for the input is > 1, we will need
+                    # to traverse this array again so we must copy.
+                    # If the refcount for the input == 0, this is the last
+                    # traversal that will happen so we can invalidate
+                    # the AdjustedArray and mutate the data in place.
+                    copy=refcounts[input_] > 1,
                 )
                 out.append(
                     adjusted_array.traverse(
                         window_length=term.window_length,
                         offset=offsets[term, input_],
-                        # If the refcount for the input is > 1, we will need
-                        # to traverse this array again so we must copy.
-                        # If the refcount for the input == 0, this is the last
-                        # traversal that will happen so we can invalidate
-                        # the AdjustedArray and mutate the data in place.
-                        copy=refcounts[input_] > 1,
+                        copy=copy,
                     )
                 )
         else:
@@ -578,11 +1028,193 @@ class SimplePipelineEngine(PipelineEngine):
                 input_data = ensure_ndarray(workspace[input_])
                 offset = offsets[term, input_]
                 input_data = input_data[offset:]
-                if refcounts[input_] > 1:
+                if columns is not None and input_data.shape[1] != 1:
+                    # Fancy indexing always makes a copy.
+                    input_data = input_data[:, columns]
+                    if input_data.dtype == float32_dtype:
+                        input_data = input_data.astype(float64_dtype)
+                elif input_data.dtype == float32_dtype:
+                    # Values stored in float32 are computed on in float64.
+                    # This always makes a copy.
+                    input_data = input_data.astype(float64_dtype)
+                elif refcounts[input_] > 1:
                     input_data = input_data.copy()
                 out.append(input_data)
         return out
 
+    @staticmethod
+    def _block_inputs_for_term(term,
+                               workspace,
+                               graph,
+                               domain,
+                               refcounts,
+                               columns=None):
+        """
+        Compute inputs for a term computed with ``compute_rolling`` or
+        ``compute_block``.
+
+        If ``columns`` is supplied, only those columns of each input are
+        traversed. Single-column inputs are traversed as-is.
+
+        See Also
+        --------
+        :meth:`zipline.lib.adjusted_array.AdjustedArray.traverse_blocks`
+        """
+        offsets = graph.offset
+        out = []
+        for input_ in term.inputs:
+            input_ = maybe_specialize(input_, domain)
+            adjusted_array, copy = _select_columns(
+                ensure_adjusted_array(
+                    workspace[input_], input_.missing_value,
+                ),
+                columns,
+                copy=refcounts[input_] > 1,
+            )
+            out.append(
+                adjusted_array.traverse_blocks(
+                    window_length=term.window_length,
+                    offset=offsets[term, input_],
+                    copy=copy,
+                )
+            )
+        return out
+
+    def _uses_rolling_kernel(self, term):
+        """Should ``term`` be computed with its ``compute_rolling`` method?
+        """
+        return (
+            self._rolling_kernels
+            and getattr(term, 'can_compute_rolling', False)
+        )
+
+    def _compute_function_and_inputs(self,
+                                     term,
+                                     workspace,
+                                     graph,
+                                     refcounts,
+                                     mask):
+        """
+        Get the function to call to compute ``term``, and the inputs to call
+        it with.
+        """
+        columns = self._columns_to_compute(term, mask)
+
+        if self._uses_rolling_kernel(term):
+            compute = term._compute_rolling
+            inputs = self._block_inputs_for_term(
+                term, workspace, graph, graph.domain, refcounts, columns,
+            )
+        elif getattr(term, 'can_compute_blocks', False):
+            compute = term._compute_blocks
+            inputs = self._block_inputs_for_term(
+                term, workspace, graph, graph.domain, refcounts, columns,
+            )
+        else:
+            compute = term._compute
+            inputs = self._inputs_for_term(
+                term, workspace, graph, graph.domain, refcounts, columns,
+            )
+
+        if columns is not None:
+            compute = partial(_compute_columns, term, compute, columns)
+        return compute, inputs
+
+    def _columns_to_compute(self, term, mask):
+        """
+        Get the columns to which the computation of ``term`` should be
+        restricted, or None if it should be computed for all columns.
+
+        When ``screen_first_cost`` is set, terms at least that expensive skip
+        the columns of assets that are masked out on every date, so that their
+        inputs are never even traversed for those assets.
+        """
+        min_cost = self._screen_first_cost
+        if (min_cost is None
+                or term.ndim != 2
+                or term.dtype == object_dtype
+                or getattr(term, 'cost', None) is None
+                or term.cost < min_cost):
+            return None
+
+        columns = mask.any(axis=0).nonzero()[0]
+        if len(columns) == mask.shape[1]:
+            return None
+        return columns
+
+    @staticmethod
+    def _shared_inputs_for_terms(terms, workspace, graph, domain, refcounts):
+        """
+        Compute inputs for a group of terms that share input windows.
+
+        Each input is traversed once, with the longest window length of any
+        term in ``terms``.
+
+        See Also
+        --------
+        :attr:`zipline.pipeline.graph.ExecutionPlan.shared_window_groups`
+        """
+        longest = max(terms, key=attrgetter('window_length'))
+        offsets = graph.offset
+        out = []
+        for input_ in longest.inputs:
+            input_ = maybe_specialize(input_, domain)
+            adjusted_array = ensure_adjusted_array(
+                workspace[input_], input_.missing_value,
+            )
+            out.append(
+                adjusted_array.traverse(
+                    window_length=longest.window_length,
+                    offset=offsets[longest, input_],
+                    # We only need to copy if a term outside of the group will
+                    # traverse this array again.
+                    copy=refcounts[input_] > len(terms),
+                )
+            )
+        return out
+
+    def _window_sharing_group(self, term, graph, workspace, can_compute):
+        """
+        Get the terms that should be computed together with ``term`` from
+        shared input windows.
+
+        Parameters
+        ----------
+        term : zipline.pipeline.term.ComputableTerm
+            The term about to be computed.
+        graph : zipline.pipeline.graph.ExecutionPlan
+            Dependency graph of the terms being executed.
+        workspace : dict
+            Map from term -> output.
+        can_compute : callable
+            Predicate returning whether another member of ``term``'s group is
+            needed and can be computed now.
+
+        Returns
+        -------
+        group : list[Term] or None
+            The terms to compute together, beginning with ``term``, or None if
+            ``term`` should be computed on its own.
+        """
+        if not self._share_windows or self._uses_rolling_kernel(term):
+            return None
+
+        group = graph.shared_window_groups.get(term)
+        if group is None:
+            return None
+
+        members = [term] + [
+            t for t in group
+            if t is not term
+            and t not in workspace
+            and t.mask in workspace
+            and not self._uses_rolling_kernel(t)
+            and can_compute(t)
+        ]
+        if len(members) == 1:
+            return None
+        return members
+
     def compute_chunk(self,
                       graph,
                       dates,
@@ -630,7 +1262,6 @@ class SimplePipelineEngine(PipelineEngine):
 
         # Copy the supplied initial workspace so we don't mutate it in place.
         workspace = workspace.copy()
-        domain = graph.domain
 
         # Many loaders can fetch data more efficiently if we ask them to
         # retrieve all their inputs at once. For example, a loader backed by a
@@ -662,11 +1293,109 @@ class SimplePipelineEngine(PipelineEngine):
             (t for t in execution_order if t in will_be_loaded),
         )
 
+        if self._memory_budget is None:
+            return self._compute_workspace(
+                graph,
+                dates,
+                sids,
+                workspace,
+                refcounts,
+                execution_order,
+                hooks,
+                loader_groups,
+                loader_group_key,
+            )
+
+        with SpillingWorkspace(self._memory_budget,
+                               workspace,
+                               directory=self._spill_directory) as workspace:
+            out = self._compute_workspace(
+                graph,
+                dates,
+                sids,
+                workspace,
+                refcounts,
+                execution_order,
+                hooks,
+                loader_groups,
+                loader_group_key,
+            )
+            hooks.on_workspace_memory(
+                workspace.peak_resident_bytes,
+                workspace.spilled_bytes,
+            )
+        return out
+
+    def _compute_workspace(self,
+                           graph,
+                           dates,
+                           sids,
+                           workspace,
+                           refcounts,
+                           execution_order,
+                           hooks,
+                           loader_groups,
+                           loader_group_key):
+        """
+        Compute the terms in ``execution_order`` into ``workspace``, and return
+        the requested outputs.
+        """
+        pool = self._get_compute_pool()
+        if pool is None:
+            self._compute_terms_serially(
+                graph,
+                dates,
+                sids,
+                workspace,
+                refcounts,
+                execution_order,
+                hooks,
+                loader_groups,
+                loader_group_key,
+            )
+        else:
+            self._compute_terms_in_pool(
+                pool,
+                graph,
+                dates,
+                sids,
+                workspace,
+                refcounts,
+                execution_order,
+                hooks,
+                loader_groups,
+                loader_group_key,
+            )
+
+        # At this point, all the output terms are in the workspace.
+        out = {}
+        graph_extra_rows = graph.extra_rows
+        for name, term in iteritems(graph.outputs):
+            # Truncate off extra rows from outputs.
+            out[name] = workspace[term][graph_extra_rows[term]:]
+        return out
+
+    def _compute_terms_serially(self,
+                                graph,
+                                dates,
+                                sids,
+                                workspace,
+                                refcounts,
+                                execution_order,
+                                hooks,
+                                loader_groups,
+                                loader_group_key):
+        """
+        Compute the terms in ``execution_order`` one at a time, storing their
+        results into ``workspace``.
+        """
+        to_compute = set(execution_order)
         for term in execution_order:
             # `term` may have been supplied in `initial_workspace`, or we may
             # have loaded `term` as part of a batch with another term coming
-            # from the same loader (see note on loader_group_key above). In
-            # either case, we already have the term computed, so don't
+            # from the same loader (see note on loader_group_key above), or
+            # computed it along with other terms sharing its input windows.
+            # In any case, we already have the term computed, so don't
             # recompute.
             if term in workspace:
                 continue
@@ -681,56 +1410,323 @@ class SimplePipelineEngine(PipelineEngine):
             )
 
             if isinstance(term, LoadableTerm):
-                loader = get_loader(term)
-                to_load = sorted(
-                    loader_groups[loader_group_key(term)],
-                    key=lambda t: t.dataset
+                self._load_terms(
+                    term,
+                    graph,
+                    mask_dates,
+                    sids,
+                    mask,
+                    workspace,
+                    hooks,
+                    loader_groups,
+                    loader_group_key,
                 )
-                self._ensure_can_load(loader, to_load)
-                with hooks.loading_terms(to_load):
-                    loaded = loader.load_adjusted_array(
-                        domain, to_load, mask_dates, sids, mask,
-                    )
-                assert set(loaded) == set(to_load), (
-                    'loader did not return an AdjustedArray for each column\n'
-                    'expected: %r\n'
-                    'got:      %r' % (
-                        sorted(to_load, key=repr),
-                        sorted(loaded, key=repr),
-                    )
+                continue
+
+            group = self._window_sharing_group(
+                term,
+                graph,
+                workspace,
+                to_compute.__contains__,
+            )
+            if group is not None:
+                masks = [
+                    graph.mask_and_dates_for_term(
+                        t,
+                        self._root_mask_term,
+                        workspace,
+                        dates,
+                    )[0]
+                    for t in group
+                ]
+                results = _compute_with_shared_windows(
+                    hooks,
+                    group,
+                    self._shared_inputs_for_terms(
+                        group,
+                        workspace,
+                        graph,
+                        graph.domain,
+                        refcounts,
+                    ),
+                    mask_dates,
+                    sids,
+                    masks,
                 )
-                workspace.update(loaded)
             else:
+                group = [term]
+                masks = [mask]
                 with hooks.computing_term(term):
-                    workspace[term] = term._compute(
-                        self._inputs_for_term(
-                            term,
-                            workspace,
-                            graph,
-                            domain,
-                            refcounts,
-                        ),
+                    compute, inputs = self._compute_function_and_inputs(
+                        term,
+                        workspace,
+                        graph,
+                        refcounts,
+                        mask,
+                    )
+                    results = [compute(inputs, mask_dates, sids, mask)]
+
+            for computed, result, computed_mask in zip(group, results, masks):
+                self._store_computed_term(
+                    computed,
+                    result,
+                    computed_mask,
+                    mask_dates,
+                    sids,
+                    graph,
+                    workspace,
+                    refcounts,
+                    hooks,
+                )
+
+    def _compute_terms_in_pool(self,
+                               pool,
+                               graph,
+                               dates,
+                               sids,
+                               workspace,
+                               refcounts,
+                               execution_order,
+                               hooks,
+                               loader_groups,
+                               loader_group_key):
+        """
+        Compute the terms in ``execution_order``, submitting each
+        ComputableTerm to ``pool`` as soon as all of its dependencies are
+        available in ``workspace``.
+
+        Inputs are prepared and results are stored on the calling thread, so
+        ``workspace`` and ``refcounts`` are never mutated concurrently.
+        LoadableTerms are loaded on the calling thread as well, which lets
+        loads overlap with any computations that are already in flight.
+        """
+        dependency_graph = graph.graph
+        pending = set(execution_order)
+
+        # Number of unfinished dependencies of each term we need to compute.
+        waiting = {
+            term: sum(
+                1 for dep in dependency_graph.predecessors(term)
+                if dep in pending
+            )
+            for term in execution_order
+        }
+        ready = deque(term for term in execution_order if not waiting[term])
+
+        def finish(term):
+            pending.discard(term)
+            for dependent in dependency_graph.successors(term):
+                if dependent in waiting:
+                    waiting[dependent] -= 1
+                    if not waiting[dependent]:
+                        ready.append(dependent)
+
+        def can_compute(term):
+            return (
+                term in pending
+                and term not in submitted
+                and not waiting[term]
+            )
+
+        completed = Queue()
+        submitted = set()
+        in_flight = 0
+        while pending:
+            while ready:
+                term = ready.popleft()
+                if term not in pending or term in submitted:
+                    # We loaded this term as part of an earlier batch, or
+                    # submitted it along with other terms sharing its input
+                    # windows.
+                    continue
+
+                mask, mask_dates = graph.mask_and_dates_for_term(
+                    term,
+                    self._root_mask_term,
+                    workspace,
+                    dates,
+                )
+
+                if isinstance(term, LoadableTerm):
+                    loaded = self._load_terms(
+                        term,
+                        graph,
                         mask_dates,
                         sids,
                         mask,
+                        workspace,
+                        hooks,
+                        loader_groups,
+                        loader_group_key,
+                    )
+                    for loaded_term in loaded:
+                        finish(loaded_term)
+                    continue
+
+                group = self._window_sharing_group(
+                    term,
+                    graph,
+                    workspace,
+                    can_compute,
+                )
+                if group is not None:
+                    masks = [
+                        graph.mask_and_dates_for_term(
+                            t,
+                            self._root_mask_term,
+                            workspace,
+                            dates,
+                        )[0]
+                        for t in group
+                    ]
+                    inputs = self._shared_inputs_for_terms(
+                        group,
+                        workspace,
+                        graph,
+                        graph.domain,
+                        refcounts,
+                    )
+                    pool.apply_async(
+                        _compute_group_in_worker,
+                        (completed, hooks, group, inputs, mask_dates, sids,
+                         masks),
                     )
-                if term.ndim == 2:
-                    assert workspace[term].shape == mask.shape
                 else:
-                    assert workspace[term].shape == (mask.shape[0], 1)
+                    group = [term]
+                    compute, inputs = self._compute_function_and_inputs(
+                        term,
+                        workspace,
+                        graph,
+                        refcounts,
+                        mask,
+                    )
+                    pool.apply_async(
+                        _compute_term_in_worker,
+                        (completed, hooks, term, compute, inputs, mask_dates,
+                         sids, mask),
+                    )
+                submitted.update(group)
+                in_flight += 1
 
-                # Decref dependencies of ``term``, and clear any terms
-                # whose refcounts hit 0.
-                for garbage in graph.decref_dependencies(term, refcounts):
-                    del workspace[garbage]
+            if not pending:
+                break
 
-        # At this point, all the output terms are in the workspace.
-        out = {}
-        graph_extra_rows = graph.extra_rows
-        for name, term in iteritems(graph.outputs):
-            # Truncate off extra rows from outputs.
-            out[name] = workspace[term][graph_extra_rows[term]:]
-        return out
+            if not in_flight:
+                raise AssertionError(
+                    "No terms are ready to compute, but {} terms are still "
+                    "pending.".format(len(pending))
+                )
+
+            terms, results, exc_info = completed.get()
+            in_flight -= 1
+            if exc_info is not None:
+                reraise(*exc_info)
+
+            for term, result in zip(terms, results):
+                mask, mask_dates = graph.mask_and_dates_for_term(
+                    term,
+                    self._root_mask_term,
+                    workspace,
+                    dates,
+                )
+                self._store_computed_term(
+                    term,
+                    result,
+                    mask,
+                    mask_dates,
+                    sids,
+                    graph,
+                    workspace,
+                    refcounts,
+                    hooks,
+                )
+                finish(term)
+
+    def _load_terms(self,
+                    term,
+                    graph,
+                    mask_dates,
+                    sids,
+                    mask,
+                    workspace,
+                    hooks,
+                    loader_groups,
+                    loader_group_key):
+        """
+        Load ``term`` along with every other term in its loader group, storing
+        the results into ``workspace``.
+
+        Returns
+        -------
+        loaded : list[LoadableTerm]
+            The terms that were loaded.
+        """
+        loader = self._get_loader(term)
+        to_load = sorted(
+            loader_groups[loader_group_key(term)],
+            key=lambda t: t.dataset
+        )
+        self._ensure_can_load(loader, to_load)
+        with hooks.loading_terms(to_load):
+            loaded = loader.load_adjusted_array(
+                graph.domain, to_load, mask_dates, sids, mask,
+            )
+        assert set(loaded) == set(to_load), (
+            'loader did not return an AdjustedArray for each column\n'
+            'expected: %r\n'
+            'got:      %r' % (
+                sorted(to_load, key=repr),
+                sorted(loaded, key=repr),
+            )
+        )
+        workspace.update(loaded)
+        for loaded_term in to_load:
+            hooks.on_term_result(
+                loaded_term,
+                ensure_ndarray(loaded[loaded_term]).nbytes,
+            )
+        return to_load
+
+    def _store_computed_term(self,
+                             term,
+                             result,
+                             mask,
+                             dates,
+                             sids,
+                             graph,
+                             workspace,
+                             refcounts,
+                             hooks):
+        """
+        Store the computed value of ``term`` into ``workspace`` and release any
+        dependencies that are no longer needed.
+        """
+        if self._float32_storage and result.dtype == float64_dtype:
+            result = result.astype(float32_dtype)
+        workspace[term] = result
+        hooks.on_term_result(term, result.nbytes)
+        if term.ndim == 2:
+            assert result.shape == mask.shape
+        else:
+            assert result.shape == (mask.shape[0], 1)
+
+        # Terms masked by the screen are only valid for this pipeline.
+        if self._term_cache is not None and \
+                term not in graph.screen_masked_terms and \
+                self._term_cache.is_worth_storing(term, graph.output_terms):
+            self._term_cache.put(
+                term,
+                graph.domain,
+                dates,
+                sids,
+                result,
+                self._term_cache_variant(sids),
+            )
+
+        # Decref dependencies of ``term``, and clear any terms whose refcounts
+        # hit 0.
+        for garbage in graph.decref_dependencies(term, refcounts):
+            del workspace[garbage]
 
     def _to_narrow(self, terms, data, mask, dates, assets):
         """
@@ -774,7 +1770,10 @@ class SimplePipelineEngine(PipelineEngine):
             empty_assets = array([], dtype=object)
             return DataFrame(
                 data={
-                    name: array([], dtype=arr.dtype)
+                    name: _restore_output_dtype(
+                        terms[name],
+                        array([], dtype=arr.dtype),
+                    )
                     for name, arr in iteritems(data)
                 },
                 index=MultiIndex.from_arrays([empty_dates, empty_assets]),
@@ -787,7 +1786,9 @@ class SimplePipelineEngine(PipelineEngine):
             #
             # As of Mon May 2 15:38:47 2016, we only use this to convert
             # LabelArrays into categoricals.
-            final_columns[name] = terms[name].postprocess(data[name][mask])
+            final_columns[name] = terms[name].postprocess(
+                _restore_output_dtype(terms[name], data[name][mask]),
+            )
 
         resolved_assets = array(self._finder.retrieve_all(assets))
         index = _pipeline_output_index(dates, resolved_assets, mask)
@@ -892,6 +1893,54 @@ class SimplePipelineEngine(PipelineEngine):
             or term is self._root_mask_dates_term
         )
 
+    def incremental(self, pipeline, hooks=None):
+        """
+        Create a runner that computes ``pipeline`` incrementally over a
+        rolling range of dates.
+
+        Parameters
+        ----------
+        pipeline : zipline.pipeline.Pipeline
+            The pipeline to run.
+        hooks : list[implements(PipelineHooks)], optional
+            Hooks for instrumenting Pipeline execution.
+
+        Returns
+        -------
+        runner : IncrementalPipelineRunner
+            Runner whose ``run`` method has the same result as
+            ``self.run_pipeline(pipeline, start_date, end_date)``, but which
+            only computes dates that weren't returned by the previous call
+            for the same data version.
+
+        See Also
+        --------
+        :class:`zipline.pipeline.engine.IncrementalPipelineRunner`
+        """
+        return IncrementalPipelineRunner(self, pipeline, hooks)
+
+    def _term_cache_variant(self, sids):
+        """
+        Get the value identifying results computed by this engine for
+        ``sids`` in ``term_cache``.
+
+        Results computed from float32 inputs are less precise than results
+        computed from float64 inputs, so they're cached separately. With
+        ``prune_assets``, cross-sectional results depend on which assets were
+        retained, so they're only shared between runs that retain the same
+        assets.
+        """
+        variant = []
+        if self._float32_storage:
+            variant.append('float32')
+        if self._prune_assets:
+            variant.append(
+                'pruned:' + sha256(
+                    array(sids, dtype=int64_dtype).tobytes(),
+                ).hexdigest(),
+            )
+        return ':'.join(variant) or None
+
     def _resolve_hooks(self, hooks):
         if hooks is None:
             hooks = []
@@ -909,6 +1958,364 @@ class SimplePipelineEngine(PipelineEngine):
                 )
 
 
+class IncrementalPipelineRunner(object):
+    """
+    Runner for computing a pipeline over a rolling range of dates.
+
+    Pipeline results are point-in-time: the row for a given session depends
+    only on data that was known as of that session. A daily production job
+    that requests a trailing window ending on each new session therefore only
+    needs to compute the sessions it hasn't already seen. The runner keeps the
+    results of its previous call and, when the requested range overlaps them,
+    only computes the sessions after the end of the retained results. Those
+    sessions are computed with the usual lookback windows, so the cost of
+    advancing by one session is proportional to the longest window in the
+    pipeline rather than to the length of the requested range.
+
+    Retained results are keyed on the ``data_version`` passed to :meth:`run`.
+    A revised adjustment or baseline value can change results for any
+    retained session, not just the sessions near the ones being computed, so
+    when the data version changes (e.g. because the underlying data was
+    re-ingested with a corrected split), every retained result is discarded
+    and the whole requested range is recomputed.
+
+    Parameters
+    ----------
+    engine : SimplePipelineEngine
+        The engine to use to compute new sessions.
+    pipeline : zipline.pipeline.Pipeline
+        The pipeline to compute.
+    hooks : list[implements(PipelineHooks)], optional
+        Hooks for instrumenting Pipeline execution.
+
+    Notes
+    -----
+    Users should construct runners via
+    :meth:`zipline.pipeline.engine.SimplePipelineEngine.incremental`.
+    """
+    def __init__(self, engine, pipeline, hooks=None):
+        self._pipeline = pipeline
+        self._hooks = hooks
+        self._domain = engine.resolve_domain(pipeline)
+        self._sessions = self._domain.all_sessions()
+        self._engine = engine
+        self._result = self._start = self._end = None
+        self._data_version = None
+
+    def invalidate(self, since=None):
+        """
+        Discard retained results.
+
+        Parameters
+        ----------
+        since : pd.Timestamp, optional
+            If supplied, only discard results for sessions on or after
+            ``since``. By default, discard all retained results.
+        """
+        if since is None or self._result is None or since <= self._start:
+            self._result = None
+            self._start = self._end = None
+            return
+
+        if since <= self._end:
+            # ``since`` needn't be a session, so find the last session before
+            # it.
+            loc = self._sessions.searchsorted(since)
+            if loc == 0 or self._sessions[loc - 1] < self._start:
+                self.invalidate()
+                return
+            self._result = self._slice(
+                self._result, self._start, since, False,
+            )
+            self._end = self._sessions[loc - 1]
+
+    @property
+    def retained_dates(self):
+        """The (start, end) range of retained results, or None.
+        """
+        if self._result is None:
+            return None
+        return self._start, self._end
+
+    def run(self, start_date, end_date, data_version):
+        """
+        Compute ``self.pipeline`` from ``start_date`` to ``end_date``.
+
+        Parameters
+        ----------
+        start_date : pd.Timestamp
+            Start date of the computed matrix.
+        end_date : pd.Timestamp
+            End date of the computed matrix.
+        data_version : object
+            Value identifying the version of the data read by the pipeline's
+            loaders, for example the ingestion timestamp of the bundle being
+            used. Retained results are only reused by runs with an equal
+            ``data_version``, so this must change whenever the data or its
+            adjustments are revised.
+
+        Returns
+        -------
+        result : pd.DataFrame
+            The same frame that would be returned by
+            ``engine.run_pipeline(pipeline, start_date, end_date)``.
+        """
+        if end_date < start_date:
+            raise ValueError(
+                "start_date must be before or equal to end_date \n"
+                "start_date=%s, end_date=%s" % (start_date, end_date)
+            )
+        for name, date in (('start', start_date), ('end', end_date)):
+            if date not in self._sessions:
+                raise ValueError(
+                    "Pipeline {} date {} is not a trading session for "
+                    "domain {}.".format(name, date, self._domain)
+                )
+
+        if data_version != self._data_version:
+            self.invalidate()
+            self._data_version = data_version
+
+        if self._result is None or start_date < self._start:
+            self.invalidate()
+            retained = None
+            compute_start = start_date
+        elif start_date > self._end:
+            retained = None
+            compute_start = start_date
+        elif end_date <= self._end:
+            retained = self._slice(self._result, start_date, end_date, True)
+            compute_start = None
+        else:
+            retained = self._slice(self._result, start_date, end_date, True)
+            compute_start = self._next_session(self._end)
+
+        if compute_start is not None:
+            new = self._engine.run_pipeline(
+                self._pipeline, compute_start, end_date, hooks=self._hooks,
+            )
+            result = self._concat(retained, new)
+        else:
+            result = retained
+
+        self._result = result
+        self._start, self._end = start_date, end_date
+        return result.copy()
+
+    def _next_session(self, date):
+        """
+        Get the first session after ``date``. ``date`` needn't be a session.
+        """
+        loc = self._sessions.searchsorted(date, side='right')
+        if loc == len(self._sessions):
+            raise NoFurtherDataError(
+                msg='No sessions after {} for domain {}.'.format(
+                    date, self._domain,
+                ),
+            )
+        return self._sessions[loc]
+
+    @staticmethod
+    def _slice(frame, start, stop, inclusive):
+        dates = frame.index.get_level_values(0)
+        if inclusive:
+            return frame[(dates >= start) & (dates <= stop)]
+        return frame[(dates >= start) & (dates < stop)]
+
+    @staticmethod
+    def _concat(retained, new):
+        if retained is None:
+            return new
+        nonempty = [f for f in (retained, new) if len(f)]
+        if len(nonempty) < 2:
+            return nonempty[0] if nonempty else new
+        return categorical_df_concat(nonempty, inplace=True)
+
+
+def _restore_output_dtype(term, values):
+    """
+    Upcast output ``values`` of a float64 ``term`` that were stored as
+    float32. See the ``float32_storage`` option of SimplePipelineEngine.
+    """
+    if values.dtype == float32_dtype and term.dtype == float64_dtype:
+        return values.astype(float64_dtype)
+    return values
+
+
+# State for processes spawned by ``_run_chunks_in_process_pool``. This is
+# populated once per worker by ``_init_chunk_worker``.
+_chunk_worker_state = {}
+
+
+def _init_chunk_worker(engine_factory, pipeline):
+    """Build the engine and pipeline to be used by a chunk worker process.
+    """
+    _chunk_worker_state['engine'] = engine_factory()
+    _chunk_worker_state['pipeline'] = pipeline
+
+
+def _run_chunk_in_worker(date_range):
+    """Compute a single chunk of a pipeline in a chunk worker process.
+    """
+    start_date, end_date = date_range
+    return _chunk_worker_state['engine'].run_pipeline(
+        _chunk_worker_state['pipeline'],
+        start_date,
+        end_date,
+    )
+
+
+def _run_chunks_in_process_pool(engine_factory, pipeline, ranges, max_workers):
+    """
+    Compute each of ``ranges`` for ``pipeline`` in a pool of ``max_workers``
+    processes.
+
+    Parameters
+    ----------
+    engine_factory : callable
+        Zero-argument function producing the engine each worker should use.
+    pipeline : zipline.pipeline.Pipeline
+        The pipeline to run.
+    ranges : list[(pd.Timestamp, pd.Timestamp)]
+        The (start_date, end_date) pairs to compute.
+    max_workers : int
+        The number of worker processes to use.
+
+    Returns
+    -------
+    chunks : list[pd.DataFrame]
+        The results for each entry in ``ranges``, in the same order.
+    """
+    pool = Pool(
+        processes=min(max_workers, len(ranges)),
+        initializer=_init_chunk_worker,
+        initargs=(engine_factory, pipeline),
+    )
+    try:
+        chunks = pool.map(_run_chunk_in_worker, ranges, chunksize=1)
+    except BaseException:
+        pool.terminate()
+        raise
+    else:
+        pool.close()
+    finally:
+        pool.join()
+    return chunks
+
+
+def _compute_term_in_worker(completed, hooks, term, compute, inputs, dates,
+                            assets, mask):
+    """
+    Compute ``term`` by calling ``compute`` and put a
+    ``(terms, results, exc_info)`` triple onto the ``completed`` queue.
+
+    This is the task submitted to the engine's ``compute_pool``. Exceptions
+    are captured and sent back to the scheduling thread rather than being
+    raised in the worker, where they would otherwise be lost.
+    """
+    try:
+        with hooks.computing_term(term):
+            result = compute(inputs, dates, assets, mask)
+    except Exception:
+        completed.put(([term], None, sys.exc_info()))
+    else:
+        completed.put(([term], [result], None))
+
+
+def _compute_group_in_worker(completed, hooks, terms, windows, dates, assets,
+                             masks):
+    """
+    Compute a group of terms from shared input windows and put a
+    ``(terms, results, exc_info)`` triple onto the ``completed`` queue.
+
+    See Also
+    --------
+    :func:`zipline.pipeline.engine._compute_term_in_worker`
+    """
+    try:
+        results = _compute_with_shared_windows(
+            hooks, terms, windows, dates, assets, masks,
+        )
+    except Exception:
+        completed.put((terms, None, sys.exc_info()))
+    else:
+        completed.put((terms, results, None))
+
+
+def _compute_with_shared_windows(hooks, terms, windows, dates, assets, masks):
+    """
+    Compute ``terms`` from shared input windows, reporting each term to
+    ``hooks``.
+    """
+    with ExitStack() as stack:
+        for term in terms:
+            stack.enter_context(hooks.computing_term(term))
+        return compute_with_shared_windows(
+            terms, windows, dates, assets, masks,
+        )
+
+
+# Terms whose value for each asset depends only on that asset's own data.
+_ASSET_LOCAL_TERM_TYPES = (
+    AssetExists,
+    InputDates,
+    LoadableTerm,
+    LatestMixin,
+    NumericalExpression,
+    ArrayPredicate,
+    NullFilter,
+    NotNullFilter,
+    SingleAsset,
+    StaticSids,
+)
+
+
+def _is_asset_local(term):
+    """
+    Does the value of ``term`` for each asset depend only on that asset's own
+    data, and not on which other assets are being computed?
+    """
+    return isinstance(term, _ASSET_LOCAL_TERM_TYPES) and all(
+        _is_asset_local(dependency) for dependency in term.dependencies
+    )
+
+
+def _select_columns(adjusted_array, columns, copy):
+    """
+    Select ``columns`` of ``adjusted_array`` if they're not None.
+
+    Returns
+    -------
+    selected : AdjustedArray
+        The array to traverse.
+    copy : bool
+        Whether the traversal of ``selected`` needs to copy its data.
+    """
+    if columns is None or adjusted_array.data.shape[1] == 1:
+        return adjusted_array, copy
+    # The selected columns are a copy, so they can always be mutated.
+    return adjusted_array.select_columns(columns), False
+
+
+def _compute_columns(term, compute, columns, inputs, dates, assets, mask):
+    """
+    Compute ``term`` for just ``columns``, returning an output for all
+    columns that holds ``term.missing_value`` everywhere else.
+    """
+    result = compute(inputs, dates, assets[columns], mask[:, columns])
+    out = term._allocate_output(inputs, mask.shape)
+    out[:, columns] = result
+    return out
+
+
+def _batched_column_name(index, name):
+    """
+    Name of the column holding the output ``name`` of the ``index``th pipeline
+    in :meth:`SimplePipelineEngine.run_pipelines`.
+    """
+    return '%d:%s' % (index, name)
+
+
 def _pipeline_output_index(dates, assets, mask):
     """
     Create a MultiIndex for a pipeline output.
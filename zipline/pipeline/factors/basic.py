@@ -17,6 +17,12 @@ from numpy import (
     unique,
 )
 
+from zipline.lib.rolling import (
+    rolling_exponential_weighted_mean,
+    rolling_exponential_weighted_std,
+    rolling_nanmean,
+    rolling_nanstd,
+)
 from zipline.pipeline.data import EquityPricing
 from zipline.utils.input_validation import expect_types
 from zipline.utils.math_utils import (
@@ -32,10 +38,10 @@ from zipline.utils.numpy_utils import (
 )
 
 from .factor import CustomFactor
-from ..mixins import SingleInputMixin
+from ..mixins import AssetLocalCostMixin, SingleInputMixin
 
 
-class Returns(CustomFactor):
+class Returns(AssetLocalCostMixin, CustomFactor):
     """
     Calculates the percent change in close price over the given window_length.
 
@@ -57,7 +63,7 @@ class Returns(CustomFactor):
         out[:] = (close[-1] - close[0]) / close[0]
 
 
-class PercentChange(SingleInputMixin, CustomFactor):
+class PercentChange(SingleInputMixin, AssetLocalCostMixin, CustomFactor):
     """
     Calculates the percent change over the given window_length.
 
@@ -96,7 +102,7 @@ class DailyReturns(Returns):
     window_length = 2
 
 
-class SimpleMovingAverage(SingleInputMixin, CustomFactor):
+class SimpleMovingAverage(SingleInputMixin, AssetLocalCostMixin, CustomFactor):
     """
     Average Value of an arbitrary column
 
@@ -112,8 +118,11 @@ class SimpleMovingAverage(SingleInputMixin, CustomFactor):
     def compute(self, today, assets, out, data):
         out[:] = nanmean(data, axis=0)
 
+    def compute_rolling(self, out, data):
+        out[:] = rolling_nanmean(data, self.window_length)
+
 
-class WeightedAverageValue(CustomFactor):
+class WeightedAverageValue(AssetLocalCostMixin, CustomFactor):
     """
     Helper for VWAP-like computations.
 
@@ -136,7 +145,7 @@ class VWAP(WeightedAverageValue):
     inputs = (EquityPricing.close, EquityPricing.volume)
 
 
-class MaxDrawdown(SingleInputMixin, CustomFactor):
+class MaxDrawdown(SingleInputMixin, AssetLocalCostMixin, CustomFactor):
     """
     Max Drawdown
 
@@ -157,7 +166,7 @@ class MaxDrawdown(SingleInputMixin, CustomFactor):
             out[i] = (peak - data[end, i]) / data[end, i]
 
 
-class AverageDollarVolume(CustomFactor):
+class AverageDollarVolume(AssetLocalCostMixin, CustomFactor):
     """
     Average Daily Dollar Volume
 
@@ -193,7 +202,9 @@ def exponential_weights(length, decay_rate):
     return full(length, decay_rate, float64_dtype) ** arange(length + 1, 1, -1)
 
 
-class _ExponentialWeightedFactor(SingleInputMixin, CustomFactor):
+class _ExponentialWeightedFactor(SingleInputMixin,
+                                 AssetLocalCostMixin,
+                                 CustomFactor):
     """
     Base class for factors implementing exponential-weighted operations.
 
@@ -396,6 +407,11 @@ class ExponentialWeightedMovingAverage(_ExponentialWeightedFactor):
             weights=exponential_weights(len(data), decay_rate),
         )
 
+    def compute_rolling(self, out, data, decay_rate):
+        out[:] = rolling_exponential_weighted_mean(
+            data, self.window_length, decay_rate,
+        )
+
 
 class ExponentialWeightedMovingStdDev(_ExponentialWeightedFactor):
     """
@@ -440,8 +456,15 @@ class ExponentialWeightedMovingStdDev(_ExponentialWeightedFactor):
         )
         out[:] = sqrt(variance * bias_correction)
 
+    def compute_rolling(self, out, data, decay_rate):
+        out[:] = rolling_exponential_weighted_std(
+            data, self.window_length, decay_rate,
+        )
+
 
-class LinearWeightedMovingAverage(SingleInputMixin, CustomFactor):
+class LinearWeightedMovingAverage(SingleInputMixin,
+                                  AssetLocalCostMixin,
+                                  CustomFactor):
     """
     Weighted Average Value of an arbitrary column
 
@@ -470,7 +493,7 @@ class LinearWeightedMovingAverage(SingleInputMixin, CustomFactor):
         out[:] = nansum(weighted_data, axis=0) / normalizer
 
 
-class AnnualizedVolatility(CustomFactor):
+class AnnualizedVolatility(AssetLocalCostMixin, CustomFactor):
     """
     Volatility. The degree of variation of a series over time as measured by
     the standard deviation of daily returns.
@@ -491,6 +514,12 @@ class AnnualizedVolatility(CustomFactor):
     def compute(self, today, assets, out, returns, annualization_factor):
         out[:] = nanstd(returns, axis=0) * (annualization_factor ** .5)
 
+    def compute_rolling(self, out, returns, annualization_factor):
+        out[:] = (
+            rolling_nanstd(returns, self.window_length)
+            * (annualization_factor ** .5)
+        )
+
 
 class PeerCount(SingleInputMixin, CustomFactor):
     """
@@ -529,7 +558,7 @@ EWMA = ExponentialWeightedMovingAverage
 EWMSTD = ExponentialWeightedMovingStdDev
 
 
-class Clip(CustomFactor):
+class Clip(AssetLocalCostMixin, CustomFactor):
     """
     Clip (limit) the values in a factor.
 
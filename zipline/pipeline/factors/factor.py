@@ -1,6 +1,7 @@
 """
 factor.py
 """
+from functools import partial
 from operator import attrgetter
 from numbers import Number
 from math import ceil
@@ -15,7 +16,12 @@ from zipline.errors import (
     UnknownRankMethod,
     UnsupportedDataType,
 )
-from zipline.lib.normalize import naive_grouped_rowwise_apply
+from zipline.lib.normalize import (
+    grouped_rowwise_demean,
+    grouped_rowwise_rankdata,
+    grouped_rowwise_zscore,
+    naive_grouped_rowwise_apply,
+)
 from zipline.lib.rank import masked_rankdata_2d, rankdata_1d_descending
 from zipline.pipeline.api_utils import restrict_to_dtype
 from zipline.pipeline.classifiers import Classifier, Everything, Quantiles
@@ -1450,17 +1456,20 @@ class GroupedRowTransform(Factor):
         group_labels, null_label = self.inputs[1]._to_integral(arrays[1])
         # Make a copy with the null code written to masked locations.
         group_labels = where(mask, group_labels, null_label)
-        return where(
-            group_labels != null_label,
-            naive_grouped_rowwise_apply(
+        out = empty_like(data, dtype=self.dtype)
+        kernel = _grouped_kernels.get(self._transform)
+        if kernel is not None:
+            result = kernel(data, group_labels, *self._transform_args,
+                            out=out)
+        else:
+            result = naive_grouped_rowwise_apply(
                 data=data,
                 group_labels=group_labels,
                 func=self._transform,
                 func_args=self._transform_args,
-                out=empty_like(data, dtype=self.dtype),
-            ),
-            self.missing_value,
-        )
+                out=out,
+            )
+        return where(group_labels != null_label, result, self.missing_value)
 
     @property
     def transform_name(self):
@@ -1629,6 +1638,37 @@ class CustomFactor(PositiveWindowLengthMixin, CustomTermMixin, Factor):
     3rd, 2014, the column of input data for asset A will have 9 leading NaNs
     for the preceding days on which data was not yet available.
 
+    CustomFactors that can be computed for many dates at once may implement
+    ``compute_block`` instead of (or in addition to) ``compute``:
+
+    .. code-block:: python
+
+        def compute_block(self, today_index, assets, out, *inputs):
+           ...
+
+    ``compute_block`` is called with many consecutive dates at a time, so it
+    avoids the overhead of calling ``compute`` once per date::
+
+        today_index : pd.DatetimeIndex
+            Labels for the rows of `out`.
+        assets : pd.Int64Index
+            Column labels for `out` and `inputs`. Unlike ``compute``,
+            ``compute_block`` is always passed every asset; values computed
+            for assets outside of ``mask`` are discarded.
+        out : np.array[self.dtype, ndim=2]
+            Output array of shape ``(len(today_index), len(assets))``.
+        *inputs : tuple of np.array
+            Read-only arrays of shape
+            ``(len(today_index), window_length, len(assets))``, such that
+            ``inputs[i][n]`` is the window that ``compute`` would receive for
+            ``today_index[n]``. These are strided views, so they don't copy
+            any data.
+
+    Windows on either side of an adjustment (e.g. a split) contain different
+    views of the same rows of data, so they can't be strided views of a single
+    array. When a chunk contains adjustments, ``compute_block`` is called once
+    for each run of dates between adjustments.
+
     Examples
     --------
 
@@ -1705,6 +1745,19 @@ class CustomFactor(PositiveWindowLengthMixin, CustomTermMixin, Factor):
         alpha = multiple_outputs.alpha
         beta = multiple_outputs.beta
 
+    A CustomFactor computed for many dates at once:
+
+    .. code-block:: python
+
+        class TenDayRange(CustomFactor):
+            inputs = [USEquityPricing.high, USEquityPricing.low]
+            window_length = 10
+
+            def compute_block(self, today_index, assets, out, highs, lows):
+                from numpy import nanmin, nanmax
+
+                out[:] = nanmax(highs, axis=1) - nanmin(lows, axis=1)
+
     Note: If a CustomFactor has multiple outputs, all outputs must have the
     same dtype. For instance, in the example above, if alpha is a float then
     beta must also be a float.
@@ -1888,3 +1941,14 @@ def winsorize(row, min_percentile, max_percentile):
             a[idx[upper_cutoff:start_of_nans]] = a[idx[upper_cutoff - 1]]
 
     return a
+
+
+# Vectorized equivalents of the transforms above, applied to every group of
+# every row at once. GroupedRowTransform falls back to
+# naive_grouped_rowwise_apply for transforms not listed here.
+_grouped_kernels = {
+    demean: grouped_rowwise_demean,
+    zscore: grouped_rowwise_zscore,
+    rankdata: partial(grouped_rowwise_rankdata, ascending=True),
+    rankdata_1d_descending: partial(grouped_rowwise_rankdata, ascending=False),
+}
@@ -1,10 +1,7 @@
 from numexpr import evaluate
 import numpy as np
 from numpy import broadcast_arrays
-from scipy.stats import (
-    linregress,
-    spearmanr,
-)
+from scipy.stats import t as t_distribution
 
 from zipline.assets import Asset
 from zipline.errors import IncompatibleTerms
@@ -133,13 +130,12 @@ class RollingSpearman(_RollingCorrelation):
     window_safe = True
 
     def compute(self, today, assets, out, base_data, target_data):
-        # If `target_data` is a Slice or single column of data, broadcast it
-        # out to the same shape as `base_data`, then compute column-wise. This
-        # is efficient because each column of the broadcasted array only refers
-        # to a single memory location.
-        target_data = broadcast_arrays(target_data, base_data)[0]
-        for i in range(len(out)):
-            out[i] = spearmanr(base_data[:, i], target_data[:, i])[0]
+        vectorized_spearman_r(
+            base_data,
+            target_data,
+            allowed_missing=0,
+            out=out,
+        )
 
 
 class RollingLinearRegression(CustomFactor):
@@ -194,29 +190,12 @@ class RollingLinearRegression(CustomFactor):
         )
 
     def compute(self, today, assets, out, dependent, independent):
-        alpha = out.alpha
-        beta = out.beta
-        r_value = out.r_value
-        p_value = out.p_value
-        stderr = out.stderr
-
-        def regress(y, x):
-            regr_results = linregress(y=y, x=x)
-            # `linregress` returns its results in the following order:
-            # slope, intercept, r-value, p-value, stderr
-            alpha[i] = regr_results[1]
-            beta[i] = regr_results[0]
-            r_value[i] = regr_results[2]
-            p_value[i] = regr_results[3]
-            stderr[i] = regr_results[4]
-
-        # If `independent` is a Slice or single column of data, broadcast it
-        # out to the same shape as `dependent`, then compute column-wise. This
-        # is efficient because each column of the broadcasted array only refers
-        # to a single memory location.
-        independent = broadcast_arrays(independent, dependent)[0]
-        for i in range(len(out)):
-            regress(y=dependent[:, i], x=independent[:, i])
+        vectorized_linear_regression(
+            dependent,
+            independent,
+            allowed_missing=0,
+            out=out,
+        )
 
 
 class RollingPearsonOfReturns(RollingPearson):
@@ -736,3 +715,192 @@ def vectorized_pearson_r(dependents, independents, allowed_missing, out=None):
         out=out,
     )
     return out
+
+
+def vectorized_spearman_r(dependents, independents, allowed_missing, out=None):
+    """
+    Compute Spearman's rank correlation coefficient between columns of
+    ``dependents`` and ``independents``.
+
+    Parameters
+    ----------
+    dependents : np.array[N, M]
+        Array with columns of data to be correlated with ``independents``.
+    independents : np.array[N, M] or np.array[N, 1]
+        Data with which to correlate the columns of ``dependents``. If a single
+        column is passed, it is broadcast to the shape of ``dependents``.
+    allowed_missing : int
+        Number of allowed missing (NaN) observations per column. Columns with
+        more than this many non-nan observations in either ``dependents`` or
+        ``independents`` will output NaN as the correlation coefficient.
+        Otherwise, each column is ranked using only the observations that are
+        present in both arrays.
+    out : np.array[M] or None, optional
+        Output array into which to write results.  If None, a new array is
+        created and returned.
+
+    Returns
+    -------
+    correlations : np.array[M]
+        Spearman rank correlation coefficients for each column of
+        ``dependents``.
+
+    See Also
+    --------
+    :func:`scipy.stats.spearmanr`
+    :class:`zipline.pipeline.factors.RollingSpearman`
+    :class:`zipline.pipeline.factors.RollingSpearmanOfReturns`
+    """
+    if allowed_missing > 0:
+        # Rank each column using only the observations where neither input
+        # is missing.
+        dependents, independents = broadcast_arrays(dependents, independents)
+        either_nan = np.isnan(dependents) | np.isnan(independents)
+        dependents = np.where(either_nan, np.nan, dependents)
+        independents = np.where(either_nan, np.nan, independents)
+
+    # Spearman's rho is Pearson's r between the ranks of each input.
+    return vectorized_pearson_r(
+        _columnwise_average_ranks(dependents),
+        _columnwise_average_ranks(independents),
+        allowed_missing,
+        out=out,
+    )
+
+
+def _columnwise_average_ranks(data):
+    """
+    Rank each column of ``data``, assigning the average rank to ties.
+
+    This is equivalent to applying ``scipy.stats.rankdata(method='average')``
+    to each column, except that NaNs are excluded from the ranking and
+    produce a rank of NaN.
+    """
+    N, M = data.shape
+    columns = np.arange(M)
+
+    # NaNs sort to the end of each column.
+    order = np.argsort(data, axis=0, kind='mergesort')
+    sorted_data = data[order, columns]
+
+    # Find the first and last position of each run of equal values.
+    positions = np.arange(N).reshape(N, 1)
+    is_start = np.ones((N, M), dtype=bool)
+    is_start[1:] = sorted_data[1:] != sorted_data[:-1]
+    is_end = np.ones((N, M), dtype=bool)
+    is_end[:-1] = is_start[1:]
+    starts = np.maximum.accumulate(np.where(is_start, positions, 0), axis=0)
+    ends = np.minimum.accumulate(
+        np.where(is_end, positions, N - 1)[::-1],
+        axis=0,
+    )[::-1]
+
+    ranks = np.empty((N, M), dtype=float64_dtype)
+    ranks[order, columns] = (starts + ends) / 2.0 + 1
+    ranks[np.isnan(data)] = np.nan
+    return ranks
+
+
+_REGRESSION_OUTPUTS = ('alpha', 'beta', 'r_value', 'p_value', 'stderr')
+
+
+def vectorized_linear_regression(dependents,
+                                 independents,
+                                 allowed_missing,
+                                 out=None):
+    """
+    Compute ordinary least-squares regressions predicting the columns of
+    ``dependents`` from the columns of ``independents``.
+
+    This computes the same values as :func:`scipy.stats.linregress` for each
+    column.
+
+    Parameters
+    ----------
+    dependents : np.array[N, M]
+        Array with columns of data to be regressed against ``independents``.
+    independents : np.array[N, M] or np.array[N, 1]
+        Independent variable(s) of the regression. If a single column is
+        passed, it is broadcast to the shape of ``dependents``.
+    allowed_missing : int
+        Number of allowed missing (NaN) observations per column. Columns with
+        more than this many non-nan observations in either ``dependents`` or
+        ``independents`` will output NaN for every result. Otherwise, each
+        regression uses only the observations that are present in both
+        arrays.
+    out : np.recarray[M] or None, optional
+        Output array into which to write results, with fields ``alpha``,
+        ``beta``, ``r_value``, ``p_value`` and ``stderr``. If None, a new
+        array is created and returned.
+
+    Returns
+    -------
+    regressions : np.recarray[M]
+        The intercept (``alpha``), slope (``beta``), correlation coefficient
+        (``r_value``), two-sided p-value for a hypothesis test whose null
+        hypothesis is that the slope is zero (``p_value``), and standard error
+        of the slope (``stderr``) of each regression.
+
+    See Also
+    --------
+    :class:`zipline.pipeline.factors.RollingLinearRegression`
+    :class:`zipline.pipeline.factors.RollingLinearRegressionOfReturns`
+    """
+    nan = np.nan
+    isnan = np.isnan
+    N, M = dependents.shape
+
+    if out is None:
+        out = np.recarray(
+            M,
+            formats=[float64_dtype.str] * len(_REGRESSION_OUTPUTS),
+            names=_REGRESSION_OUTPUTS,
+        )
+
+    dependents, independents = broadcast_arrays(dependents, independents)
+    either_nan = isnan(dependents) | isnan(independents)
+    too_many_missing = either_nan.sum(axis=0) > allowed_missing
+    if allowed_missing > 0:
+        independents = np.where(either_nan, nan, independents)
+        dependents = np.where(either_nan, nan, dependents)
+        mean = nanmean
+    else:
+        mean = np.mean
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ind_mean = mean(independents, axis=0)
+        dep_mean = mean(dependents, axis=0)
+        ind_residual = independents - ind_mean
+        dep_residual = dependents - dep_mean
+
+        # These are the entries of ``np.cov(x, y, bias=1)`` used by
+        # ``linregress``.
+        ind_variance = mean(ind_residual ** 2, axis=0)
+        dep_variance = mean(dep_residual ** 2, axis=0)
+        covariance = mean(ind_residual * dep_residual, axis=0)
+
+        r_denominator = np.sqrt(ind_variance * dep_variance)
+        r = np.where(
+            r_denominator == 0.0,
+            0.0,
+            np.clip(covariance / r_denominator, -1.0, 1.0),
+        )
+        beta = covariance / ind_variance
+        alpha = dep_mean - beta * ind_mean
+
+        count = (~either_nan).sum(axis=0)
+        df = count - 2
+        t = r * np.sqrt(df / ((1.0 - r + 1.0e-20) * (1.0 + r + 1.0e-20)))
+        p_value = 2 * t_distribution.sf(np.abs(t), df)
+        stderr = np.sqrt((1 - r ** 2) * dep_variance / ind_variance / df)
+
+        # With only two points, the regression line passes through both.
+        two_points = count == 2
+        p_value[two_points] = (dep_variance[two_points] == 0).astype(float)
+        stderr[two_points] = 0.0
+
+    for name, values in zip(_REGRESSION_OUTPUTS,
+                            (alpha, beta, r, p_value, stderr)):
+        values = np.where(too_many_missing | isnan(beta), nan, values)
+        out[name] = values
+    return out
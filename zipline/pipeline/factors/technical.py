@@ -14,9 +14,10 @@ from numpy import (
 )
 from numexpr import evaluate
 
+from zipline.lib.rolling import rolling_nanmean_and_nanstd
 from zipline.pipeline.data import EquityPricing
 from zipline.pipeline.factors import CustomFactor
-from zipline.pipeline.mixins import SingleInputMixin
+from zipline.pipeline.mixins import AssetLocalCostMixin, SingleInputMixin
 from zipline.utils.input_validation import expect_bounded
 from zipline.utils.math_utils import (
     nanargmax,
@@ -40,7 +41,7 @@ from .basic import (  # noqa reexport
 )
 
 
-class RSI(SingleInputMixin, CustomFactor):
+class RSI(SingleInputMixin, AssetLocalCostMixin, CustomFactor):
     """
     Relative Strength Index
 
@@ -64,7 +65,7 @@ class RSI(SingleInputMixin, CustomFactor):
         )
 
 
-class BollingerBands(CustomFactor):
+class BollingerBands(AssetLocalCostMixin, CustomFactor):
     """
     Bollinger Bands technical indicator.
     https://en.wikipedia.org/wiki/Bollinger_Bands
@@ -92,8 +93,15 @@ class BollingerBands(CustomFactor):
         out.upper = middle + difference
         out.lower = middle - difference
 
+    def compute_rolling(self, out, close, k):
+        middle, std = rolling_nanmean_and_nanstd(close, self.window_length)
+        difference = k * std
+        out.middle = middle
+        out.upper = middle + difference
+        out.lower = middle - difference
+
 
-class Aroon(CustomFactor):
+class Aroon(AssetLocalCostMixin, CustomFactor):
     """
     Aroon technical indicator.
     https://www.fidelity.com/learning-center/trading-investing/technical-analysis/technical-indicator-guide/aroon-indicator
@@ -133,7 +141,7 @@ class Aroon(CustomFactor):
         )
 
 
-class FastStochasticOscillator(CustomFactor):
+class FastStochasticOscillator(AssetLocalCostMixin, CustomFactor):
     """
     Fast Stochastic Oscillator Indicator [%K, Momentum Indicator]
     https://wiki.timetotrade.eu/Stochastic
@@ -174,7 +182,7 @@ class FastStochasticOscillator(CustomFactor):
         )
 
 
-class IchimokuKinkoHyo(CustomFactor):
+class IchimokuKinkoHyo(AssetLocalCostMixin, CustomFactor):
     """Compute the various metrics for the Ichimoku Kinko Hyo (Ichimoku Cloud).
     http://stockcharts.com/school/doku.php?id=chart_school:technical_indicators:ichimoku_cloud
 
@@ -245,7 +253,7 @@ class IchimokuKinkoHyo(CustomFactor):
         out.chikou_span = close[chikou_span_length]
 
 
-class RateOfChangePercentage(CustomFactor):
+class RateOfChangePercentage(AssetLocalCostMixin, CustomFactor):
     """
     Rate of change Percentage
     ROC measures the percentage change in price from one period to the next.
@@ -268,7 +276,7 @@ class RateOfChangePercentage(CustomFactor):
                  )
 
 
-class TrueRange(CustomFactor):
+class TrueRange(AssetLocalCostMixin, CustomFactor):
     """
     True Range
 
@@ -302,7 +310,8 @@ class TrueRange(CustomFactor):
         )
 
 
-class MovingAverageConvergenceDivergenceSignal(CustomFactor):
+class MovingAverageConvergenceDivergenceSignal(AssetLocalCostMixin,
+                                               CustomFactor):
     """
     Moving Average Convergence/Divergence (MACD) Signal line
     https://en.wikipedia.org/wiki/MACD
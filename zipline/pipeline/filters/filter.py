@@ -3,6 +3,7 @@ filter.py
 """
 from itertools import chain
 from operator import attrgetter
+import re
 
 from numpy import (
     any as np_any,
@@ -51,6 +52,55 @@ from zipline.utils.numpy_utils import (
 from ..sentinels import NotSpecified
 
 
+_VARIABLE_RE = re.compile(r"x_([0-9]+)")
+
+
+def _strip_parens(expr):
+    """Strip any parentheses enclosing the entire expression ``expr``.
+    """
+    expr = expr.strip()
+    while expr.startswith('('):
+        depth = 0
+        for i, char in enumerate(expr):
+            if char == '(':
+                depth += 1
+            elif char == ')':
+                depth -= 1
+                if depth == 0:
+                    break
+        if i != len(expr) - 1:
+            break
+        expr = expr[1:-1].strip()
+    return expr
+
+
+def _split_conjunction(expr):
+    """
+    Split a numexpr expression into the operands of its (possibly nested)
+    top-level ``&``s.
+
+    Examples
+    --------
+    >>> _split_conjunction('((x_0 == 3) & (x_1)) & (x_2 > 5)')
+    ['x_0 == 3', 'x_1', 'x_2 > 5']
+    """
+    expr = _strip_parens(expr)
+    operands = []
+    depth = start = 0
+    for i, char in enumerate(expr + '&'):
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '&' and depth == 0:
+            operands.append(expr[start:i])
+            start = i + 1
+
+    if len(operands) == 1:
+        return [expr]
+    return list(chain.from_iterable(map(_split_conjunction, operands)))
+
+
 def concat_tuples(*tuples):
     """
     Concatenate a sequence of tuples into one tuple.
@@ -222,6 +272,18 @@ class Filter(RestrictedDTypeMixin, ComputableTerm):
     def _principal_computable_term_type(cls):
         return Filter
 
+    def _conjuncts(self):
+        """
+        Get filters whose intersection is equivalent to this filter.
+
+        Returns
+        -------
+        conjuncts : list[Filter]
+            The operands of the ``&``s from which this filter was built, or
+            ``[self]`` if this filter isn't an intersection.
+        """
+        return [self]
+
     @expect_types(if_true=ComputableTerm, if_false=ComputableTerm)
     def if_else(self, if_true, if_false):
         """
@@ -335,6 +397,39 @@ class NumExprFilter(NumericalExpression, Filter):
         """
         return cls(expr=expr, binds=binds, dtype=bool_dtype)
 
+    def _conjuncts(self):
+        operands = _split_conjunction(self._expr)
+        if len(operands) == 1:
+            return [self]
+
+        out = []
+        for operand in operands:
+            # Bind the operand's inputs in the order in which they appear.
+            indices = []
+            for i in map(int, _VARIABLE_RE.findall(operand)):
+                if i not in indices:
+                    indices.append(i)
+            if not indices:
+                # A constant operand doesn't depend on any term.
+                continue
+            binds = tuple(self.inputs[i] for i in indices)
+
+            if _VARIABLE_RE.sub('', operand) == '' and \
+                    isinstance(binds[0], Filter):
+                # The operand is a single input, which may itself be an
+                # intersection.
+                out.extend(binds[0]._conjuncts())
+                continue
+
+            out.append(NumExprFilter.create(
+                _VARIABLE_RE.sub(
+                    lambda match: 'x_%d' % indices.index(int(match.group(1))),
+                    operand,
+                ),
+                binds,
+            ))
+        return out
+
     def _compute(self, arrays, dates, assets, mask):
         """
         Compute our result with numexpr, then re-apply `mask`.
@@ -391,7 +486,7 @@ class NotNullFilter(SingleInputMixin, Filter):
     def _compute(self, arrays, dates, assets, mask):
         data = arrays[0]
         if isinstance(data, LabelArray):
-            return ~data.is_missing()
+            return data.not_missing()
         return ~is_missing(arrays[0], self.inputs[0].missing_value)
 
 
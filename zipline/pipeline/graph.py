@@ -106,6 +106,13 @@ class TermGraph(object):
         """
         return self._outputs
 
+    @lazyval
+    def output_terms(self):
+        """
+        Set of the terms designated as outputs.
+        """
+        return frozenset(self._outputs.values())
+
     @property
     def screen_name(self):
         """Name of the specially-designated ``screen`` term for the pipeline.
@@ -259,6 +266,7 @@ class ExecutionPlan(TermGraph):
     extra_rows
     outputs
     offset
+    screen_masked_terms
     """
     def __init__(self,
                  domain,
@@ -286,6 +294,7 @@ class ExecutionPlan(TermGraph):
         self.graph = nx.relabel_nodes(self.graph, specializations)
 
         self.domain = domain
+        self.screen_masked_terms = frozenset()
 
         sessions = domain.all_sessions()
         for term in terms.values():
@@ -456,6 +465,110 @@ class ExecutionPlan(TermGraph):
             for term, attrs in iteritems(self.graph.node)
         }
 
+    @lazyval
+    def shared_window_groups(self):
+        """
+        A dict mapping each windowed term that can share input windows with
+        other terms in the plan to the tuple of terms in its group.
+
+        Two terms are in the same group if they compute over the same inputs
+        for the same number of extra rows, and both have
+        ``can_share_windows``. Such terms can be computed from a single
+        traversal of each input, using the longest window length in the group,
+        instead of one traversal per term.
+
+        Examples
+        --------
+        Our graph contains the following terms:
+
+            A = SimpleMovingAverage([USEquityPricing.close], window_length=10)
+            B = SimpleMovingAverage([USEquityPricing.close], window_length=50)
+            C = USEquityPricing.close.latest
+
+        A, B, and C are all grouped together, and the engine traverses `close`
+        once with a window length of 50. A and C see the last 10 and 1 rows of
+        each window, respectively.
+
+        Notes
+        -----
+        Only the adjusted input windows are shared. Each term still runs its
+        own ``compute`` over its suffix of the window, so intermediate values
+        like the rolling sums behind A and B are not shared between terms.
+
+        See Also
+        --------
+        :func:`zipline.pipeline.mixins.compute_with_shared_windows`
+        """
+        extra_rows = self.extra_rows
+        groups = {}
+        for term in self.ordered():
+            if not getattr(term, 'can_share_windows', False):
+                continue
+            key = (
+                tuple(maybe_specialize(t, self.domain) for t in term.inputs),
+                extra_rows[term],
+            )
+            groups.setdefault(key, []).append(term)
+
+        out = {}
+        for members in groups.values():
+            if len(members) > 1:
+                members = tuple(members)
+                for term in members:
+                    out[term] = members
+        return out
+
+    def screen_first(self, min_cost):
+        """
+        Compute expensive output terms only where the pipeline's screen
+        passes.
+
+        A term is masked by the screen if it's a pipeline output that no other
+        term depends on, it has a ``cost`` of at least ``min_cost``, and it's
+        computed for the same dates as the screen. Masked terms are computed
+        after the screen, with a mask of ``term.mask & screen``, so their
+        computations skip assets that won't appear in the pipeline's output.
+
+        Parameters
+        ----------
+        min_cost : float
+            Minimum ``cost`` of the terms to mask. See
+            :attr:`zipline.pipeline.mixins.CustomTermMixin.cost`.
+
+        Returns
+        -------
+        masked : frozenset[Term]
+            The terms that will be masked by the screen.
+
+        Notes
+        -----
+        Masked terms only see the assets that pass the screen, so this should
+        only be used with terms whose value for each asset doesn't depend on
+        the other assets being computed.
+        """
+        screen = self.outputs[self.screen_name]
+        extra_rows = self.extra_rows
+        shared = self.shared_window_groups
+
+        masked = set(self.screen_masked_terms)
+        for name, term in iteritems(self.outputs):
+            cost = getattr(term, 'cost', None)
+            if (name == self.screen_name
+                    or term.mask is screen
+                    or cost is None
+                    or cost < min_cost
+                    or term.ndim != 2
+                    or term in shared
+                    or self.graph.out_degree(term)
+                    or extra_rows[term] != extra_rows[screen]):
+                continue
+            # Compute the screen before the term.
+            self.graph.add_edge(screen, term)
+            masked.add(term)
+
+        self.screen_masked_terms = frozenset(masked)
+        return self.screen_masked_terms
+
     def _ensure_extra_rows(self, term, N):
         """
         Ensure that we're going to compute at least N extra rows of `term`.
@@ -498,7 +611,12 @@ class ExecutionPlan(TermGraph):
             self.extra_rows[root_mask_term] - self.extra_rows[term]
         )
 
-        return workspace[mask][mask_offset:], all_dates[dates_offset:]
+        mask_values = workspace[mask][mask_offset:]
+        if term in self.screen_masked_terms:
+            # See ExecutionPlan.screen_first.
+            mask_values = mask_values & workspace[self.outputs[SCREEN_NAME]]
+
+        return mask_values, all_dates[dates_offset:]
 
     def _assert_all_loadable_terms_specialized_to(self, domain):
         """Make sure that we've specialized all loadable terms in the graph.
@@ -1,6 +1,6 @@
 from zipline.utils.compat import contextmanager as _contextmanager
 
-from interface import Interface
+from interface import default, Interface
 
 
 # Keep track of which methods of PipelineHooks are contextmanagers. Used by
@@ -33,6 +33,8 @@ class PipelineHooks(Interface):
     computing_chunk(self, terms, start_date, end_date)
     loading_terms(self, terms)
     computing_term(self, term):
+    on_workspace_memory(self, peak_resident_bytes, spilled_bytes)
+    on_term_result(self, term, nbytes)
     """
 
     @contextmanager
@@ -87,3 +89,38 @@ class PipelineHooks(Interface):
         terms : zipline.pipeline.ComputableTerm
             Terms being computed.
         """
+
+    @default
+    def on_workspace_memory(self, peak_resident_bytes, spilled_bytes):
+        """Called after computing a chunk with a memory-budgeted workspace.
+
+        This is only called by engines constructed with a ``memory_budget``.
+        By default, this does nothing, so existing hooks implementations
+        don't need to define it.
+
+        Parameters
+        ----------
+        peak_resident_bytes : int
+            Largest number of bytes of intermediate results held in memory at
+            once while computing the chunk.
+        spilled_bytes : int
+            Total number of bytes of intermediate results written to disk
+            while computing the chunk.
+        """
+
+    @default
+    def on_term_result(self, term, nbytes):
+        """Called after the result of a term is stored in the workspace.
+
+        This is called for each loaded term after its batch is loaded, and for
+        each computed term after it's computed. By default, this does nothing,
+        so existing hooks implementations don't need to define it.
+
+        Parameters
+        ----------
+        term : zipline.pipeline.Term
+            The term that was loaded or computed.
+        nbytes : int
+            Size of the term's result in bytes. For loaded terms, this is the
+            size of the baseline data, excluding adjustments.
+        """
@@ -23,3 +23,9 @@ class NoHooks(implements(PipelineHooks)):
     @contextmanager
     def computing_term(self, term):
         yield
+
+    def on_workspace_memory(self, peak_resident_bytes, spilled_bytes):
+        pass
+
+    def on_term_result(self, term, nbytes):
+        pass
@@ -0,0 +1,430 @@
+"""Pipeline hooks for profiling pipeline executions.
+"""
+from collections import defaultdict, namedtuple
+from io import StringIO
+from math import isnan
+import threading
+import time
+
+from interface import implements
+import pandas as pd
+
+from zipline.utils.compat import contextmanager
+
+from .iface import PipelineHooks
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+try:
+    _wall_time = time.perf_counter
+    _cpu_time = time.process_time
+except AttributeError:  # Python 2
+    _wall_time = time.time
+    _cpu_time = time.clock
+
+
+class ProfileRecord(namedtuple('ProfileRecord', [
+        'event',
+        'label',
+        'terms',
+        'start_date',
+        'end_date',
+        'wall_time',
+        'cpu_time',
+        'peak_bytes',
+        'net_bytes',
+        'result_bytes',
+        'stack',
+])):
+    """
+    Measurements of a single event recorded by :class:`ProfilingHooks`.
+
+    Attributes
+    ----------
+    event : {'pipeline', 'chunk', 'load', 'compute'}
+        The kind of event.
+    label : str
+        Short description of the event.
+    terms : tuple[zipline.pipeline.Term]
+        The terms loaded or computed. Empty for pipeline and chunk events.
+    start_date : pd.Timestamp
+        First date of the pipeline or chunk in which the event happened.
+    end_date : pd.Timestamp
+        Last date of the pipeline or chunk in which the event happened.
+    wall_time : float
+        Elapsed time in seconds.
+    cpu_time : float
+        CPU time in seconds used by the whole process during the event.
+    peak_bytes : float
+        Peak bytes allocated during the event, above the bytes allocated when
+        the event started. NaN if memory wasn't traced.
+    net_bytes : float
+        Bytes allocated during the event that were still allocated when it
+        finished. For loads and computations, this is dominated by the size
+        of the output arrays. NaN if memory wasn't traced.
+    result_bytes : float
+        Size in bytes of the results of the terms loaded or computed, as
+        reported by :meth:`PipelineHooks.on_term_result`. For loads, this is
+        the total over the batch. NaN for pipeline and chunk events, and for
+        events whose results weren't reported.
+    stack : tuple[str]
+        Labels of the events enclosing this event, outermost first, ending
+        with this event's label.
+    """
+    __slots__ = ()
+
+
+class _Frame(object):
+    """An event that is currently being profiled.
+    """
+    __slots__ = (
+        'event',
+        'label',
+        'terms',
+        'start_date',
+        'end_date',
+        'stack',
+        'wall_start',
+        'cpu_start',
+        'memory_start',
+        'peak',
+    )
+
+    def __init__(self, event, label, terms, start_date, end_date, parent):
+        self.event = event
+        self.label = label
+        self.terms = terms
+        self.start_date = start_date
+        self.end_date = end_date
+        self.stack = parent + (label,)
+
+
+def term_label(term):
+    """Short label for ``term`` used in profiles.
+    """
+    return term.recursive_repr()
+
+
+class ProfilingHooks(implements(PipelineHooks)):
+    """
+    Hooks implementation that measures time and memory used by each term.
+
+    Every pipeline, chunk, batch of loaded terms and computed term is
+    recorded as a :class:`ProfileRecord`. Records accumulate across runs
+    until :meth:`clear` is called.
+
+    Parameters
+    ----------
+    trace_memory : bool, optional
+        Whether to measure memory allocations with :mod:`tracemalloc`. Memory
+        is only measured if ``tracemalloc`` isn't already tracing when the
+        pipeline starts, and isn't measured on Python 2. Tracing memory slows
+        down execution several-fold, which also inflates the recorded times,
+        so it's best to profile time and memory in separate runs. Default is
+        False.
+
+    Attributes
+    ----------
+    records : list[ProfileRecord]
+        The recorded events, in the order in which they finished.
+    workspace_memory : list[tuple]
+        ``(start_date, end_date, peak_resident_bytes, spilled_bytes)`` for
+        each chunk computed by an engine with a ``memory_budget``.
+
+    Notes
+    -----
+    Memory is traced for the whole process, so memory measurements are only
+    meaningful when terms are computed one at a time. When the engine is
+    given a ``compute_pool``, time measurements are still recorded, but the
+    memory measurements of concurrent terms include each other's allocations.
+
+    Examples
+    --------
+    ::
+
+        hooks = ProfilingHooks()
+        engine.run_pipeline(pipe, start_date, end_date, hooks=[hooks])
+        hooks.to_frame().sort_values('wall_time', ascending=False)
+    """
+    def __init__(self, trace_memory=False):
+        self._trace_memory = trace_memory and tracemalloc is not None
+        self.records = []
+        self.workspace_memory = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._open_frames = []
+        self._chunk = None
+        self._tracing = False
+        self._memory_offset = 0
+
+    def clear(self):
+        """Discard all recorded events.
+        """
+        self.records = []
+        self.workspace_memory = []
+
+    def _stack(self):
+        """Get the frames currently open on this thread.
+        """
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = stack = []
+            return stack
+
+    def _parent(self, stack):
+        if stack:
+            return stack[-1].stack
+        # Terms computed on a compute_pool thread are nested under the chunk
+        # being computed.
+        if self._chunk is not None:
+            return self._chunk.stack
+        return ()
+
+    def _memory(self):
+        current, peak = tracemalloc.get_traced_memory()
+        return current + self._memory_offset, peak + self._memory_offset
+
+    def _reset_peak(self):
+        """Start measuring peak memory from the current allocation.
+        """
+        current, peak = self._memory()
+        # Remember the peak of the events that were already running before we
+        # lose it.
+        for frame in self._open_frames:
+            frame.peak = max(frame.peak, peak)
+
+        reset_peak = getattr(tracemalloc, 'reset_peak', None)
+        if reset_peak is not None:
+            reset_peak()
+        else:
+            # Before Python 3.9, the only way to reset the peak is to forget
+            # all traced allocations, so count them towards an offset instead.
+            tracemalloc.clear_traces()
+            self._memory_offset = current
+
+    @contextmanager
+    def _profile(self, event, label, terms, start_date, end_date):
+        stack = self._stack()
+        frame = _Frame(
+            event,
+            label,
+            terms,
+            start_date,
+            end_date,
+            self._parent(stack),
+        )
+        stack.append(frame)
+        if event == 'chunk':
+            self._chunk = frame
+
+        with self._lock:
+            if self._tracing:
+                self._reset_peak()
+                frame.memory_start, frame.peak = self._memory()
+                self._open_frames.append(frame)
+        frame.wall_start = _wall_time()
+        frame.cpu_start = _cpu_time()
+
+        try:
+            yield
+        finally:
+            wall_time = _wall_time() - frame.wall_start
+            cpu_time = _cpu_time() - frame.cpu_start
+            stack.pop()
+
+            peak_bytes = net_bytes = float('nan')
+            with self._lock:
+                if frame in self._open_frames:
+                    self._open_frames.remove(frame)
+                    current, peak = self._memory()
+                    peak_bytes = max(frame.peak, peak) - frame.memory_start
+                    net_bytes = current - frame.memory_start
+
+            self.records.append(ProfileRecord(
+                event=event,
+                label=label,
+                terms=terms,
+                start_date=start_date,
+                end_date=end_date,
+                wall_time=wall_time,
+                cpu_time=cpu_time,
+                peak_bytes=peak_bytes,
+                net_bytes=net_bytes,
+                result_bytes=float('nan'),
+                stack=frame.stack,
+            ))
+
+    @contextmanager
+    def running_pipeline(self, pipeline, start_date, end_date):
+        start_tracing = self._trace_memory and not tracemalloc.is_tracing()
+        if start_tracing:
+            tracemalloc.start()
+            self._tracing = True
+            self._memory_offset = 0
+
+        try:
+            with self._profile('pipeline', 'pipeline', (), start_date,
+                               end_date):
+                yield
+        finally:
+            self._chunk = None
+            if start_tracing:
+                self._tracing = False
+                tracemalloc.stop()
+
+    @contextmanager
+    def computing_chunk(self, terms, start_date, end_date):
+        label = 'chunk {}:{}'.format(
+            start_date.strftime('%Y-%m-%d'),
+            end_date.strftime('%Y-%m-%d'),
+        )
+        with self._profile('chunk', label, (), start_date, end_date):
+            yield
+
+    def _chunk_dates(self):
+        """
+        Get the dates of the chunk being computed, or ``(None, None)`` if
+        events are reported outside of ``computing_chunk``.
+        """
+        chunk = self._chunk
+        if chunk is None:
+            return None, None
+        return chunk.start_date, chunk.end_date
+
+    @contextmanager
+    def loading_terms(self, terms):
+        label = 'load ' + ', '.join(map(term_label, terms))
+        start_date, end_date = self._chunk_dates()
+        with self._profile('load', label, tuple(terms), start_date,
+                           end_date):
+            yield
+
+    @contextmanager
+    def computing_term(self, term):
+        label = 'compute ' + term_label(term)
+        start_date, end_date = self._chunk_dates()
+        with self._profile('compute', label, (term,), start_date, end_date):
+            yield
+
+    def on_workspace_memory(self, peak_resident_bytes, spilled_bytes):
+        start_date, end_date = self._chunk_dates()
+        self.workspace_memory.append((
+            start_date,
+            end_date,
+            peak_resident_bytes,
+            spilled_bytes,
+        ))
+
+    def on_term_result(self, term, nbytes):
+        # Results are reported after the event that produced them finished,
+        # so look for its record among the records of the current chunk.
+        with self._lock:
+            records = self.records
+            for i in range(len(records) - 1, -1, -1):
+                record = records[i]
+                if record.event in ('pipeline', 'chunk'):
+                    return
+                if term in record.terms:
+                    result_bytes = record.result_bytes
+                    if isnan(result_bytes):
+                        result_bytes = 0
+                    records[i] = record._replace(
+                        result_bytes=result_bytes + nbytes,
+                    )
+                    return
+
+    def to_frame(self):
+        """
+        Get the recorded events as a DataFrame.
+
+        Returns
+        -------
+        profile : pd.DataFrame
+            Frame with a row for each :class:`ProfileRecord`, in the order
+            in which the events finished, and a column for each of its
+            fields except ``stack``.
+        """
+        columns = [f for f in ProfileRecord._fields if f != 'stack']
+        return pd.DataFrame.from_records(
+            [r[:-1] for r in self.records],
+            columns=columns,
+        )
+
+    def term_times(self):
+        """
+        Get the total time spent loading or computing each term.
+
+        The time spent loading a batch of terms is divided evenly among the
+        terms in the batch.
+
+        Returns
+        -------
+        times : dict[zipline.pipeline.Term -> float]
+            Wall time in seconds spent on each term, summed over all chunks.
+        """
+        times = defaultdict(float)
+        for record in self.records:
+            for term in record.terms:
+                times[term] += record.wall_time / len(record.terms)
+        return dict(times)
+
+    def to_folded(self):
+        """
+        Get the recorded events in the "folded stacks" format read by flame
+        graph tools such as ``flamegraph.pl`` and speedscope.
+
+        Each line holds a semicolon-separated stack of events followed by the
+        microseconds spent in the innermost event, excluding time spent in
+        the events nested inside it.
+
+        Returns
+        -------
+        folded : str
+            The folded stacks, one per line.
+        """
+        self_times = defaultdict(float)
+        for record in self.records:
+            self_times[record.stack] += record.wall_time
+            if len(record.stack) > 1:
+                self_times[record.stack[:-1]] -= record.wall_time
+
+        out = StringIO()
+        for stack, seconds in sorted(self_times.items()):
+            # Events on a compute_pool can overlap, so the time spent in their
+            # parents can appear negative.
+            microseconds = int(round(max(seconds, 0.0) * 1e6))
+            out.write(u'{} {}\n'.format(
+                u';'.join(label.replace(';', ',') for label in stack),
+                microseconds,
+            ))
+        return out.getvalue()
+
+    def to_dot(self, plan, include_asset_exists=False):
+        """
+        Get the DOT source for an execution plan, annotating each term with
+        the time spent loading or computing it.
+
+        Parameters
+        ----------
+        plan : zipline.pipeline.graph.ExecutionPlan
+            The plan to draw, e.g. from
+            :meth:`zipline.pipeline.Pipeline.to_execution_plan`.
+        include_asset_exists : bool, optional
+            Whether to draw the ``AssetExists()`` node.
+
+        Returns
+        -------
+        source : str
+            DOT source, which can be rendered with ``dot``.
+        """
+        # Imported here because visualize depends on the pipeline package.
+        from zipline.pipeline.visualize import profile_dot
+        return profile_dot(
+            plan,
+            self.term_times(),
+            include_asset_exists=include_asset_exists,
+        )
@@ -109,6 +109,9 @@ class ProgressHooks(implements(PipelineHooks)):
             self._model.finish_compute_term(term)
             self._publish()
 
+    def on_workspace_memory(self, peak_resident_bytes, spilled_bytes):
+        pass
+
 
 class ProgressModel(object):
     """
@@ -1,3 +1,4 @@
+from .cache import LoaderCache
 from .equity_pricing_loader import (
     EquityPricingLoader,
     USEquityPricingLoader,
@@ -5,5 +6,6 @@ from .equity_pricing_loader import (
 
 __all__ = [
     'EquityPricingLoader',
+    'LoaderCache',
     'USEquityPricingLoader',
 ]
@@ -0,0 +1,123 @@
+"""
+In-memory caching of data loaded by pipeline loaders.
+"""
+from collections import OrderedDict
+import threading
+
+import numpy as np
+
+
+class LoaderCache(object):
+    """
+    Size-bounded in-memory cache of data loaded by pipeline loaders.
+
+    Each entry stores a value loaded for a key and a range of dates. A request
+    for a range of dates contained within a cached entry is served from that
+    entry, along with the offset of the requested dates within the entry's
+    dates, so that loaders can slice the cached value. When the cache grows
+    beyond ``max_size`` bytes, the least-recently-used entries are evicted.
+
+    A single cache can be shared by many loaders, for example to reuse data
+    across the loaders built for each run in a notebook. Loaders are
+    responsible for including everything their data depends on in the keys
+    they use.
+
+    Parameters
+    ----------
+    max_size : int
+        Maximum number of bytes to store.
+
+    See Also
+    --------
+    zipline.pipeline.loaders.EquityPricingLoader
+    """
+    def __init__(self, max_size):
+        self._max_size = max_size
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    def size(self):
+        """The number of bytes currently stored in the cache.
+        """
+        return self._size
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, dates):
+        """
+        Look up the value stored for ``key`` over a range of dates containing
+        ``dates``.
+
+        Parameters
+        ----------
+        key : hashable
+            The key under which the value was stored.
+        dates : pd.DatetimeIndex
+            The requested dates.
+
+        Returns
+        -------
+        found : tuple[object, int] or None
+            The cached value and the index of ``dates[0]`` within the dates
+            for which it was stored, or None if no entry covers ``dates``.
+        """
+        requested = dates.asi8
+        with self._lock:
+            for entry_key, entry in reversed(self._entries.items()):
+                if entry_key[0] != key:
+                    continue
+                cached_dates, value, _ = entry
+                start = cached_dates.searchsorted(requested[0])
+                if not np.array_equal(
+                        cached_dates[start:start + len(requested)],
+                        requested):
+                    continue
+                # Mark the entry as most recently used.
+                self._entries[entry_key] = self._entries.pop(entry_key)
+                return value, int(start)
+        return None
+
+    def put(self, key, dates, value, nbytes):
+        """
+        Store a value loaded for ``key`` over ``dates``.
+
+        Parameters
+        ----------
+        key : hashable
+            Key identifying the value.
+        dates : pd.DatetimeIndex
+            The dates for which ``value`` was loaded.
+        value : object
+            The value to store. Cached values are shared by every caller that
+            looks them up, so they must not be mutated.
+        nbytes : int
+            The size of ``value`` in bytes.
+        """
+        if nbytes > self._max_size:
+            return
+
+        raw_dates = dates.asi8
+        entry_key = (key, raw_dates[0], raw_dates[-1])
+        with self._lock:
+            old = self._entries.pop(entry_key, None)
+            if old is not None:
+                self._size -= old[2]
+            self._entries[entry_key] = (raw_dates, value, nbytes)
+            self._size += nbytes
+
+            while self._size > self._max_size:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self._size -= evicted
+
+    def clear(self):
+        """Remove all entries from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
@@ -14,11 +14,16 @@
 from collections import defaultdict
 
 from interface import implements
-from numpy import iinfo, uint32, multiply
+from numpy import asarray, iinfo, int64, uint32, multiply
+from six import iteritems
 
 from zipline.data.fx import ExplodingFXRateReader
 from zipline.lib.adjusted_array import AdjustedArray
-from zipline.utils.numpy_utils import repeat_first_axis
+from zipline.utils.numpy_utils import (
+    float32_dtype,
+    float64_dtype,
+    repeat_first_axis,
+)
 
 from .base import PipelineLoader
 from .utils import shift_dates
@@ -38,18 +43,43 @@ class EquityPricingLoader(implements(PipelineLoader)):
         Reader providing price/volume adjustments.
     fx_reader : zipline.data.fx.FXRateReader
        Reader providing currency conversions.
+    float32_storage : bool, optional
+        Whether to store loaded float64 columns as float32, halving their
+        memory footprint. Windows over the loaded data are still computed in
+        float64. Default is False.
+    cache : zipline.pipeline.loaders.cache.LoaderCache, optional
+        Cache in which to keep loaded baselines and adjustments, so that
+        later loads of the same columns and sids for the same dates, or for a
+        range of dates within them, don't read them again. Cached baselines
+        are read-only, so traversals of the loaded arrays always copy them.
+    data_version : object, optional
+        Value identifying the version of the data provided by the readers,
+        for example the ingestion timestamp of the bundle being read. Cached
+        data is only reused by loaders with the same readers and the same
+        ``data_version``.
     """
 
     def __init__(self,
                  raw_price_reader,
                  adjustments_reader,
-                 fx_reader):
+                 fx_reader,
+                 float32_storage=False,
+                 cache=None,
+                 data_version=None):
         self.raw_price_reader = raw_price_reader
         self.adjustments_reader = adjustments_reader
         self.fx_reader = fx_reader
+        self.float32_storage = float32_storage
+        self.cache = cache
+        self.data_version = data_version
 
     @classmethod
-    def without_fx(cls, raw_price_reader, adjustments_reader):
+    def without_fx(cls,
+                   raw_price_reader,
+                   adjustments_reader,
+                   float32_storage=False,
+                   cache=None,
+                   data_version=None):
         """
         Construct an EquityPricingLoader without support for fx rates.
 
@@ -62,6 +92,13 @@ class EquityPricingLoader(implements(PipelineLoader)):
             Reader providing raw prices.
         adjustments_reader : zipline.data.adjustments.SQLiteAdjustmentReader
             Reader providing price/volume adjustments.
+        float32_storage : bool, optional
+            Whether to store loaded float64 columns as float32.
+        cache : zipline.pipeline.loaders.cache.LoaderCache, optional
+            Cache in which to keep loaded baselines and adjustments.
+        data_version : object, optional
+            Value identifying the version of the data provided by the
+            readers.
 
         Returns
         -------
@@ -72,6 +109,9 @@ class EquityPricingLoader(implements(PipelineLoader)):
             raw_price_reader=raw_price_reader,
             adjustments_reader=adjustments_reader,
             fx_reader=ExplodingFXRateReader(),
+            float32_storage=float32_storage,
+            cache=cache,
+            data_version=data_version,
         )
 
     def load_adjusted_array(self, domain, columns, dates, sids, mask):
@@ -85,6 +125,14 @@ class EquityPricingLoader(implements(PipelineLoader)):
 
         ohlcv_cols, currency_cols = self._split_column_types(columns)
         del columns  # From here on we should use ohlcv_cols or currency_cols.
+
+        out = {}
+        if self.cache is not None:
+            ohlcv_cols = self._load_cached(
+                domain, ohlcv_cols, dates, sids, out,
+            )
+            if not ohlcv_cols and not currency_cols:
+                return out
         ohlcv_colnames = [c.name for c in ohlcv_cols]
 
         raw_ohlcv_arrays = self.raw_price_reader.load_raw_arrays(
@@ -110,13 +158,18 @@ class EquityPricingLoader(implements(PipelineLoader)):
             sids,
         )
 
-        out = {}
         for c, c_raw, c_adjs in zip(ohlcv_cols, raw_ohlcv_arrays, adjustments):
-            out[c] = AdjustedArray(
-                c_raw.astype(c.dtype),
-                c_adjs,
-                c.missing_value,
-            )
+            baseline = c_raw.astype(self._storage_dtype(c.dtype))
+            if self.cache is not None:
+                # Cached baselines are shared by every load that hits them.
+                baseline.setflags(write=False)
+                self.cache.put(
+                    self._cache_key(domain, c, sids),
+                    dates,
+                    (baseline, c_adjs),
+                    baseline.nbytes,
+                )
+            out[c] = AdjustedArray(baseline, c_adjs, c.missing_value)
 
         for c in currency_cols:
             codes_1d = self.raw_price_reader.currency_codes(sids)
@@ -129,6 +182,75 @@ class EquityPricingLoader(implements(PipelineLoader)):
 
         return out
 
+    def _cache_key(self, domain, column, sids):
+        """Key under which to cache data loaded for ``column`` and ``sids``.
+        """
+        return (
+            self.raw_price_reader,
+            self.adjustments_reader,
+            self.fx_reader,
+            self.data_version,
+            self.float32_storage,
+            domain,
+            column,
+            asarray(sids, dtype=int64).tobytes(),
+        )
+
+    def _load_cached(self, domain, columns, dates, sids, out):
+        """
+        Load cached data for ``columns`` into ``out``.
+
+        Returns
+        -------
+        uncached : list[zipline.pipeline.data.BoundColumn]
+            The columns in ``columns`` that weren't found in the cache.
+        """
+        uncached = []
+        cached = []
+        for c in columns:
+            found = self.cache.get(self._cache_key(domain, c, sids), dates)
+            if found is None:
+                uncached.append(c)
+                continue
+            (baseline, adjustments), start = found
+            stop = start + len(dates)
+            cached.append((
+                c,
+                baseline[start:stop],
+                _slice_adjustments(adjustments, start, stop),
+                start,
+            ))
+
+        # Adjustments with effective dates between the session before
+        # dates[0] and dates[0] are cached at the index of dates[0], but they
+        # aren't known when loading from dates[0], so reload the adjustments
+        # at dates[0] for columns sliced from the middle of a cached range.
+        offset = [(c, adjustments) for c, _, adjustments, start in cached
+                  if start]
+        if offset:
+            reader = self.adjustments_reader
+            first_adjustments = reader.load_pricing_adjustments(
+                [c.name for c, _ in offset],
+                dates[:1],
+                sids,
+            )
+            for (_, adjustments), c_first in zip(offset, first_adjustments):
+                adjustments.pop(0, None)
+                if 0 in c_first:
+                    adjustments[0] = c_first[0]
+
+        for c, baseline, adjustments, _ in cached:
+            out[c] = AdjustedArray(baseline, adjustments, c.missing_value)
+
+        return uncached
+
+    def _storage_dtype(self, dtype):
+        """Get the dtype in which to store loaded data of ``dtype``.
+        """
+        if self.float32_storage and dtype == float64_dtype:
+            return float32_dtype
+        return dtype
+
     @property
     def currency_aware(self):
         # Tell the pipeline engine that this loader supports currency
@@ -212,5 +334,34 @@ class EquityPricingLoader(implements(PipelineLoader)):
         return ohlcv, currency
 
 
+def _slice_adjustments(adjustments, start, stop):
+    """
+    Get the adjustments to rows ``start:stop`` of an array, indexed relative
+    to ``start``.
+    """
+    out = {}
+    for index, row_adjustments in iteritems(adjustments):
+        if not start <= index < stop:
+            continue
+        if start:
+            row_adjustments = [
+                _shift_rows(adjustment, start)
+                for adjustment in row_adjustments
+            ]
+        out[index - start] = list(row_adjustments)
+    return out
+
+
+def _shift_rows(adjustment, start):
+    """Shift the rows of ``adjustment`` up by ``start`` rows.
+    """
+    type_, args = adjustment.__reduce__()
+    return type_(
+        max(args[0] - start, 0),
+        args[1] - start,
+        *args[2:]
+    )
+
+
 # Backwards compat alias.
 USEquityPricingLoader = EquityPricingLoader
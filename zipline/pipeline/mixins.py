@@ -9,6 +9,8 @@ from abc import abstractmethod
 from numpy import (
     array,
     full,
+    isinf,
+    newaxis,
     recarray,
     searchsorted,
     vstack,
@@ -23,9 +25,14 @@ from zipline.errors import (
     NoFurtherDataError,
 )
 from zipline.lib.labelarray import LabelArray, labelarray_where
+from zipline.utils.compat import ExitStack
 from zipline.utils.context_tricks import nop_context
 from zipline.utils.input_validation import expect_dtypes, expect_types
-from zipline.utils.numpy_utils import bool_dtype
+from zipline.utils.numpy_utils import (
+    bool_dtype,
+    object_dtype,
+    rolling_window,
+)
 from zipline.utils.pandas_utils import nearest_unequal_elements
 
 
@@ -100,6 +107,20 @@ class RestrictedDTypeMixin(Term):
             )
 
 
+class AssetLocalCostMixin(Term):
+    """
+    Mixin for custom terms whose value for each asset depends only on that
+    asset's own inputs.
+
+    Estimates the ``cost`` of these terms as the number of input values read,
+    i.e. ``window_length * len(inputs)``. Subclasses that compare assets in
+    ``compute`` should set ``cost = None``.
+    """
+    @property
+    def cost(self):
+        return max(self.window_length, 1) * max(len(self.inputs), 1)
+
+
 class CustomTermMixin(Term):
     """
     Mixin for user-defined rolling-window Terms.
@@ -153,6 +174,51 @@ class CustomTermMixin(Term):
             )
         )
 
+    #: Optional implementation of ``compute`` for many dates at once.
+    #:
+    #: If defined, this is called as
+    #: ``compute_block(today_index, assets, out, *windows, **params)``, where
+    #: each array in ``windows`` is a 3D stack of the windows of an input for
+    #: the dates in ``today_index``.
+    #:
+    #: See :class:`zipline.pipeline.CustomFactor` for details.
+    compute_block = None
+
+    #: Optional rolling implementation of ``compute``.
+    #:
+    #: If defined, this is called as ``compute_rolling(out, *data, **params)``,
+    #: where each array in ``data`` holds ``len(out) + window_length - 1``
+    #: consecutive rows of an input, and should write into each row ``i`` of
+    #: ``out`` the value ``compute`` would write for the window
+    #: ``data[i:i + window_length]``. Values should be computed for every
+    #: column; masked-out values are replaced with ``missing_value``
+    #: afterwards.
+    compute_rolling = None
+
+    @property
+    def can_compute_rolling(self):
+        """
+        Whether this term can be computed with ``compute_rolling``.
+
+        ``compute_rolling`` is only used if it was defined alongside the
+        ``compute`` method that would otherwise be used, so that subclasses
+        overriding ``compute`` don't silently inherit a rolling implementation
+        of their parent's computation.
+
+        See Also
+        --------
+        :meth:`zipline.pipeline.mixins.CustomTermMixin._compute_rolling`
+        """
+        cls = type(self)
+        return (
+            self.compute_rolling is not None
+            and self.ndim == 2
+            and len(self.inputs) == 1
+            and self.can_share_windows
+            and _defining_class(cls, 'compute_rolling')
+            is _defining_class(cls, 'compute')
+        )
+
     def _allocate_output(self, windows, shape):
         """
         Allocate an output array whose rows should be passed to `self.compute`.
@@ -222,6 +288,130 @@ class CustomTermMixin(Term):
                 out[idx][out_mask] = out_row
         return out
 
+    def _compute_rolling(self, blocks, dates, assets, mask):
+        """
+        Compute this term from blocks of consecutive windows using
+        ``compute_rolling``.
+
+        ``blocks`` contains a single iterator, as produced by
+        :meth:`zipline.lib.adjusted_array.AdjustedArray.traverse_blocks`.
+        Blocks containing infinities fall back to calling ``compute`` on each
+        window, since rolling kernels generally can't handle them.
+        """
+        compute = self.compute
+        compute_rolling = self.compute_rolling
+        params = self.params
+        window_length = self.window_length
+
+        out = self._allocate_output(blocks, mask.shape)
+
+        start = 0
+        with self.ctx:
+            for block in blocks[0]:
+                stop = start + len(block) - window_length + 1
+                if block.dtype.kind == 'f' and isinf(block).any():
+                    for idx in range(start, stop):
+                        inputs_mask = mask[idx]
+                        window = block[idx - start:idx - start + window_length]
+                        if window.shape[1] != 1:
+                            # Do not mask single-column inputs.
+                            window = window[:, inputs_mask]
+                        out_row = out[idx][inputs_mask]
+                        compute(
+                            dates[idx],
+                            assets[inputs_mask],
+                            out_row,
+                            window,
+                            **params
+                        )
+                        out[idx][inputs_mask] = out_row
+                else:
+                    compute_rolling(out[start:stop], block, **params)
+                start = stop
+
+        out[~mask] = self.missing_value
+        return out
+
+    @property
+    def can_share_windows(self):
+        """
+        Whether this term can be computed from a suffix of a longer window
+        over its inputs.
+
+        This is true unless a subclass has replaced the default strategy for
+        mapping ``compute`` over windows.
+
+        See Also
+        --------
+        :func:`zipline.pipeline.mixins.compute_with_shared_windows`
+        """
+        cls = type(self)
+        return self.windowed and self.compute_block is None and all(
+            _defining_class(cls, name) is CustomTermMixin
+            for name in ('_compute', '_format_inputs')
+        )
+
+    @property
+    def can_compute_blocks(self):
+        """
+        Whether this term can be computed with ``compute_block``.
+
+        See Also
+        --------
+        :meth:`zipline.pipeline.mixins.CustomTermMixin._compute_blocks`
+        """
+        return (
+            self.compute_block is not None
+            and self.windowed
+            and len(self.inputs) > 0
+            and self.dtype != object_dtype
+            and all(input_.dtype != object_dtype for input_ in self.inputs)
+        )
+
+    #: Estimated relative cost of computing this term for one asset on one
+    #: date, or None if the term can't be computed for just some assets.
+    #:
+    #: Terms with a cost may be computed only for the assets that can pass a
+    #: pipeline's screen, so a cost should only be set on terms whose value
+    #: for each asset doesn't depend on which other assets are computed
+    #: alongside it, e.g. ``cost = 1000``.
+    #:
+    #: See :meth:`zipline.pipeline.graph.ExecutionPlan.screen_first`.
+    cost = None
+
+    def _compute_blocks(self, blocks, dates, assets, mask):
+        """
+        Call the user's ``compute_block`` function on stacks of windows of
+        each input.
+
+        ``blocks`` contains an iterator for each input, as produced by
+        :meth:`zipline.lib.adjusted_array.AdjustedArray.traverse_blocks`.
+        """
+        compute_block = self.compute_block
+        params = self.params
+        window_length = self.window_length
+
+        shape = (len(mask), 1) if self.ndim == 1 else mask.shape
+        out = self._allocate_output(blocks, shape)
+
+        start = 0
+        with self.ctx:
+            for count, arrays in _aligned_blocks(blocks, window_length):
+                stop = start + count
+                compute_block(
+                    dates[start:stop],
+                    assets,
+                    out[start:stop],
+                    *[_stack_windows(a, window_length) for a in arrays],
+                    **params
+                )
+                start = stop
+
+        # Never apply a mask to 1D outputs.
+        if self.ndim == 2:
+            out[~mask] = self.missing_value
+        return out
+
     def graph_repr(self):
         """Short repr to use when rendering Pipeline graphs."""
         # Graphviz interprets `\l` as "divide label into lines, left-justified"
@@ -229,6 +419,146 @@ class CustomTermMixin(Term):
             self.window_length
 
 
+def _defining_class(cls, name):
+    """Find the class in ``cls.__mro__`` that defines the attribute ``name``.
+    """
+    for c in cls.__mro__:
+        if name in vars(c):
+            return c
+    return None
+
+
+def _aligned_blocks(block_iterators, window_length):
+    """
+    Jointly iterate over blocks of several inputs.
+
+    Each input is split into blocks at its own adjustments, so this yields
+    ``(count, blocks)`` pairs, where ``blocks`` contains a slice of the
+    current block of each input covering the same ``count`` windows.
+    """
+    iterators = [iter(blocks) for blocks in block_iterators]
+
+    # List of [block, index of the next window in block] for each input.
+    states = []
+    for iterator in iterators:
+        block = next(iterator, None)
+        if block is None:
+            return
+        states.append([block, 0])
+
+    while True:
+        count = min(
+            len(block) - window_length + 1 - position
+            for block, position in states
+        )
+        yield count, [
+            block[position:position + count + window_length - 1]
+            for block, position in states
+        ]
+
+        for state, iterator in zip(states, iterators):
+            block, position = state
+            position += count
+            if position == len(block) - window_length + 1:
+                # All inputs produce the same number of windows, so they're
+                # exhausted at the same time.
+                block = next(iterator, None)
+                if block is None:
+                    return
+                position = 0
+            state[:] = block, position
+
+
+def _stack_windows(block, window_length):
+    """
+    Restride ``block`` into a read-only array of its consecutive windows.
+    """
+    if len(block) == window_length:
+        out = block[newaxis]
+    else:
+        out = rolling_window(block, window_length)
+    out.setflags(write=False)
+    return out
+
+
+def compute_with_shared_windows(terms, windows, dates, assets, masks):
+    """
+    Compute several CustomTerms that share the same inputs from a single
+    traversal of each input.
+
+    ``windows`` must be traversed with the longest window length of any term
+    in ``terms``. Each term's ``compute`` is called with the trailing
+    ``window_length`` rows of each window, which are exactly the rows (and
+    adjustments) the term would have seen from its own traversal.
+
+    Parameters
+    ----------
+    terms : list[CustomTermMixin]
+        Terms to compute. Every term must have ``can_share_windows`` and the
+        same inputs.
+    windows : list[AdjustedArrayWindow]
+        Iterators over the shared inputs.
+    dates : pd.DatetimeIndex
+        Row labels for the outputs.
+    assets : pd.Int64Index
+        Column labels for the outputs.
+    masks : list[np.ndarray[bool]]
+        The mask for each term in ``terms``.
+
+    Returns
+    -------
+    results : list[np.ndarray]
+        The computed values of each term in ``terms``.
+    """
+    outs = [
+        term._allocate_output(
+            windows,
+            (len(mask), 1) if term.ndim == 1 else mask.shape,
+        )
+        for term, mask in zip(terms, masks)
+    ]
+
+    # Enter each distinct context once.
+    contexts = []
+    for term in terms:
+        if not any(term.ctx is ctx for ctx in contexts):
+            contexts.append(term.ctx)
+
+    with ExitStack() as stack:
+        for ctx in contexts:
+            stack.enter_context(ctx)
+
+        for idx, date in enumerate(dates):
+            raw_inputs = [next(window) for window in windows]
+            for term, out, mask in zip(terms, outs, masks):
+                # Never apply a mask to 1D outputs.
+                out_mask = array([True]) if term.ndim == 1 else mask[idx]
+
+                # Mask our inputs as usual.
+                inputs_mask = mask[idx]
+
+                window_length = term.window_length
+                inputs = []
+                for raw in raw_inputs:
+                    window = raw[-window_length:]
+                    if window.shape[1] == 1:
+                        # Do not mask single-column inputs.
+                        inputs.append(window)
+                    else:
+                        inputs.append(window[:, inputs_mask])
+
+                out_row = out[idx][out_mask]
+                term.compute(
+                    date,
+                    assets[inputs_mask],
+                    out_row,
+                    *inputs,
+                    **term.params
+                )
+                out[idx][out_mask] = out_row
+    return outs
+
+
 class LatestMixin(SingleInputMixin):
     """
     Common behavior for :attr:`zipline.pipeline.data.BoundColumn.latest`.
@@ -0,0 +1,166 @@
+"""
+Sinks for writing pipeline results to disk as they're computed.
+
+See :meth:`zipline.pipeline.engine.SimplePipelineEngine.run_pipeline_iter`.
+"""
+import os
+
+from interface import implements, Interface
+import pandas as pd
+
+from zipline.utils.paths import ensure_directory
+
+_PARTITION_FORMAT = '%Y%m%d'
+
+
+class PipelineSink(Interface):
+    """Interface for objects that consume chunks of pipeline results.
+    """
+
+    def write(self, result, start_date, end_date):
+        """
+        Write a chunk of pipeline results.
+
+        Parameters
+        ----------
+        result : pd.DataFrame
+            Pipeline results for the chunk, as returned by ``run_pipeline``.
+        start_date : pd.Timestamp
+            First date of the chunk.
+        end_date : pd.Timestamp
+            Last date of the chunk.
+        """
+
+
+def partition_name(start_date, end_date):
+    """
+    Name of the partition holding results from ``start_date`` to
+    ``end_date``.
+    """
+    return 'd{}_{}'.format(
+        start_date.strftime(_PARTITION_FORMAT),
+        end_date.strftime(_PARTITION_FORMAT),
+    )
+
+
+def to_storable_frame(result):
+    """
+    Convert a pipeline result into a frame that can be serialized.
+
+    Pipeline results are indexed by (date, Asset). Assets can't be stored in
+    columnar formats, so they're replaced by their sids.
+
+    Parameters
+    ----------
+    result : pd.DataFrame
+        Pipeline results, as returned by ``run_pipeline``.
+
+    Returns
+    -------
+    storable : pd.DataFrame
+        ``result``, re-indexed by (date, sid).
+    """
+    out = result.copy(deep=False)
+    out.index = pd.MultiIndex.from_arrays(
+        [
+            result.index.get_level_values(0),
+            [asset.sid for asset in result.index.get_level_values(1)],
+        ],
+        names=['date', 'sid'],
+    )
+    return out
+
+
+class ParquetPipelineSink(implements(PipelineSink)):
+    """
+    Sink that writes each chunk of pipeline results to its own Parquet file.
+
+    Files are named ``d<start>_<end>.parquet``, so the directory can be read
+    as a partitioned dataset. Writing Parquet requires ``pyarrow`` or
+    ``fastparquet``, which can be installed with the ``parquet`` extra.
+
+    Parameters
+    ----------
+    path : str
+        Directory in which to write the partitions.
+    """
+    def __init__(self, path):
+        ensure_directory(path)
+        self.path = path
+
+    def write(self, result, start_date, end_date):
+        to_storable_frame(result).reset_index().to_parquet(
+            os.path.join(
+                self.path,
+                partition_name(start_date, end_date) + '.parquet',
+            ),
+        )
+
+    def read(self):
+        """
+        Read back all of the partitions written to this sink.
+
+        Returns
+        -------
+        results : pd.DataFrame
+            The concatenated partitions, indexed by (date, sid).
+        """
+        # Partition names start with their start dates, so they sort in
+        # chronological order.
+        names = sorted(
+            name for name in os.listdir(self.path)
+            if name.endswith('.parquet')
+        )
+        return pd.concat([
+            pd.read_parquet(os.path.join(self.path, name))
+            for name in names
+        ]).set_index(['date', 'sid'])
+
+
+class HDF5PipelineSink(implements(PipelineSink)):
+    """
+    Sink that writes each chunk of pipeline results to its own node of an HDF5
+    file.
+
+    Nodes are named ``<key>/d<start>_<end>``. Chunks are written to separate
+    nodes because categorical columns of different chunks may have different
+    categories, which can't be appended to a single table.
+
+    Parameters
+    ----------
+    path : str
+        Path of the HDF5 file to write.
+    key : str, optional
+        Group under which to write the partitions.
+    complevel : int, optional
+        Compression level passed to ``pd.HDFStore``.
+    """
+    def __init__(self, path, key='pipeline', complevel=None):
+        self.path = path
+        self.key = key
+        self.complevel = complevel
+
+    def write(self, result, start_date, end_date):
+        with pd.HDFStore(
+                self.path,
+                mode='a',
+                complevel=self.complevel) as store:
+            store.put(
+                '/'.join([self.key, partition_name(start_date, end_date)]),
+                to_storable_frame(result),
+                format='table',
+            )
+
+    def read(self):
+        """
+        Read back all of the partitions written to this sink.
+
+        Returns
+        -------
+        results : pd.DataFrame
+            The concatenated partitions, indexed by (date, sid).
+        """
+        with pd.HDFStore(self.path, mode='r') as store:
+            prefix = '/' + self.key + '/'
+            keys = sorted(k for k in store.keys() if k.startswith(prefix))
+            return pd.concat([store[k] for k in keys])
@@ -161,6 +161,10 @@ class Term(with_metaclass(ABCMeta, object)):
                     params=params,
                     *args, **kwargs
                 )
+            # Remember the identity we were constructed with so that it can be
+            # used to derive a stable signature for the term. See
+            # zipline.pipeline.cache.term_signature.
+            new_instance._identity = identity
             return new_instance
 
     @classmethod
@@ -81,45 +81,52 @@ def filter_nodes(include_asset_exists, nodes):
     return filter(lambda n: n is not AssetExists(), nodes)
 
 
-def _render(g, out, format_, include_asset_exists=False):
+def _write_dot(g, f, include_asset_exists=False, node_attrs=None):
     """
-    Draw `g` as a graph to `out`, in format `format`.
+    Write the DOT source for `g` to `f`.
 
     Parameters
     ----------
     g : zipline.pipeline.graph.TermGraph
         Graph to render.
-    out : file-like object
-    format_ : str {'png', 'svg'}
-        Output format.
+    f : file-like object
+        Binary file to which to write.
     include_asset_exists : bool
         Whether to filter out `AssetExists()` nodes.
+    node_attrs : callable, optional
+        Function from a term to the graphviz attributes of its node. Defaults
+        to :func:`attrs_for_node`.
     """
+    if node_attrs is None:
+        node_attrs = attrs_for_node
+
     graph_attrs = {'rankdir': 'TB', 'splines': 'ortho'}
     cluster_attrs = {'style': 'filled', 'color': 'lightgoldenrod1'}
 
     in_nodes = g.loadable_terms
     out_nodes = list(g.outputs.values())
 
-    f = BytesIO()
+    def add_node(term):
+        declare_node(f, id(term), node_attrs(term))
+
     with graph(f, "G", **graph_attrs):
 
         # Write outputs cluster.
         with cluster(f, 'Output', labelloc='b', **cluster_attrs):
             for term in filter_nodes(include_asset_exists, out_nodes):
-                add_term_node(f, term)
+                add_node(term)
 
         # Write inputs cluster.
         with cluster(f, 'Input', **cluster_attrs):
             for term in filter_nodes(include_asset_exists, in_nodes):
-                add_term_node(f, term)
+                add_node(term)
 
         # Write intermediate results.
         for term in filter_nodes(include_asset_exists,
                                  topological_sort(g.graph)):
             if term in in_nodes or term in out_nodes:
                 continue
-            add_term_node(f, term)
+            add_node(term)
 
         # Write edges
         for source, dest in g.graph.edges():
@@ -127,6 +134,24 @@ def _render(g, out, format_, include_asset_exists=False):
                 continue
             add_edge(f, id(source), id(dest))
 
+
+def _render(g, out, format_, include_asset_exists=False):
+    """
+    Draw `g` as a graph to `out`, in format `format`.
+
+    Parameters
+    ----------
+    g : zipline.pipeline.graph.TermGraph
+        Graph to render.
+    out : file-like object
+    format_ : str {'png', 'svg'}
+        Output format.
+    include_asset_exists : bool
+        Whether to filter out `AssetExists()` nodes.
+    """
+    f = BytesIO()
+    _write_dot(g, f, include_asset_exists=include_asset_exists)
+
     cmd = ['dot', '-T', format_]
     try:
         proc = Popen(cmd, stdin=PIPE, stdout=PIPE, stderr=PIPE)
@@ -168,6 +193,65 @@ def display_graph(g, format='svg', include_asset_exists=False):
     return display_cls(data=out.getvalue())
 
 
+def profile_dot(g, term_times, include_asset_exists=False):
+    """
+    Get the DOT source for `g`, annotating each node with the time spent
+    computing or loading its term.
+
+    Nodes are shaded from white to red by their share of the total time.
+
+    Parameters
+    ----------
+    g : zipline.pipeline.graph.TermGraph
+        Graph to render.
+    term_times : dict[zipline.pipeline.Term -> float]
+        Seconds spent on each term. Terms missing from ``term_times`` are
+        drawn without a time.
+    include_asset_exists : bool
+        Whether to filter out `AssetExists()` nodes.
+
+    Returns
+    -------
+    source : str
+        DOT source, which can be rendered with ``dot``.
+
+    See Also
+    --------
+    :meth:`zipline.pipeline.hooks.ProfilingHooks.to_dot`
+    """
+    total = sum(term_times.values())
+
+    def node_attrs(term):
+        attrs = attrs_for_node(term)
+        seconds = term_times.get(term)
+        if seconds is None:
+            return attrs
+
+        # Strip the quotes and any trailing line break from the label.
+        label = attrs['label'][1:-1]
+        if label.endswith('\\l'):
+            label = label[:-2]
+
+        share = seconds / total if total else 0.0
+        attrs['label'] = quote('{}\\l{:.3f}s ({:.0%})\\l'.format(
+            label,
+            seconds,
+            share,
+        ))
+        attrs['colorscheme'] = 'reds9'
+        attrs['fillcolor'] = str(1 + int(round(share * 8)))
+        return attrs
+
+    f = BytesIO()
+    _write_dot(
+        g,
+        f,
+        include_asset_exists=include_asset_exists,
+        node_attrs=node_attrs,
+    )
+    return f.getvalue().decode('utf-8')
+
+
 def writeln(f, s):
     f.write((s + '\n').encode('utf-8'))
 
@@ -0,0 +1,214 @@
+"""
+Workspaces holding intermediate results of pipeline executions.
+"""
+from collections import MutableMapping, OrderedDict
+import os
+import shutil
+from tempfile import mkdtemp
+
+import numpy as np
+
+from zipline.lib.adjusted_array import AdjustedArray
+from zipline.utils.numpy_utils import object_dtype
+
+
+def _spillable_array(value):
+    """
+    Get the array that would be written to disk to spill ``value``, or None
+    if ``value`` can't be spilled.
+    """
+    if isinstance(value, AdjustedArray):
+        if value._invalidated:
+            return None
+        value = value.data
+
+    # Subclasses like LabelArray carry state that wouldn't survive a round
+    # trip through a file, and object arrays can't be memory-mapped.
+    if type(value) is not np.ndarray or value.dtype == object_dtype:
+        return None
+    return value
+
+
+def _nbytes(value):
+    """Get the number of bytes of array data held by ``value``.
+    """
+    if isinstance(value, AdjustedArray):
+        return value._data.nbytes
+    return getattr(value, 'nbytes', 0)
+
+
+class SpillingWorkspace(MutableMapping):
+    """
+    Map from term -> output that keeps the size of its in-memory values under
+    a budget by spilling them to disk.
+
+    When the bytes held in memory exceed ``memory_budget``, the least recently
+    used arrays are written to memory-mapped files in a temporary directory
+    and dropped from memory. Spilled values are read back into memory the
+    next time they're requested.
+
+    Parameters
+    ----------
+    memory_budget : int
+        Number of bytes of array data to hold in memory.
+    initial : dict, optional
+        Initial contents of the workspace.
+    directory : str, optional
+        Directory in which to create the temporary directory holding spilled
+        arrays. Defaults to the system temporary directory.
+
+    Notes
+    -----
+    Plain arrays and the data of AdjustedArrays are spilled. LabelArrays and
+    object arrays are never spilled, but are counted against the budget.
+
+    The most recently stored value is never spilled, so the workspace can
+    exceed its budget if a single value is larger than the budget.
+    """
+    def __init__(self, memory_budget, initial=(), directory=None):
+        self.memory_budget = memory_budget
+        self.resident_bytes = 0
+        self.peak_resident_bytes = 0
+        self.spilled_bytes = 0
+
+        self._directory = directory
+        self._spill_dir = None
+        self._spill_count = 0
+
+        # Values held in memory, in order from least to most recently used.
+        self._resident = OrderedDict()
+        # Map from term -> (path, rebuild) for values spilled to disk.
+        self._spilled = {}
+
+        self.update(initial)
+
+    def __getitem__(self, term):
+        try:
+            value = self._resident.pop(term)
+        except KeyError:
+            if term not in self._spilled:
+                raise
+            value = self._reload(term)
+            self.resident_bytes += _nbytes(value)
+
+        self._resident[term] = value
+        self._enforce_budget(keep=term)
+        return value
+
+    def __setitem__(self, term, value):
+        if term in self:
+            del self[term]
+        self._resident[term] = value
+        self.resident_bytes += _nbytes(value)
+        self._enforce_budget(keep=term)
+
+    def __delitem__(self, term):
+        try:
+            value = self._resident.pop(term)
+        except KeyError:
+            path, _ = self._spilled.pop(term)
+            os.remove(path)
+        else:
+            self.resident_bytes -= _nbytes(value)
+
+    def __contains__(self, term):
+        return term in self._resident or term in self._spilled
+
+    def __iter__(self):
+        for term in list(self._resident):
+            yield term
+        for term in list(self._spilled):
+            yield term
+
+    def __len__(self):
+        return len(self._resident) + len(self._spilled)
+
+    def close(self):
+        """Delete all spilled values.
+        """
+        for term in list(self._spilled):
+            del self[term]
+        if self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _enforce_budget(self, keep):
+        self.peak_resident_bytes = max(
+            self.peak_resident_bytes,
+            self.resident_bytes,
+        )
+        if self.resident_bytes <= self.memory_budget:
+            return
+
+        for term in list(self._resident):
+            if term is keep:
+                continue
+            if self._spill(term):
+                if self.resident_bytes <= self.memory_budget:
+                    return
+
+    def _spill(self, term):
+        """
+        Write the value of ``term`` to disk and drop it from memory.
+
+        Returns
+        -------
+        spilled : bool
+            Whether the value could be spilled.
+        """
+        value = self._resident[term]
+        array = _spillable_array(value)
+        if array is None or not array.nbytes:
+            return False
+
+        if self._spill_dir is None:
+            self._spill_dir = mkdtemp(
+                prefix='zipline-workspace-',
+                dir=self._directory,
+            )
+        path = os.path.join(self._spill_dir, '%d.npy' % self._spill_count)
+        self._spill_count += 1
+
+        out = np.lib.format.open_memmap(
+            path,
+            mode='w+',
+            dtype=array.dtype,
+            shape=array.shape,
+        )
+        out[...] = array
+        out.flush()
+        del out
+
+        if isinstance(value, AdjustedArray):
+            adjustments = value.adjustments
+            missing_value = value.missing_value
+
+            def rebuild(data):
+                return AdjustedArray(data, adjustments, missing_value)
+        else:
+            rebuild = None
+
+        del self._resident[term]
+        self.resident_bytes -= _nbytes(value)
+        self.spilled_bytes += array.nbytes
+        self._spilled[term] = path, rebuild
+        return True
+
+    def _reload(self, term):
+        """Read the spilled value of ``term`` back into memory.
+        """
+        path, rebuild = self._spilled.pop(term)
+        mapped = np.load(path, mmap_mode='r')
+        data = np.array(mapped)
+        del mapped
+        os.remove(path)
+
+        if rebuild is not None:
+            return rebuild(data)
+        return data
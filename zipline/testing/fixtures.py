@@ -1854,6 +1854,17 @@ class WithSeededRandomPipelineEngine(WithTradingSessions, WithAssetFinder):
             hooks=hooks,
         )
 
+    def run_pipelines(self, pipelines, start_date, end_date, hooks=None):
+        """
+        Run several pipelines together with self.seeded_random_engine.
+        """
+        return self.seeded_random_engine.run_pipelines(
+            pipelines,
+            start_date,
+            end_date,
+            hooks=hooks,
+        )
+
 
 class WithDataPortal(WithAdjustmentReader,
                      # Ordered so that bcolz minute reader is used first.